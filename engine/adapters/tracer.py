@@ -5,6 +5,7 @@ This enables:
 - Real-time streaming to TUI for live agent monitoring
 - Persistent trace files for history loading and debugging
 - Thread-safe operation for concurrent agent turns
+- File writes on a background thread (TraceWriter), off the event loop
 
 Events follow the engine format:
 - turn_start: Beginning of agent turn with context
@@ -15,13 +16,14 @@ Events follow the engine format:
 - interpret_complete: Interpreted observations (after InterpretPhase)
 """
 
-import json
 import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, TYPE_CHECKING
 
+from .trace_writer import TraceWriter
+
 if TYPE_CHECKING:
     from engine.runtime.interpreter import AgentTurnResult
 
@@ -33,6 +35,9 @@ class VillageTracer:
     Writes events to per-agent JSONL files and notifies registered callbacks
     in real-time. Designed for concurrent agent turns with proper locking.
 
+    Callbacks fire synchronously; file writes are queued to a TraceWriter,
+    so call flush() before reading trace files back.
+
     Events:
     - turn_start: Beginning of agent turn
     - text: Streaming text output
@@ -42,15 +47,20 @@ class VillageTracer:
     - interpret_complete: Interpreted observations (after InterpretPhase)
     """
 
-    def __init__(self, trace_dir: Path):
+    # Superseded by the next event of the same type, so safe to drop under load
+    DROPPABLE_EVENTS = frozenset({"token_update"})
+
+    def __init__(self, trace_dir: Path, writer: TraceWriter | None = None):
         """
         Initialize tracer.
 
         Args:
             trace_dir: Directory for trace files (e.g., village/traces)
+            writer: Background file writer (default: a new TraceWriter)
         """
         self.trace_dir = trace_dir
         self.trace_dir.mkdir(parents=True, exist_ok=True)
+        self._writer = writer or TraceWriter()
 
         # Thread-safe callback management
         self._callbacks: list[Callable[[str, dict], None]] = []
@@ -79,6 +89,14 @@ class VillageTracer:
             if callback in self._callbacks:
                 self._callbacks.remove(callback)
 
+    def flush(self) -> None:
+        """Block until every event logged so far is written to its trace file."""
+        self._writer.flush()
+
+    def close(self) -> None:
+        """Write out pending events and stop the writer thread."""
+        self._writer.close()
+
     def _get_trace_file(self, agent_name: str) -> Path:
         """Get the trace file path for an agent."""
         return self.trace_dir / f"{agent_name}.jsonl"
@@ -109,10 +127,13 @@ class VillageTracer:
             **data
         }
 
-        # Write to file (per-agent file minimizes contention)
-        trace_file = self._get_trace_file(agent_name)
-        with open(trace_file, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        # Queue for the writer thread (per-agent file minimizes contention)
+        self._writer.write(
+            self._get_trace_file(agent_name),
+            entry,
+            droppable=event_type in self.DROPPABLE_EVENTS,
+            index_key=turn_id if event_type == "turn_start" else None,
+        )
 
         # Notify callbacks (copy list under lock, invoke outside)
         with self._callbacks_lock:
@@ -56,6 +56,7 @@ from engine.runtime import (
     AgentTurnPhase,
     InterpretPhase,
     ApplyEffectsPhase,
+    InterpreterClient,
     LLMProvider,
     get_conversation_tools,
 )
@@ -119,6 +120,9 @@ class VillageEngine:
         if llm_provider is not None:
             self._compaction_service = CompactionService(llm_provider, self._tracer)
 
+        # One interpreter client per engine: shared pool, capped concurrency
+        self._interpreter_client = InterpreterClient()
+
         # Build pipeline (phases that don't need LLM can still run)
         self._pipeline = self._build_pipeline()
 
@@ -152,7 +156,7 @@ class VillageEngine:
         agent_turn_phase.set_compaction_service(self._compaction_service)
 
         # Create interpret phase with tracer for interpret_complete events
-        interpret_phase = InterpretPhase()
+        interpret_phase = InterpretPhase(self._interpreter_client)
         interpret_phase.set_tracer(self._tracer)
 
         # Create apply effects phase with compaction service
@@ -836,4 +840,10 @@ class VillageEngine:
         if hasattr(self._llm_provider, "disconnect_all"):
             await self._llm_provider.disconnect_all()
 
+        # Close the interpreter's connection pool
+        await self._interpreter_client.close()
+
+        # Write out buffered trace events
+        self._tracer.close()
+
         logger.info("Engine shutdown complete")
@@ -11,10 +11,11 @@ Each phase transforms the context, accumulating effects and events.
 After all phases complete, the engine commits events to storage.
 """
 
-from .context import TickContext, TickResult
+from .context import TickContext, TickContextBuilder, TickResult
 from .pipeline import TickPipeline, Phase, BasePhase, PhaseError, PipelineMetrics
 from .interpreter import (
     NarrativeInterpreter,
+    InterpreterClient,
     AgentTurnResult,
     MutableTurnResult,
     InterpreterError,
@@ -43,6 +44,7 @@ from .phases import (
 __all__ = [
     # Context
     "TickContext",
+    "TickContextBuilder",
     "TickResult",
     # Pipeline
     "TickPipeline",
@@ -52,6 +54,7 @@ __all__ = [
     "PipelineMetrics",
     # Interpreter
     "NarrativeInterpreter",
+    "InterpreterClient",
     "AgentTurnResult",
     "MutableTurnResult",
     "InterpreterError",
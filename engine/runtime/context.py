@@ -5,8 +5,13 @@ The context carries all state needed for a tick and accumulates effects/events
 as phases execute. Each phase returns a new context with updates applied via
 the with_* methods.
 
+Phases that apply many updates at once (one per agent or per effect) should
+use TickContextBuilder instead: it takes the same updates in place and
+freezes into a new TickContext once, rather than copying the context on
+every call.
+
 Design principles:
-- Treat as immutable (use with_* methods to create new instances)
+- Treat as immutable (use with_* methods or a builder to create new instances)
 - Phases read from context, produce effects/events
 - Engine commits changes after all phases complete
 """
@@ -131,6 +136,10 @@ class TickContext(BaseModel):
         """Update the world snapshot in the context."""
         return self.model_copy(update={"world": world})
 
+    def builder(self) -> "TickContextBuilder":
+        """Start a mutable builder seeded from this context."""
+        return TickContextBuilder(self)
+
     # ==========================================================================
     # Query helpers
     # ==========================================================================
@@ -170,6 +179,122 @@ class TickContext(BaseModel):
         ]
 
 
+class TickContextBuilder:
+    """
+    Mutable accumulator for a phase's updates to a TickContext.
+
+    Every with_* method on TickContext copies the whole context, so a phase
+    calling them once per agent or per effect does work quadratic in the
+    size of the tick. The builder holds the same state in plain lists,
+    dicts and sets, applies updates in place, and copies once in build().
+
+    The source context is never modified, so phases keep the immutable
+    contract: they take a TickContext and return a new one.
+
+    Usage:
+        builder = ctx.builder()
+        for effect in effects:
+            builder.add_effect(effect)
+        return builder.build()
+    """
+
+    def __init__(self, ctx: TickContext) -> None:
+        self._base = ctx
+
+        # --- Read-only tick identity ---
+        self.tick = ctx.tick
+        self.timestamp = ctx.timestamp
+        self.time_snapshot = ctx.time_snapshot
+        self.unseen_endings = ctx.unseen_endings
+        self.scheduled_events = ctx.scheduled_events
+
+        # --- Mutable state (copies, so ctx stays untouched) ---
+        self.world = ctx.world
+        self.agents = dict(ctx.agents)
+        self.conversations = dict(ctx.conversations)
+        self.pending_invites = dict(ctx.pending_invites)
+        self.effects = list(ctx.effects)
+        self.events = list(ctx.events)
+        self.turn_results = dict(ctx.turn_results)
+        self.agents_to_act = ctx.agents_to_act
+        self.agents_acted = set(ctx.agents_acted)
+
+    # ==========================================================================
+    # Mutation methods (update in place)
+    # ==========================================================================
+
+    def add_effect(self, effect: Effect) -> None:
+        """Add a single effect."""
+        self.effects.append(effect)
+
+    def add_effects(self, effects: Iterable[Effect]) -> None:
+        """Add multiple effects."""
+        self.effects.extend(effects)
+
+    def add_event(self, event: DomainEvent) -> None:
+        """Add a single domain event."""
+        self.events.append(event)
+
+    def add_events(self, events: Iterable[DomainEvent]) -> None:
+        """Add multiple domain events."""
+        self.events.extend(events)
+
+    def set_turn_result(self, agent: AgentName, result: AgentTurnResult) -> None:
+        """Set the turn result for an agent."""
+        self.turn_results[agent] = result
+
+    def mark_agent_acted(self, agent: AgentName) -> None:
+        """Mark an agent as having acted."""
+        self.agents_acted.add(agent)
+
+    def update_agent(self, agent: AgentSnapshot) -> None:
+        """Update an agent's snapshot."""
+        self.agents[agent.name] = agent
+
+    def update_conversation(self, conv: Conversation) -> None:
+        """Update a conversation."""
+        self.conversations[conv.id] = conv
+
+    def remove_conversation(self, conv_id: ConversationId) -> None:
+        """Remove a conversation, if present."""
+        self.conversations.pop(conv_id, None)
+
+    def add_invite(self, invite: Invitation) -> None:
+        """Add a pending invite."""
+        self.pending_invites[invite.invitee] = invite
+
+    def remove_invite(self, invitee: AgentName) -> None:
+        """Remove a pending invite, if present."""
+        self.pending_invites.pop(invitee, None)
+
+    def update_world(self, world: WorldSnapshot) -> None:
+        """Update the world snapshot."""
+        self.world = world
+
+    # ==========================================================================
+    # Finishing
+    # ==========================================================================
+
+    def build(self) -> TickContext:
+        """
+        Freeze the accumulated state into a new TickContext.
+
+        The builder can keep being used afterwards; later updates don't
+        leak into contexts already built.
+        """
+        return self._base.model_copy(update={
+            "world": self.world,
+            "agents": dict(self.agents),
+            "conversations": dict(self.conversations),
+            "pending_invites": dict(self.pending_invites),
+            "effects": tuple(self.effects),
+            "events": tuple(self.events),
+            "turn_results": dict(self.turn_results),
+            "agents_to_act": self.agents_to_act,
+            "agents_acted": frozenset(self.agents_acted),
+        })
+
+
 class TickResult(BaseModel):
     """
     Result of executing a tick.
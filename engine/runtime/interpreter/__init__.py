@@ -15,8 +15,8 @@ from dataclasses import dataclass
 from typing import Any
 
 import anthropic
-from langsmith.wrappers import wrap_anthropic
 
+from .client import InterpreterClient
 from .result import AgentTurnResult, MutableTurnResult
 from .registry import (
     OBSERVATION_REGISTRY,
@@ -89,7 +89,7 @@ class NarrativeInterpreter:
         present_agents: list[str],
         conversation_participants: list[str] | None = None,
         conversation_history: list[dict] | None = None,
-        client: anthropic.AsyncAnthropic | None = None,
+        client: InterpreterClient | anthropic.AsyncAnthropic | None = None,
         model: str = "claude-haiku-4-5-20251001",
     ):
         """
@@ -101,7 +101,8 @@ class NarrativeInterpreter:
             present_agents: Other agents at this location
             conversation_participants: Participants in the current conversation (if any)
             conversation_history: Last N turns of conversation [{speaker, narrative}]
-            client: Anthropic client (creates one if not provided)
+            client: Client to send requests through (normally the engine's
+                shared InterpreterClient; a private one if not provided)
             model: Model to use for interpretation (default: Haiku)
         """
         self.current_location = current_location
@@ -109,8 +110,7 @@ class NarrativeInterpreter:
         self.present_agents = present_agents
         self.conversation_participants = conversation_participants
         self.conversation_history = conversation_history
-        # Wrap with LangSmith for automatic tracing (if LANGSMITH_TRACING=true)
-        self.client = client or wrap_anthropic(anthropic.AsyncAnthropic())
+        self.client = client or InterpreterClient()
         self.model = model
 
         self.context = InterpreterContext(
@@ -295,6 +295,7 @@ Read this narrative and use your tools to report what you observed."""
 
 __all__ = [
     "NarrativeInterpreter",
+    "InterpreterClient",
     "AgentTurnResult",
     "MutableTurnResult",
     "InterpreterError",
@@ -0,0 +1,125 @@
+"""
+InterpreterClient - the engine's concurrency-limited Haiku client.
+
+Every interpreter call in a tick goes through one InterpreterClient owned by
+the engine, so a burst of turns shares one connection pool, never has more
+than max_concurrency requests in flight, and rides out transient API errors
+(connection, 429, 5xx) with full-jitter exponential backoff.
+
+The underlying AsyncAnthropic client is created on first use and recreated
+if the client is later used from a different event loop, since its
+connection pool is bound to the loop that opened it.
+"""
+
+import asyncio
+import logging
+import random
+from typing import Any, Awaitable, Callable
+
+import anthropic
+from langsmith.wrappers import wrap_anthropic
+
+
+logger = logging.getLogger(__name__)
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether an API error is transient and worth retrying."""
+    if isinstance(error, (anthropic.APIConnectionError, anthropic.RateLimitError)):
+        return True
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code >= 500
+    return False
+
+
+class InterpreterClient:
+    """
+    Shared front for interpreter requests: ``await client.messages.create(...)``.
+
+    Stands in for anthropic.AsyncAnthropic wherever NarrativeInterpreter
+    takes a client. The wrapped client is created with its own retries
+    disabled so they don't multiply with ours.
+    """
+
+    def __init__(
+        self,
+        client: anthropic.AsyncAnthropic | None = None,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        rng: Callable[[], float] = random.random,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            client: Anthropic client to use (created lazily per event loop if None)
+            max_concurrency: Maximum simultaneous requests
+            max_retries: Retries after the first attempt for transient errors
+            base_delay: Backoff ceiling (seconds) for the first retry
+            max_delay: Largest backoff ceiling (seconds)
+            sleep: Sleep function, injectable for tests
+            rng: Uniform [0, 1) source for jitter, injectable for tests
+        """
+        self._injected = client
+        self._client: anthropic.AsyncAnthropic | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_retries = max_retries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._sleep = sleep
+        self._rng = rng
+
+    @property
+    def messages(self) -> "InterpreterClient":
+        """Mirror ``client.messages`` so this can stand in for a client."""
+        return self
+
+    async def create(self, **kwargs: Any) -> Any:
+        """
+        Send a messages.create request, capped and retried.
+
+        Args:
+            **kwargs: Arguments for ``AsyncAnthropic.messages.create``
+
+        Raises:
+            anthropic.APIError: If the request fails after all retries
+        """
+        client = self._client_for_running_loop()
+        attempt = 0
+        while True:
+            async with self._semaphore:
+                try:
+                    return await client.messages.create(**kwargs)
+                except Exception as e:
+                    error = e
+
+            if attempt >= self._max_retries or not is_retryable(error):
+                raise error
+
+            attempt += 1
+            delay = self._rng() * min(self._max_delay, self._base_delay * 2 ** (attempt - 1))
+            logger.debug(f"Interpreter request failed ({error!r}); retry {attempt} in {delay:.2f}s")
+            await self._sleep(delay)
+
+    async def close(self) -> None:
+        """Close the underlying client's connections (if we created it)."""
+        client, self._client, self._loop = self._client, None, None
+        if client is not None and client is not self._injected:
+            await client.close()
+
+    def _client_for_running_loop(self) -> anthropic.AsyncAnthropic:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Pools and semaphores from another loop can't be used on this one
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._client = None
+        if self._client is None:
+            # Wrap with LangSmith for automatic tracing (if LANGSMITH_TRACING=true)
+            self._client = self._injected or wrap_anthropic(anthropic.AsyncAnthropic(max_retries=0))
+        return self._client
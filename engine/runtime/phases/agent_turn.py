@@ -569,7 +569,7 @@ class AgentTurnPhase(BasePhase):
         )
 
         # Process results
-        new_ctx = ctx
+        builder = ctx.builder()
         for (agent_name, _), result in zip(tasks, results):
             if isinstance(result, Exception):
                 logger.error(f"Turn failed for {agent_name}: {result}")
@@ -587,15 +587,15 @@ class AgentTurnPhase(BasePhase):
             agent = ctx.agents.get(agent_name)
             agent_location = agent.location if agent else None
 
-            new_ctx = new_ctx.with_turn_result(agent_name, agent_turn_result)
-            new_ctx = new_ctx.with_effects(turn_result.effects)
+            builder.set_turn_result(agent_name, agent_turn_result)
+            builder.add_effects(turn_result.effects)
             if agent_location:
-                new_ctx = new_ctx.with_effect(UpdateLastActiveTickEffect(agent=agent_name, location=agent_location))
-            new_ctx = new_ctx.with_agent_acted(agent_name)
+                builder.add_effect(UpdateLastActiveTickEffect(agent=agent_name, location=agent_location))
+            builder.mark_agent_acted(agent_name)
 
             # Emit token usage effect if we have usage data
             if turn_result.token_usage:
-                new_ctx = new_ctx.with_effect(RecordAgentTokenUsageEffect(
+                builder.add_effect(RecordAgentTokenUsageEffect(
                     agent=agent_name,
                     input_tokens=turn_result.token_usage.input_tokens,
                     output_tokens=turn_result.token_usage.output_tokens,
@@ -607,7 +607,7 @@ class AgentTurnPhase(BasePhase):
             # Mark unseen conversation endings as seen
             unseen_endings = ctx.unseen_endings.get(agent_name, [])
             for ending in unseen_endings:
-                new_ctx = new_ctx.with_effect(ConversationEndingSeenEffect(
+                builder.add_effect(ConversationEndingSeenEffect(
                     agent=agent_name,
                     conversation_id=ending.conversation_id,
                 ))
@@ -620,7 +620,7 @@ class AgentTurnPhase(BasePhase):
                 if tokens >= PRE_SLEEP_THRESHOLD:  # 100K - lower threshold
                     # Emit ShouldCompactEffect for ApplyEffectsPhase to handle
                     # critical=True if >= 150K (must compact), False if 100K-150K (pre-sleep)
-                    new_ctx = new_ctx.with_effect(ShouldCompactEffect(
+                    builder.add_effect(ShouldCompactEffect(
                         agent=agent_name,
                         pre_tokens=tokens,
                         critical=tokens >= CRITICAL_THRESHOLD,
@@ -630,8 +630,8 @@ class AgentTurnPhase(BasePhase):
                         f"tokens={tokens} | critical={tokens >= CRITICAL_THRESHOLD}"
                     )
 
-        logger.info(f"Executed {len(new_ctx.agents_acted)} agent turns")
-        return new_ctx
+        logger.info(f"Executed {len(builder.agents_acted)} agent turns")
+        return builder.build()
 
     async def _execute_agent_turn(
         self,
@@ -651,13 +651,14 @@ class AgentTurnPhase(BasePhase):
                 ensure_agent_directory,
                 ensure_shared_directories,
                 sync_shared_files_in,
-                sync_shared_files_out,
             )
 
             ensure_shared_directories(self._village_root)
             agent_dir = ensure_agent_directory(agent.name, self._village_root)
             shared_master_dir = self._village_root / "shared"
-            shared_files = sync_shared_files_in(
+            # File I/O runs off the event loop so parallel turns don't queue on it
+            shared_files = await asyncio.to_thread(
+                sync_shared_files_in,
                 agent_dir,
                 str(start_location),
                 shared_master_dir,
@@ -696,7 +697,8 @@ class AgentTurnPhase(BasePhase):
             if agent_dir and shared_master_dir:
                 from engine.services import sync_shared_files_out
 
-                sync_shared_files_out(
+                await asyncio.to_thread(
+                    sync_shared_files_out,
                     agent_dir,
                     str(start_location),
                     shared_master_dir,
@@ -90,7 +90,7 @@ from engine.domain import (
     InterpreterTokenUsageRecordedEvent,
     SessionTokensResetEvent,
 )
-from engine.runtime.context import TickContext
+from engine.runtime.context import TickContext, TickContextBuilder
 from engine.runtime.pipeline import BasePhase
 
 
@@ -104,7 +104,7 @@ class ApplyEffectsPhase(BasePhase):
     This phase:
     - Processes effects in order
     - Creates domain events for each effect
-    - Updates context state (for subsequent effect processing)
+    - Updates context state in a builder (for subsequent effect processing)
     - Handles conversation lifecycle (create on accept, end on leave)
     - Handles compaction (ShouldCompactEffect -> CompactionService -> DidCompactEvent)
 
@@ -227,26 +227,24 @@ class ApplyEffectsPhase(BasePhase):
         Since ApplyEffectsPhase doesn't do any I/O, all work is synchronous.
         This method can be called directly without needing an event loop.
         """
-        events: list[DomainEvent] = []
-        new_ctx = ctx
+        builder = ctx.builder()
 
         for effect in ctx.effects:
-            event_list, new_ctx = self._apply_effect(effect, new_ctx)
-            events.extend(event_list)
+            builder.add_events(self._apply_effect(effect, builder))
 
         # Expire any pending invites that have passed their deadline
-        expired_events, new_ctx = self._expire_invites(new_ctx)
-        events.extend(expired_events)
+        builder.add_events(self._expire_invites(builder))
 
-        logger.debug(f"Applied {len(ctx.effects)} effects, produced {len(events)} events")
-        return new_ctx.with_events(events)
+        produced = len(builder.events) - len(ctx.events)
+        logger.debug(f"Applied {len(ctx.effects)} effects, produced {produced} events")
+        return builder.build()
 
     def _apply_effect(
         self,
         effect: Effect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
-        """Apply a single effect and return events + updated context."""
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
+        """Apply a single effect to the builder and return its events."""
         match effect:
             case MoveAgentEffect():
                 return self._apply_move(effect, ctx)
@@ -288,7 +286,7 @@ class ApplyEffectsPhase(BasePhase):
                 return self._apply_conversation_ending_seen(effect, ctx)
             case ShouldCompactEffect():
                 # Handled asynchronously in _execute, skip here
-                return [], ctx
+                return []
             case RecordAgentTokenUsageEffect():
                 return self._apply_agent_token_usage(effect, ctx)
             case RecordInterpreterTokenUsageEffect():
@@ -297,7 +295,7 @@ class ApplyEffectsPhase(BasePhase):
                 return self._apply_reset_session_tokens(effect, ctx)
             case _:
                 logger.warning(f"Unknown effect type: {type(effect)}")
-                return [], ctx
+                return []
 
     # =========================================================================
     # Agent effects
@@ -306,12 +304,12 @@ class ApplyEffectsPhase(BasePhase):
     def _apply_move(
         self,
         effect: MoveAgentEffect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Apply agent movement."""
         agent = ctx.agents.get(effect.agent)
         if not agent:
-            return [], ctx
+            return []
 
         # Update agent location
         new_agent = AgentSnapshot(**{
@@ -327,17 +325,18 @@ class ApplyEffectsPhase(BasePhase):
             to_location=effect.to_location,
         )
 
-        return [event], ctx.with_updated_agent(new_agent)
+        ctx.update_agent(new_agent)
+        return [event]
 
     def _apply_mood(
         self,
         effect: UpdateMoodEffect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Apply mood change."""
         agent = ctx.agents.get(effect.agent)
         if not agent:
-            return [], ctx
+            return []
 
         old_mood = agent.mood
         new_agent = AgentSnapshot(**{
@@ -353,22 +352,23 @@ class ApplyEffectsPhase(BasePhase):
             new_mood=effect.mood,
         )
 
-        return [event], ctx.with_updated_agent(new_agent)
+        ctx.update_agent(new_agent)
+        return [event]
 
     def _apply_energy(
         self,
         effect: UpdateEnergyEffect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Apply energy change."""
         agent = ctx.agents.get(effect.agent)
         if not agent:
-            return [], ctx
+            return []
 
         old_energy = agent.energy
         new_energy_value = max(0, min(100, effect.energy))
         if new_energy_value == old_energy:
-            return [], ctx
+            return []
 
         new_agent = AgentSnapshot(**{
             **agent.model_dump(),
@@ -383,17 +383,18 @@ class ApplyEffectsPhase(BasePhase):
             new_energy=new_energy_value,
         )
 
-        return [event], ctx.with_updated_agent(new_agent)
+        ctx.update_agent(new_agent)
+        return [event]
 
     def _apply_action(
         self,
         effect: RecordActionEffect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Record an action (produces event, no state change)."""
         agent = ctx.agents.get(effect.agent)
         if not agent:
-            return [], ctx
+            return []
 
         event = AgentActionEvent(
             tick=ctx.tick,
@@ -403,17 +404,17 @@ class ApplyEffectsPhase(BasePhase):
             description=effect.description,
         )
 
-        return [event], ctx
+        return [event]
 
     def _apply_sleep(
         self,
         effect: AgentSleepEffect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Apply agent going to sleep."""
         agent = ctx.agents.get(effect.agent)
         if not agent:
-            return [], ctx
+            return []
 
         new_agent = AgentSnapshot(**{
             **agent.model_dump(),
@@ -429,17 +430,18 @@ class ApplyEffectsPhase(BasePhase):
             location=agent.location,
         )
 
-        return [event], ctx.with_updated_agent(new_agent)
+        ctx.update_agent(new_agent)
+        return [event]
 
     def _apply_wake(
         self,
         effect: AgentWakeEffect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Apply agent waking up."""
         agent = ctx.agents.get(effect.agent)
         if not agent:
-            return [], ctx
+            return []
 
         new_agent = AgentSnapshot(**{
             **agent.model_dump(),
@@ -456,22 +458,23 @@ class ApplyEffectsPhase(BasePhase):
             reason=effect.reason or "phase_check",
         )
 
-        return [event], ctx.with_updated_agent(new_agent)
+        ctx.update_agent(new_agent)
+        return [event]
 
     def _apply_last_active_tick(
         self,
         effect: UpdateLastActiveTickEffect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Update the agent's last active tick."""
         agent = ctx.agents.get(effect.agent)
         if not agent:
-            return [], ctx
+            return []
 
         old_tick = agent.last_active_tick
         new_tick = ctx.tick
         if new_tick == old_tick:
-            return [], ctx
+            return []
 
         new_agent = AgentSnapshot(**{
             **agent.model_dump(),
@@ -487,24 +490,25 @@ class ApplyEffectsPhase(BasePhase):
             new_last_active_tick=new_tick,
         )
 
-        return [event], ctx.with_updated_agent(new_agent)
+        ctx.update_agent(new_agent)
+        return [event]
 
     def _apply_session_id(
         self,
         effect: UpdateSessionIdEffect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Update the agent's SDK session ID."""
         agent = ctx.agents.get(effect.agent)
         if not agent:
-            return [], ctx
+            return []
 
         old_session_id = agent.session_id
         new_session_id = effect.session_id
 
         # Don't emit event if unchanged
         if new_session_id == old_session_id:
-            return [], ctx
+            return []
 
         new_agent = AgentSnapshot(**{
             **agent.model_dump(),
@@ -519,7 +523,8 @@ class ApplyEffectsPhase(BasePhase):
             new_session_id=new_session_id,
         )
 
-        return [event], ctx.with_updated_agent(new_agent)
+        ctx.update_agent(new_agent)
+        return [event]
 
     # =========================================================================
     # Conversation effects
@@ -528,8 +533,8 @@ class ApplyEffectsPhase(BasePhase):
     def _apply_invite(
         self,
         effect: InviteToConversationEffect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Create a conversation invitation."""
         # Check if inviter is already in a conversation at this location
         # If so, invite to that existing conversation instead of creating a new one
@@ -568,17 +573,18 @@ class ApplyEffectsPhase(BasePhase):
             privacy=effect.privacy,
         )
 
-        return [event], ctx.with_added_invite(invitation)
+        ctx.add_invite(invitation)
+        return [event]
 
     def _apply_accept(
         self,
         effect: AcceptInviteEffect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Accept an invitation (creates conversation if first accept)."""
         invite = ctx.pending_invites.get(effect.agent)
         if not invite or invite.conversation_id != effect.conversation_id:
-            return [], ctx
+            return []
 
         events: list[DomainEvent] = []
 
@@ -623,7 +629,7 @@ class ApplyEffectsPhase(BasePhase):
                     narrative=effect.first_message,
                 ))
 
-            new_ctx = ctx.with_updated_conversation(conv)
+            ctx.update_conversation(conv)
         else:
             # Conversation already exists - join it
             existing_conv = ctx.conversations[effect.conversation_id]
@@ -651,21 +657,21 @@ class ApplyEffectsPhase(BasePhase):
                     narrative=effect.first_message,
                 ))
 
-            new_ctx = ctx.with_updated_conversation(updated_conv)
+            ctx.update_conversation(updated_conv)
 
-        new_ctx = new_ctx.with_removed_invite(effect.agent)
+        ctx.remove_invite(effect.agent)
 
-        return events, new_ctx
+        return events
 
     def _apply_decline(
         self,
         effect: DeclineInviteEffect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Decline an invitation."""
         invite = ctx.pending_invites.get(effect.agent)
         if not invite or invite.conversation_id != effect.conversation_id:
-            return [], ctx
+            return []
 
         event = ConversationInviteDeclinedEvent(
             tick=ctx.tick,
@@ -675,17 +681,18 @@ class ApplyEffectsPhase(BasePhase):
             invitee=effect.agent,
         )
 
-        return [event], ctx.with_removed_invite(effect.agent)
+        ctx.remove_invite(effect.agent)
+        return [event]
 
     def _apply_expire(
         self,
         effect: ExpireInviteEffect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Handle invitation expiry."""
         invite = ctx.pending_invites.get(effect.invitee)
         if not invite or invite.conversation_id != effect.conversation_id:
-            return [], ctx
+            return []
 
         event = ConversationInviteExpiredEvent(
             tick=ctx.tick,
@@ -695,17 +702,18 @@ class ApplyEffectsPhase(BasePhase):
             invitee=effect.invitee,
         )
 
-        return [event], ctx.with_removed_invite(effect.invitee)
+        ctx.remove_invite(effect.invitee)
+        return [event]
 
     def _apply_join(
         self,
         effect: JoinConversationEffect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Join a public conversation."""
         conv = ctx.conversations.get(effect.conversation_id)
         if not conv:
-            return [], ctx
+            return []
 
         # Add participant
         new_conv = Conversation(**{
@@ -732,17 +740,18 @@ class ApplyEffectsPhase(BasePhase):
                 narrative=effect.first_message,
             ))
 
-        return events, ctx.with_updated_conversation(new_conv)
+        ctx.update_conversation(new_conv)
+        return events
 
     def _apply_leave(
         self,
         effect: LeaveConversationEffect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Leave a conversation (may end it if < 2 remain)."""
         conv = ctx.conversations.get(effect.conversation_id)
         if not conv or effect.agent not in conv.participants:
-            return [], ctx
+            return []
 
         events: list[DomainEvent] = []
         new_participants = conv.participants - {effect.agent}
@@ -789,7 +798,8 @@ class ApplyEffectsPhase(BasePhase):
                         final_message=effect.last_message,
                     ))
 
-            return events, ctx.with_removed_conversation(conv.id)
+            ctx.remove_conversation(conv.id)
+            return events
         else:
             # Update conversation
             new_conv = Conversation(**{
@@ -797,27 +807,27 @@ class ApplyEffectsPhase(BasePhase):
                 "participants": new_participants,
             })
 
-            return events, ctx.with_updated_conversation(new_conv)
+            ctx.update_conversation(new_conv)
+            return events
 
     def _apply_move_conversation(
         self,
         effect: MoveConversationEffect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Apply conversation move - moves all participants to new location."""
         conv = ctx.conversations.get(effect.conversation_id)
         if not conv:
-            return [], ctx
+            return []
 
         from_location = conv.location
         to_location = effect.to_location
 
         events: list[DomainEvent] = []
-        new_ctx = ctx
 
         # Move each participant
         for participant in conv.participants:
-            agent = new_ctx.agents.get(participant)
+            agent = ctx.agents.get(participant)
             if not agent:
                 continue
 
@@ -836,7 +846,7 @@ class ApplyEffectsPhase(BasePhase):
                 **agent.model_dump(),
                 "location": to_location,
             })
-            new_ctx = new_ctx.with_updated_agent(new_agent)
+            ctx.update_agent(new_agent)
 
         # Create conversation moved event
         conv_moved_event = ConversationMovedEvent(
@@ -855,19 +865,19 @@ class ApplyEffectsPhase(BasePhase):
             **conv.model_dump(),
             "location": to_location,
         })
-        new_ctx = new_ctx.with_updated_conversation(new_conv)
+        ctx.update_conversation(new_conv)
 
-        return events, new_ctx
+        return events
 
     def _apply_conv_turn(
         self,
         effect: AddConversationTurnEffect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Add a turn to a conversation."""
         conv = ctx.conversations.get(effect.conversation_id)
         if not conv:
-            return [], ctx
+            return []
 
         turn = ConversationTurn(
             speaker=effect.speaker,
@@ -892,17 +902,18 @@ class ApplyEffectsPhase(BasePhase):
             narrative_with_tools=effect.narrative_with_tools,
         )
 
-        return [event], ctx.with_updated_conversation(new_conv)
+        ctx.update_conversation(new_conv)
+        return [event]
 
     def _apply_set_next_speaker(
         self,
         effect: SetNextSpeakerEffect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Set the next speaker for a conversation."""
         conv = ctx.conversations.get(effect.conversation_id)
         if not conv or effect.speaker not in conv.participants:
-            return [], ctx
+            return []
 
         new_conv = Conversation(**{
             **conv.model_dump(),
@@ -916,17 +927,18 @@ class ApplyEffectsPhase(BasePhase):
             next_speaker=effect.speaker,
         )
 
-        return [event], ctx.with_updated_conversation(new_conv)
+        ctx.update_conversation(new_conv)
+        return [event]
 
     def _apply_end_conversation(
         self,
         effect: EndConversationEffect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Explicitly end a conversation."""
         conv = ctx.conversations.get(effect.conversation_id)
         if not conv:
-            return [], ctx
+            return []
 
         event = ConversationEndedEvent(
             tick=ctx.tick,
@@ -937,13 +949,14 @@ class ApplyEffectsPhase(BasePhase):
             summary="",  # Would generate summary here
         )
 
-        return [event], ctx.with_removed_conversation(conv.id)
+        ctx.remove_conversation(conv.id)
+        return [event]
 
     def _apply_conversation_ending_seen(
         self,
         effect: ConversationEndingSeenEffect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Mark a conversation ending as seen by an agent."""
         event = ConversationEndingSeenEvent(
             tick=ctx.tick,
@@ -952,7 +965,7 @@ class ApplyEffectsPhase(BasePhase):
             conversation_id=effect.conversation_id,
         )
 
-        return [event], ctx
+        return [event]
 
     # =========================================================================
     # Invite expiry
@@ -960,11 +973,10 @@ class ApplyEffectsPhase(BasePhase):
 
     def _expire_invites(
         self,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Expire any invites past their deadline."""
         events: list[DomainEvent] = []
-        new_ctx = ctx
 
         for invitee, invite in list(ctx.pending_invites.items()):
             if invite.expires_at_tick <= ctx.tick:
@@ -976,12 +988,12 @@ class ApplyEffectsPhase(BasePhase):
                     invitee=invite.invitee,
                 ))
 
-                new_ctx = new_ctx.with_removed_invite(invitee)
+                ctx.remove_invite(invitee)
 
         if events:
             logger.debug(f"Expired {len(events)} invites")
 
-        return events, new_ctx
+        return events
 
     # =========================================================================
     # Token usage effects
@@ -990,12 +1002,12 @@ class ApplyEffectsPhase(BasePhase):
     def _apply_agent_token_usage(
         self,
         effect: RecordAgentTokenUsageEffect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Record token usage from an agent turn."""
         agent = ctx.agents.get(effect.agent)
         if not agent:
-            return [], ctx
+            return []
 
         old_usage = agent.token_usage
 
@@ -1038,13 +1050,14 @@ class ApplyEffectsPhase(BasePhase):
             ),
         )
 
-        return [event], ctx.with_updated_agent(new_agent)
+        ctx.update_agent(new_agent)
+        return [event]
 
     def _apply_interpreter_token_usage(
         self,
         effect: RecordInterpreterTokenUsageEffect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Record token usage from interpreter call (system overhead)."""
         old_usage = ctx.world.interpreter_usage
 
@@ -1069,17 +1082,18 @@ class ApplyEffectsPhase(BasePhase):
             ),
         )
 
-        return [event], ctx.with_updated_world(new_world)
+        ctx.update_world(new_world)
+        return [event]
 
     def _apply_reset_session_tokens(
         self,
         effect: ResetSessionTokensEffect,
-        ctx: TickContext,
-    ) -> tuple[list[DomainEvent], TickContext]:
+        ctx: TickContextBuilder,
+    ) -> list[DomainEvent]:
         """Reset session tokens after compaction."""
         agent = ctx.agents.get(effect.agent)
         if not agent:
-            return [], ctx
+            return []
 
         old_usage = agent.token_usage
 
@@ -1107,4 +1121,5 @@ class ApplyEffectsPhase(BasePhase):
             new_session_tokens=effect.new_session_tokens,
         )
 
-        return [event], ctx.with_updated_agent(new_agent)
+        ctx.update_agent(new_agent)
+        return [event]
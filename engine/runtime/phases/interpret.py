@@ -26,7 +26,12 @@ from engine.domain import (
 )
 from engine.runtime.context import TickContext
 from engine.runtime.pipeline import BasePhase
-from engine.runtime.interpreter import NarrativeInterpreter, AgentTurnResult, InterpreterTokenUsage
+from engine.runtime.interpreter import (
+    NarrativeInterpreter,
+    AgentTurnResult,
+    InterpreterClient,
+    InterpreterTokenUsage,
+)
 
 from typing import TYPE_CHECKING
 
@@ -51,8 +56,16 @@ class InterpretPhase(BasePhase):
     These observations are stored in turn_results and converted to effects.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, client: InterpreterClient | None = None) -> None:
+        """
+        Initialize the phase.
+
+        Args:
+            client: Client shared by every interpreter call (a private one
+                if not provided)
+        """
         super().__init__()
+        self._client = client or InterpreterClient()
         self._tracer: "VillageTracer | None" = None
 
     def set_tracer(self, tracer: "VillageTracer") -> None:
@@ -86,7 +99,7 @@ class InterpretPhase(BasePhase):
         )
 
         # Process results
-        new_ctx = ctx
+        builder = ctx.builder()
         for (agent_name, _), result in zip(tasks, results):
             if isinstance(result, Exception):
                 logger.error(f"Interpretation failed for {agent_name}: {result}")
@@ -95,12 +108,12 @@ class InterpretPhase(BasePhase):
             interpreted_result, effects, token_usage = result
 
             # Update turn result with interpreted data
-            new_ctx = new_ctx.with_turn_result(agent_name, interpreted_result)
-            new_ctx = new_ctx.with_effects(effects)
+            builder.set_turn_result(agent_name, interpreted_result)
+            builder.add_effects(effects)
 
             # Emit interpreter token usage effect (system overhead)
             if token_usage:
-                new_ctx = new_ctx.with_effect(RecordInterpreterTokenUsageEffect(
+                builder.add_effect(RecordInterpreterTokenUsageEffect(
                     input_tokens=token_usage.input_tokens,
                     output_tokens=token_usage.output_tokens,
                 ))
@@ -112,7 +125,7 @@ class InterpretPhase(BasePhase):
                 )
 
         logger.debug(f"Interpreted {len(ctx.turn_results)} narratives")
-        return new_ctx
+        return builder.build()
 
     async def _interpret_turn(
         self,
@@ -165,6 +178,7 @@ class InterpretPhase(BasePhase):
             present_agents=present_agents,
             conversation_participants=conversation_participants,
             conversation_history=conversation_history,
+            client=self._client,
         )
 
         # Run interpretation
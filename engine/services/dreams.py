@@ -2,19 +2,30 @@
 Dream storage and retrieval for ClaudeVille (engine).
 
 Dreams are stored separately from journals in an agent-specific dreams directory.
+Each dream file is named after its tick ("tick-0000000042_<timestamp>.md"), so
+finding unseen dreams only opens the files it returns.
 """
 
 from __future__ import annotations
 
 from datetime import datetime
 import logging
+import os
 from pathlib import Path
+import re
 
 from .shared_files import ensure_agent_directory
 
 
 logger = logging.getLogger(__name__)
 
+_DREAM_FILE_RE = re.compile(r"^tick-(-?\d+)_")
+
+# Legacy files without a [tick:N] header can never be unseen; they're renamed
+# with this prefix so they aren't opened again
+_UNTIMED_PREFIX = "untimed_"
+
+
 def append_dream(
     agent_name: str,
     content: str,
@@ -33,7 +44,7 @@ def append_dream(
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     entry = _format_dream_entry(content)
     file_content = f"[tick:{tick}]\n{entry}"
-    dream_file = dreams_dir / f"{timestamp}.md"
+    dream_file = dreams_dir / _dream_file_name(tick, timestamp)
 
     with open(dream_file, "w") as f:
         f.write(file_content)
@@ -49,22 +60,54 @@ def append_dream(
 
 def get_unseen_dreams(agent_dir: Path, last_active_tick: int) -> list[str]:
     """
-    Return dreams with tick > last active tick.
+    Return dreams with tick > last active tick, oldest first.
+
+    Ticks are read from file names, so only unseen dreams are opened.
+    Dream files from before tick-prefixed names are renamed on first sight.
     """
     dreams_dir = agent_dir / "dreams"
     if not dreams_dir.exists():
         return []
 
-    unseen: list[str] = []
-
-    for dream_file in sorted(dreams_dir.glob("*.md")):
-        tick, content = _read_dream_entry(dream_file)
-        if tick is None:
-            continue
+    with os.scandir(dreams_dir) as entries:
+        names = [
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".md")
+            and not entry.name.startswith(_UNTIMED_PREFIX)
+            and entry.is_file()
+        ]
+
+    unseen: list[tuple[int, str]] = []
+    for name in names:
+        match = _DREAM_FILE_RE.match(name)
+        if match is None:
+            migrated = _migrate_dream_file(dreams_dir / name)
+            if migrated is None:
+                continue
+            name = migrated
+            match = _DREAM_FILE_RE.match(name)
+        tick = int(match.group(1))
         if tick > last_active_tick:
-            unseen.append(content)
+            unseen.append((tick, name))
+
+    return [_read_dream_entry(dreams_dir / name)[1] for _, name in sorted(unseen)]
+
+
+def _dream_file_name(tick: int, stem: str) -> str:
+    return f"tick-{tick:010d}_{stem}.md"
+
 
-    return unseen
+def _migrate_dream_file(path: Path) -> str | None:
+    """Rename a legacy dream file to carry its tick; return the new name."""
+    tick, _ = _read_dream_entry(path)
+    if tick is None:
+        new_path = path.with_name(f"{_UNTIMED_PREFIX}{path.name}")
+    else:
+        new_path = path.with_name(_dream_file_name(tick, path.stem))
+    path.rename(new_path)
+    logger.debug("DREAM_MIGRATE | %s -> %s", path.name, new_path.name)
+    return new_path.name if tick is not None else None
 
 
 def _format_dream_entry(content: str) -> str:
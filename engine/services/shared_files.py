@@ -2,13 +2,25 @@
 Shared files management for ClaudeVille (engine).
 
 Copies location-based shared files into an agent's ./shared/ directory
-before a turn, and syncs them back out afterward.
+before a turn, and syncs them back out afterward. Both directions are
+incremental: only files that changed since the last sync are copied.
 """
 
 from pathlib import Path
+from typing import Any
+import hashlib
+import json
 import logging
+import os
 import re
 import shutil
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 
 logger = logging.getLogger(__name__)
@@ -72,38 +84,70 @@ def sync_shared_files_in(
     master_dir: Path,
 ) -> list[str]:
     """
-    Copy shared files INTO agent's directory before their turn.
+    Bring agent's ./shared/ directory up to date with master before their turn.
+
+    The agent's copy is kept between turns, so only files whose size or
+    mtime differ from the last sync are copied; files gone from master and
+    directories for other locations are removed. What the agent was handed
+    is recorded in a manifest that sync_shared_files_out() diffs against.
+
+    Blocking; call it via asyncio.to_thread() from async code.
 
-    Returns a list of relative file paths copied (for context prompt).
+    Returns a list of relative file paths available (for context prompt).
     """
     master_dir.mkdir(parents=True, exist_ok=True)
     shared_dir = agent_dir / "shared"
-
-    if shared_dir.exists():
-        shutil.rmtree(shared_dir)
     shared_dir.mkdir(exist_ok=True)
 
-    copied_files: list[str] = []
-    for subdir in get_shared_dirs_for_location(location):
-        src = master_dir / subdir
-        dst = shared_dir / subdir
+    subdirs = get_shared_dirs_for_location(location)
+    for child in shared_dir.iterdir():
+        if child.name not in subdirs:
+            _remove(child)
 
-        if src.exists() and src.is_dir():
-            shutil.copytree(src, dst)
+    old_manifest = _load_manifest(agent_dir)
+    manifest: dict[str, dict[str, Any]] = {}
+    files_copied = 0
 
-            for f in dst.rglob("*"):
-                if f.is_file():
-                    rel_path = f.relative_to(agent_dir)
-                    copied_files.append(str(rel_path))
+    for subdir in subdirs:
+        src = master_dir / subdir
+        dst = shared_dir / subdir
 
-    if copied_files:
+        if not src.is_dir():
+            _remove(dst)
+            continue
+
+        with _master_lock(src):
+            master_files = _list_files(src)
+            for rel, path in _list_files(dst).items():
+                if rel not in master_files:
+                    path.unlink()
+
+            for rel, master_file in master_files.items():
+                key = f"{subdir}/{rel}"
+                target = dst / rel
+                master_stat = master_file.stat()
+                entry = old_manifest.get(key)
+                if entry is not None and _is_unchanged(entry, master_file, master_stat, target):
+                    if entry["racy"]:
+                        entry = _manifest_entry(entry["hash"], target, master_stat)
+                    manifest[key] = entry
+                    continue
+
+                _copy_file(master_file, target)
+                manifest[key] = _manifest_entry(_hash_file(target), target, master_stat)
+                files_copied += 1
+
+    _save_manifest(agent_dir, manifest)
+
+    if files_copied:
         logger.debug(
-            "sync_shared_files_in | location=%s | files=%d",
+            "sync_shared_files_in | location=%s | files=%d | copied=%d",
             location,
-            len(copied_files),
+            len(manifest),
+            files_copied,
         )
 
-    return sorted(copied_files)
+    return sorted(f"shared/{key}" for key in manifest)
 
 
 def sync_shared_files_out(
@@ -112,41 +156,219 @@ def sync_shared_files_out(
     master_dir: Path,
 ) -> None:
     """
-    Copy modified shared files FROM agent's directory back to master.
+    Copy files the agent changed FROM agent's directory back to master.
 
-    Uses the location from turn start, not current location.
+    Uses the location from turn start, not current location. A file counts
+    as changed when its content hash differs from what sync_shared_files_in()
+    handed the agent (size and mtime are checked first, so untouched files
+    are never read). Files the agent deleted are deleted from master.
+
+    Merge rule when agents at the same location edit concurrently: whoever
+    syncs out first wins the path. If master no longer matches the version
+    this agent started from, the agent's version is written next to it as
+    "<name>.conflict-<agent><suffix>" instead, so neither edit is lost.
+    Likewise a delete is skipped if master changed in the meantime.
+
+    Blocking; call it via asyncio.to_thread() from async code.
     """
     shared_dir = agent_dir / "shared"
     if not shared_dir.exists():
         return
 
+    manifest = _load_manifest(agent_dir)
+    agent_name = agent_dir.name
     files_synced = 0
+    files_deleted = 0
+    conflicts = 0
+
     for subdir in get_shared_dirs_for_location(location):
         src = shared_dir / subdir
         dst = master_dir / subdir
-
-        if src.exists() and src.is_dir():
-            dst.mkdir(parents=True, exist_ok=True)
-
-            for f in src.rglob("*"):
-                if f.is_file():
-                    rel = f.relative_to(src)
-                    target = dst / rel
-                    target.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(f, target)
-                    files_synced += 1
-
-    if shared_dir.exists():
-        shutil.rmtree(shared_dir)
-
-    if files_synced:
+        agent_files = _list_files(src) if src.is_dir() else {}
+
+        with _master_lock(dst):
+            for rel, agent_file in agent_files.items():
+                key = f"{subdir}/{rel}"
+                entry = manifest.get(key)
+                agent_stat = agent_file.stat()
+                if (
+                    entry is not None
+                    and not entry["racy"]
+                    and agent_stat.st_size == entry["size"]
+                    and agent_stat.st_mtime_ns == entry["mtime_ns"]
+                ):
+                    continue
+
+                digest = _hash_file(agent_file)
+                base = entry["hash"] if entry is not None else None
+                if digest == base:
+                    continue
+
+                target = dst / rel
+                master_digest = _hash_file(target) if target.is_file() else None
+                if master_digest == digest:
+                    continue
+
+                if master_digest != base:
+                    conflict = target.with_name(
+                        f"{target.stem}.conflict-{agent_name}{target.suffix}"
+                    )
+                    _copy_file(agent_file, conflict)
+                    conflicts += 1
+                    logger.info(
+                        "sync_shared_files_out | conflict | location=%s | file=%s | kept=%s",
+                        location,
+                        key,
+                        conflict.name,
+                    )
+                    continue
+
+                _copy_file(agent_file, target)
+                manifest[key] = _manifest_entry(digest, agent_file, target.stat())
+                files_synced += 1
+
+            prefix = f"{subdir}/"
+            for key, entry in list(manifest.items()):
+                rel = key.removeprefix(prefix)
+                if not key.startswith(prefix) or rel in agent_files:
+                    continue
+                del manifest[key]
+                target = dst / rel
+                if target.is_file() and _hash_file(target) == entry["hash"]:
+                    target.unlink()
+                    files_deleted += 1
+
+    _save_manifest(agent_dir, manifest)
+
+    if files_synced or files_deleted or conflicts:
         logger.debug(
-            "sync_shared_files_out | location=%s | files=%d",
+            "sync_shared_files_out | location=%s | files=%d | deleted=%d | conflicts=%d",
             location,
             files_synced,
+            files_deleted,
+            conflicts,
         )
 
 
+# Sync manifest: what each agent was last handed, keyed by path under shared/
+_MANIFEST_NAME = ".shared_manifest.json"
+
+# Files modified this close to a sync could change again without their mtime
+# moving (coarse filesystem timestamps), so their stats alone aren't trusted
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Serializes check-then-write on a master directory across turn threads
+_master_locks: dict[Path, threading.Lock] = {}
+_master_locks_guard = threading.Lock()
+
+
+def _master_lock(directory: Path) -> threading.Lock:
+    key = directory.resolve()
+    with _master_locks_guard:
+        return _master_locks.setdefault(key, threading.Lock())
+
+
+def _load_manifest(agent_dir: Path) -> dict[str, dict[str, Any]]:
+    try:
+        return json.loads((agent_dir / _MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(agent_dir: Path, manifest: dict[str, dict[str, Any]]) -> None:
+    path = agent_dir / _MANIFEST_NAME
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(manifest, sort_keys=True))
+    os.replace(tmp, path)
+
+
+def _manifest_entry(
+    digest: str,
+    agent_file: Path,
+    master_stat: os.stat_result,
+) -> dict[str, Any]:
+    agent_stat = agent_file.stat()
+    newest = max(agent_stat.st_mtime_ns, master_stat.st_mtime_ns)
+    return {
+        "hash": digest,
+        "size": agent_stat.st_size,
+        "mtime_ns": agent_stat.st_mtime_ns,
+        "master_size": master_stat.st_size,
+        "master_mtime_ns": master_stat.st_mtime_ns,
+        "racy": time.time_ns() - newest < _RACY_WINDOW_NS,
+    }
+
+
+def _is_unchanged(
+    entry: dict[str, Any],
+    master_file: Path,
+    master_stat: os.stat_result,
+    agent_file: Path,
+) -> bool:
+    """Neither master nor the agent's copy changed since the entry was made."""
+    if (master_stat.st_size, master_stat.st_mtime_ns) != (
+        entry["master_size"],
+        entry["master_mtime_ns"],
+    ):
+        return False
+    try:
+        agent_stat = agent_file.stat()
+    except FileNotFoundError:
+        return False
+    if (agent_stat.st_size, agent_stat.st_mtime_ns) != (
+        entry["size"],
+        entry["mtime_ns"],
+    ):
+        return False
+    return not entry["racy"] or (
+        _hash_file(master_file) == entry["hash"] == _hash_file(agent_file)
+    )
+
+
+def _list_files(directory: Path) -> dict[str, Path]:
+    """Regular files under directory, keyed by POSIX path relative to it."""
+    return {
+        f.relative_to(directory).as_posix(): f
+        for f in directory.rglob("*")
+        if f.is_file()
+    }
+
+
+def _hash_file(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy src over dst atomically, as a reflink where the filesystem allows."""
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst.with_name(f".{dst.name}.tmp")
+    if not _clone_file(src, tmp):
+        shutil.copyfile(src, tmp)
+    shutil.copystat(src, tmp)
+    os.replace(tmp, dst)
+
+
+def _clone_file(src: Path, dst: Path) -> bool:
+    """Copy-on-write clone (btrfs, XFS); False if unsupported here."""
+    ficlone = getattr(fcntl, "FICLONE", None) if fcntl is not None else None
+    if ficlone is None:
+        return False
+    try:
+        with open(src, "rb") as s, open(dst, "wb") as d:
+            fcntl.ioctl(d.fileno(), ficlone, s.fileno())
+        return True
+    except OSError:
+        return False
+
+
+def _remove(path: Path) -> None:
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    elif path.exists() or path.is_symlink():
+        path.unlink()
+
+
 def get_shared_file_list(agent_dir: Path) -> list[str]:
     """
     Get list of available shared files in agent's directory.
@@ -1,10 +1,12 @@
 from .snapshot_store import SnapshotStore, VillageSnapshot
 from .archive import EventArchive
 from .event_store import EventStore
+from .event_index import EventLogIndex
 
 __all__ = [
     "SnapshotStore",
     "VillageSnapshot",
     "EventArchive",
     "EventStore",
+    "EventLogIndex",
 ]
\ No newline at end of file
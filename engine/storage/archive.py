@@ -1,8 +1,27 @@
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import json
+import os
+import shutil
+
+from .event_index import peek_tick
+
+FOOTER_KEY = "archive_footer"
 
 
 class EventArchive:
-    """Manages archival of old events to cold storage."""
+    """
+    Manages archival of old events to cold storage.
+
+    Archive files are written once and never rewritten. Each ends with a footer
+    line recording its tick range and the byte offset where each tick starts,
+    so range queries seek straight to the requested ticks. Files without a
+    footer (from older villages) are scanned line by line.
+    """
+
+    MAX_READERS = 8
+
     def __init__(self, village_root: Path):
         self.village_root = village_root
         self.archive_dir = village_root / "archive"
@@ -13,69 +32,146 @@ class EventArchive:
         """
         Move events older than `tick` from active log to archive.
         Returns the number of events archived.
+
+        The active log is tick-ordered, so only the archived prefix is inspected;
+        the remainder is copied to the new active log as raw bytes.
         """
         if not self.active_log.exists():
             return 0
-        
-        with open(self.active_log, "r") as f:
-            lines = f.readlines()
-
-        if not lines:
-            return 0
 
-        import json
-        keep_lines = []
-        archive_lines = []
+        tmp_archive = self.archive_dir / "events.archiving.tmp"
+        tick_offsets: list[list[int]] = []
+        count = 0
+        first_tick = last_tick = 0
 
-        for line in lines:
-            if not line.strip():
-                continue
-            event = json.loads(line)
-            if event.get("tick", 0) < tick:
-                archive_lines.append(line)
-            else:
-                keep_lines.append(line)
+        with open(self.active_log, "rb") as src:
+            with open(tmp_archive, "wb") as out:
+                while True:
+                    line_start = src.tell()
+                    line = src.readline()
+                    if not line:
+                        break
+                    if not line.strip():
+                        continue
+                    event_tick = peek_tick(line)
+                    if event_tick >= tick:
+                        src.seek(line_start)
+                        break
+                    if not tick_offsets or tick_offsets[-1][0] != event_tick:
+                        tick_offsets.append([event_tick, out.tell()])
+                    out.write(line)
+                    if count == 0:
+                        first_tick = event_tick
+                    last_tick = event_tick
+                    count += 1
 
-        if not archive_lines:
-            return 0
+                if count:
+                    footer = {FOOTER_KEY: {
+                        "first_tick": first_tick,
+                        "last_tick": last_tick,
+                        "count": count,
+                        "tick_offsets": tick_offsets,
+                    }}
+                    out.write((json.dumps(footer) + "\n").encode())
 
-        first_tick = json.loads(archive_lines[0])["tick"]
-        last_tick = json.loads(archive_lines[-1])["tick"]
-        archive_path = self.archive_dir / f"events_{first_tick}_{last_tick}.jsonl"
+            if not count:
+                tmp_archive.unlink()
+                return 0
 
-        with open(archive_path, "a") as f:
-            f.writelines(archive_lines)
+            # Stream the events we keep into a fresh active log
+            tmp_log = self.active_log.with_name(self.active_log.name + ".tmp")
+            with open(tmp_log, "wb") as keep:
+                shutil.copyfileobj(src, keep)
 
-        with open(self.active_log, "w") as f:
-            f.writelines(keep_lines)
-
-        return len(archive_lines)
+        archive_path = self._unique_path(first_tick, last_tick)
+        os.replace(tmp_archive, archive_path)
+        os.replace(tmp_log, self.active_log)
+        return count
 
     def get_archive_ranges(self) -> list[tuple[int, int]]:
         """Get list of (start_tick, end_tick) ranges for all archived files."""
-        ranges = []
-        for path in self.archive_dir.glob("events_*_*.jsonl"):
-            parts = path.stem.split("_")
-            if len(parts) == 3:
-                ranges.append((int(parts[1]), int(parts[2])))
-        return sorted(ranges)
+        return sorted((start, end) for start, end, _ in self._archive_files())
 
     def load_archived_events(self, start_tick: int, end_tick: int) -> list[str]:
-        """Load events from archived file within the given tick range. Returns raw JSON strings."""
-        import json
-        results = []
+        """
+        Load events from archived file within the given tick range. Returns raw JSON strings.
+
+        Overlapping archive files are read concurrently; results are in tick order.
+        """
+        paths = [
+            path for start, end, path in sorted(self._archive_files())
+            if start <= end_tick and end >= start_tick
+        ]
+        if not paths:
+            return []
+        if len(paths) == 1:
+            return _read_range(paths[0], start_tick, end_tick)
+
+        with ThreadPoolExecutor(max_workers=min(len(paths), self.MAX_READERS)) as pool:
+            chunks = pool.map(lambda p: _read_range(p, start_tick, end_tick), paths)
+            return [line for chunk in chunks for line in chunk]
+
+    def _archive_files(self) -> list[tuple[int, int, Path]]:
+        files = []
         for path in self.archive_dir.glob("events_*_*.jsonl"):
             parts = path.stem.split("_")
-            if len(parts) != 3:
+            if len(parts) < 3:
+                continue
+            files.append((int(parts[1]), int(parts[2]), path))
+        return files
+
+    def _unique_path(self, first_tick: int, last_tick: int) -> Path:
+        """Archive files are never appended to; disambiguate a repeated range."""
+        path = self.archive_dir / f"events_{first_tick}_{last_tick}.jsonl"
+        n = 1
+        while path.exists():
+            path = self.archive_dir / f"events_{first_tick}_{last_tick}_{n}.jsonl"
+            n += 1
+        return path
+
+
+def read_footer(path: Path) -> dict | None:
+    """Return an archive file's footer, or None for files written without one."""
+    size = path.stat().st_size
+    if size == 0:
+        return None
+    block = 4096
+    with open(path, "rb") as f:
+        while True:
+            start = max(0, size - block)
+            f.seek(start)
+            data = f.read(size - start)
+            body = data.rstrip(b"\n")
+            newline = body.rfind(b"\n")
+            if newline != -1 or start == 0:
+                last_line = body[newline + 1:]
+                break
+            block *= 2
+
+    if not last_line.startswith(b'{"' + FOOTER_KEY.encode()):
+        return None
+    return json.loads(last_line)[FOOTER_KEY]
+
+
+def _read_range(path: Path, start_tick: int, end_tick: int) -> list[str]:
+    """Read the lines of one archive file whose tick falls in [start_tick, end_tick]."""
+    footer = read_footer(path)
+    results = []
+    with open(path, "rb") as f:
+        if footer is not None:
+            ticks = [t for t, _ in footer["tick_offsets"]]
+            i = bisect_left(ticks, start_tick)
+            if i == len(ticks):
+                return []
+            f.seek(footer["tick_offsets"][i][1])
+        for line in f:
+            if not line.strip():
                 continue
-            start, end = int(parts[1]), int(parts[2])
-            if start <= end_tick and end >= start_tick:
-                with open(path, "r") as f:
-                    for line in f:
-                        if line.strip():
-                            event = json.loads(line)
-                            if start_tick <= event.get("tick", 0) <= end_tick:
-                                results.append(line)
-        return results
-        
-        
\ No newline at end of file
+            if line.startswith(b'{"' + FOOTER_KEY.encode()):
+                break
+            event_tick = peek_tick(line)
+            if footer is not None and event_tick > end_tick:
+                break
+            if start_tick <= event_tick <= end_tick:
+                results.append(line.decode())
+    return results
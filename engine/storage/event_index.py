@@ -0,0 +1,217 @@
+from bisect import bisect_left
+from heapq import merge
+from dataclasses import dataclass
+from pathlib import Path
+import json
+import re
+
+_TICK_RE = re.compile(rb'"tick":\s*(-?\d+)')
+
+
+def peek_tick(line: bytes) -> int:
+    """
+    Read an event line's tick without parsing the whole line.
+
+    Events are serialized with `type` and `tick` ahead of any nested payload,
+    so the first `"tick":` key is the event's own. Falls back to a full parse
+    if the key is not found.
+    """
+    match = _TICK_RE.search(line)
+    if match is not None:
+        return int(match.group(1))
+    return json.loads(line).get("tick", 0)
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """Location and routing keys of one event line in the active log."""
+    offset: int
+    length: int
+    tick: int
+    type: str
+
+
+class EventLogIndex:
+    """
+    Sidecar index of byte offsets, ticks and event types for the active event log.
+
+    The log is append-only and tick-ordered, so the index forms contiguous per-tick
+    segments. Reverse and range queries consult the index and seek straight to the
+    lines they need instead of reading and parsing the whole log.
+
+    The sidecar is a plain text file with one "offset length tick type" line per
+    event. If it falls behind the log (e.g. a crash between the two writes) the
+    missing tail is indexed on load; if the log was rewritten underneath it
+    (archiving), the index is rebuilt from scratch.
+    """
+
+    def __init__(self, log_path: Path):
+        self.log_path = log_path
+        self.index_path = log_path.with_name(log_path.name + ".idx")
+        self._entries: list[IndexEntry] = []
+        self._ticks: list[int] = []
+        # Positions into _entries per event type, for filtered reverse scans
+        self._by_type: dict[str, list[int]] = {}
+        self._end = 0
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def end_offset(self) -> int:
+        """Byte offset just past the last indexed line."""
+        return self._end
+
+    def record(self, offset: int, lines: list[bytes], ticks: list[int], types: list[str]) -> None:
+        """Index lines that were just appended to the log starting at `offset`."""
+        new_entries = []
+        for line, tick, event_type in zip(lines, ticks, types):
+            new_entries.append(IndexEntry(offset, len(line), tick, event_type))
+            offset += len(line)
+        self._append_entries(new_entries, persist=True)
+
+    def rebuild(self) -> None:
+        """Discard the index and re-scan the whole log."""
+        self._entries = []
+        self._ticks = []
+        self._by_type = {}
+        self._end = 0
+        self._index_tail()
+
+    def refresh(self) -> None:
+        """Bring the index in line with the log if it was changed outside this index."""
+        size = self.log_path.stat().st_size if self.log_path.exists() else 0
+        if size == self._end:
+            return
+        if size < self._end:
+            self.rebuild()
+        else:
+            self._index_tail()
+
+    def entries_since(self, tick: int) -> list[IndexEntry]:
+        """Entries with tick >= `tick`, oldest first."""
+        self.refresh()
+        return self._entries[bisect_left(self._ticks, tick):]
+
+    def latest(
+        self,
+        limit: int,
+        event_types: set[str] | None = None,
+        since_tick: int = 0,
+    ) -> list[IndexEntry]:
+        """
+        The most recent `limit` entries matching the filters, oldest first.
+
+        Only the matching entries are visited, newest to oldest.
+        """
+        self.refresh()
+        if limit <= 0:
+            return []
+        if event_types:
+            positions = merge(
+                *(reversed(self._by_type.get(t, [])) for t in event_types),
+                reverse=True,
+            )
+        else:
+            positions = reversed(range(len(self._entries)))
+
+        selected = []
+        for pos in positions:
+            entry = self._entries[pos]
+            if entry.tick < since_tick:
+                break
+            selected.append(entry)
+            if len(selected) >= limit:
+                break
+        selected.reverse()
+        return selected
+
+    def read_lines(self, entries: list[IndexEntry]) -> list[bytes]:
+        """Read the raw log lines for the given entries, in the order given."""
+        if not entries:
+            return []
+        lines = []
+        with open(self.log_path, "rb") as f:
+            for entry in entries:
+                f.seek(entry.offset)
+                lines.append(f.read(entry.length))
+        return lines
+
+    def read_range(self, entries: list[IndexEntry]) -> bytes:
+        """Read the contiguous byte span covering `entries` in one call."""
+        if not entries:
+            return b""
+        start = entries[0].offset
+        end = entries[-1].offset + entries[-1].length
+        with open(self.log_path, "rb") as f:
+            f.seek(start)
+            return f.read(end - start)
+
+    def _load(self) -> None:
+        entries = []
+        torn = False
+        if self.index_path.exists():
+            with open(self.index_path, "r") as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) != 4 or not line.endswith("\n"):
+                        # Torn final write; the tail is re-indexed below.
+                        torn = True
+                        break
+                    entries.append(IndexEntry(int(parts[0]), int(parts[1]), int(parts[2]), parts[3]))
+        if torn:
+            self.index_path.unlink()
+        self._append_entries(entries, persist=torn)
+        if entries and not self._entry_matches(entries[-1]):
+            # The log was rewritten while the index was not looking.
+            self.rebuild()
+            return
+        self.refresh()
+
+    def _entry_matches(self, entry: IndexEntry) -> bool:
+        """Check that an entry still points at the event line it describes."""
+        if not self.log_path.exists():
+            return False
+        line = self.read_lines([entry])[0]
+        if not line.endswith(b"\n"):
+            return False
+        try:
+            data = json.loads(line)
+        except ValueError:
+            return False
+        return data.get("tick") == entry.tick and data.get("type") == entry.type
+
+    def _index_tail(self) -> None:
+        """Index log lines past the current end without fully validating them."""
+        if not self.log_path.exists():
+            return
+        new_entries = []
+        offset = self._end
+        with open(self.log_path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Partially written line; leave it for the next refresh.
+                    break
+                if line.strip():
+                    data = json.loads(line)
+                    new_entries.append(IndexEntry(offset, len(line), data.get("tick", 0), data.get("type", "")))
+                offset += len(line)
+        if self._end == 0:
+            self.index_path.unlink(missing_ok=True)
+        self._append_entries(new_entries, persist=True)
+        self._end = offset
+
+    def _append_entries(self, entries: list[IndexEntry], persist: bool) -> None:
+        if not entries:
+            return
+        for entry in entries:
+            self._by_type.setdefault(entry.type, []).append(len(self._entries))
+            self._entries.append(entry)
+            self._ticks.append(entry.tick)
+        last = entries[-1]
+        self._end = last.offset + last.length
+        if persist:
+            with open(self.index_path, "a") as f:
+                f.writelines(f"{e.offset} {e.length} {e.tick} {e.type}\n" for e in entries)
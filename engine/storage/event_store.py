@@ -1,17 +1,29 @@
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Sequence
+from typing import Any, Iterator, Sequence
+import logging
+import multiprocessing
+import os
+import time
 from pydantic import TypeAdapter
 
 from engine.services.scheduler import SchedulerState
 
 from engine.domain import (
     DomainEvent,
+    AgentName,
+    ConversationId,
+    LocationId,
     AgentSnapshot,
     TimeSnapshot,
     WorldSnapshot,
     Conversation,
+    ConversationTurn,
     Invitation,
     UnseenConversationEnding,
+    Weather,
     TokenUsage,
     InterpreterUsage,
     INVITE_EXPIRY_TICKS,
@@ -45,9 +57,147 @@ from engine.domain import (
 )
 from .snapshot_store import SnapshotStore, VillageSnapshot
 from .archive import EventArchive
+from .event_index import EventLogIndex, IndexEntry
 
 EventAdapter = TypeAdapter(DomainEvent)
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RecoveryStats:
+    """Throughput of the last EventStore.recover() call."""
+    snapshot_tick: int
+    events_replayed: int
+    seconds: float
+    workers: int
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events_replayed / self.seconds if self.seconds > 0 else 0.0
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    """Start method for recovery workers: forkserver where available, else spawn."""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _parse_lines(data: bytes) -> list[DomainEvent]:
+    """Validate a block of event log lines (runs in recovery worker processes)."""
+    return [EventAdapter.validate_json(line) for line in data.splitlines() if line.strip()]
+
+
+class _SnapshotBuilder:
+    """
+    Copy-on-write working state for folding a batch of events into a snapshot.
+
+    Top-level maps are copied the first time a batch writes to them, and models
+    are updated with model_copy, so untouched agents, conversations and history
+    tuples are shared with the previous snapshot instead of being re-validated.
+    """
+
+    def __init__(self, base: VillageSnapshot):
+        self._base = base
+        self.world: WorldSnapshot = base.world
+        self._agents: dict[AgentName, AgentSnapshot] | None = None
+        self._conversations: dict[ConversationId, Conversation] | None = None
+        self._pending_invites: dict[AgentName, Invitation] | None = None
+        self._unseen_endings: dict[AgentName, list[UnseenConversationEnding]] | None = None
+        self._last_location_speaker: dict[LocationId, AgentName] | None = None
+
+    # --- Writable views (copied on first access) ---
+
+    @property
+    def agents(self) -> dict[AgentName, AgentSnapshot]:
+        if self._agents is None:
+            self._agents = dict(self._base.agents)
+        return self._agents
+
+    @property
+    def conversations(self) -> dict[ConversationId, Conversation]:
+        if self._conversations is None:
+            self._conversations = dict(self._base.conversations)
+        return self._conversations
+
+    @property
+    def pending_invites(self) -> dict[AgentName, Invitation]:
+        if self._pending_invites is None:
+            self._pending_invites = dict(self._base.pending_invites)
+        return self._pending_invites
+
+    @property
+    def unseen_endings(self) -> dict[AgentName, list[UnseenConversationEnding]]:
+        if self._unseen_endings is None:
+            self._unseen_endings = dict(self._base.unseen_endings or {})
+        return self._unseen_endings
+
+    @property
+    def last_location_speaker(self) -> dict[LocationId, AgentName]:
+        if self._last_location_speaker is None:
+            base = self._base.scheduler_state
+            self._last_location_speaker = dict(base.last_location_speaker) if base else {}
+        return self._last_location_speaker
+
+    # --- Read-only lookups (never copy) ---
+
+    def get_agent(self, name: AgentName) -> AgentSnapshot | None:
+        source = self._agents if self._agents is not None else self._base.agents
+        return source.get(name)
+
+    def get_conversation(self, conv_id: ConversationId) -> Conversation | None:
+        source = self._conversations if self._conversations is not None else self._base.conversations
+        return source.get(conv_id)
+
+    def peek_unseen_endings(self) -> dict[AgentName, list[UnseenConversationEnding]]:
+        if self._unseen_endings is not None:
+            return self._unseen_endings
+        return self._base.unseen_endings or {}
+
+    # --- Path updates ---
+
+    def update_agent(self, name: AgentName, **changes: Any) -> None:
+        """Replace fields on one agent, if it exists."""
+        agent = self.get_agent(name)
+        if agent is not None:
+            self.agents[name] = agent.model_copy(update=changes)
+
+    def update_conversation(self, conv_id: ConversationId, **changes: Any) -> None:
+        """Replace fields on one conversation, if it exists."""
+        conv = self.get_conversation(conv_id)
+        if conv is not None:
+            self.conversations[conv_id] = conv.model_copy(update=changes)
+
+    def build(self) -> VillageSnapshot:
+        """Freeze the working state into a new VillageSnapshot."""
+        base = self._base
+        scheduler_state = base.scheduler_state
+        if scheduler_state is None:
+            scheduler_state = SchedulerState(
+                queue=(),
+                forced_next=None,
+                skip_counts={},
+                turn_counts={},
+                last_location_speaker=self.last_location_speaker,
+            )
+        elif self._last_location_speaker is not None:
+            scheduler_state = replace(scheduler_state, last_location_speaker=self._last_location_speaker)
+
+        if self._unseen_endings is not None:
+            unseen_endings = self._unseen_endings or None
+        else:
+            unseen_endings = base.unseen_endings or None
+
+        return VillageSnapshot(
+            world=self.world,
+            agents=self._agents if self._agents is not None else base.agents,
+            conversations=self._conversations if self._conversations is not None else base.conversations,
+            pending_invites=self._pending_invites if self._pending_invites is not None else base.pending_invites,
+            scheduler_state=scheduler_state,
+            unseen_endings=unseen_endings,
+        )
+
+
 class EventStore:
     """
     Append-only event store with snapshot cache and cold storage.
@@ -56,6 +206,9 @@ class EventStore:
     """
     
     SNAPSHOT_INTERVAL = 50
+    # Replays shorter than this are parsed in-process; process startup isn't worth it
+    PARALLEL_RECOVERY_MIN_EVENTS = 20_000
+    RECOVERY_CHUNK_EVENTS = 5_000
 
     def __init__(self, village_root: Path):
         self.village_root = village_root
@@ -64,10 +217,12 @@ class EventStore:
         self.event_log = village_root / "events.jsonl"
         self.snapshot_store = SnapshotStore(village_root)
         self.archive = EventArchive(village_root)
+        self.index = EventLogIndex(self.event_log)
         
         # In-memory current state
         self._current_snapshot: VillageSnapshot | None = None
         self._events_since_snapshot: list[DomainEvent] = []
+        self.last_recovery: RecoveryStats | None = None
 
     def initialize(self, initial_snapshot: VillageSnapshot) -> None:
         """Initialize with a starting snapshot (for new villages)."""
@@ -75,23 +230,76 @@ class EventStore:
         self._events_since_snapshot = []
         self.snapshot_store.save(initial_snapshot)
 
-    def recover(self) -> VillageSnapshot | None:
-        """Recover state from latest snapshot and replay events."""
+    def recover(self, workers: int | None = None) -> VillageSnapshot | None:
+        """
+        Recover state from latest snapshot and replay events.
+
+        Only events after the snapshot tick are read (located via the log index,
+        without parsing the ones before). Long replays are validated in a process
+        pool and folded in batches as chunks arrive. Throughput is recorded in
+        `last_recovery`.
+
+        Args:
+            workers: Parser processes for long replays (default: CPU count).
+                Pass 1 to always parse in-process.
+        """
         snapshot = self.snapshot_store.load_latest()
         if snapshot is None:
             return None
 
-        # Replay events since snapshot
-        events = self._load_events_since(snapshot.tick)
+        started = time.perf_counter()
         self._current_snapshot = snapshot
         self._events_since_snapshot = []
 
-        for event in events:
-            self._apply_event(event)
-            self._events_since_snapshot.append(event)
+        # Replay events since snapshot
+        entries = self.index.entries_since(snapshot.tick + 1)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if len(entries) < self.PARALLEL_RECOVERY_MIN_EVENTS:
+            workers = 1
+
+        for events in self._parse_for_replay(entries, workers):
+            self._apply_events(events)
+            self._events_since_snapshot.extend(events)
+
+        self.last_recovery = RecoveryStats(
+            snapshot_tick=snapshot.tick,
+            events_replayed=len(self._events_since_snapshot),
+            seconds=time.perf_counter() - started,
+            workers=workers,
+        )
+        logger.info(
+            f"Replayed {self.last_recovery.events_replayed} events after snapshot tick "
+            f"{snapshot.tick} in {self.last_recovery.seconds:.3f}s "
+            f"({self.last_recovery.events_per_second:,.0f} events/sec, {workers} worker(s))"
+        )
 
         return self.get_current_snapshot()
 
+    def _parse_for_replay(self, entries: list[IndexEntry], workers: int) -> Iterator[list[DomainEvent]]:
+        """Yield parsed events in log order, one chunk at a time."""
+        chunk = self.RECOVERY_CHUNK_EVENTS
+        blocks = (
+            self.index.read_range(entries[i:i + chunk])
+            for i in range(0, len(entries), chunk)
+        )
+        if workers <= 1:
+            for block in blocks:
+                yield _parse_lines(block)
+            return
+
+        # Keep only a bounded window of blocks in flight, so the log is read
+        # no faster than chunks are folded. Workers don't fork this process:
+        # it may have other threads running holding locks.
+        window: deque[Future[list[DomainEvent]]] = deque()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as pool:
+            for block in blocks:
+                if len(window) >= 2 * workers:
+                    yield window.popleft().result()
+                window.append(pool.submit(_parse_lines, block))
+            while window:
+                yield window.popleft().result()
+
     def append(self, event: DomainEvent) -> None:
         """Append a single event."""
         self.append_all([event])
@@ -104,16 +312,21 @@ class EventStore:
         if not events:
             return
 
-        # Write to log file
-        with open(self.event_log, "a") as f:
-            for event in events:
-                line = event.model_dump_json() + "\n"
-                f.write(line)
+        # Write to log file, then record where each line landed in the index
+        lines = [(event.model_dump_json() + "\n").encode() for event in events]
+        with open(self.event_log, "ab") as f:
+            offset = f.tell()
+            f.writelines(lines)
+        self.index.record(
+            offset,
+            lines,
+            [event.tick for event in events],
+            [event.type for event in events],
+        )
 
         # Update in-memory state
-        for event in events:
-            self._apply_event(event)
-            self._events_since_snapshot.append(event)
+        self._apply_events(events)
+        self._events_since_snapshot.extend(events)
 
     def get_current_snapshot(self) -> VillageSnapshot:
         """Get the current village state."""
@@ -140,133 +353,88 @@ class EventStore:
             event_types: Optional set of event.type values to include
             since_tick: Only include events with tick >= since_tick
         """
-        if limit <= 0 or not self.event_log.exists():
-            return []
-
-        with open(self.event_log) as f:
-            lines = f.readlines()
-
-        events: list[DomainEvent] = []
-        for line in reversed(lines):
-            if not line.strip():
-                continue
-            event = EventAdapter.validate_json(line)
-            if event.tick < since_tick:
-                break
-            if event_types and event.type not in event_types:
-                continue
-            events.append(event)
-            if len(events) >= limit:
-                break
-
-        return list(reversed(events))
-
-    def _load_events_since(self, tick: int) -> list[DomainEvent]:
-        """Load events from disk since a given tick."""
-        events = []
-        if self.event_log.exists():
-            with open(self.event_log) as f:
-                for line in f:
-                    if line.strip():
-                        event = EventAdapter.validate_json(line)
-                        if event.tick > tick:
-                            events.append(event)
-        return events
+        # The index picks the lines, so only the events we return are read and parsed
+        selected = self.index.latest(limit, event_types, since_tick)
+        return [EventAdapter.validate_json(line) for line in self.index.read_lines(selected)]
+
     def _apply_event(self, event: DomainEvent) -> None:
         """Apply an event to update the current snapshot."""
+        self._apply_events([event])
+
+    def _apply_events(self, events: Sequence[DomainEvent]) -> None:
+        """
+        Fold a batch of events into the current snapshot.
+
+        Only the paths an event touches are copied; everything else is shared
+        with the previous snapshot, and a single new VillageSnapshot is built
+        for the whole batch.
+        """
         if self._current_snapshot is None:
             raise RuntimeError("Cannot apply event - no current snapshot")
+        if not events:
+            return
 
-        # This is where events update the in-memory state
-        # We need to create new immutable snapshots
-
-        snapshot = self._current_snapshot
-        world = snapshot.world
-        agents = dict(snapshot.agents)
-        conversations = dict(snapshot.conversations)
-        pending_invites = dict(snapshot.pending_invites)
-        unseen_endings: dict[str, list[UnseenConversationEnding]] = dict(snapshot.unseen_endings or {})
-        # Track last_location_speaker for turn-taking (rebuilt from events)
-        last_location_speaker = dict(snapshot.scheduler_state.last_location_speaker) if snapshot.scheduler_state else {}
+        state = _SnapshotBuilder(self._current_snapshot)
+        for event in events:
+            self._fold_event(state, event)
+        self._current_snapshot = state.build()
 
+    def _fold_event(self, state: "_SnapshotBuilder", event: DomainEvent) -> None:
+        """Apply a single event to the working state of a batch."""
         # Update tick on world
-        if event.tick > world.tick:
-            world = WorldSnapshot(
-                tick=event.tick,
-                world_time=event.timestamp,
-                start_date=world.start_date,
-                weather=world.weather,
-                locations=world.locations,
-                agent_locations=world.agent_locations,
-                interpreter_usage=world.interpreter_usage,
+        if event.tick > state.world.tick:
+            state.world = state.world.model_copy(
+                update={"tick": event.tick, "world_time": event.timestamp}
             )
 
         time_snapshot = TimeSnapshot(
             world_time=event.timestamp,
             tick=event.tick,
-            start_date=world.start_date,
+            start_date=state.world.start_date,
         )
 
         # Handle specific event types
         match event:
             case AgentMovedEvent():
-                if event.agent in agents:
-                    agent = agents[event.agent]
-                    agents[event.agent] = AgentSnapshot(
-                        **{**agent.model_dump(), "location": event.to_location}
-                    )
+                state.update_agent(event.agent, location=event.to_location)
                 # Update world agent_locations
-                new_locations = dict(world.agent_locations)
+                new_locations = dict(state.world.agent_locations)
                 new_locations[event.agent] = event.to_location
-                world = WorldSnapshot(**{**world.model_dump(), "agent_locations": new_locations})
+                state.world = state.world.model_copy(update={"agent_locations": new_locations})
 
             case AgentMoodChangedEvent():
-                if event.agent in agents:
-                    agent = agents[event.agent]
-                    agents[event.agent] = AgentSnapshot(
-                        **{**agent.model_dump(), "mood": event.new_mood}
-                    )
+                state.update_agent(event.agent, mood=event.new_mood)
 
             case AgentEnergyChangedEvent():
-                if event.agent in agents:
-                    agent = agents[event.agent]
-                    agents[event.agent] = AgentSnapshot(
-                        **{**agent.model_dump(), "energy": event.new_energy}
-                    )
+                state.update_agent(event.agent, energy=event.new_energy)
 
             case AgentSleptEvent():
-                if event.agent in agents:
-                    agent = agents[event.agent]
-                    agents[event.agent] = AgentSnapshot(
-                        **{**agent.model_dump(), "is_sleeping": True, "sleep_started_tick": event.tick, "sleep_started_time_period": time_snapshot.period}
-                    )
+                state.update_agent(
+                    event.agent,
+                    is_sleeping=True,
+                    sleep_started_tick=event.tick,
+                    sleep_started_time_period=time_snapshot.period,
+                )
 
             case AgentWokeEvent():
-                if event.agent in agents:
-                    agent = agents[event.agent]
-                    agents[event.agent] = AgentSnapshot(
-                        **{**agent.model_dump(), "is_sleeping": False, "sleep_started_tick": None, "sleep_started_time_period": None}
-                    )
+                state.update_agent(
+                    event.agent,
+                    is_sleeping=False,
+                    sleep_started_tick=None,
+                    sleep_started_time_period=None,
+                )
 
             case AgentLastActiveTickUpdatedEvent():
-                if event.agent in agents:
-                    agent = agents[event.agent]
-                    agents[event.agent] = AgentSnapshot(
-                        **{**agent.model_dump(), "last_active_tick": event.new_last_active_tick}
-                    )
+                state.update_agent(event.agent, last_active_tick=event.new_last_active_tick)
                 # Update last_location_speaker for turn-taking
                 if event.location:
-                    last_location_speaker[event.location] = event.agent
+                    state.last_location_speaker[event.location] = event.agent
 
             case AgentSessionIdUpdatedEvent():
-                if event.agent in agents:
-                    agent = agents[event.agent]
-                    agents[event.agent] = AgentSnapshot(
-                        **{**agent.model_dump(), "session_id": event.new_session_id}
-                    )
+                state.update_agent(event.agent, session_id=event.new_session_id)
 
             case ConversationStartedEvent():
-                conversations[event.conversation_id] = Conversation(
+                state.conversations[event.conversation_id] = Conversation(
                     id=event.conversation_id,
                     location=event.location,
                     privacy=event.privacy,
@@ -286,35 +454,34 @@ class EventStore:
                     expires_at_tick=event.tick + INVITE_EXPIRY_TICKS,
                     invited_at=event.timestamp,
                 )
-                pending_invites[event.invitee] = invitation
+                state.pending_invites[event.invitee] = invitation
 
             case ConversationInviteAcceptedEvent():
-                pending_invites.pop(event.invitee, None)
+                state.pending_invites.pop(event.invitee, None)
 
             case ConversationInviteDeclinedEvent():
-                pending_invites.pop(event.invitee, None)
+                state.pending_invites.pop(event.invitee, None)
 
             case ConversationInviteExpiredEvent():
-                pending_invites.pop(event.invitee, None)
+                state.pending_invites.pop(event.invitee, None)
 
             case ConversationJoinedEvent():
-                if event.conversation_id in conversations:
-                    conv = conversations[event.conversation_id]
-                    conversations[event.conversation_id] = Conversation(
-                        **{**conv.model_dump(), "participants": conv.participants | {event.agent}}
+                conv = state.get_conversation(event.conversation_id)
+                if conv is not None:
+                    state.update_conversation(
+                        event.conversation_id, participants=conv.participants | {event.agent}
                     )
 
             case ConversationLeftEvent():
-                if event.conversation_id in conversations:
-                    conv = conversations[event.conversation_id]
-                    conversations[event.conversation_id] = Conversation(
-                        **{**conv.model_dump(), "participants": conv.participants - {event.agent}}
+                conv = state.get_conversation(event.conversation_id)
+                if conv is not None:
+                    state.update_conversation(
+                        event.conversation_id, participants=conv.participants - {event.agent}
                     )
 
             case ConversationTurnEvent():
-                if event.conversation_id in conversations:
-                    conv = conversations[event.conversation_id]
-                    from engine.domain import ConversationTurn
+                conv = state.get_conversation(event.conversation_id)
+                if conv is not None:
                     new_turn = ConversationTurn(
                         speaker=event.speaker,
                         narrative=event.narrative,
@@ -323,60 +490,52 @@ class EventStore:
                         is_departure=event.is_departure,
                         narrative_with_tools=event.narrative_with_tools,
                     )
-                    conversations[event.conversation_id] = Conversation(
-                        **{
-                            **conv.model_dump(),
-                            "history": (*conv.history, new_turn),
-                            "next_speaker": None,
-                        }
+                    state.update_conversation(
+                        event.conversation_id,
+                        history=(*conv.history, new_turn),
+                        next_speaker=None,
                     )
 
             case ConversationNextSpeakerSetEvent():
-                if event.conversation_id in conversations:
-                    conv = conversations[event.conversation_id]
-                    conversations[event.conversation_id] = Conversation(
-                        **{**conv.model_dump(), "next_speaker": event.next_speaker}
-                    )
+                state.update_conversation(event.conversation_id, next_speaker=event.next_speaker)
 
             case ConversationMovedEvent():
                 # Update conversation location
                 # Note: AgentMovedEvents are processed separately to update agent locations
-                if event.conversation_id in conversations:
-                    conv = conversations[event.conversation_id]
-                    conversations[event.conversation_id] = Conversation(
-                        **{**conv.model_dump(), "location": event.to_location}
-                    )
+                state.update_conversation(event.conversation_id, location=event.to_location)
 
             case ConversationEndedEvent():
-                if event.conversation_id in conversations:
-                    del conversations[event.conversation_id]
+                if state.get_conversation(event.conversation_id) is not None:
+                    del state.conversations[event.conversation_id]
 
             case ConversationEndingUnseenEvent():
                 # Add unseen ending notification for the agent
-                if event.agent not in unseen_endings:
-                    unseen_endings[event.agent] = []
-                unseen_endings[event.agent].append(UnseenConversationEnding(
-                    conversation_id=event.conversation_id,
-                    other_participant=event.other_participant,
-                    final_message=event.final_message,
-                    ended_at_tick=event.tick,
-                ))
+                endings = state.unseen_endings
+                endings[event.agent] = [
+                    *endings.get(event.agent, []),
+                    UnseenConversationEnding(
+                        conversation_id=event.conversation_id,
+                        other_participant=event.other_participant,
+                        final_message=event.final_message,
+                        ended_at_tick=event.tick,
+                    ),
+                ]
 
             case ConversationEndingSeenEvent():
                 # Remove unseen ending notification for the agent
-                if event.agent in unseen_endings:
-                    unseen_endings[event.agent] = [
-                        e for e in unseen_endings[event.agent]
+                if event.agent in state.peek_unseen_endings():
+                    endings = state.unseen_endings
+                    remaining = [
+                        e for e in endings[event.agent]
                         if e.conversation_id != event.conversation_id
                     ]
-                    if not unseen_endings[event.agent]:
-                        del unseen_endings[event.agent]
+                    if remaining:
+                        endings[event.agent] = remaining
+                    else:
+                        del endings[event.agent]
 
             case WeatherChangedEvent():
-                from engine.domain import Weather
-                world = WorldSnapshot(
-                    **{**world.model_dump(), "weather": Weather(event.new_weather)}
-                )
+                state.world = state.world.model_copy(update={"weather": Weather(event.new_weather)})
 
             case NightSkippedEvent():
                 # Night skip updates world time (already handled via event.timestamp above)
@@ -390,8 +549,8 @@ class EventStore:
 
             case AgentTokenUsageRecordedEvent():
                 # Update agent's token usage - session_tokens is context window size
-                if event.agent in agents:
-                    agent = agents[event.agent]
+                agent = state.get_agent(event.agent)
+                if agent is not None:
                     old_usage = agent.token_usage
                     # Context window = cache_read (cumulative) + input (per-turn)
                     context_window_size = event.cache_read_input_tokens + event.input_tokens
@@ -409,55 +568,26 @@ class EventStore:
                         ),
                         turn_count=old_usage.turn_count + 1,
                     )
-                    agents[event.agent] = AgentSnapshot(
-                        **{**agent.model_dump(), "token_usage": new_usage}
-                    )
+                    state.update_agent(event.agent, token_usage=new_usage)
 
             case InterpreterTokenUsageRecordedEvent():
                 # Update world's interpreter usage
-                old_usage = world.interpreter_usage
+                old_usage = state.world.interpreter_usage
                 new_usage = InterpreterUsage(
                     total_input_tokens=old_usage.total_input_tokens + event.input_tokens,
                     total_output_tokens=old_usage.total_output_tokens + event.output_tokens,
                     call_count=old_usage.call_count + 1,
                 )
-                world = WorldSnapshot(**{**world.model_dump(), "interpreter_usage": new_usage})
+                state.world = state.world.model_copy(update={"interpreter_usage": new_usage})
 
             case SessionTokensResetEvent():
                 # Reset session tokens after compaction (all-time stays the same)
-                if event.agent in agents:
-                    agent = agents[event.agent]
-                    old_usage = agent.token_usage
-                    new_usage = TokenUsage(
-                        session_tokens=event.new_session_tokens,
-                        total_input_tokens=old_usage.total_input_tokens,
-                        total_output_tokens=old_usage.total_output_tokens,
-                        cache_creation_input_tokens=old_usage.cache_creation_input_tokens,
-                        cache_read_input_tokens=old_usage.cache_read_input_tokens,
-                        turn_count=old_usage.turn_count,
+                agent = state.get_agent(event.agent)
+                if agent is not None:
+                    new_usage = agent.token_usage.model_copy(
+                        update={"session_tokens": event.new_session_tokens}
                     )
-                    agents[event.agent] = AgentSnapshot(
-                        **{**agent.model_dump(), "token_usage": new_usage}
-                    )
-
-        # Update scheduler_state with last_location_speaker (rebuilt from events)
-        if snapshot.scheduler_state:
-            scheduler_state = SchedulerState(
-                queue=snapshot.scheduler_state.queue,
-                forced_next=snapshot.scheduler_state.forced_next,
-                skip_counts=snapshot.scheduler_state.skip_counts,
-                turn_counts=snapshot.scheduler_state.turn_counts,
-                last_location_speaker=last_location_speaker,
-            )
-        else:
-            scheduler_state = SchedulerState(
-                queue=(),
-                forced_next=None,
-                skip_counts={},
-                turn_counts={},
-                last_location_speaker=last_location_speaker,
-            )
-        self._current_snapshot = VillageSnapshot(world, agents, conversations, pending_invites, scheduler_state, unseen_endings or None)
+                    state.update_agent(event.agent, token_usage=new_usage)
 
     def set_scheduler_state(self, scheduler_state: SchedulerState) -> None:
         """Update the scheduler state in the current snapshot.
@@ -490,7 +620,8 @@ class EventStore:
         # Archive events older than SNAPSHOT_INTERVAL ticks ago
         archive_before = self._current_snapshot.tick - self.SNAPSHOT_INTERVAL
         if archive_before > 0:
-            self.archive.archive_events_before(archive_before)
+            if self.archive.archive_events_before(archive_before):
+                self.index.rebuild()
 
         # Clear in-memory event buffer (we have a snapshot now)
         self._events_since_snapshot = []
@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from pathlib import Path
+import gzip
 import json
+import os
 from typing import Any, TYPE_CHECKING
 
 from engine.domain import (
@@ -8,6 +10,7 @@ from engine.domain import (
     WorldSnapshot,
     Conversation,
     ConversationId,
+    ConversationTurn,
     Invitation,
     AgentName,
     UnseenConversationEnding,
@@ -32,10 +35,16 @@ class VillageSnapshot:
         return self.world.tick
 
     def to_dict(self) -> dict[str, Any]:
-        result = {
-            "world": self.world.model_dump(mode="json"),
+        return {
             "agents": {name: agent.model_dump(mode="json") for name, agent in self.agents.items()},
             "conversations": {id: conversation.model_dump(mode="json") for id, conversation in self.conversations.items()},
+            **self._shared_to_dict(),
+        }
+
+    def _shared_to_dict(self) -> dict[str, Any]:
+        """Serialize everything except agents and conversations."""
+        result = {
+            "world": self.world.model_dump(mode="json"),
             "pending_invites": {name: invite.model_dump(mode="json") for name, invite in self.pending_invites.items()},
         }
         if self.scheduler_state is not None:
@@ -75,45 +84,227 @@ class VillageSnapshot:
         )
 
 class SnapshotStore:
-    """Handles saving and loading village snapshots."""
+    """
+    Handles saving and loading village snapshots.
+
+    Snapshots are gzip-compressed compact JSON. Every FULL_EVERY-th save writes
+    a full snapshot; the saves in between write deltas holding only the agents
+    and conversations that changed since that full snapshot (conversations
+    store just the turns appended since). An append-only manifest records
+    every snapshot so the latest one is found without listing the directory.
+
+    Plain `state_<tick>.json` files from older villages are still readable.
+    """
+
+    FULL_EVERY = 10
+
     def __init__(self, village_root: Path):
         self.village_root = village_root
         self.snapshots_dir = village_root / "snapshots"
         self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.snapshots_dir / "manifest.jsonl"
+
+        self._manifest: dict[int, dict[str, Any]] | None = None
+        # Most recent full snapshot, the base for subsequent deltas
+        self._base: VillageSnapshot | None = None
+        self._deltas_since_base = 0
 
     def save(self, snapshot: VillageSnapshot) -> Path:
         """Save a snapshot to disk. Returns the path to the saved snapshot."""
-        path = self.snapshots_dir / f"state_{snapshot.tick}.json"
-        with open(path, "w") as f:
-            json.dump(snapshot.to_dict(), f, indent=2, default=str)
+        base = self._base_for_delta()
+        if base is None or base.tick >= snapshot.tick or self._deltas_since_base + 1 >= self.FULL_EVERY:
+            path = self.snapshots_dir / f"state_{snapshot.tick}.json.gz"
+            self._write(path, snapshot.to_dict())
+            entry = {"tick": snapshot.tick, "kind": "full", "file": path.name}
+            self._set_base(snapshot)
+        else:
+            path = self.snapshots_dir / f"delta_{snapshot.tick}.json.gz"
+            self._write(path, _make_delta(base, snapshot))
+            entry = {"tick": snapshot.tick, "kind": "delta", "file": path.name, "base": base.tick}
+            self._deltas_since_base += 1
+
+        self._append_manifest(entry)
         return path
 
     def load(self, tick: int) -> VillageSnapshot | None:
         """Load a snapshot from disk. Returns None if the snapshot does not exist."""
-        path = self.snapshots_dir / f"state_{tick}.json"
-        if not path.exists():
+        entry = self._get_manifest().get(tick)
+        if entry is None:
             return None
-        with open(path, "r") as f:
-            return VillageSnapshot.from_dict(json.load(f))
+        return self._load_entry(entry)
 
     def load_latest(self) -> VillageSnapshot | None:
         """Load the latest snapshot from disk. Returns None if no snapshots exist."""
-        snapshots = list(self.snapshots_dir.glob("state_*.json"))
-        if not snapshots:
+        tick = self.get_latest_tick()
+        if tick is None:
             return None
-        latest = max(snapshots, key=lambda x: int(x.stem.split("_")[1]))
-        with open(latest, "r") as f:
-            return VillageSnapshot.from_dict(json.load(f))
+        return self.load(tick)
 
     def get_latest_tick(self) -> int | None:
         """Get the tick number of the latest snapshot. Returns None if no snapshots exist."""
-        snapshots = list(self.snapshots_dir.glob("state_*.json"))
-        if not snapshots:
-            return None
-        return max(int(x.stem.split("_")[1]) for x in snapshots)
+        manifest = self._get_manifest()
+        return max(manifest) if manifest else None
 
     def list_snapshots(self) -> list[int]:
         """List all available snapshot tick numbers."""
-        return sorted(
-            int(x.stem.split("_")[1]) for x in self.snapshots_dir.glob("state_*.json")
+        return sorted(self._get_manifest())
+
+    # --- Internals ---
+
+    def _load_entry(self, entry: dict[str, Any]) -> VillageSnapshot:
+        path = self.snapshots_dir / entry["file"]
+        data = self._read(path)
+        if entry["kind"] == "delta":
+            base = self.load(entry["base"])
+            if base is None:
+                raise FileNotFoundError(f"Base snapshot {entry['base']} missing for {path.name}")
+            return _apply_delta(base, data)
+
+        snapshot = VillageSnapshot.from_dict(data)
+        if self._base is None or snapshot.tick > self._base.tick:
+            self._set_base(snapshot)
+        return snapshot
+
+    def _set_base(self, snapshot: VillageSnapshot) -> None:
+        self._base = snapshot
+        self._deltas_since_base = sum(
+            1 for e in self._get_manifest().values()
+            if e["kind"] == "delta" and e["base"] == snapshot.tick
         )
+
+    def _base_for_delta(self) -> VillageSnapshot | None:
+        """The full snapshot new deltas are taken against, loading it after a restart."""
+        if self._base is None:
+            fulls = [e for e in self._get_manifest().values() if e["kind"] == "full"]
+            if not fulls:
+                return None
+            self._load_entry(max(fulls, key=lambda e: e["tick"]))
+        return self._base
+
+    def _get_manifest(self) -> dict[int, dict[str, Any]]:
+        if self._manifest is None:
+            if self.manifest_path.exists():
+                self._manifest = {}
+                with open(self.manifest_path, "r") as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            # Torn final line from a crash mid-append
+                            continue
+                        self._manifest[entry["tick"]] = entry
+            else:
+                self._manifest = self._scan_legacy()
+                for entry in sorted(self._manifest.values(), key=lambda e: e["tick"]):
+                    self._append_manifest(entry, record=False)
+        return self._manifest
+
+    def _scan_legacy(self) -> dict[int, dict[str, Any]]:
+        """One-time listing of snapshot files written before the manifest existed."""
+        entries = {}
+        for path in self.snapshots_dir.glob("state_*.json*"):
+            if not path.name.endswith((".json", ".json.gz")):
+                continue
+            tick = int(path.name.split(".")[0].split("_")[1])
+            entries[tick] = {"tick": tick, "kind": "full", "file": path.name}
+        return entries
+
+    def _append_manifest(self, entry: dict[str, Any], record: bool = True) -> None:
+        if record:
+            self._get_manifest()[entry["tick"]] = entry
+        with open(self.manifest_path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    @staticmethod
+    def _write(path: Path, data: dict[str, Any]) -> None:
+        tmp = path.with_name(path.name + ".tmp")
+        payload = json.dumps(data, separators=(",", ":"), default=str).encode()
+        with open(tmp, "wb") as f:
+            f.write(gzip.compress(payload, compresslevel=6))
+        os.replace(tmp, path)
+
+    @staticmethod
+    def _read(path: Path) -> dict[str, Any]:
+        if path.suffix == ".gz":
+            with gzip.open(path, "rb") as f:
+                return json.loads(f.read())
+        with open(path, "r") as f:
+            return json.load(f)
+
+
+def _make_delta(base: VillageSnapshot, snapshot: VillageSnapshot) -> dict[str, Any]:
+    """Serialize what changed in `snapshot` relative to the full snapshot `base`."""
+    # Agents and conversations are diffed below; serializing them here too
+    # would cost as much as a full snapshot
+    data = snapshot._shared_to_dict()
+
+    agents = {
+        name: agent.model_dump(mode="json")
+        for name, agent in snapshot.agents.items()
+        if base.agents.get(name) != agent
+    }
+
+    conversations = {}
+    for conv_id, conv in snapshot.conversations.items():
+        old = base.conversations.get(conv_id)
+        if old is conv:
+            continue
+        history_base = 0
+        if old is not None and conv.history[:len(old.history)] == old.history:
+            if old == conv:
+                continue
+            history_base = len(old.history)
+        conv_data = conv.model_dump(mode="json", exclude={"history"})
+        conv_data["history_base"] = history_base
+        conv_data["history_tail"] = [
+            turn.model_dump(mode="json") for turn in conv.history[history_base:]
+        ]
+        conversations[conv_id] = conv_data
+
+    return {
+        "world": data["world"],
+        "pending_invites": data["pending_invites"],
+        "scheduler_state": data.get("scheduler_state"),
+        "unseen_endings": data.get("unseen_endings"),
+        "agents": agents,
+        "removed_agents": [name for name in base.agents if name not in snapshot.agents],
+        "conversations": conversations,
+        "removed_conversations": [c for c in base.conversations if c not in snapshot.conversations],
+    }
+
+
+def _apply_delta(base: VillageSnapshot, delta: dict[str, Any]) -> VillageSnapshot:
+    """Rebuild a snapshot from its full base and a delta written by _make_delta."""
+    agents = dict(base.agents)
+    for name in delta["removed_agents"]:
+        agents.pop(name, None)
+    for name, agent in delta["agents"].items():
+        agents[name] = AgentSnapshot.model_validate(agent)
+
+    conversations = dict(base.conversations)
+    for conv_id in delta["removed_conversations"]:
+        conversations.pop(conv_id, None)
+    for conv_id, conv_data in delta["conversations"].items():
+        conv_data = dict(conv_data)
+        history_base = conv_data.pop("history_base")
+        tail = tuple(ConversationTurn.model_validate(t) for t in conv_data.pop("history_tail"))
+        prefix = base.conversations[conv_id].history[:history_base] if history_base else ()
+        conv_data["history"] = prefix + tail
+        conversations[conv_id] = Conversation.model_validate(conv_data)
+
+    rest = VillageSnapshot.from_dict({
+        "world": delta["world"],
+        "agents": {},
+        "conversations": {},
+        "pending_invites": delta["pending_invites"],
+        **({"scheduler_state": delta["scheduler_state"]} if delta["scheduler_state"] is not None else {}),
+        **({"unseen_endings": delta["unseen_endings"]} if delta["unseen_endings"] is not None else {}),
+    })
+    return VillageSnapshot(
+        world=rest.world,
+        agents=agents,
+        conversations=conversations,
+        pending_invites=rest.pending_invites,
+        scheduler_state=rest.scheduler_state,
+        unseen_endings=rest.unseen_endings,
+    )
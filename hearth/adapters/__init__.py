@@ -15,6 +15,8 @@ from langsmith.integrations.claude_agent_sdk import configure_claude_agent_sdk
 configure_claude_agent_sdk()
 
 from .perception import AgentPerception, PerceptionBuilder, get_time_of_day
+from .narrative_cache import NarrativeCache, NarrativeCacheStats
+from .haiku_broker import HaikuBroker, HaikuBrokerStats
 from .claude_provider import HearthProvider, ProviderTurnResult, TurnTokenUsage
 from .prompt_builder import PromptBuilder, DEFAULT_AGENTS
 from .tracer import HearthTracer
@@ -32,6 +34,11 @@ __all__ = [
     "AgentPerception",
     "PerceptionBuilder",
     "get_time_of_day",
+    "NarrativeCache",
+    "NarrativeCacheStats",
+    # Haiku
+    "HaikuBroker",
+    "HaikuBrokerStats",
     # Provider
     "HearthProvider",
     "ProviderTurnResult",
@@ -0,0 +1,232 @@
+"""Shared Haiku request broker for Hearth.
+
+One Anthropic client for every Haiku caller (Narrator, PerceptionBuilder),
+with a cap on concurrent requests, coalescing of identical in-flight
+requests, retry with jittered backoff, and a latency histogram.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+import anthropic
+
+
+logger = logging.getLogger(__name__)
+
+
+# Upper bounds (seconds) of the latency histogram buckets; the last is open-ended
+LATENCY_BUCKETS: tuple[float, ...] = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+
+
+@dataclass(frozen=True)
+class HaikuBrokerStats:
+    """Counters for a HaikuBroker since the last reset."""
+
+    requests: int
+    """Calls made to the API, including retries."""
+
+    coalesced: int
+    """Calls answered by joining an identical in-flight request."""
+
+    retries: int
+    """Calls that were retried after a transient error."""
+
+    failures: int
+    """Calls that failed after all retries."""
+
+    latency_histogram: tuple[tuple[float, int], ...]
+    """(upper bound in seconds, count) for each latency bucket."""
+
+
+@dataclass
+class _InFlight:
+    """A request being sent, shared by every caller waiting on it."""
+
+    task: asyncio.Task[Any]
+    waiters: int = 0
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether an API error is transient and worth retrying."""
+    if isinstance(error, (anthropic.APIConnectionError, anthropic.RateLimitError)):
+        return True
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code >= 500
+    return False
+
+
+class HaikuBroker:
+    """Concurrency-limited, coalescing front for Haiku message requests.
+
+    Drop-in for the part of anthropic.AsyncAnthropic the callers use:
+    ``await broker.messages.create(**kwargs)``.
+
+    - At most max_concurrency requests are in flight at once; the rest wait.
+    - A request identical to one already in flight waits for that one's
+      response instead of being sent again. The request runs in its own
+      task, so cancelling one waiter leaves the others unaffected; it is
+      cancelled only once every waiter has gone.
+    - Transient errors (connection, 429, 5xx) are retried up to max_retries
+      times with full-jitter exponential backoff. The underlying client is
+      created with its own retries disabled so they don't multiply.
+    """
+
+    def __init__(
+        self,
+        client: anthropic.AsyncAnthropic | None = None,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        base_url: str | None = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        rng: Callable[[], float] = random.random,
+    ):
+        """Initialize HaikuBroker.
+
+        Args:
+            client: Anthropic client to share (lazy-initialized if None)
+            max_concurrency: Maximum simultaneous requests
+            max_retries: Retries after the first attempt for transient errors
+            base_delay: Backoff ceiling (seconds) for the first retry
+            max_delay: Largest backoff ceiling (seconds)
+            base_url: API base URL for the lazily created client (e.g., a local fake)
+            sleep: Sleep function, injectable for tests
+            rng: Uniform [0, 1) source for jitter, injectable for tests
+        """
+        self._client = client
+        self._injected = client
+        self._base_url = base_url
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_retries = max_retries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._sleep = sleep
+        self._rng = rng
+        self._in_flight: dict[str, _InFlight] = {}
+        self.reset_stats()
+
+    @property
+    def messages(self) -> HaikuBroker:
+        """Mirror ``client.messages`` so the broker can stand in for a client."""
+        return self
+
+    @property
+    def client(self) -> anthropic.AsyncAnthropic:
+        """The shared Anthropic client."""
+        if self._client is None:
+            self._client = anthropic.AsyncAnthropic(base_url=self._base_url, max_retries=0)
+        return self._client
+
+    async def close(self) -> None:
+        """Close the underlying client's connections (if we created it)."""
+        client, self._client = self._client, self._injected
+        if client is not None and client is not self._injected:
+            await client.close()
+
+    # -------------------------------------------------------------------------
+    # Requests
+    # -------------------------------------------------------------------------
+
+    async def create(self, **kwargs: Any) -> Any:
+        """Send a messages.create request through the broker.
+
+        Args:
+            **kwargs: Arguments for ``AsyncAnthropic.messages.create``
+
+        Returns:
+            The API response (shared with any coalesced callers)
+
+        Raises:
+            anthropic.APIError: If the request fails after all retries
+        """
+        key = self._request_key(kwargs)
+        request = self._in_flight.get(key)
+        if request is None:
+            request = _InFlight(asyncio.ensure_future(self._send(kwargs)))
+            self._in_flight[key] = request
+            request.task.add_done_callback(lambda _: self._forget(key, request))
+        else:
+            self._coalesced += 1
+
+        request.waiters += 1
+        try:
+            # Shielded: one waiter being cancelled mustn't cancel the others
+            return await asyncio.shield(request.task)
+        finally:
+            request.waiters -= 1
+            if request.waiters == 0 and not request.task.done():
+                # Nobody is left to take the response
+                request.task.cancel()
+
+    def _forget(self, key: str, request: _InFlight) -> None:
+        if self._in_flight.get(key) is request:
+            del self._in_flight[key]
+        if not request.task.cancelled():
+            # Mark retrieved so a failure nobody was left to see doesn't log a warning
+            request.task.exception()
+
+    async def _send(self, kwargs: dict[str, Any]) -> Any:
+        attempt = 0
+        while True:
+            async with self._semaphore:
+                started = time.perf_counter()
+                self._requests += 1
+                try:
+                    return await self.client.messages.create(**kwargs)
+                except Exception as e:
+                    error = e
+                finally:
+                    self._record_latency(time.perf_counter() - started)
+
+            if attempt >= self._max_retries or not is_retryable(error):
+                self._failures += 1
+                raise error
+
+            attempt += 1
+            self._retries += 1
+            delay = self._rng() * min(self._max_delay, self._base_delay * 2 ** (attempt - 1))
+            logger.debug(f"Haiku request failed ({error!r}); retry {attempt} in {delay:.2f}s")
+            await self._sleep(delay)
+
+    @staticmethod
+    def _request_key(kwargs: dict[str, Any]) -> str:
+        payload = json.dumps(kwargs, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # -------------------------------------------------------------------------
+    # Stats
+    # -------------------------------------------------------------------------
+
+    def _record_latency(self, seconds: float) -> None:
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self._latency_counts[i] += 1
+                return
+
+    @property
+    def stats(self) -> HaikuBrokerStats:
+        """Counters since the last reset_stats()."""
+        return HaikuBrokerStats(
+            requests=self._requests,
+            coalesced=self._coalesced,
+            retries=self._retries,
+            failures=self._failures,
+            latency_histogram=tuple(zip(LATENCY_BUCKETS, self._latency_counts)),
+        )
+
+    def reset_stats(self) -> None:
+        """Zero all counters (e.g., at the start of a tick)."""
+        self._requests = 0
+        self._coalesced = 0
+        self._retries = 0
+        self._failures = 0
+        self._latency_counts = [0] * len(LATENCY_BUCKETS)
@@ -0,0 +1,208 @@
+"""Narrative cache for Hearth perception.
+
+Content-addressed cache of Haiku narratives, keyed on the features, time of
+day and weather the narrative was generated from. An agent whose
+surroundings have not changed since the last tick gets the same narrative
+back without a network round-trip.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+
+@dataclass(frozen=True)
+class NarrativeCacheStats:
+    """Hit/miss counters for a NarrativeCache."""
+
+    hits: int
+    misses: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 if none yet)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class NarrativeCache:
+    """LRU cache of generated narratives with time-based expiry.
+
+    Entries are evicted least-recently-used once max_entries is reached,
+    and expire ttl_seconds after they were generated so a long-running
+    world still sees some variety in its prose.
+
+    If a path is given, entries are appended to it as JSONL when stored and
+    read back on first use, so the cache survives restarts. The file is
+    rewritten with only the live entries when it has grown to more than
+    twice max_entries lines.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float | None = 6 * 60 * 60,
+        path: Path | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize NarrativeCache.
+
+        Args:
+            max_entries: Maximum number of narratives kept in memory
+            ttl_seconds: Seconds before an entry expires (None = never)
+            path: Optional JSONL file to persist entries to
+            clock: Wall-clock source (seconds), injectable for tests
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._path = path
+        self._clock = clock
+        # key -> (created_at, narrative), oldest use first
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._loaded = path is None
+        self._file_lines = 0
+        self._hits = 0
+        self._misses = 0
+
+    # -------------------------------------------------------------------------
+    # Keys
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def make_key(features: dict, time_of_day: str, weather: str) -> str:
+        """Canonical hash of the inputs a narrative is generated from.
+
+        Args:
+            features: Extracted features dict
+            time_of_day: Current time of day
+            weather: Current weather value
+
+        Returns:
+            Hex digest identifying the narrative inputs
+        """
+        payload = json.dumps(
+            {"features": features, "time_of_day": time_of_day, "weather": weather},
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # -------------------------------------------------------------------------
+    # Lookup / Store
+    # -------------------------------------------------------------------------
+
+    def get(self, key: str) -> str | None:
+        """Get a cached narrative, counting the hit or miss.
+
+        Args:
+            key: Key from make_key()
+
+        Returns:
+            Narrative if cached and not expired, else None
+        """
+        self._ensure_loaded()
+        entry = self._entries.get(key)
+        if entry is not None and self._expired(entry[0]):
+            del self._entries[key]
+            entry = None
+
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry[1]
+
+    def put(self, key: str, narrative: str) -> None:
+        """Store a generated narrative.
+
+        Args:
+            key: Key from make_key()
+            narrative: Narrative text to cache
+        """
+        self._ensure_loaded()
+        created_at = self._clock()
+        self._insert(key, created_at, narrative)
+
+        if self._path is not None:
+            self._append(key, created_at, narrative)
+
+    def clear(self) -> None:
+        """Drop all entries (and the persisted file, if any)."""
+        self._entries.clear()
+        self._loaded = True
+        self._file_lines = 0
+        if self._path is not None and self._path.exists():
+            self._path.unlink()
+
+    @property
+    def stats(self) -> NarrativeCacheStats:
+        """Current hit/miss counters."""
+        return NarrativeCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            size=len(self._entries),
+        )
+
+    def reset_stats(self) -> None:
+        """Zero the hit/miss counters (e.g., at the start of a tick)."""
+        self._hits = 0
+        self._misses = 0
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _expired(self, created_at: float) -> bool:
+        return self._ttl is not None and self._clock() - created_at >= self._ttl
+
+    def _insert(self, key: str, created_at: float, narrative: str) -> None:
+        self._entries[key] = (created_at, narrative)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self._path.exists():
+            return
+
+        with open(self._path) as f:
+            for line in f:
+                self._file_lines += 1
+                try:
+                    record = json.loads(line)
+                    key, created_at, narrative = record["key"], record["created_at"], record["narrative"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+                if not self._expired(created_at):
+                    self._insert(key, created_at, narrative)
+
+        if self._file_lines > 2 * self._max_entries:
+            self._rewrite()
+
+    def _append(self, key: str, created_at: float, narrative: str) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._path, "a") as f:
+            f.write(json.dumps({"key": key, "created_at": created_at, "narrative": narrative}) + "\n")
+        self._file_lines += 1
+        if self._file_lines > 2 * self._max_entries:
+            self._rewrite()
+
+    def _rewrite(self) -> None:
+        tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+        with open(tmp, "w") as f:
+            for key, (created_at, narrative) in self._entries.items():
+                f.write(json.dumps({"key": key, "created_at": created_at, "narrative": narrative}) + "\n")
+        tmp.replace(self._path)
+        self._file_lines = len(self._entries)
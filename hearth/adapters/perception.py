@@ -6,8 +6,8 @@ This is the "eyes" of the agent - what they see and know about their surrounding
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable
 
 import anthropic
 from dotenv import load_dotenv
@@ -29,12 +29,16 @@ from core.world import Cell
 from core.agent import Agent, Inventory
 from core.objects import Sign, PlacedItem, AnyWorldObject
 from core.conversation import Invitation, ConversationContext
+from services.agent_service import AgentNotFoundError
+
+from .narrative_cache import NarrativeCache, NarrativeCacheStats
 
 if TYPE_CHECKING:
     from services.world_service import WorldService
     from services.agent_service import AgentService
     from services.conversation import ConversationService
     from storage import Storage
+    from .haiku_broker import HaikuBroker
 
 
 # -----------------------------------------------------------------------------
@@ -120,6 +124,39 @@ class AgentPerception:
     pending_invitation_text: str | None = None  # "Sage has invited you to talk."
 
 
+# -----------------------------------------------------------------------------
+# PerceptionSnapshot
+# -----------------------------------------------------------------------------
+
+
+@dataclass
+class PerceptionSnapshot:
+    """World state covering a group of perceiving agents, read in bulk.
+
+    Loaded once per cluster by PerceptionBuilder.load_snapshot so that each
+    agent's perception is derived in memory. Valid until something writes to
+    the world; callers load a fresh one after a turn that changed anything.
+    """
+
+    tick: int
+    weather: Weather
+    width: int
+    height: int
+    radius: int  # Effective vision radius at this tick
+    perceivers: frozenset[AgentName]
+    # Every agent inside the covered rect (perceivers included)
+    agents: dict[AgentName, Agent]
+    cells: dict[Position, Cell]
+    objects: list[AnyWorldObject]
+    invitations: dict[AgentName, Invitation] = field(default_factory=dict)
+    conversations: dict[AgentName, ConversationContext] = field(default_factory=dict)
+
+    def visible_rect(self, pos: Position) -> Rect:
+        """Rect an agent at pos can see (clamped to world bounds)."""
+        r = self.radius
+        return Rect(pos.x - r, pos.y - r, pos.x + r, pos.y + r).clamp(self.width, self.height)
+
+
 # -----------------------------------------------------------------------------
 # Box-Drawing Wall Characters
 # -----------------------------------------------------------------------------
@@ -234,9 +271,10 @@ class PerceptionBuilder:
         world_service: "WorldService",
         agent_service: "AgentService",
         conversation_service: "ConversationService | None" = None,
-        haiku_client: anthropic.AsyncAnthropic | None = None,
+        haiku_client: "anthropic.AsyncAnthropic | HaikuBroker | None" = None,
         haiku_model: str = "claude-haiku-4-5-20251001",
         vision_radius: int = 3,
+        narrative_cache: NarrativeCache | None = None,
     ):
         """Initialize PerceptionBuilder.
 
@@ -244,9 +282,10 @@ class PerceptionBuilder:
             world_service: WorldService for spatial queries
             agent_service: AgentService for agent queries
             conversation_service: ConversationService for conversation context
-            haiku_client: Anthropic client (lazy-initialized if None)
+            haiku_client: Anthropic client or shared HaikuBroker (lazy-initialized if None)
             haiku_model: Model to use for narrative generation
             vision_radius: How far agent can see (default 3 = 7x7 grid)
+            narrative_cache: Cache for Haiku narratives (in-memory if None)
         """
         self._world_service = world_service
         self._agent_service = agent_service
@@ -254,50 +293,142 @@ class PerceptionBuilder:
         self._haiku_client = haiku_client
         self._haiku_model = haiku_model
         self._vision_radius = vision_radius
+        self._narrative_cache = narrative_cache or NarrativeCache()
+
+    @property
+    def narrative_cache_stats(self) -> NarrativeCacheStats:
+        """Hit/miss counts for the narrative cache."""
+        return self._narrative_cache.stats
+
+    def reset_narrative_cache_stats(self) -> None:
+        """Zero the narrative cache hit/miss counts."""
+        self._narrative_cache.reset_stats()
+
+    def get_vision_radius(self, tick: int) -> int:
+        """Effective vision radius at a tick (reduced at night)."""
+        if get_time_of_day(tick) == "night":
+            return max(1, int(self._vision_radius * NIGHT_VISION_MODIFIER))
+        return self._vision_radius
+
+    async def load_snapshot(
+        self, agent_names: Iterable[AgentName], tick: int
+    ) -> PerceptionSnapshot:
+        """Read everything needed to perceive for a group of agents.
+
+        Agents, cells and objects are read once for the bounding rect of all
+        their views; invitations and conversations with one query each
+        (plus one load per distinct conversation).
+
+        Args:
+            agent_names: Agents who will perceive (typically one cluster)
+            tick: Current world tick
+
+        Returns:
+            PerceptionSnapshot covering those agents
+        """
+        perceivers = frozenset(agent_names)
+        world_state = await self._world_service.get_world_state()
+        width, height = await self._world_service.get_world_dimensions()
+        radius = self.get_vision_radius(tick)
+
+        positions = [
+            agent.position
+            for agent in await self._agent_service.get_agents(sorted(perceivers))
+        ]
+        agents: dict[AgentName, Agent] = {}
+        cells: dict[Position, Cell] = {}
+        objects: list[AnyWorldObject] = []
+        if positions:
+            covered = Rect(
+                min(p.x for p in positions) - radius,
+                min(p.y for p in positions) - radius,
+                max(p.x for p in positions) + radius,
+                max(p.y for p in positions) + radius,
+            ).clamp(width, height)
+            agents = {
+                a.name: a for a in await self._agent_service.get_agents_in_rect(covered)
+            }
+            cells = {
+                c.position: c for c in await self._world_service.get_cells_in_rect(covered)
+            }
+            objects = await self._world_service.get_objects_in_rect(covered)
+
+        snapshot = PerceptionSnapshot(
+            tick=tick,
+            weather=world_state.weather,
+            width=width,
+            height=height,
+            radius=radius,
+            perceivers=perceivers,
+            agents=agents,
+            cells=cells,
+            objects=objects,
+        )
+
+        if self._conversation_service is not None:
+            names = sorted(perceivers)
+            snapshot.invitations = await self._conversation_service.get_pending_invitations(names)
+            snapshot.conversations = await self._conversation_service.get_conversation_contexts(names)
 
-    async def build(self, agent_name: AgentName, tick: int) -> AgentPerception:
+        return snapshot
+
+    async def build(
+        self,
+        agent_name: AgentName,
+        tick: int,
+        snapshot: PerceptionSnapshot | None = None,
+    ) -> AgentPerception:
         """Build complete perception for an agent.
 
         Args:
             agent_name: Name of the agent to build perception for
             tick: Current world tick
+            snapshot: Shared snapshot covering this agent; loaded for this
+                agent alone if omitted
 
         Returns:
             AgentPerception with all context for the agent's turn
+
+        Raises:
+            AgentNotFoundError: If the agent doesn't exist
         """
-        # 1. Get agent and world state
-        agent = await self._agent_service.get_agent_or_raise(agent_name)
-        world_state = await self._world_service.get_world_state()
+        if snapshot is None or agent_name not in snapshot.perceivers:
+            snapshot = await self.load_snapshot([agent_name], tick)
+
+        # 1. Get agent from the snapshot
+        agent = snapshot.agents.get(agent_name)
+        if agent is None:
+            raise AgentNotFoundError(f"Agent '{agent_name}' not found", agent_name)
 
         # 2. Derive time of day
         time_of_day = get_time_of_day(tick)
 
-        # 3. Calculate effective vision radius (reduced at night)
-        effective_radius = self._vision_radius
-        if time_of_day == "night":
-            effective_radius = max(1, int(self._vision_radius * NIGHT_VISION_MODIFIER))
+        # 3-4. Visible cells and objects (vision reduced at night)
+        effective_radius = snapshot.radius
+        width, height = snapshot.width, snapshot.height
+        rect = snapshot.visible_rect(agent.position)
 
-        # 4. Get visible cells (clamped to world bounds)
-        width, height = await self._world_service.get_world_dimensions()
-        rect = Rect(
-            agent.position.x - effective_radius,
-            agent.position.y - effective_radius,
-            agent.position.x + effective_radius,
-            agent.position.y + effective_radius,
-        ).clamp(width, height)
-
-        cells = await self._world_service.get_cells_in_rect(rect)
-        objects = await self._world_service.get_objects_in_rect(rect)
+        cells = [
+            snapshot.cells.get(pos) or Cell(position=pos) for pos in rect.positions()
+        ]
+        objects = [obj for obj in snapshot.objects if rect.contains(obj.position)]
 
         # 5. Get agents in vision
-        other_agents = await self._agent_service.get_nearby_agents(
-            agent.position, radius=effective_radius
-        )
-        other_agents = [a for a in other_agents if a.name != agent_name]
+        other_agents = [
+            a for a in snapshot.agents.values()
+            if a.name != agent_name
+            and agent.position.distance_to(a.position) <= effective_radius
+        ]
 
         # Record meetings with visible agents (enables sense_others)
         for other in other_agents:
-            await self._agent_service.record_meeting(agent_name, other.name)
+            if other.name in agent.known_agents and agent_name in other.known_agents:
+                continue
+            agent, updated_other = await self._agent_service.record_meeting(
+                agent_name, other.name
+            )
+            snapshot.agents[agent_name] = agent
+            snapshot.agents[other.name] = updated_other
 
         # 6. Build grid view
         grid_view = self._build_grid_view(agent, cells, objects, other_agents, rect)
@@ -314,7 +445,7 @@ class PerceptionBuilder:
 
         # 8. Generate narrative
         narrative = await self._generate_narrative(
-            features, time_of_day, world_state.weather
+            features, time_of_day, snapshot.weather
         )
 
         # 9. Format state information
@@ -322,23 +453,15 @@ class PerceptionBuilder:
         journey_text = self._format_journey(agent)
         visible_agents_text = self._format_visible_agents(agent, other_agents)
 
-        # 10. Get conversation context (if service available)
+        # 10. Conversation context
         conversation_text = None
         pending_invitation_text = None
-        if self._conversation_service is not None:
-            # Check for pending invitation
-            pending_invite = await self._conversation_service.get_pending_invitation(
-                agent_name
-            )
-            if pending_invite is not None:
-                pending_invitation_text = self._format_invitation(pending_invite)
-
-            # Check for active conversation
-            conv_context = await self._conversation_service.get_conversation_context(
-                agent_name
-            )
-            if conv_context is not None:
-                conversation_text = self._format_conversation(conv_context)
+        pending_invite = snapshot.invitations.get(agent_name)
+        if pending_invite is not None:
+            pending_invitation_text = self._format_invitation(pending_invite)
+        conv_context = snapshot.conversations.get(agent_name)
+        if conv_context is not None:
+            conversation_text = self._format_conversation(conv_context)
 
         return AgentPerception(
             grid_view=grid_view,
@@ -348,7 +471,7 @@ class PerceptionBuilder:
             journey_text=journey_text,
             visible_agents_text=visible_agents_text,
             time_of_day=time_of_day,
-            weather=world_state.weather,
+            weather=snapshot.weather,
             position=agent.position,
             conversation_text=conversation_text,
             pending_invitation_text=pending_invitation_text,
@@ -735,6 +858,10 @@ class PerceptionBuilder:
     ) -> str:
         """Generate atmospheric narrative via Haiku.
 
+        Narratives are cached on (features, time_of_day, weather), so an
+        unchanged scene is described without calling Haiku again. Fallback
+        narratives are not cached, so a failed call is retried next time.
+
         Args:
             features: Extracted features dict
             time_of_day: Current time of day
@@ -743,6 +870,11 @@ class PerceptionBuilder:
         Returns:
             Atmospheric prose description
         """
+        cache_key = NarrativeCache.make_key(features, time_of_day, weather.value)
+        cached = self._narrative_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         if self._haiku_client is None:
             self._haiku_client = anthropic.AsyncAnthropic()
 
@@ -761,7 +893,9 @@ class PerceptionBuilder:
             )
 
             if response.content and len(response.content) > 0:
-                return response.content[0].text
+                narrative = response.content[0].text
+                self._narrative_cache.put(cache_key, narrative)
+                return narrative
 
             return self._fallback_narrative(features, time_of_day, weather)
         except Exception:
@@ -0,0 +1,206 @@
+"""Trace readers - load recent history from per-agent JSONL trace files.
+
+Trace files grow for the life of a world, so nothing here parses a
+whole file:
+- Recent entries and turns are read backwards from EOF in blocks,
+  stopping as soon as enough has been found.
+- Single turns are found through the turn index TraceWriter keeps next
+  to each trace file ("<agent>.idx", one "turn_id<TAB>byte offset" line
+  per turn_start), then read forwards from that offset.
+
+Trace files without an index (or with a stale one) fall back to the
+backwards scan.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+
+BLOCK_SIZE = 64 * 1024
+
+
+def index_path(trace_file: Path) -> Path:
+    """Path of the turn index kept alongside a trace file."""
+    return trace_file.with_suffix(".idx")
+
+
+def iter_lines_reversed(path: Path, block_size: int = BLOCK_SIZE) -> Iterator[bytes]:
+    """Yield a file's non-empty lines last to first, reading blocks from EOF.
+
+    Lines are yielded without their trailing newline.
+    """
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        remainder = b""
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            block = f.read(read_size) + remainder
+            lines = block.split(b"\n")
+            # The first piece may continue in the previous block
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                if line.strip():
+                    yield line
+        if remainder.strip():
+            yield remainder
+
+
+def _iter_entries_reversed(trace_file: Path) -> Iterator[dict[str, Any]]:
+    for line in iter_lines_reversed(trace_file):
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            continue
+
+
+def read_last_entries(trace_file: Path, limit: int) -> list[dict[str, Any]]:
+    """Return the last `limit` entries of a trace file, oldest first.
+
+    Args:
+        trace_file: Per-agent JSONL trace file
+        limit: Maximum entries to return
+
+    Returns:
+        List of trace entry dicts, most recent last
+    """
+    if limit <= 0 or not trace_file.exists():
+        return []
+
+    entries: list[dict[str, Any]] = []
+    for entry in _iter_entries_reversed(trace_file):
+        entries.append(entry)
+        if len(entries) >= limit:
+            break
+    entries.reverse()
+    return entries
+
+
+def read_recent_turns(
+    trace_file: Path,
+    count: int,
+) -> list[tuple[str, list[dict[str, Any]]]]:
+    """Return the last `count` complete turns (turn_start through turn_end).
+
+    Scans backwards until that many complete turns have been seen, so the
+    cost depends on the size of those turns, not of the file.
+
+    Args:
+        trace_file: Per-agent JSONL trace file
+        count: Number of turns to return
+
+    Returns:
+        (turn_id, events) pairs, oldest turn first, events in file order
+    """
+    if count <= 0 or not trace_file.exists():
+        return []
+
+    turns: dict[str, list[dict[str, Any]]] = {}
+    ended: set[str] = set()
+    complete: list[str] = []
+
+    for entry in _iter_entries_reversed(trace_file):
+        turn_id = entry.get("turn_id")
+        if not turn_id:
+            continue
+        turns.setdefault(turn_id, []).append(entry)
+
+        event_type = entry.get("event")
+        if event_type == "turn_end":
+            ended.add(turn_id)
+        elif event_type == "turn_start" and turn_id in ended:
+            # Scanning backwards, a turn's start is its last event seen
+            complete.append(turn_id)
+            if len(complete) >= count:
+                break
+
+    return [
+        (turn_id, list(reversed(turns[turn_id])))
+        for turn_id in reversed(complete)
+    ]
+
+
+def read_turn(trace_file: Path, turn_id: str) -> list[dict[str, Any]]:
+    """Return every event of one turn, in file order.
+
+    Seeks straight to the turn via the index when it has an entry for
+    it; otherwise scans backwards until the turn's start.
+
+    Args:
+        trace_file: Per-agent JSONL trace file
+        turn_id: The turn to load
+
+    Returns:
+        List of events for that turn
+    """
+    if not trace_file.exists():
+        return []
+
+    offset = _find_turn_offset(trace_file, turn_id)
+    if offset is not None:
+        events = _read_turn_from(trace_file, turn_id, offset)
+        if events is not None:
+            return events
+
+    events = []
+    for entry in _iter_entries_reversed(trace_file):
+        if entry.get("turn_id") != turn_id:
+            continue
+        events.append(entry)
+        if entry.get("event") == "turn_start":
+            break
+    events.reverse()
+    return events
+
+
+def _find_turn_offset(trace_file: Path, turn_id: str) -> int | None:
+    """Byte offset of a turn's start from the index, or None if not indexed."""
+    index = index_path(trace_file)
+    if not index.exists():
+        return None
+
+    key = turn_id.encode()
+    for line in iter_lines_reversed(index):
+        indexed_id, _, offset = line.partition(b"\t")
+        if indexed_id == key:
+            try:
+                return int(offset)
+            except ValueError:
+                return None
+    return None
+
+
+def _read_turn_from(
+    trace_file: Path,
+    turn_id: str,
+    offset: int,
+) -> list[dict[str, Any]] | None:
+    """Read a turn forwards from its indexed start; None if the index is stale."""
+    events: list[dict[str, Any]] = []
+    with open(trace_file, "rb") as f:
+        f.seek(offset)
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                if not events:
+                    return None
+                continue
+
+            if not events:
+                if entry.get("turn_id") != turn_id or entry.get("event") != "turn_start":
+                    return None
+            elif entry.get("event") == "turn_start":
+                break
+
+            if entry.get("turn_id") == turn_id:
+                events.append(entry)
+    return events
@@ -0,0 +1,309 @@
+"""TraceWriter - buffered background writer for JSONL trace files.
+
+Tracers call write() from the event loop (or any thread) while agents
+stream. Entries go onto a bounded in-memory queue; a writer thread
+serializes them, batches lines per file, and keeps files open between
+batches, flushing them periodically.
+
+Under bursts the queue applies backpressure: write() blocks briefly for
+a free slot, then drops the entry rather than stall the engine.
+Droppable entries (ones a later entry supersedes, like token updates)
+are dropped at once instead of blocking. Drops are counted and logged.
+
+Entries written with an index_key also get a "key<TAB>byte offset" line
+in an index file next to the trace file ("<agent>.idx"), so readers can
+seek straight to them (see trace_reader).
+
+The writer thread starts on the first write and exits (closing its
+files) after idling for a while, so an unused tracer holds no thread or
+file handles.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import queue
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from .trace_reader import index_path
+
+
+logger = logging.getLogger(__name__)
+
+
+class _Barrier:
+    """Queue marker: set once every entry queued before it is on disk."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+# (trace file, entry, index key)
+_Item = tuple[Path, dict[str, Any], str | None]
+
+
+class TraceWriter:
+    """Thread-safe, buffered JSONL appender backed by one writer thread.
+
+    Usage:
+        writer = TraceWriter()
+        writer.write(trace_dir / "Ember.jsonl", {"event": "text", ...})
+        writer.flush()  # Before reading the files back
+        writer.close()  # On shutdown
+    """
+
+    def __init__(
+        self,
+        max_queue: int = 10_000,
+        batch_size: int = 500,
+        flush_interval: float = 0.5,
+        block_timeout: float = 0.1,
+        idle_timeout: float = 5.0,
+    ):
+        """Initialize writer.
+
+        Args:
+            max_queue: Entries buffered before write() applies backpressure
+            batch_size: Max entries written per batch
+            flush_interval: Max seconds a written entry waits in file buffers
+            block_timeout: Seconds write() waits for a queue slot before
+                dropping a non-droppable entry
+            idle_timeout: Seconds without writes before the thread exits
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.block_timeout = block_timeout
+        self.idle_timeout = idle_timeout
+
+        self._queue: queue.Queue[_Item | _Barrier] = queue.Queue(max_queue)
+        self._files: dict[Path, BinaryIO] = {}
+
+        # Guards starting the thread vs. the thread deciding to exit
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+        self._dropped = 0
+        self._dropped_reported = 0
+
+        _live_writers.add(self)
+
+    @property
+    def dropped(self) -> int:
+        """Entries dropped because the queue was full."""
+        return self._dropped
+
+    def write(
+        self,
+        path: Path,
+        entry: dict[str, Any],
+        droppable: bool = False,
+        index_key: str | None = None,
+    ) -> bool:
+        """Queue an entry to be appended to path as one JSON line.
+
+        Never blocks longer than block_timeout. After close(), entries are
+        written synchronously.
+
+        Args:
+            path: JSONL file to append to
+            entry: JSON-serializable dict; must not be mutated afterwards
+            droppable: Drop at once instead of blocking if the queue is full
+            index_key: If given, record this entry's offset under this key
+                in the trace file's index
+
+        Returns:
+            False if the entry was dropped
+        """
+        if self._closed:
+            with open(path, "ab") as f:
+                index_lines = _append(path, [(entry, index_key)], f)
+            if index_lines:
+                with open(index_path(path), "ab") as f:
+                    f.write(index_lines)
+            return True
+
+        item = (path, entry, index_key)
+        try:
+            if droppable:
+                self._queue.put_nowait(item)
+            else:
+                self._queue.put(item, timeout=self.block_timeout)
+        except queue.Full:
+            with self._lock:
+                self._dropped += 1
+            return False
+
+        self._ensure_thread()
+        return True
+
+    def flush(self) -> None:
+        """Block until every entry queued so far has been written and flushed."""
+        if self._closed:
+            return
+        self._wait_for_barrier()
+
+    def close(self) -> None:
+        """Write everything queued, stop the thread, and close files."""
+        if self._closed:
+            return
+        # Writes racing with close() go straight to disk from here on
+        self._closed = True
+        self._wait_for_barrier().join()
+
+    # -------------------------------------------------------------------------
+    # Writer thread
+    # -------------------------------------------------------------------------
+
+    def _ensure_thread(self) -> threading.Thread:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, daemon=True, name="TraceWriter"
+                )
+                self._thread.start()
+            return self._thread
+
+    def _wait_for_barrier(self) -> threading.Thread:
+        barrier = _Barrier()
+        self._queue.put(barrier)
+        thread = self._ensure_thread()
+        barrier.done.wait()
+        return thread
+
+    def _run(self) -> None:
+        dirty = False
+        last_flush = time.monotonic()
+        while True:
+            try:
+                first = self._queue.get(
+                    timeout=self.flush_interval if dirty else self.idle_timeout
+                )
+            except queue.Empty:
+                if dirty:
+                    self._flush_files()
+                    dirty = False
+                    last_flush = time.monotonic()
+                elif self._exit_if_idle():
+                    return
+                continue
+
+            batch = [first]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            barriers = self._write_batch(batch)
+            dirty = True
+            if barriers or time.monotonic() - last_flush >= self.flush_interval:
+                self._flush_files()
+                dirty = False
+                last_flush = time.monotonic()
+            for barrier in barriers:
+                barrier.done.set()
+
+            if self._closed and self._exit_if_idle():
+                return
+
+    def _write_batch(self, batch: list[_Item | _Barrier]) -> list[_Barrier]:
+        """Append a batch, one write() per file; return the barriers in it."""
+        by_path: dict[Path, list[tuple[dict[str, Any], str | None]]] = {}
+        barriers: list[_Barrier] = []
+        for item in batch:
+            if isinstance(item, _Barrier):
+                barriers.append(item)
+            else:
+                path, entry, index_key = item
+                by_path.setdefault(path, []).append((entry, index_key))
+
+        for path, entries in by_path.items():
+            try:
+                index_lines = _append(path, entries, self._open(path))
+                if index_lines:
+                    self._open(index_path(path)).write(index_lines)
+            except OSError:
+                logger.exception("Failed to write trace file %s", path)
+
+        self._report_drops()
+        return barriers
+
+    def _open(self, path: Path) -> BinaryIO:
+        f = self._files.get(path)
+        if f is None:
+            f = self._files[path] = open(path, "ab")
+        return f
+
+    def _flush_files(self) -> None:
+        for path, f in self._files.items():
+            try:
+                f.flush()
+            except OSError:
+                logger.exception("Failed to flush trace file %s", path)
+
+    def _close_files(self) -> None:
+        for f in self._files.values():
+            try:
+                f.close()
+            except OSError:
+                pass
+        self._files.clear()
+
+    def _exit_if_idle(self) -> bool:
+        """Stop the thread if the queue is empty; a later write starts a new one."""
+        with self._lock:
+            if not self._queue.empty():
+                return False
+            self._close_files()
+            self._thread = None
+            return True
+
+    def _report_drops(self) -> None:
+        dropped = self._dropped
+        if dropped != self._dropped_reported:
+            logger.warning(
+                "TRACE_DROPPED | %d entries dropped under load (%d total)",
+                dropped - self._dropped_reported,
+                dropped,
+            )
+            self._dropped_reported = dropped
+
+
+def _append(
+    path: Path,
+    entries: list[tuple[dict[str, Any], str | None]],
+    f: BinaryIO,
+) -> bytes:
+    """Append entries as JSON lines to f; return index lines for keyed ones."""
+    offset = f.tell()
+    data = bytearray()
+    index_lines = bytearray()
+    for entry, index_key in entries:
+        try:
+            line = json.dumps(entry).encode() + b"\n"
+        except (TypeError, ValueError):
+            logger.exception("Unserializable trace entry for %s", path.name)
+            continue
+        if index_key is not None:
+            index_lines += f"{index_key}\t{offset + len(data)}\n".encode()
+        data += line
+    f.write(data)
+    return bytes(index_lines)
+
+
+# Writers still holding entries at interpreter exit get flushed, since their
+# threads are daemons and would otherwise be killed mid-buffer
+_live_writers: weakref.WeakSet[TraceWriter] = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_writers() -> None:
+    for writer in list(_live_writers):
+        writer.close()
@@ -4,11 +4,11 @@ Enables:
 - Real-time streaming to TUI for live agent monitoring
 - Persistent trace files for history loading and debugging
 - Thread-safe operation for concurrent agent turns
+- File writes on a background thread (TraceWriter), off the event loop
 """
 
 from __future__ import annotations
 
-import json
 import threading
 import uuid
 from datetime import datetime
@@ -18,6 +18,9 @@ from typing import Any, Callable
 from core.types import AgentName, Position
 from core.constants import HEARTH_TZ
 
+from .trace_reader import read_last_entries, read_turn
+from .trace_writer import TraceWriter
+
 
 class HearthTracer:
     """Thread-safe tracer for agent activity.
@@ -32,16 +35,24 @@ class HearthTracer:
     - tool_result: Tool response
     - turn_end: End of turn
     - token_update: Context window size update
+
+    Callbacks fire synchronously; file writes are queued to a TraceWriter,
+    so call flush() before reading trace files directly.
     """
 
-    def __init__(self, trace_dir: Path):
+    # Superseded by the next event of the same type, so safe to drop under load
+    DROPPABLE_EVENTS = frozenset({"token_update"})
+
+    def __init__(self, trace_dir: Path, writer: TraceWriter | None = None):
         """Initialize tracer.
 
         Args:
             trace_dir: Directory for trace files (e.g., data/traces)
+            writer: Background file writer (default: a new TraceWriter)
         """
         self.trace_dir = trace_dir
         self.trace_dir.mkdir(parents=True, exist_ok=True)
+        self._writer = writer or TraceWriter()
 
         # Thread-safe callback management
         self._callbacks: list[Callable[[str, dict], None]] = []
@@ -69,6 +80,14 @@ class HearthTracer:
             if callback in self._callbacks:
                 self._callbacks.remove(callback)
 
+    def flush(self) -> None:
+        """Block until every event logged so far is written to its trace file."""
+        self._writer.flush()
+
+    def close(self) -> None:
+        """Write out pending events and stop the writer thread."""
+        self._writer.close()
+
     def _get_trace_file(self, agent_name: str) -> Path:
         """Get the trace file path for an agent."""
         return self.trace_dir / f"{agent_name}.jsonl"
@@ -98,10 +117,13 @@ class HearthTracer:
             **data
         }
 
-        # Write to file (per-agent file minimizes contention)
-        trace_file = self._get_trace_file(agent_name)
-        with open(trace_file, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        # Queue for the writer thread (per-agent file minimizes contention)
+        self._writer.write(
+            self._get_trace_file(agent_name),
+            entry,
+            droppable=event_type in self.DROPPABLE_EVENTS,
+            index_key=turn_id if event_type == "turn_start" else None,
+        )
 
         # Notify callbacks (copy list under lock, invoke outside)
         with self._callbacks_lock:
@@ -283,26 +305,12 @@ class HearthTracer:
         Returns:
             List of trace entry dicts, most recent last
         """
-        trace_file = self._get_trace_file(agent_name)
-        if not trace_file.exists():
-            return []
-
-        entries = []
+        self.flush()
         try:
-            with open(trace_file, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            entries.append(json.loads(line))
-                        except json.JSONDecodeError:
-                            continue
-        except IOError:
+            return read_last_entries(self._get_trace_file(agent_name), limit)
+        except OSError:
             return []
 
-        # Return last N entries
-        return entries[-limit:]
-
     def get_turn_history(
         self,
         agent_name: str,
@@ -310,6 +318,9 @@ class HearthTracer:
     ) -> list[dict[str, Any]]:
         """Get all events for a specific turn.
 
+        Seeks to the turn through the trace file's turn index, so old
+        turns load as fast as recent ones.
+
         Args:
             agent_name: Which agent
             turn_id: The turn ID to find
@@ -317,5 +328,8 @@ class HearthTracer:
         Returns:
             List of events for that turn
         """
-        entries = self.load_recent_entries(agent_name, limit=1000)
-        return [e for e in entries if e.get("turn_id") == turn_id]
+        self.flush()
+        try:
+            return read_turn(self._get_trace_file(agent_name), turn_id)
+        except OSError:
+            return []
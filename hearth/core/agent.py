@@ -292,6 +292,18 @@ class Agent(BaseModel):
         """Check if agent is currently on a journey."""
         return self.journey is not None and not self.journey.is_complete
 
+    def changed_fields(self, since: Agent) -> frozenset[str]:
+        """Names of fields that differ from an earlier version of this agent.
+
+        Agents are immutable, so dirtiness is relative to a baseline: the
+        repository passes the version it last stored.
+        """
+        return frozenset(
+            name
+            for name in type(self).model_fields
+            if getattr(self, name) != getattr(since, name)
+        )
+
     def with_position(self, pos: Position) -> Agent:
         """Return a new agent at the given position."""
         return self.model_copy(update={"position": pos})
@@ -29,7 +29,7 @@ from services import (
     ConversationService,
 )
 from services.scheduler import Scheduler
-from adapters import PerceptionBuilder, get_time_of_day
+from adapters import PerceptionBuilder, NarrativeCache, HaikuBroker, get_time_of_day
 from adapters.tracer import HearthTracer
 from adapters.claude_provider import HearthProvider
 from observe.api import ObserverAPI
@@ -58,6 +58,7 @@ class HearthEngine:
         vision_radius: int | None = None,
         agents_root: Path | None = None,
         enable_llm: bool = True,
+        transactional_ticks: bool = False,
     ):
         """Initialize HearthEngine.
 
@@ -66,9 +67,12 @@ class HearthEngine:
             vision_radius: Vision radius for agents (default: 3)
             agents_root: Root directory for agent home directories
             enable_llm: Whether to enable LLM calls (False for testing)
+            transactional_ticks: Run each tick in one storage unit of work,
+                committing all its writes and events together
         """
         self._storage = storage
         self._enable_llm = enable_llm
+        self._transactional_ticks = transactional_ticks
         self._agents_root = agents_root or Path("agents")
 
         # Vision radius is the single source of truth
@@ -87,14 +91,18 @@ class HearthEngine:
             self._conversation,
             vision_radius=self._vision_radius,
         )
-        self._narrator = Narrator()
+        # One Haiku client for narration and perception, with a concurrency cap
+        self._haiku = HaikuBroker()
+        self._narrator = Narrator(client=self._haiku)
 
         # PerceptionBuilder and Scheduler share vision_radius
         self._perception = PerceptionBuilder(
             self._world_service,
             self._agent_service,
             conversation_service=self._conversation,
+            haiku_client=self._haiku,
             vision_radius=self._vision_radius,
+            narrative_cache=NarrativeCache(path=storage.data_dir / "narratives.jsonl"),
         )
         self._scheduler = Scheduler(vision_radius=self._vision_radius)
 
@@ -161,12 +169,18 @@ class HearthEngine:
             Final TickContext after all phases complete
         """
         self._tick += 1
-
-        # Build initial context
-        ctx = await self._build_context()
-
-        # Execute pipeline
-        ctx = await self._pipeline.execute(ctx)
+        self._haiku.reset_stats()
+
+        if self._transactional_ticks:
+            try:
+                async with self._storage.unit_of_work():
+                    ctx = await self._run_tick()
+            except BaseException:
+                # Nothing from the tick was committed; run it again next time
+                self._tick -= 1
+                raise
+        else:
+            ctx = await self._run_tick()
 
         # Notify callbacks
         for callback in self._tick_callbacks:
@@ -174,6 +188,11 @@ class HearthEngine:
 
         return ctx
 
+    async def _run_tick(self) -> TickContext:
+        """Build the tick's context and run it through the pipeline."""
+        ctx = await self._build_context()
+        return await self._pipeline.execute(ctx)
+
     async def _build_context(self) -> TickContext:
         """Build initial TickContext for a tick.
 
@@ -272,6 +291,11 @@ class HearthEngine:
         """Get perception builder."""
         return self._perception
 
+    @property
+    def haiku_broker(self) -> HaikuBroker:
+        """Get the shared Haiku broker (stats cover the latest tick)."""
+        return self._haiku
+
     @property
     def tracer(self) -> HearthTracer:
         """Get tracer."""
@@ -286,3 +310,5 @@ class HearthEngine:
         """Clean shutdown of engine resources."""
         if self._provider:
             await self._provider.disconnect_all()
+        await self._haiku.close()
+        self._tracer.close()
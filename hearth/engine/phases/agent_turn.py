@@ -3,6 +3,9 @@
 Executes agent turns using cluster-based ordering:
 - Different clusters run in parallel (asyncio.gather)
 - Agents within a cluster run sequentially (round-robin)
+
+Perception for a cluster is built from one shared PerceptionSnapshot, which
+is reloaded only after a turn that changed the world.
 """
 
 from __future__ import annotations
@@ -16,7 +19,7 @@ from core.events import DomainEvent
 from ..context import TickContext, TurnResult
 
 if TYPE_CHECKING:
-    from adapters.perception import PerceptionBuilder
+    from adapters.perception import PerceptionBuilder, PerceptionSnapshot
     from adapters.claude_provider import HearthProvider
 
 
@@ -61,6 +64,8 @@ class AgentTurnPhase:
             # No agents to execute
             return ctx
 
+        self._perception.reset_narrative_cache_stats()
+
         # Execute clusters in parallel, agents within cluster sequentially
         cluster_tasks = [
             self._execute_cluster(cluster, ctx) for cluster in ctx.clusters
@@ -78,6 +83,13 @@ class AgentTurnPhase:
                 turn_results[result.agent_name] = result
                 all_events.extend(result.events)
 
+        stats = self._perception.narrative_cache_stats
+        if stats.hits or stats.misses:
+            logger.debug(
+                f"Tick {ctx.tick} narrative cache: {stats.hits} hits, "
+                f"{stats.misses} misses ({stats.size} cached)"
+            )
+
         return ctx.with_turn_results(turn_results).append_events(all_events)
 
     async def _execute_cluster(
@@ -93,27 +105,41 @@ class AgentTurnPhase:
             List of TurnResults for all agents in the cluster
         """
         results: list[TurnResult] = []
+        snapshot = await self._perception.load_snapshot(cluster, ctx.tick)
 
-        for agent_name in cluster:
-            result = await self._execute_agent_turn(agent_name, ctx)
+        for i, agent_name in enumerate(cluster):
+            result, may_have_written = await self._execute_agent_turn(
+                agent_name, ctx, snapshot
+            )
             results.append(result)
 
+            # Later agents must see what this one changed
+            remaining = cluster[i + 1:]
+            if remaining and may_have_written:
+                snapshot = await self._perception.load_snapshot(remaining, ctx.tick)
+
         return results
 
     async def _execute_agent_turn(
-        self, agent_name: AgentName, ctx: TickContext
-    ) -> TurnResult:
+        self,
+        agent_name: AgentName,
+        ctx: TickContext,
+        snapshot: "PerceptionSnapshot | None" = None,
+    ) -> tuple[TurnResult, bool]:
         """Execute a single agent's turn.
 
         Args:
             agent_name: Name of the agent
             ctx: Current tick context
+            snapshot: Shared perception snapshot covering the agent's cluster
 
         Returns:
-            TurnResult with perception, actions, events, and narrative
+            TurnResult with perception, actions, events, and narrative, and
+            whether the turn may have changed the world (acted, or failed
+            partway through)
         """
         # Build perception
-        perception = await self._perception.build(agent_name, ctx.tick)
+        perception = await self._perception.build(agent_name, ctx.tick, snapshot)
 
         # If no provider, return stub result
         if self._provider is None:
@@ -123,7 +149,7 @@ class AgentTurnPhase:
                 perception=perception,
                 actions_taken=[],
                 events=[],
-            )
+            ), False
 
         # Get agent from context
         agent = ctx.agents.get(agent_name)
@@ -134,7 +160,7 @@ class AgentTurnPhase:
                 perception=perception,
                 actions_taken=[],
                 events=[],
-            )
+            ), False
 
         # Skip sleeping agents
         if agent.is_sleeping:
@@ -144,7 +170,7 @@ class AgentTurnPhase:
                 perception=perception,
                 actions_taken=[],
                 events=[],
-            )
+            ), False
 
         # Execute turn via provider
         try:
@@ -154,7 +180,7 @@ class AgentTurnPhase:
                 tick=ctx.tick,
             )
 
-            return TurnResult(
+            result = TurnResult(
                 agent_name=agent_name,
                 perception=perception,
                 actions_taken=provider_result.actions_taken,
@@ -163,6 +189,7 @@ class AgentTurnPhase:
                 session_id=provider_result.session_id,
                 token_usage=provider_result.token_usage,
             )
+            return result, bool(result.actions_taken or result.events)
 
         except Exception as e:
             logger.exception(f"[{agent_name}] Error executing turn: {e}")
@@ -171,4 +198,4 @@ class AgentTurnPhase:
                 perception=perception,
                 actions_taken=[],
                 events=[],
-            )
+            ), True
@@ -1,11 +1,16 @@
 """World generation for Hearth."""
 
-from .terrain import generate_terrain, generate_terrain_grid
+from .terrain import generate_terrain, generate_terrain_grid, TerrainGrid
+from .chunked import generate_terrain_chunked, stream_terrain_chunked, iterate_in_thread
 from .tileset import create_hearth_tileset, TILE_TO_TERRAIN
 
 __all__ = [
     "generate_terrain",
     "generate_terrain_grid",
+    "TerrainGrid",
+    "generate_terrain_chunked",
+    "stream_terrain_chunked",
+    "iterate_in_thread",
     "create_hearth_tileset",
     "TILE_TO_TERRAIN",
 ]
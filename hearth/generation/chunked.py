@@ -0,0 +1,370 @@
+"""
+Chunked, multi-process terrain generation.
+
+Solving a whole 500x500+ world as one WFC grid is single-threaded, and one
+contradiction restarts the entire map. Instead the world is tiled into
+blocks separated by narrow seams:
+
+    +--------+--+--------+
+    | block  |v | block  |     1. blocks are solved independently, in parallel
+    +--------+--+--------+     2. vertical seams (v) are solved against the
+    |  horizontal strip  |        fixed block columns on either side
+    +--------+--+--------+     3. horizontal strips are solved against the
+    | block  |v | block  |        fixed rows above and below
+    +--------+--+--------+
+
+Every region gets a seed derived from the world seed and its coordinates,
+so output depends only on the seed (not on worker count or scheduling),
+and a contradiction only retries the region it happened in.
+
+stream_terrain_chunked() yields each region's cells as soon as it is
+solved, so callers can write them out while later regions are still being
+generated. Only one byte per cell is kept for stitching.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import random
+import threading
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator
+
+from core.types import Position
+from core.terrain import Terrain
+from .tileset import create_hearth_tileset, TILE_TO_TERRAIN
+from .wfc import Grid, WFCSolver
+
+
+# Tile IDs in bit order (Grid sorts them); cells store index + 1, 0 = unsolved
+_TILE_ORDER: tuple[str, ...] = tuple(sorted(TILE_TO_TERRAIN))
+_TERRAIN_BY_CODE: tuple[Terrain | None, ...] = (None,) + tuple(TILE_TO_TERRAIN[t] for t in _TILE_ORDER)
+
+
+# -----------------------------------------------------------------------------
+# Regions
+# -----------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class _Region:
+    """One rectangle to solve, with any cells already fixed by its neighbors."""
+
+    kind: str
+    x: int
+    y: int
+    width: int
+    height: int
+    seed: str
+    # (local x, local y, tile id) for border cells copied from solved neighbors
+    fixed: tuple[tuple[int, int, str], ...] = ()
+    solver_args: dict = field(default_factory=dict)
+
+
+def _split_axis(length: int, block: int, seam: int) -> list[tuple[int, int]]:
+    """Split [0, length) into blocks of ~block cells with seam-sized gaps.
+
+    Returns (start, end) of each block; the gaps are the spans between them.
+    A tail too short for another gap and block is merged into the last block.
+    """
+    blocks = []
+    start = 0
+    while start < length:
+        end = min(start + block, length)
+        if length - end <= seam:
+            end = length
+        blocks.append((start, end))
+        start = end + seam
+    return blocks
+
+
+def _solve_region(region: _Region, max_retries: int) -> bytes | None:
+    """Solve one region (runs in a worker process).
+
+    Returns one tile code per cell, row-major (see _TILE_ORDER), or None
+    if every attempt hit a contradiction.
+    """
+    tileset = create_hearth_tileset()
+
+    for attempt in range(max_retries):
+        random.seed(f"{region.seed}:{attempt}")
+        grid = Grid(region.width, region.height, set(tileset.keys()))
+        solver = WFCSolver(grid, tileset, **region.solver_args)
+
+        fixed_cells = []
+        for x, y, tile_id in region.fixed:
+            cell = grid.get_cell(x, y)
+            cell.collapse_to(tile_id)
+            fixed_cells.append(cell)
+        if fixed_cells and not solver.propagate(fixed_cells):
+            # The borders themselves are incompatible; retrying won't help
+            return None
+
+        if solver.solve():
+            # A collapsed cell's mask is the single bit for its tile
+            return bytes(mask.bit_length() for mask in grid.masks)
+
+    return None
+
+
+def _solve_all(
+    regions: list[_Region],
+    max_retries: int,
+    executor: ProcessPoolExecutor | None,
+) -> Iterator[tuple[_Region, bytes | None]]:
+    """Solve independent regions, in parallel if an executor is given."""
+    if executor is None:
+        results: Iterable[bytes | None] = (_solve_region(r, max_retries) for r in regions)
+    else:
+        results = executor.map(_solve_region, regions, [max_retries] * len(regions))
+    return zip(regions, results)
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    """Start method for solver workers.
+
+    Never fork: generation runs on a worker thread (see iterate_in_thread)
+    alongside the event loop and database threads, and forking a
+    multi-threaded process can deadlock on locks held at fork time.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+# -----------------------------------------------------------------------------
+# Generator
+# -----------------------------------------------------------------------------
+
+
+def generate_terrain_chunked(
+    width: int = 500,
+    height: int = 500,
+    seed: int | None = None,
+    **kwargs,
+) -> dict[Position, Terrain]:
+    """
+    Generate terrain in independently solved chunks, across processes.
+
+    Args:
+        width: World width in cells
+        height: World height in cells
+        seed: Random seed for reproducibility (None = random)
+        **kwargs: Additional arguments passed to stream_terrain_chunked()
+
+    Returns:
+        Dict mapping Position to Terrain for non-grass cells.
+        (Grass is the default terrain, so only non-default cells are returned)
+
+    Raises:
+        ValueError: If chunk_size or seam_width is not positive
+        RuntimeError: If a chunk or seam fails after max_retries attempts
+    """
+    result: dict[Position, Terrain] = {}
+    for cells in stream_terrain_chunked(width, height, seed, **kwargs):
+        result.update(cells)
+    return result
+
+
+def stream_terrain_chunked(
+    width: int = 500,
+    height: int = 500,
+    seed: int | None = None,
+    chunk_size: int = 64,
+    seam_width: int = 6,
+    workers: int | None = None,
+    batch_size: int = 100,
+    min_batch_distance: int = 4,
+    max_water_ratio: float = 0.3,
+    fill_bias: float = 0.5,
+    progress_callback: Callable[[int, int], None] | None = None,
+    max_retries: int = 10,
+) -> Iterator[list[tuple[Position, Terrain]]]:
+    """
+    Generate terrain in chunks, yielding each region's cells once solved.
+
+    Regions finish chunk by chunk, then seam by seam; a region's cells never
+    change after they are yielded. The generator holds one byte per cell
+    for stitching, plus whatever regions the worker pool has in flight.
+
+    Args:
+        width: World width in cells
+        height: World height in cells
+        seed: Random seed for reproducibility (None = random)
+        chunk_size: Side of each independently solved block
+        seam_width: Width of the seams between blocks. Must leave room for
+                    the terrain gradient (water to stone needs 4 cells).
+        workers: Worker processes (None = all cores, 1 = solve in-process)
+        batch_size: Cells to collapse per step within a chunk
+        min_batch_distance: Minimum Manhattan distance between simultaneous collapses
+        max_water_ratio: Max fraction of batch that can be water (0.0-1.0)
+        fill_bias: Bias toward filling interior cells (0 = spread, 1+ = fill)
+        progress_callback: Optional callback(cells_done, total_cells), called
+                           as each chunk or seam finishes
+        max_retries: Attempts per chunk or seam before giving up
+
+    Yields:
+        (Position, Terrain) pairs for the non-grass cells of each region
+        (grass is the default terrain, so it is left out)
+
+    Raises:
+        ValueError: If chunk_size or seam_width is not positive
+        RuntimeError: If a chunk or seam fails after max_retries attempts
+    """
+    if chunk_size < 1 or seam_width < 1:
+        raise ValueError("chunk_size and seam_width must be positive")
+
+    if seed is None:
+        seed = random.randrange(2**63)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    solver_args = {
+        "batch_size": batch_size,
+        "min_batch_distance": min_batch_distance,
+        "max_water_ratio": max_water_ratio,
+        "fill_bias": fill_bias,
+        "snapshot_interval": 1000,
+        "max_backtracks": 10,
+    }
+
+    total_cells = width * height
+    codes = bytearray(total_cells)
+    done = 0
+
+    def store(region: _Region, result: bytes | None) -> list[tuple[Position, Terrain]]:
+        nonlocal done
+        if result is None:
+            raise RuntimeError(
+                f"Terrain {region.kind} at ({region.x}, {region.y}) failed after "
+                f"{max_retries} attempts. Try a wider seam_width or other parameters."
+            )
+        fixed = {(x, y) for x, y, _ in region.fixed}
+        cells = []
+        for ly in range(region.height):
+            y = region.y + ly
+            row = y * width
+            for lx in range(region.width):
+                if (lx, ly) in fixed:
+                    continue
+                code = result[ly * region.width + lx]
+                x = region.x + lx
+                codes[row + x] = code
+                terrain = _TERRAIN_BY_CODE[code]
+                if terrain != Terrain.GRASS:
+                    cells.append((Position(x, y), terrain))
+        done += region.width * region.height - len(fixed)
+        if progress_callback is not None:
+            progress_callback(done, total_cells)
+        return cells
+
+    def tile_at(x: int, y: int) -> str:
+        code = codes[y * width + x]
+        assert code, f"({x}, {y}) used as a border before it was solved"
+        return _TILE_ORDER[code - 1]
+
+    columns = _split_axis(width, chunk_size, seam_width)
+    rows = _split_axis(height, chunk_size, seam_width)
+
+    executor = (
+        ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context())
+        if workers > 1
+        else None
+    )
+    try:
+        # 1. Blocks: no shared borders, fully independent
+        blocks = [
+            _Region("chunk", x0, y0, x1 - x0, y1 - y0, f"{seed}:chunk:{x0}:{y0}", solver_args=solver_args)
+            for y0, y1 in rows
+            for x0, x1 in columns
+        ]
+        for region, result in _solve_all(blocks, max_retries, executor):
+            yield store(region, result)
+
+        # 2. Vertical seams between horizontally adjacent blocks, one block
+        #    column on each side fixed
+        seams = []
+        for y0, y1 in rows:
+            for (_, left_end), (right_start, _) in zip(columns, columns[1:]):
+                x0, x1 = left_end - 1, right_start + 1
+                fixed = tuple(
+                    (lx, ly, tile_at(x0 + lx, y0 + ly))
+                    for ly in range(y1 - y0)
+                    for lx in (0, x1 - x0 - 1)
+                )
+                seams.append(
+                    _Region("seam", x0, y0, x1 - x0, y1 - y0, f"{seed}:vseam:{x0}:{y0}", fixed, solver_args)
+                )
+        for region, result in _solve_all(seams, max_retries, executor):
+            yield store(region, result)
+
+        # 3. Horizontal strips across the full width, the solved row above
+        #    and below fixed
+        strips = []
+        for (_, top_end), (bottom_start, _) in zip(rows, rows[1:]):
+            y0, y1 = top_end - 1, bottom_start + 1
+            fixed = tuple(
+                (lx, ly, tile_at(lx, y0 + ly))
+                for ly in (0, y1 - y0 - 1)
+                for lx in range(width)
+            )
+            strips.append(
+                _Region("seam", 0, y0, width, y1 - y0, f"{seed}:hseam:{y0}", fixed, solver_args)
+            )
+        for region, result in _solve_all(strips, max_retries, executor):
+            yield store(region, result)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+# -----------------------------------------------------------------------------
+# Async consumption
+# -----------------------------------------------------------------------------
+
+
+async def iterate_in_thread[T](iterator: Iterator[T], prefetch: int = 4) -> AsyncIterator[T]:
+    """Drive a blocking iterator on a worker thread, yielding its items.
+
+    Up to `prefetch` items are produced ahead of the consumer, so the thread
+    keeps working while the event loop handles earlier items. Exceptions
+    from the iterator are re-raised here.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[tuple[bool, object]] = asyncio.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def produce() -> None:
+        try:
+            for item in iterator:
+                if stop.is_set():
+                    return
+                asyncio.run_coroutine_threadsafe(queue.put((False, item)), loop).result()
+        except BaseException as e:
+            asyncio.run_coroutine_threadsafe(queue.put((True, e)), loop).result()
+        else:
+            asyncio.run_coroutine_threadsafe(queue.put((True, None)), loop).result()
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    producer = loop.run_in_executor(None, produce)
+    try:
+        while True:
+            finished, value = await queue.get()
+            if finished:
+                if value is not None:
+                    raise value
+                return
+            yield value
+    finally:
+        # Unblock the producer if the consumer stopped early
+        stop.set()
+        while not producer.done():
+            while not queue.empty():
+                queue.get_nowait()
+            await asyncio.sleep(0.01)
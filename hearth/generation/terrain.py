@@ -6,13 +6,12 @@ The WFC algorithm creates natural-looking terrain with biomes that flow into
 each other based on adjacency rules.
 """
 
-import random
+from collections.abc import Iterator, Mapping
 from typing import Callable
 
 from core.types import Position
 from core.terrain import Terrain
-from .tileset import create_hearth_tileset, TILE_TO_TERRAIN
-from .wfc import Grid, WFCSolver, SolverState
+from .chunked import generate_terrain_chunked
 
 
 def generate_terrain(
@@ -25,6 +24,8 @@ def generate_terrain(
     fill_bias: float = 0.5,
     progress_callback: Callable[[int, int], None] | None = None,
     max_retries: int = 10,
+    chunk_size: int = 64,
+    workers: int | None = 1,
 ) -> dict[Position, Terrain]:
     """
     Generate terrain using Wave Function Collapse.
@@ -32,6 +33,10 @@ def generate_terrain(
     Creates a natural-looking terrain map with biomes that flow into each other:
     water -> coast -> sand -> grass -> forest/hill -> stone
 
+    The world is solved in chunks joined by seams (see generate_terrain_chunked),
+    so a contradiction only retries its own chunk. Maps no larger than one
+    chunk are solved as a single grid.
+
     Args:
         width: World width in cells
         height: World height in cells
@@ -40,8 +45,10 @@ def generate_terrain(
         min_batch_distance: Minimum Manhattan distance between simultaneous collapses
         max_water_ratio: Max fraction of batch that can be water (0.0-1.0)
         fill_bias: Bias toward filling interior cells (0 = spread, 1+ = fill)
-        progress_callback: Optional callback(step, total_cells) for progress updates
-        max_retries: Max attempts before giving up (WFC can hit contradictions)
+        progress_callback: Optional callback(cells_done, total_cells) for progress updates
+        max_retries: Max attempts per chunk before giving up (WFC can hit contradictions)
+        chunk_size: Side of each independently solved chunk
+        workers: Worker processes (1 = in-process, None = all cores)
 
     Returns:
         Dict mapping Position to Terrain for non-grass cells.
@@ -50,58 +57,18 @@ def generate_terrain(
     Raises:
         RuntimeError: If terrain generation fails after max_retries attempts
     """
-    if seed is not None:
-        random.seed(seed)
-
-    tileset = create_hearth_tileset()
-    total_cells = width * height
-
-    for attempt in range(max_retries):
-        # Create fresh grid for each attempt
-        grid = Grid(width, height, set(tileset.keys()))
-
-        solver = WFCSolver(
-            grid,
-            tileset,
-            batch_size=batch_size,
-            min_batch_distance=min_batch_distance,
-            max_water_ratio=max_water_ratio,
-            fill_bias=fill_bias,
-            snapshot_interval=10000,  # Save every 10k cells for backtracking
-            max_backtracks=50,        # Allow many backtracks before full restart
-        )
-
-        # Run the solver
-        contradiction = False
-        while True:
-            state = solver.step()
-
-            if progress_callback is not None:
-                # Use solver's internal count (O(1) instead of O(n))
-                progress_callback(solver.collapsed_count, total_cells)
-
-            if state == SolverState.COMPLETE:
-                break
-            if state == SolverState.CONTRADICTION:
-                contradiction = True
-                break
-
-        if not contradiction:
-            # Success! Convert to Hearth terrain
-            result: dict[Position, Terrain] = {}
-            for cell in grid.all_cells():
-                terrain = TILE_TO_TERRAIN[cell.tile_id]
-                if terrain != Terrain.GRASS:
-                    result[Position(cell.x, cell.y)] = terrain
-            return result
-
-        # Contradiction after exhausting backtracks - full restart
-        print(f"\n  [Full restart: attempt {attempt + 1}/{max_retries}]")
-        # (random state advances naturally, giving us a new seed effectively)
-
-    raise RuntimeError(
-        f"Terrain generation failed after {max_retries} attempts. "
-        "Try adjusting parameters or tileset rules."
+    return generate_terrain_chunked(
+        width,
+        height,
+        seed=seed,
+        chunk_size=chunk_size,
+        workers=workers,
+        batch_size=batch_size,
+        min_batch_distance=min_batch_distance,
+        max_water_ratio=max_water_ratio,
+        fill_bias=fill_bias,
+        progress_callback=progress_callback,
+        max_retries=max_retries,
     )
 
 
@@ -139,3 +106,42 @@ def generate_terrain_grid(
         grid[pos.y][pos.x] = terrain
 
     return grid
+
+
+_TERRAINS = tuple(Terrain)
+
+
+class TerrainGrid(Mapping[Position, Terrain]):
+    """Non-grass terrain for a whole world, one byte per cell.
+
+    Reads like the dict[Position, Terrain] generate_terrain() returns (grass
+    cells are absent), without a Position object per cell.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self._codes = bytearray(width * height)  # index into _TERRAINS + 1
+        self._count = 0
+
+    def set(self, pos: Position, terrain: Terrain) -> None:
+        """Record a non-grass cell."""
+        index = pos.y * self.width + pos.x
+        if not self._codes[index]:
+            self._count += 1
+        self._codes[index] = _TERRAINS.index(terrain) + 1
+
+    def __getitem__(self, pos: Position) -> Terrain:
+        if 0 <= pos.x < self.width and 0 <= pos.y < self.height:
+            code = self._codes[pos.y * self.width + pos.x]
+            if code:
+                return _TERRAINS[code - 1]
+        raise KeyError(pos)
+
+    def __iter__(self) -> Iterator[Position]:
+        for index, code in enumerate(self._codes):
+            if code:
+                yield Position(index % self.width, index // self.width)
+
+    def __len__(self) -> int:
+        return self._count
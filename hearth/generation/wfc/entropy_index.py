@@ -0,0 +1,196 @@
+"""
+Incremental priority index for WFC cell selection.
+
+The solver wants the uncollapsed cells with the lowest
+``entropy - collapsed_neighbors * fill_bias`` each step. Scanning the whole
+grid for them makes every step O(width x height). This index keeps the
+uncollapsed cells bucketed by (entropy, collapsed neighbor count) and is
+told about each cell whose mask changed, so a step only touches the cells
+propagation touched plus the candidates it hands out.
+"""
+
+from array import array
+import random
+
+from .grid import Grid
+
+
+# Directions as (dx, dy); order doesn't matter here
+_OFFSETS = ((0, -1), (0, 1), (1, 0), (-1, 0))
+
+# Bucket key = entropy * _CN_SLOTS + collapsed neighbor count (0-4)
+_CN_SLOTS = 8
+
+
+class EntropyIndex:
+    """
+    Uncollapsed cells bucketed by (entropy, collapsed neighbor count).
+
+    Each bucket is a list with a per-cell position array, so cells move
+    between buckets in O(1) (swap-remove). A flat list of every uncollapsed
+    cell is kept the same way for uniform sampling.
+
+    The index mirrors grid.masks: call update() after writing a cell's mask.
+    """
+
+    def __init__(self, grid: Grid):
+        """
+        Build the index from the grid's current masks (O(n)).
+
+        Args:
+            grid: Grid whose masks array the index tracks
+        """
+        self._masks = grid.masks
+        self._width = grid.width
+        self._height = grid.height
+        size = grid.width * grid.height
+
+        # Collapsed neighbor count for every cell (collapsed or not)
+        self._collapsed_neighbors = array("B", [0]) * size
+        # Bucket key per cell, -1 once collapsed
+        self._key = array("i", [-1]) * size
+        # Position of each cell within its bucket list and within _all
+        self._bucket_pos = array("i", [-1]) * size
+        self._all_pos = array("i", [-1]) * size
+
+        self._buckets: dict[int, list[int]] = {}
+        self._all: list[int] = []
+
+        masks = self._masks
+        for index in range(size):
+            if masks[index].bit_count() == 1:
+                for neighbor in self._neighbors(index):
+                    self._collapsed_neighbors[neighbor] += 1
+
+        for index in range(size):
+            entropy = masks[index].bit_count()
+            if entropy != 1:
+                self._insert(index, entropy * _CN_SLOTS + self._collapsed_neighbors[index])
+
+    def __len__(self) -> int:
+        """Number of uncollapsed cells."""
+        return len(self._all)
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def update(self, index: int) -> None:
+        """
+        Re-bucket a cell after its mask changed.
+
+        If the cell has collapsed, it leaves the index and each neighbor's
+        collapsed neighbor count goes up by one.
+        """
+        old_key = self._key[index]
+        if old_key < 0:
+            return
+
+        entropy = self._masks[index].bit_count()
+        if entropy == 1:
+            self._remove(index)
+            counts = self._collapsed_neighbors
+            for neighbor in self._neighbors(index):
+                counts[neighbor] += 1
+                neighbor_key = self._key[neighbor]
+                if neighbor_key >= 0:
+                    self._move(neighbor, neighbor_key + 1)
+            return
+
+        new_key = entropy * _CN_SLOTS + self._collapsed_neighbors[index]
+        if new_key != old_key:
+            self._move(index, new_key)
+
+    # -------------------------------------------------------------------------
+    # Selection
+    # -------------------------------------------------------------------------
+
+    def sample(self, count: int) -> list[int]:
+        """Up to count uncollapsed cells, chosen uniformly at random."""
+        return random.sample(self._all, min(count, len(self._all)))
+
+    def lowest(self, count: int, fill_bias: float) -> list[int]:
+        """
+        Up to count cells with the lowest ``entropy - collapsed_neighbors * fill_bias``.
+
+        Returned in priority order; cells with equal priority come in random
+        order, and when only some of a tie can be returned they are sampled
+        at random.
+        """
+        # Group buckets that share a priority so ties are broken across them
+        groups: dict[float, list[list[int]]] = {}
+        for key, members in self._buckets.items():
+            if members:
+                entropy, collapsed_neighbors = divmod(key, _CN_SLOTS)
+                priority = round(entropy - collapsed_neighbors * fill_bias, 9)
+                groups.setdefault(priority, []).append(members)
+
+        result: list[int] = []
+        for priority in sorted(groups):
+            need = count - len(result)
+            if need <= 0:
+                break
+            lists = groups[priority]
+            total = sum(len(members) for members in lists)
+            if total <= need:
+                tied = [index for members in lists for index in members]
+                random.shuffle(tied)
+            else:
+                tied = [self._pick(lists, i) for i in random.sample(range(total), need)]
+            result.extend(tied)
+        return result
+
+    @staticmethod
+    def _pick(lists: list[list[int]], i: int) -> int:
+        for members in lists:
+            if i < len(members):
+                return members[i]
+            i -= len(members)
+        raise IndexError(i)
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _neighbors(self, index: int) -> list[int]:
+        width, height = self._width, self._height
+        x, y = index % width, index // width
+        return [
+            (y + dy) * width + (x + dx)
+            for dx, dy in _OFFSETS
+            if 0 <= x + dx < width and 0 <= y + dy < height
+        ]
+
+    def _insert(self, index: int, key: int) -> None:
+        members = self._buckets.setdefault(key, [])
+        self._bucket_pos[index] = len(members)
+        members.append(index)
+        self._key[index] = key
+        self._all_pos[index] = len(self._all)
+        self._all.append(index)
+
+    def _remove(self, index: int) -> None:
+        self._detach(index)
+        self._key[index] = -1
+        pos = self._all_pos[index]
+        last = self._all.pop()
+        if last != index:
+            self._all[pos] = last
+            self._all_pos[last] = pos
+        self._all_pos[index] = -1
+
+    def _move(self, index: int, key: int) -> None:
+        self._detach(index)
+        members = self._buckets.setdefault(key, [])
+        self._bucket_pos[index] = len(members)
+        members.append(index)
+        self._key[index] = key
+
+    def _detach(self, index: int) -> None:
+        """Take a cell out of its bucket list (swap-remove)."""
+        members = self._buckets[self._key[index]]
+        pos = self._bucket_pos[index]
+        last = members.pop()
+        if last != index:
+            members[pos] = last
+            self._bucket_pos[last] = pos
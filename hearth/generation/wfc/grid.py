@@ -6,19 +6,31 @@ is in superposition (multiple possibilities) until it collapses to a
 single definite tile.
 
 This is where we track the state of the generation process.
+
+Possibilities are stored as integer bitmasks (one bit per tile ID) in a
+flat array indexed by ``y * width + x``, so constraining a cell is a
+single AND and copying the whole wave is a single array copy.
+Cell objects are lightweight views onto that array.
 """
 
-from dataclasses import dataclass, field
+from array import array
 from typing import Iterator
 import random
 
 from .tile import Direction
 
 
-@dataclass
+def _mask_typecode(tile_count: int) -> str:
+    """Smallest unsigned array typecode with a bit per tile."""
+    for typecode in ("B", "H", "I", "Q"):
+        if tile_count <= array(typecode).itemsize * 8:
+            return typecode
+    raise ValueError(f"Grid supports at most 64 tile types, got {tile_count}")
+
+
 class Cell:
     """
-    A single cell in the WFC grid.
+    A single cell in the WFC grid (a view onto the Grid's mask array).
 
     Before collapse: holds a set of possible tile IDs
     After collapse: holds exactly one tile ID
@@ -26,9 +38,14 @@ class Cell:
     The "entropy" of a cell is how uncertain we are about it.
     Lower entropy = fewer possibilities = more constrained.
     """
-    x: int
-    y: int
-    possibilities: set[str] = field(default_factory=set)
+
+    __slots__ = ("x", "y", "_grid", "_index")
+
+    def __init__(self, grid: "Grid", x: int, y: int):
+        self.x = x
+        self.y = y
+        self._grid = grid
+        self._index = y * grid.width + x
 
     def __hash__(self):
         """Hash by position - cells are unique by their grid location."""
@@ -40,16 +57,34 @@ class Cell:
             return False
         return self.x == other.x and self.y == other.y
 
+    def __repr__(self):
+        return f"Cell(x={self.x}, y={self.y}, possibilities={self.possibilities!r})"
+
+    @property
+    def mask(self) -> int:
+        """Bitmask of the remaining possibilities."""
+        return self._grid.masks[self._index]
+
+    @property
+    def possibilities(self) -> set[str]:
+        """The tile IDs this cell could still be."""
+        return self._grid.decode(self.mask)
+
+    @possibilities.setter
+    def possibilities(self, tile_ids: set[str]):
+        self._grid.masks[self._index] = self._grid.encode(tile_ids)
+
     @property
     def collapsed(self) -> bool:
         """A cell is collapsed when it has exactly one possibility."""
-        return len(self.possibilities) == 1
+        return self.mask.bit_count() == 1
 
     @property
     def tile_id(self) -> str | None:
         """The chosen tile ID, or None if not yet collapsed."""
-        if self.collapsed:
-            return next(iter(self.possibilities))
+        mask = self.mask
+        if mask.bit_count() == 1:
+            return self._grid.tile_order[mask.bit_length() - 1]
         return None
 
     @property
@@ -60,11 +95,11 @@ class Cell:
         We use simple count of possibilities.
         Lower = more constrained = should be collapsed first.
         """
-        return len(self.possibilities)
+        return self.mask.bit_count()
 
     def collapse_to(self, tile_id: str):
         """Force this cell to a specific tile."""
-        self.possibilities = {tile_id}
+        self._grid.masks[self._index] = self._grid.bit(tile_id)
 
     def remove_possibility(self, tile_id: str) -> bool:
         """
@@ -73,8 +108,10 @@ class Cell:
         Returns True if the possibility was actually removed (cell changed).
         Returns False if the tile wasn't a possibility anyway.
         """
-        if tile_id in self.possibilities:
-            self.possibilities.discard(tile_id)
+        bit = self._grid.bit(tile_id)
+        mask = self.mask
+        if mask & bit:
+            self._grid.masks[self._index] = mask & ~bit
             return True
         return False
 
@@ -84,9 +121,10 @@ class Cell:
 
         Returns True if the cell changed (lost possibilities).
         """
-        old_count = len(self.possibilities)
-        self.possibilities &= allowed
-        return len(self.possibilities) < old_count
+        mask = self.mask
+        new_mask = mask & self._grid.encode(allowed)
+        self._grid.masks[self._index] = new_mask
+        return new_mask != mask
 
 
 class Grid:
@@ -106,24 +144,62 @@ class Grid:
             width: Number of cells horizontally
             height: Number of cells vertically
             tile_ids: Set of all possible tile IDs (initial superposition)
+
+        Raises:
+            ValueError: If there are more than 64 tile IDs
         """
         self.width = width
         self.height = height
         self.tile_ids = tile_ids
 
-        # Create 2D array of cells, each starting with all possibilities
-        self.cells: list[list[Cell]] = [
-            [
-                Cell(x=x, y=y, possibilities=set(tile_ids))
-                for x in range(width)
-            ]
-            for y in range(height)
-        ]
+        # Bit i stands for tile_order[i]; sorted so masks don't depend on set order
+        self.tile_order: tuple[str, ...] = tuple(sorted(tile_ids))
+        self._bits: dict[str, int] = {tile_id: 1 << i for i, tile_id in enumerate(self.tile_order)}
+        self.full_mask = (1 << len(self.tile_order)) - 1
+
+        # Flat array of possibility masks, indexed y * width + x
+        self.masks = array(_mask_typecode(len(self.tile_order)), [self.full_mask]) * (width * height)
+
+    # -------------------------------------------------------------------------
+    # Masks
+    # -------------------------------------------------------------------------
+
+    def bit(self, tile_id: str) -> int:
+        """Bit for a single tile ID."""
+        return self._bits[tile_id]
+
+    def encode(self, tile_ids: set[str]) -> int:
+        """Bitmask for a set of tile IDs (unknown IDs are ignored)."""
+        mask = 0
+        for tile_id in tile_ids:
+            mask |= self._bits.get(tile_id, 0)
+        return mask
+
+    def decode(self, mask: int) -> set[str]:
+        """Tile IDs whose bits are set in mask."""
+        return {tile_id for tile_id, bit in self._bits.items() if mask & bit}
+
+    def snapshot(self) -> array:
+        """Copy of the mask array (for backtracking)."""
+        return array(self.masks.typecode, self.masks)
+
+    def restore(self, masks: array) -> None:
+        """Restore the mask array from a snapshot()."""
+        self.masks[:] = masks
+
+    # -------------------------------------------------------------------------
+    # Cells
+    # -------------------------------------------------------------------------
+
+    @property
+    def cells(self) -> list[list[Cell]]:
+        """Rows of cell views, indexed as cells[y][x]."""
+        return [[Cell(self, x, y) for x in range(self.width)] for y in range(self.height)]
 
     def get_cell(self, x: int, y: int) -> Cell | None:
         """Get cell at position, or None if out of bounds."""
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.cells[y][x]
+            return Cell(self, x, y)
         return None
 
     def neighbors(self, cell: Cell) -> Iterator[tuple[Cell, Direction]]:
@@ -150,37 +226,38 @@ class Grid:
         This is important - always picking top-left would create biased patterns.
         """
         min_entropy = float("inf")
-        candidates: list[Cell] = []
+        candidates: list[int] = []
 
-        for row in self.cells:
-            for cell in row:
-                # Skip already collapsed cells
-                if cell.collapsed:
-                    continue
+        for index, mask in enumerate(self.masks):
+            entropy = mask.bit_count()
+            # Skip already collapsed cells
+            if entropy == 1:
+                continue
 
-                if cell.entropy < min_entropy:
-                    min_entropy = cell.entropy
-                    candidates = [cell]
-                elif cell.entropy == min_entropy:
-                    candidates.append(cell)
+            if entropy < min_entropy:
+                min_entropy = entropy
+                candidates = [index]
+            elif entropy == min_entropy:
+                candidates.append(index)
 
         if not candidates:
             return None  # All collapsed
 
         # Random selection among ties
-        return random.choice(candidates)
+        index = random.choice(candidates)
+        return Cell(self, index % self.width, index // self.width)
 
     def is_complete(self) -> bool:
         """Check if all cells have collapsed."""
-        return all(cell.collapsed for row in self.cells for cell in row)
+        return all(mask.bit_count() == 1 for mask in self.masks)
 
     def reset(self):
         """Reset all cells to maximum superposition."""
-        for row in self.cells:
-            for cell in row:
-                cell.possibilities = set(self.tile_ids)
+        # In place, so solvers holding a reference to masks see the reset
+        self.masks[:] = array(self.masks.typecode, [self.full_mask]) * (self.width * self.height)
 
     def all_cells(self) -> Iterator[Cell]:
         """Iterate over all cells in the grid."""
-        for row in self.cells:
-            yield from row
+        for y in range(self.height):
+            for x in range(self.width):
+                yield Cell(self, x, y)
@@ -11,12 +11,12 @@ The algorithm:
 4. Repeat until complete or contradiction
 """
 
+from array import array
 from collections import deque
 from enum import Enum, auto
-import heapq
 import random
-import time
 
+from .entropy_index import EntropyIndex
 from .grid import Grid, Cell
 from .tile import Tile, Direction
 
@@ -91,27 +91,48 @@ class WFCSolver:
         # Track the last collapsed cells (for visualization/debugging)
         self.last_collapsed: list[Cell] = []
 
-        # Track cells modified in last propagation (for visualization/debugging)
-        self.last_propagated: set[Cell] = set()
+        # Indices of cells modified in last propagation (see last_propagated)
+        self._last_propagated: set[int] = set()
 
         # Backtracking state
-        self._snapshots: list[tuple[int, list[list[set[str]]]]] = []  # (collapsed_count, grid_state)
+        self._snapshots: list[tuple[int, array]] = []  # (collapsed_count, grid masks)
         self._collapsed_count = 0
         self._last_snapshot_at = 0
         self._backtrack_count = 0
 
+        # Uncollapsed cells by priority; built on first step, rebuilt after restores
+        self._index: EntropyIndex | None = None
+
+        # Adjacency as bitmasks: for each direction, the neighbors allowed by
+        # each tile bit, plus a memo of the union for each possibility mask
+        self._tile_order = grid.tile_order
+        self._weights = [tileset[tile_id].weight for tile_id in self._tile_order]
+        self._affinities = [tileset[tile_id].self_affinity for tile_id in self._tile_order]
+        self._water_mask = grid.encode({"water"})
+        self._steps: list[tuple[int, int, list[int], dict[int, int]]] = [
+            (
+                direction.dx,
+                direction.dy,
+                [grid.encode(tileset[tile_id].get_allowed_neighbors(direction)) for tile_id in self._tile_order],
+                {},
+            )
+            for direction in Direction
+        ]
+
     @property
     def collapsed_count(self) -> int:
         """Number of cells that have been collapsed."""
         return self._collapsed_count
 
+    @property
+    def last_propagated(self) -> set[Cell]:
+        """Cells modified in the last propagation (for visualization/debugging)."""
+        width = self.grid.width
+        return {self.grid.get_cell(i % width, i // width) for i in self._last_propagated}
+
     def _save_snapshot(self) -> None:
         """Save current grid state for backtracking."""
-        state = [
-            [set(cell.possibilities) for cell in row]
-            for row in self.grid.cells
-        ]
-        self._snapshots.append((self._collapsed_count, state))
+        self._snapshots.append((self._collapsed_count, self.grid.snapshot()))
         self._last_snapshot_at = self._collapsed_count
 
     def _restore_snapshot(self) -> bool:
@@ -120,9 +141,8 @@ class WFCSolver:
             return False
 
         collapsed_count, state = self._snapshots.pop()
-        for y, row in enumerate(state):
-            for x, possibilities in enumerate(row):
-                self.grid.cells[y][x].possibilities = set(possibilities)
+        self.grid.restore(state)
+        self._index = None
 
         self._collapsed_count = collapsed_count
         self._last_snapshot_at = self._snapshots[-1][0] if self._snapshots else 0
@@ -138,7 +158,7 @@ class WFCSolver:
 
         Returns the current solver state after this step.
         """
-        self.last_propagated.clear()
+        self._last_propagated.clear()
         self.last_collapsed.clear()
 
         # 1. Find cells to collapse (respecting batch_size and min_distance)
@@ -147,16 +167,17 @@ class WFCSolver:
         if not cells_to_collapse:
             return SolverState.COMPLETE
 
-        if cells_to_collapse[0].entropy == 0:
+        if self.grid.masks[cells_to_collapse[0]] == 0:
             return self._handle_contradiction()
 
         if self._collapsed_count - self._last_snapshot_at >= self.snapshot_interval:
             self._save_snapshot()
 
         # 2. Collapse all selected cells
-        for cell in cells_to_collapse:
-            self._collapse(cell)
-            self.last_collapsed.append(cell)
+        width = self.grid.width
+        for index in cells_to_collapse:
+            self._collapse(index)
+            self.last_collapsed.append(self.grid.get_cell(index % width, index // width))
             self._collapsed_count += 1
 
         self.step_count += 1
@@ -183,41 +204,41 @@ class WFCSolver:
             print(f"\n  [Contradiction with no snapshots to restore]")
             return SolverState.CONTRADICTION
 
-    def _find_batch_cells(self) -> list[Cell]:
+    def _find_batch_cells(self) -> list[int]:
         """
-        Find cells to collapse this step using heap-based selection.
+        Find cells to collapse this step from the entropy index.
 
-        Uses heapq.nsmallest() instead of full sort for O(n + k log n) vs O(n log n).
-        For 250k cells and k=batch_size*5, this is significantly faster.
+        The index keeps uncollapsed cells bucketed by entropy and collapsed
+        neighbor count, updated as cells change, so picking candidates costs
+        O(batch) rather than a scan of the grid.
 
         Priority is based on:
         - Entropy (lower = higher priority, more constrained)
         - Collapsed neighbor count (more neighbors = higher priority with fill_bias)
 
-        Returns up to batch_size cells that are at least min_batch_distance apart.
+        Returns indices of up to batch_size cells that are at least
+        min_batch_distance apart.
         """
-        # Get all uncollapsed cells - this is unavoidable O(n)
-        uncollapsed = [c for c in self.grid.all_cells() if not c.collapsed]
+        masks = self.grid.masks
+        width = self.grid.width
+
+        if self._index is None:
+            self._index = EntropyIndex(self.grid)
+        index = self._index
 
-        if not uncollapsed:
+        if not len(index):
             return []
 
         # Fast path for early steps: when few cells are collapsed, all priorities
         # are nearly equal (same entropy, ~0 collapsed neighbors). Just pick randomly.
-        collapsed_ratio = 1.0 - (len(uncollapsed) / (self.grid.width * self.grid.height))
+        collapsed_ratio = 1.0 - (len(index) / len(masks))
         if collapsed_ratio < 0.01:  # Less than 1% collapsed
-            random.shuffle(uncollapsed)
-            candidates = uncollapsed[:self.batch_size * 10]
+            candidates = index.sample(self.batch_size * 10)
         else:
-            def cell_priority(cell: Cell) -> float:
-                collapsed_neighbors = self._count_collapsed_neighbors(cell)
-                return cell.entropy - (collapsed_neighbors * self.fill_bias) + random.random() * 0.01
-
-            candidate_count = min(len(uncollapsed), self.batch_size * 10)
-            candidates = heapq.nsmallest(candidate_count, uncollapsed, key=cell_priority)
+            candidates = index.lowest(self.batch_size * 10, self.fill_bias)
 
         # Check for contradiction (min entropy is 0)
-        if candidates[0].entropy == 0:
+        if masks[candidates[0]] == 0:
             return [candidates[0]]
 
         if self.batch_size == 1:
@@ -225,60 +246,45 @@ class WFCSolver:
 
         # Greedily select spatially-separated cells from candidates
         # Use spatial hashing for O(1) average distance checks instead of O(n)
-        selected: list[Cell] = []
+        selected: list[int] = []
         water_count = 0
+        max_water_cells = max(1, int(self.batch_size * self.max_water_ratio))
 
-        # Spatial hash: map bucket -> list of cells in that bucket
+        # Spatial hash: map bucket -> list of (x, y) selected in that bucket
         bucket_size = self.min_batch_distance
-        buckets: dict[tuple[int, int], list[Cell]] = {}
+        buckets: dict[tuple[int, int], list[tuple[int, int]]] = {}
 
-        def get_bucket(x: int, y: int) -> tuple[int, int]:
-            return (x // bucket_size, y // bucket_size)
-
-        def is_far_from_selected(cell: Cell) -> bool:
-            bx, by = get_bucket(cell.x, cell.y)
+        def is_far_from_selected(x: int, y: int) -> bool:
+            bx, by = x // bucket_size, y // bucket_size
             # Check 3x3 neighborhood of buckets
-            for dx in [-1, 0, 1]:
-                for dy in [-1, 0, 1]:
-                    bucket_key = (bx + dx, by + dy)
-                    if bucket_key in buckets:
-                        for other in buckets[bucket_key]:
-                            dist = abs(cell.x - other.x) + abs(cell.y - other.y)
-                            if dist < self.min_batch_distance:
-                                return False
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    for ox, oy in buckets.get((bx + dx, by + dy), ()):
+                        if abs(x - ox) + abs(y - oy) < self.min_batch_distance:
+                            return False
             return True
 
-        for cell in candidates:
+        for index in candidates:
             if len(selected) >= self.batch_size:
                 break
 
-            if not is_far_from_selected(cell):
+            x, y = index % width, index // width
+            if not is_far_from_selected(x, y):
                 continue
 
             # Check water ratio constraint
-            can_be_water = "water" in cell.possibilities
-
-            if can_be_water:
-                max_water_cells = max(1, int(self.batch_size * self.max_water_ratio))
+            if masks[index] & self._water_mask:
                 if water_count >= max_water_cells:
                     continue
-
                 water_count += 1
 
-            selected.append(cell)
-            bucket_key = get_bucket(cell.x, cell.y)
-            if bucket_key not in buckets:
-                buckets[bucket_key] = []
-            buckets[bucket_key].append(cell)
+            selected.append(index)
+            buckets.setdefault((x // bucket_size, y // bucket_size), []).append((x, y))
 
         # Skip expensive fallback - just use what we got
         # With 20k random candidates, we should get enough spatially-separated cells
         return selected
 
-    def _count_collapsed_neighbors(self, cell: Cell) -> int:
-        """Count how many of a cell's neighbors are already collapsed."""
-        return sum(1 for neighbor, _ in self.grid.neighbors(cell) if neighbor.collapsed)
-
     def _is_far_from_all(self, cell: Cell, others: list[Cell]) -> bool:
         """Check if cell is at least min_batch_distance from all others."""
         for other in others:
@@ -287,7 +293,7 @@ class WFCSolver:
                 return False
         return True
 
-    def _propagate_batch(self, start_cells: list[Cell]) -> bool:
+    def _propagate_batch(self, start_cells: list[int]) -> bool:
         """
         Propagate constraints from multiple cells simultaneously.
 
@@ -300,34 +306,52 @@ class WFCSolver:
         if not start_cells:
             return True
 
+        masks = self.grid.masks
+        width, height = self.grid.width, self.grid.height
+        propagated = self._last_propagated
+        entropy_index = self._index
+
         # Initialize queue with all start cells
-        queue: deque[Cell] = deque(start_cells)
-        in_queue: set[tuple[int, int]] = {(c.x, c.y) for c in start_cells}
+        queue: deque[int] = deque(start_cells)
+        in_queue: set[int] = set(start_cells)
 
         while queue:
-            cell = queue.popleft()
-            in_queue.discard((cell.x, cell.y))
-
-            for neighbor, direction in self.grid.neighbors(cell):
-                if neighbor.collapsed:
+            index = queue.popleft()
+            in_queue.discard(index)
+            mask = masks[index]
+            x, y = index % width, index // width
+
+            for dx, dy, tile_allowed, memo in self._steps:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
                     continue
-
-                allowed = self._get_allowed_neighbors(cell, direction)
-                changed = neighbor.constrain_to(allowed)
-
-                if changed:
-                    self.last_propagated.add(neighbor)
-
-                    if neighbor.entropy == 0:
+                neighbor = ny * width + nx
+                # Collapsed neighbors are checked too: two batch collapses
+                # can meet with incompatible tiles, which must be a contradiction
+                neighbor_mask = masks[neighbor]
+
+                allowed = memo.get(mask)
+                if allowed is None:
+                    allowed = self._allowed_mask(mask, tile_allowed)
+                    memo[mask] = allowed
+                new_mask = neighbor_mask & allowed
+
+                if new_mask != neighbor_mask:
+                    masks[neighbor] = new_mask
+                    propagated.add(neighbor)
+                    if entropy_index is not None:
+                        entropy_index.update(neighbor)
+
+                    if new_mask == 0:
                         return False
 
-                    if (neighbor.x, neighbor.y) not in in_queue:
+                    if neighbor not in in_queue:
                         queue.append(neighbor)
-                        in_queue.add((neighbor.x, neighbor.y))
+                        in_queue.add(neighbor)
 
         return True
 
-    def _collapse(self, cell: Cell):
+    def _collapse(self, index: int):
         """
         Collapse a cell to a single tile using weighted random selection.
 
@@ -335,42 +359,72 @@ class WFCSolver:
         Self-affinity boosts weights when neighboring cells have the same tile,
         creating natural clustering behavior.
         """
-        possibilities = list(cell.possibilities)
-
-        # Get base weights
-        weights = [self.tileset[tile_id].weight for tile_id in possibilities]
-
-        # Apply self-affinity boost based on collapsed neighbors
-        for i, tile_id in enumerate(possibilities):
-            tile = self.tileset[tile_id]
-            if tile.self_affinity != 1.0:
-                # Count collapsed neighbors with the same tile type
-                same_neighbor_count = sum(
-                    1 for neighbor, _ in self.grid.neighbors(cell)
-                    if neighbor.collapsed and neighbor.tile_id == tile_id
-                )
-                # Boost weight: base_weight * self_affinity^same_neighbor_count
+        masks = self.grid.masks
+        width, height = self.grid.width, self.grid.height
+        x, y = index % width, index // width
+        mask = masks[index]
+
+        # Collapsed neighbors, as single-bit masks
+        collapsed_neighbors = []
+        for dx, dy, _, _ in self._steps:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height:
+                neighbor_mask = masks[ny * width + nx]
+                if neighbor_mask.bit_count() == 1:
+                    collapsed_neighbors.append(neighbor_mask)
+
+        bits: list[int] = []
+        weights: list[float] = []
+        for i in range(len(self._tile_order)):
+            bit = 1 << i
+            if not mask & bit:
+                continue
+            weight = self._weights[i]
+
+            # Boost weight: base_weight * self_affinity^same_neighbor_count
+            if self._affinities[i] != 1.0:
+                same_neighbor_count = collapsed_neighbors.count(bit)
                 if same_neighbor_count > 0:
-                    weights[i] *= tile.self_affinity ** same_neighbor_count
+                    weight *= self._affinities[i] ** same_neighbor_count
+
+            bits.append(bit)
+            weights.append(weight)
 
         # Weighted random choice
-        chosen = random.choices(possibilities, weights=weights, k=1)[0]
+        masks[index] = random.choices(bits, weights=weights, k=1)[0]
+        if self._index is not None:
+            self._index.update(index)
 
-        cell.collapse_to(chosen)
+    @staticmethod
+    def _allowed_mask(mask: int, tile_allowed: list[int]) -> int:
+        """
+        Union of the neighbors allowed (in one direction) by every tile in mask.
 
-    def _get_allowed_neighbors(self, cell: Cell, direction: Direction) -> set[str]:
+        Args:
+            mask: Possibility mask of the cell
+            tile_allowed: Allowed-neighbor mask for each tile bit, in that direction
         """
-        Get all tile IDs that are allowed adjacent to cell in the given direction.
+        allowed = 0
+        for i, neighbors in enumerate(tile_allowed):
+            if mask >> i & 1:
+                allowed |= neighbors
+        return allowed
 
-        This unions the allowed neighbors of all tiles that cell could still be.
+    def propagate(self, cells: list[Cell]) -> bool:
         """
-        allowed: set[str] = set()
+        Propagate constraints from cells that were changed outside the solver.
 
-        for tile_id in cell.possibilities:
-            tile = self.tileset[tile_id]
-            allowed |= tile.get_allowed_neighbors(direction)
+        Use this after pre-collapsing cells (e.g., fixed borders copied from
+        an already-solved neighbor) and before the first step().
 
-        return allowed
+        Returns True on success, False on contradiction.
+        """
+        width = self.grid.width
+        indices = [cell.y * width + cell.x for cell in cells]
+        if self._index is not None:
+            for index in indices:
+                self._index.update(index)
+        return self._propagate_batch(indices)
 
     def solve(self) -> bool:
         """
@@ -390,8 +444,9 @@ class WFCSolver:
         self.grid.reset()
         self.step_count = 0
         self.last_collapsed.clear()
-        self.last_propagated.clear()
+        self._last_propagated.clear()
         self._snapshots.clear()
         self._collapsed_count = 0
         self._last_snapshot_at = 0
         self._backtrack_count = 0
+        self._index = None
@@ -6,6 +6,7 @@ import logging
 import random
 import sys
 from collections import deque
+from collections.abc import AsyncIterator, Mapping
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -16,7 +17,7 @@ from core.terrain import Terrain
 
 
 def find_agent_positions(
-    terrain_map: dict[Position, Terrain],
+    terrain_map: Mapping[Position, Terrain],
     world_width: int,
     world_height: int,
     num_agents: int = 3,
@@ -32,7 +33,7 @@ def find_agent_positions(
     3. Connected via passable paths
 
     Args:
-        terrain_map: Dict of non-grass terrain positions
+        terrain_map: Non-grass terrain positions (dict or TerrainGrid)
         world_width: World width
         world_height: World height
         num_agents: Number of positions to find
@@ -147,7 +148,7 @@ async def init_world(data_dir: Path) -> int:
     from core.agent import Agent, AgentModel, Inventory
     from core.world import Cell
     from core.terrain import Weather
-    from generation import generate_terrain
+    from generation import TerrainGrid, iterate_in_thread, stream_terrain_chunked
     from storage import Storage
     from services import WorldService, AgentService
     from adapters.prompt_builder import DEFAULT_AGENTS
@@ -174,10 +175,13 @@ async def init_world(data_dir: Path) -> int:
         await storage.world.set_tick(0)
         await storage.world.set_weather(Weather.CLEAR)
 
-        # Generate terrain using WFC
+        # Generate terrain using WFC, writing each chunk as it finishes
         # For 500x500 grid (250k cells):
-        # - batch_size=2000: collapse many cells per step
+        # - solved in 64x64 chunks on all cores, then stitched along seams
+        # - batch_size=200: collapse many cells per step within a chunk
         # - min_batch_distance=4: standard spacing
+        # Generation runs on a worker thread so chunks are inserted while
+        # later ones are still being solved.
         from tqdm import tqdm
         pbar = tqdm(total=500*500, desc="  Generating terrain", unit="cells")
         last_progress = [0]
@@ -188,20 +192,25 @@ async def init_world(data_dir: Path) -> int:
                 pbar.update(delta)
                 last_progress[0] = current
 
-        terrain_map = generate_terrain(
-            width=500,
-            height=500,
-            batch_size=2000,
-            min_batch_distance=4,
-            progress_callback=update_progress,
-        )
-        pbar.close()
-        print(f"  Generated {len(terrain_map)} non-grass cells")
+        terrain_map = TerrainGrid(500, 500)
 
-        # Insert terrain cells (bulk insert for speed)
-        print("  Saving terrain to database...")
-        cells = [Cell(position=pos, terrain=terrain_type) for pos, terrain_type in terrain_map.items()]
-        await storage.world.set_cells_bulk(cells)
+        async def cell_batches() -> AsyncIterator[list[Cell]]:
+            regions = stream_terrain_chunked(
+                width=500,
+                height=500,
+                batch_size=200,
+                min_batch_distance=4,
+                progress_callback=update_progress,
+                workers=None,
+            )
+            async for region in iterate_in_thread(regions):
+                for pos, terrain_type in region:
+                    terrain_map.set(pos, terrain_type)
+                yield [Cell(position=pos, terrain=terrain_type) for pos, terrain_type in region]
+
+        saved = await storage.world.load_cells(cell_batches())
+        pbar.close()
+        print(f"  Generated and saved {saved} non-grass cells")
 
         # Find valid starting positions for agents
         # Agents spawn 30-60 cells apart on grass with passable paths between them
@@ -273,10 +282,12 @@ async def run_batch(data_dir: Path, num_ticks: int) -> int:
 
     async with Storage(data_dir) as storage:
         # Create engine
+        # Each tick commits once, instead of once per write
         engine = HearthEngine(
             storage,
             agents_root=agents_dir,
             enable_llm=True,
+            transactional_ticks=True,
         )
         await engine.initialize()
 
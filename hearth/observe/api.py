@@ -142,6 +142,16 @@ class ObserverAPI:
         """Get position of a named place."""
         return await self._world.get_place_position(name)
 
+    async def get_travel_distance(self, pos: Position, name: str) -> int | None:
+        """Get walking distance in steps from a position to a named place.
+
+        Returns None if the place is unknown or unreachable.
+        """
+        target = await self._world.get_place_position(name)
+        if target is None:
+            return None
+        return await self._world.travel_distance(pos, target)
+
     # -------------------------------------------------------------------------
     # Convenience Methods for TUI
     # -------------------------------------------------------------------------
@@ -264,6 +264,7 @@ class HearthTUI(App):
                 stream_panel.add_class(self._focused_agent.lower())
 
             # Load recent turns
+            self._engine.tracer.flush()
             trace_dir = self._engine._storage.data_dir / "traces"
             stream_panel.load_recent_turns(trace_dir, count=20)
         else:
@@ -378,6 +379,7 @@ class HearthTUI(App):
                 stream_panel.add_class(agent_name.lower())
                 # Reload turns for new agent
                 stream_panel.clear_log()
+                self._engine.tracer.flush()
                 trace_dir = self._engine._storage.data_dir / "traces"
                 stream_panel.load_recent_turns(trace_dir, count=20)
 
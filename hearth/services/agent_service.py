@@ -6,7 +6,6 @@ No in-memory caching - always delegates to storage.
 
 from __future__ import annotations
 
-import heapq
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
@@ -149,6 +148,17 @@ class AgentService:
         """
         return await self._agent_repo.get_all_agents()
 
+    async def get_agents(self, names: list[AgentName]) -> list[Agent]:
+        """Get several agents by name, skipping any that don't exist.
+
+        Args:
+            names: Agent names
+
+        Returns:
+            Agents found, in the order of names
+        """
+        return await self._agent_repo.get_agents(names)
+
     async def save_agent(self, agent: Agent) -> None:
         """Save or update an agent.
 
@@ -205,19 +215,7 @@ class AgentService:
         Returns:
             List of agents within radius
         """
-        # Create bounding rect
-        rect = Rect(
-            position.x - radius,
-            position.y - radius,
-            position.x + radius,
-            position.y + radius,
-        )
-        agents = await self._agent_repo.get_agents_in_rect(rect)
-
-        # Filter by actual Manhattan distance
-        return [
-            a for a in agents if position.distance_to(a.position) <= radius
-        ]
+        return await self._agent_repo.get_agents_near(position, radius)
 
     # -------------------------------------------------------------------------
     # State Queries
@@ -822,6 +820,9 @@ class AgentService:
     ) -> tuple[Position, ...]:
         """Compute path from start to goal using A*.
 
+        The search runs over WorldService's precomputed passability map, so it
+        does not query storage per expanded node.
+
         Args:
             start: Starting position
             goal: Goal position
@@ -833,46 +834,10 @@ class AgentService:
         Raises:
             JourneyError: If no path exists
         """
-        if start == goal:
-            return (start,)
-
-        # A* algorithm
-        # Priority queue: (f_score, counter, position)
-        # counter is for tie-breaking when f_scores are equal
-        counter = 0
-        open_set: list[tuple[int, int, Position]] = []
-        heapq.heappush(open_set, (0, counter, start))
-
-        came_from: dict[Position, Position] = {}
-        g_score: dict[Position, int] = {start: 0}
-
-        while open_set:
-            _, _, current = heapq.heappop(open_set)
-
-            if current == goal:
-                # Reconstruct path
-                path = [current]
-                while current in came_from:
-                    current = came_from[current]
-                    path.append(current)
-                path.reverse()
-                return tuple(path)
-
-            for direction in Direction:
-                if not await world_service.can_move(current, direction):
-                    continue
-
-                neighbor = current + direction
-                tentative_g = g_score[current] + 1
-
-                if neighbor not in g_score or tentative_g < g_score[neighbor]:
-                    came_from[neighbor] = current
-                    g_score[neighbor] = tentative_g
-                    f_score = tentative_g + neighbor.distance_to(goal)
-                    counter += 1
-                    heapq.heappush(open_set, (f_score, counter, neighbor))
-
-        raise JourneyError(f"No path from {start} to {goal}")
+        path = await world_service.find_path(start, goal)
+        if path is None:
+            raise JourneyError(f"No path from {start} to {goal}")
+        return path
 
     # -------------------------------------------------------------------------
     # Home Directory Management
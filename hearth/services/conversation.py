@@ -35,6 +35,10 @@ class ConversationService:
     ConversationRepository.
     """
 
+    # Turns kept in ConversationContext.conversation.history; the turns an
+    # agent actually needs are in unseen_turns
+    CONTEXT_HISTORY_LIMIT = 10
+
     def __init__(self, storage: "Storage"):
         """Initialize service with storage.
 
@@ -116,7 +120,9 @@ class ConversationService:
         Returns:
             ConversationContext with unseen turns, or None if not in conversation
         """
-        conv = await self._repo.get_conversation_for_agent(agent)
+        conv = await self._repo.get_conversation_for_agent(
+            agent, history_limit=self.CONTEXT_HISTORY_LIMIT
+        )
         if conv is None:
             return None
 
@@ -135,6 +141,54 @@ class ConversationService:
             other_participants=other_participants,
         )
 
+    async def get_pending_invitations(
+        self, agents: list[AgentName]
+    ) -> dict[AgentName, Invitation]:
+        """Get pending invitations for several agents (as invitees) in one query.
+
+        Args:
+            agents: Agent names
+
+        Returns:
+            Dict mapping each invitee with a pending invitation to it
+        """
+        return await self._repo.get_pending_invitations(agents)
+
+    async def get_conversation_contexts(
+        self, agents: list[AgentName]
+    ) -> dict[AgentName, ConversationContext]:
+        """Get conversation context for several agents at once.
+
+        Each conversation is loaded once even when several of the agents are
+        in it; unseen turns come from the repository's turn cache.
+
+        Args:
+            agents: Agent names
+
+        Returns:
+            Dict mapping each agent in a conversation to its context
+        """
+        memberships = await self._repo.get_active_memberships(agents)
+        conversations: dict[ConversationId, Conversation | None] = {}
+        for conv_id, _ in memberships.values():
+            if conv_id not in conversations:
+                conversations[conv_id] = await self._repo.get_conversation(
+                    conv_id, history_limit=self.CONTEXT_HISTORY_LIMIT
+                )
+
+        contexts: dict[AgentName, ConversationContext] = {}
+        for agent, (conv_id, last_turn_tick) in memberships.items():
+            conv = conversations[conv_id]
+            if conv is None:
+                continue
+            unseen_turns = await self._repo.get_turns_since(conv_id, last_turn_tick)
+            contexts[agent] = ConversationContext(
+                conversation=conv,
+                unseen_turns=unseen_turns,
+                other_participants=conv.participants - {agent},
+            )
+        return contexts
+
     async def get_all_active_conversations(self) -> list[Conversation]:
         """Get all active conversations.
 
@@ -0,0 +1,229 @@
+"""Grid cache for Hearth.
+
+Write-through, chunked in-memory cache of grid cells and object passability,
+so movement checks and perception can read the grid without SQLite round-trips.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable
+
+from core.types import Position, Rect, ObjectId
+from core.world import Cell
+from core.objects import AnyWorldObject
+
+if TYPE_CHECKING:
+    from storage import Storage
+
+
+ChunkKey = tuple[int, int]
+
+
+@dataclass
+class _Chunk:
+    """Cached state of one CHUNK_SIZE x CHUNK_SIZE block of the grid."""
+
+    # Only non-default cells; a missing position is a default grass cell
+    cells: dict[Position, Cell] = field(default_factory=dict)
+    # Positions holding at least one impassable object
+    blockers: dict[Position, set[ObjectId]] = field(default_factory=dict)
+
+
+class GridCache:
+    """Chunked cache of cells and impassable objects, loaded lazily.
+
+    Chunks are filled with one bulk query for cells and one for objects the
+    first time any position in them is read. Writes go to storage first and
+    are then applied here by the caller (WorldService); writes to chunks that
+    are not loaded are skipped, since the next load reads them from storage.
+
+    World dimensions are cached too. Tick and weather are not, since the
+    commit phase updates them directly in storage.
+    """
+
+    CHUNK_SIZE = 32
+
+    def __init__(self, storage: "Storage"):
+        self._storage = storage
+        self._chunks: dict[ChunkKey, _Chunk] = {}
+        self._blocker_positions: dict[ObjectId, Position] = {}
+        self._dimensions: tuple[int, int] | None = None
+        self._loading: dict[ChunkKey, asyncio.Future[_Chunk]] = {}
+        # Loads that overlapped a write and must be redone
+        self._stale_loads: set[ChunkKey] = set()
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    async def get_dimensions(self) -> tuple[int, int]:
+        """Get world (width, height)."""
+        if self._dimensions is None:
+            state = await self._storage.world.get_world_state()
+            self._dimensions = (state.width, state.height)
+        return self._dimensions
+
+    async def get_cell(self, pos: Position) -> Cell:
+        """Get cell at position. Returns default if not stored."""
+        chunk = await self._get_chunk(self._key(pos))
+        cell = chunk.cells.get(pos)
+        return cell if cell is not None else Cell(position=pos)
+
+    async def get_cells_in_rect(self, rect: Rect) -> list[Cell]:
+        """Get all cells in a rectangle (includes defaults), in Rect.positions() order."""
+        await self._load_rect(rect)
+        size = self.CHUNK_SIZE
+        result = []
+        for pos in rect.positions():
+            cell = self._chunks[(pos.x // size, pos.y // size)].cells.get(pos)
+            result.append(cell if cell is not None else Cell(position=pos))
+        return result
+
+    async def has_blocking_object(self, pos: Position) -> bool:
+        """Check if an impassable object sits at position."""
+        chunk = await self._get_chunk(self._key(pos))
+        return pos in chunk.blockers
+
+    # -------------------------------------------------------------------------
+    # Write-through updates (call after the storage write succeeded)
+    # -------------------------------------------------------------------------
+
+    def put_cell(self, cell: Cell) -> None:
+        """Record a cell that was just written to storage."""
+        chunk = self._loaded_chunk(cell.position)
+        if chunk is None:
+            return
+        if cell == Cell(position=cell.position):
+            chunk.cells.pop(cell.position, None)
+        else:
+            chunk.cells[cell.position] = cell
+
+    def put_object(self, obj: AnyWorldObject) -> None:
+        """Record an object that was just saved (placed, moved or updated)."""
+        self.drop_object(obj.id)
+        if obj.passable:
+            return
+        chunk = self._loaded_chunk(obj.position)
+        if chunk is None:
+            return
+        chunk.blockers.setdefault(obj.position, set()).add(obj.id)
+        self._blocker_positions[obj.id] = obj.position
+
+    def drop_object(self, object_id: ObjectId) -> None:
+        """Forget an object that was just deleted (or is about to be re-recorded)."""
+        self._stale_loads.update(self._loading)
+        pos = self._blocker_positions.pop(object_id, None)
+        if pos is None:
+            return
+        chunk = self._chunks.get(self._key(pos))
+        if chunk is None:
+            return
+        ids = chunk.blockers.get(pos)
+        if ids is not None:
+            ids.discard(object_id)
+            if not ids:
+                del chunk.blockers[pos]
+
+    async def refresh_rect(self, rect: Rect) -> None:
+        """Re-read stored cells in rect after storage changed them behind our back."""
+        self._stale_loads.update(self._loading)
+        keys = [k for k in self._chunk_keys(rect) if k in self._chunks]
+        if not keys:
+            return
+        stored = await self._storage.world.get_stored_cells_in_rect(rect)
+        by_pos = {cell.position: cell for cell in stored}
+        for key in keys:
+            chunk = self._chunks.get(key)
+            if chunk is None:
+                continue
+            for pos in [p for p in chunk.cells if rect.contains(p)]:
+                del chunk.cells[pos]
+            for pos, cell in by_pos.items():
+                if self._key(pos) == key:
+                    chunk.cells[pos] = cell
+
+    def invalidate(self, rect: Rect | None = None) -> None:
+        """Drop cached chunks (all, or those overlapping rect) and the dimensions."""
+        self._stale_loads.update(self._loading)
+        if rect is None:
+            self._chunks.clear()
+            self._blocker_positions.clear()
+            self._dimensions = None
+            return
+        for key in self._chunk_keys(rect):
+            chunk = self._chunks.pop(key, None)
+            if chunk is not None:
+                for ids in chunk.blockers.values():
+                    for object_id in ids:
+                        self._blocker_positions.pop(object_id, None)
+
+    # -------------------------------------------------------------------------
+    # Chunk loading
+    # -------------------------------------------------------------------------
+
+    def _key(self, pos: Position) -> ChunkKey:
+        return (pos.x // self.CHUNK_SIZE, pos.y // self.CHUNK_SIZE)
+
+    def _chunk_keys(self, rect: Rect) -> Iterable[ChunkKey]:
+        size = self.CHUNK_SIZE
+        for cx in range(rect.min_x // size, rect.max_x // size + 1):
+            for cy in range(rect.min_y // size, rect.max_y // size + 1):
+                yield (cx, cy)
+
+    def _loaded_chunk(self, pos: Position) -> _Chunk | None:
+        # Any write may race a load that already read its rows; redo pending loads
+        self._stale_loads.update(self._loading)
+        return self._chunks.get(self._key(pos))
+
+    async def _load_rect(self, rect: Rect) -> None:
+        missing = [k for k in self._chunk_keys(rect) if k not in self._chunks]
+        if missing:
+            await asyncio.gather(*(self._get_chunk(k) for k in missing))
+
+    async def _get_chunk(self, key: ChunkKey) -> _Chunk:
+        chunk = self._chunks.get(key)
+        if chunk is not None:
+            return chunk
+
+        pending = self._loading.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[_Chunk] = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        try:
+            while True:
+                self._stale_loads.discard(key)
+                chunk = await self._read_chunk(key)
+                if key not in self._stale_loads:
+                    break
+            self._chunks[key] = chunk
+            for pos, ids in chunk.blockers.items():
+                for object_id in ids:
+                    self._blocker_positions[object_id] = pos
+            future.set_result(chunk)
+            return chunk
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a load nobody else awaited doesn't log a warning
+            future.exception()
+            raise
+        finally:
+            del self._loading[key]
+
+    async def _read_chunk(self, key: ChunkKey) -> _Chunk:
+        size = self.CHUNK_SIZE
+        rect = Rect(key[0] * size, key[1] * size, key[0] * size + size - 1, key[1] * size + size - 1)
+        cells = await self._storage.world.get_stored_cells_in_rect(rect)
+        objects = await self._storage.objects.get_objects_in_rect(rect)
+
+        chunk = _Chunk(cells={cell.position: cell for cell in cells})
+        for obj in objects:
+            if not obj.passable:
+                chunk.blockers.setdefault(obj.position, set()).add(obj.id)
+        return chunk
@@ -23,7 +23,7 @@ from core.actions import ActionResult
 from .action_engine import serialize_for_narrator
 
 if TYPE_CHECKING:
-    pass
+    from adapters.haiku_broker import HaikuBroker
 
 
 # -----------------------------------------------------------------------------
@@ -314,13 +314,13 @@ class Narrator:
 
     def __init__(
         self,
-        client: anthropic.AsyncAnthropic | None = None,
+        client: "anthropic.AsyncAnthropic | HaikuBroker | None" = None,
         model: str = "claude-haiku-4-5-20251001",
     ):
         """Initialize Narrator.
 
         Args:
-            client: Anthropic client (lazy-initialized if None)
+            client: Anthropic client or shared HaikuBroker (lazy-initialized if None)
             model: Model to use for Haiku narration
         """
         self._client = client
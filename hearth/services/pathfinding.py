@@ -0,0 +1,504 @@
+"""Pathfinding for Hearth.
+
+A packed passability map over the whole world and an A* search that runs
+against it synchronously, so computing a journey never awaits storage per node.
+Journeys to named places follow cached breadth-first flow fields instead.
+"""
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from core.types import Position, Direction, Rect, ObjectId
+from core.terrain import is_passable as terrain_is_passable
+from core.world import Cell
+from core.objects import AnyWorldObject
+
+if TYPE_CHECKING:
+    from storage import Storage
+
+
+# One bit per direction in a cell's move mask
+_BITS: dict[Direction, int] = {
+    Direction.NORTH: 1,
+    Direction.SOUTH: 2,
+    Direction.EAST: 4,
+    Direction.WEST: 8,
+}
+_ALL_MOVES = 15
+
+# (bit, dx, dy, bit of the opposite direction)
+_STEPS: tuple[tuple[int, int, int, int], ...] = tuple(
+    (bit, *direction.offset, _BITS[direction.opposite]) for direction, bit in _BITS.items()
+)
+
+
+@dataclass
+class _FlowField:
+    """Breadth-first distances to one goal, grown only as far as queries need."""
+
+    # Steps to the goal per cell index; -1 where not yet reached
+    dist: array
+    # Reached cells whose neighbors have not been expanded yet
+    frontier: deque[int]
+
+
+class PassabilityMap:
+    """Per-cell move masks for the whole world, packed one byte per cell.
+
+    Bit d of a cell's mask is set when a step in direction d is allowed: the
+    neighbor is in bounds, its terrain is passable, no impassable object sits
+    on it, and neither side of the shared edge has a wall without a door.
+    This is exactly WorldService.can_move, precomputed.
+
+    The map is built from two bulk queries the first time a path is needed
+    and patched cell by cell afterwards; callers (WorldService) report every
+    cell and object write after it reaches storage.
+    """
+
+    # Flood-fill budget for detecting start/goal sealed into a small pocket
+    POCKET_LIMIT = 4096
+    # Flow fields kept at once (one int per world cell each)
+    MAX_FIELDS = 16
+
+    def __init__(self, storage: "Storage"):
+        self._storage = storage
+        self._width = 0
+        self._height = 0
+        self._built = False
+        self._stale = False
+        self._moves = bytearray()
+        # Cells that cannot be entered (terrain or impassable object)
+        self._blocked = bytearray()
+        # Directions each cell cannot be exited through (wall without door)
+        self._walled = bytearray()
+        self._terrain_blocked: set[int] = set()
+        self._blockers: dict[int, set[ObjectId]] = {}
+        self._blocker_index: dict[ObjectId, int] = {}
+        self._fields: OrderedDict[int, _FlowField] = OrderedDict()
+
+    # -------------------------------------------------------------------------
+    # Building and updates
+    # -------------------------------------------------------------------------
+
+    async def ensure_built(self) -> None:
+        """Build the map from storage if it isn't current."""
+        if self._built:
+            return
+        while True:
+            self._stale = False
+            state = await self._storage.world.get_world_state()
+            rect = Rect(0, 0, state.width - 1, state.height - 1)
+            cells = await self._storage.world.get_stored_cells_in_rect(rect)
+            objects = await self._storage.objects.get_objects_in_rect(rect)
+            # A write landed while we were reading; read again
+            if not self._stale:
+                break
+        self._build(state.width, state.height, cells, objects)
+
+    def put_cell(self, cell: Cell) -> None:
+        """Record a cell that was just written to storage."""
+        if not self._built:
+            self._stale = True
+            return
+        i = self._record_cell(cell)
+        if i is not None:
+            self._refresh_around(i)
+
+    def put_object(self, obj: AnyWorldObject) -> None:
+        """Record an object that was just saved (placed, moved or updated)."""
+        self.drop_object(obj.id)
+        if not self._built:
+            return
+        i = self._record_object(obj)
+        if i is not None:
+            self._refresh_around(i)
+
+    def drop_object(self, object_id: ObjectId) -> None:
+        """Forget an object that was just deleted (or is about to be re-recorded)."""
+        if not self._built:
+            self._stale = True
+            return
+        i = self._blocker_index.pop(object_id, None)
+        if i is None:
+            return
+        ids = self._blockers[i]
+        ids.discard(object_id)
+        if not ids:
+            del self._blockers[i]
+        self._refresh_blocked(i)
+        self._refresh_around(i)
+
+    def invalidate(self) -> None:
+        """Drop the map; it is rebuilt on the next search."""
+        self._built = False
+        self._stale = True
+        self._moves = bytearray()
+        self._blocked = bytearray()
+        self._walled = bytearray()
+        self._terrain_blocked.clear()
+        self._blockers.clear()
+        self._blocker_index.clear()
+        self._fields.clear()
+
+    def can_move(self, from_pos: Position, direction: Direction) -> bool:
+        """Check a single step against the map (map must be built)."""
+        i = self._index(from_pos)
+        return i is not None and bool(self._moves[i] & _BITS[direction])
+
+    # -------------------------------------------------------------------------
+    # Enclosure
+    # -------------------------------------------------------------------------
+
+    def walled_region(self, start: Position, max_cells: int) -> tuple[set[Position], bool]:
+        """Flood-fill the cells reachable from start through walls alone.
+
+        Only walls and doors count here; terrain and objects are ignored, as
+        structures are defined by their walls. Map must be built.
+
+        Returns:
+            (visited cells, enclosed). enclosed is False if the fill crossed
+            an open world edge or grew past max_cells; visited then holds the
+            cells seen so far, all of which share start's (unenclosed) region.
+        """
+        width, height = self._width, self._height
+        walled = self._walled
+        s = self._index(start)
+        if s is None:
+            return set(), False
+
+        visited = {s}
+        to_visit = [s]
+        enclosed = True
+        while to_visit:
+            current = to_visit.pop()
+            x, y = current % width, current // width
+            for bit, dx, dy, back in _STEPS:
+                if walled[current] & bit:
+                    continue
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    # Open edge onto the world boundary
+                    enclosed = False
+                    break
+                n = ny * width + nx
+                if n in visited or walled[n] & back:
+                    continue
+                visited.add(n)
+                to_visit.append(n)
+            if not enclosed or len(visited) > max_cells:
+                enclosed = False
+                break
+
+        return {Position(i % width, i // width) for i in visited}, enclosed
+
+    # -------------------------------------------------------------------------
+    # Search
+    # -------------------------------------------------------------------------
+
+    def find_path(self, start: Position, goal: Position) -> tuple[Position, ...] | None:
+        """Shortest 4-connected path from start to goal (inclusive), or None.
+
+        Map must be built. Ties between equal-cost nodes are broken toward the
+        goal, so open terrain expands little more than the path itself.
+        """
+        if start == goal:
+            return (start,)
+        s = self._index(start)
+        g = self._index(goal)
+        if s is None or g is None:
+            return None
+        if self._blocked[g] or self._sealed_apart(s, g):
+            return None
+
+        width = self._width
+        moves = self._moves
+        steps = ((1, width), (2, -width), (4, 1), (8, -1))
+        gx, gy = goal.x, goal.y
+
+        came_from: dict[int, int] = {}
+        g_score: dict[int, int] = {s: 0}
+        h = abs(start.x - gx) + abs(start.y - gy)
+        open_set: list[tuple[int, int, int]] = [(h, h, s)]
+
+        while open_set:
+            f, h, current = heapq.heappop(open_set)
+            if current == g:
+                return self._reconstruct(came_from, current)
+            cost = g_score[current]
+            if f > cost + h:
+                # Superseded by a cheaper entry for the same cell
+                continue
+            mask = moves[current]
+            tentative = cost + 1
+            for bit, delta in steps:
+                if not mask & bit:
+                    continue
+                neighbor = current + delta
+                known = g_score.get(neighbor)
+                if known is not None and known <= tentative:
+                    continue
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative
+                nh = abs(neighbor % width - gx) + abs(neighbor // width - gy)
+                heapq.heappush(open_set, (tentative + nh, nh, neighbor))
+
+        return None
+
+    def path_along_field(self, start: Position, goal: Position) -> tuple[Position, ...] | None:
+        """Shortest path to goal read off its cached flow field, or None.
+
+        Meant for goals many journeys share, such as named places. The first
+        query grows a breadth-first field out from the goal until it reaches
+        start; later queries from inside that region are walks down the field.
+        Map must be built.
+        """
+        if start == goal:
+            return (start,)
+        s = self._index(start)
+        field = self._reach(start, goal)
+        if field is None:
+            return None
+
+        width = self._width
+        moves = self._moves
+        dist = field.dist
+        current = s
+        path = [current]
+        while dist[current] > 0:
+            mask = moves[current]
+            step = dist[current] - 1
+            for bit, dx, dy, _ in _STEPS:
+                if mask & bit and dist[current + dy * width + dx] == step:
+                    current += dy * width + dx
+                    break
+            path.append(current)
+        return tuple(Position(i % width, i // width) for i in path)
+
+    def distance_along_field(self, start: Position, goal: Position) -> int | None:
+        """Steps from start to goal via goal's cached flow field, or None if unreachable."""
+        if start == goal:
+            return 0
+        field = self._reach(start, goal)
+        if field is None:
+            return None
+        return field.dist[self._index(start)]
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _reach(self, start: Position, goal: Position) -> _FlowField | None:
+        """Goal's flow field, grown until it covers start; None if start can't get there."""
+        s = self._index(start)
+        g = self._index(goal)
+        if s is None or g is None or self._blocked[g]:
+            return None
+
+        field = self._fields.get(g)
+        if field is None:
+            if self._sealed_apart(s, g):
+                return None
+            dist = array("i", [-1]) * len(self._moves)
+            dist[g] = 0
+            field = _FlowField(dist=dist, frontier=deque([g]))
+            self._fields[g] = field
+            while len(self._fields) > self.MAX_FIELDS:
+                self._fields.popitem(last=False)
+        else:
+            self._fields.move_to_end(g)
+
+        if field.dist[s] < 0 and not self._grow(field, s):
+            return None
+        return field
+
+    def _grow(self, field: _FlowField, target: int) -> bool:
+        """Expand the field breadth-first until target is reached."""
+        width, height = self._width, self._height
+        moves = self._moves
+        dist = field.dist
+        frontier = field.frontier
+        while frontier:
+            current = frontier.popleft()
+            step = dist[current] + 1
+            x, y = current % width, current // width
+            # Cells that can step into current
+            for _, dx, dy, back in _STEPS:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                n = ny * width + nx
+                if dist[n] >= 0 or not moves[n] & back:
+                    continue
+                dist[n] = step
+                frontier.append(n)
+            if dist[target] >= 0:
+                return True
+        return False
+
+    def _drop_fields_touching(self, cells: list[int]) -> None:
+        """Drop flow fields whose explored region includes any changed cell.
+
+        Distances settled inside a field cannot depend on an edge between two
+        cells the field never reached, so fields elsewhere stay valid.
+        """
+        stale = [
+            goal for goal, field in self._fields.items()
+            if any(field.dist[i] >= 0 for i in cells)
+        ]
+        for goal in stale:
+            del self._fields[goal]
+
+    def _build(
+        self,
+        width: int,
+        height: int,
+        cells: list[Cell],
+        objects: list[AnyWorldObject],
+    ) -> None:
+        self._width = width
+        self._height = height
+        size = width * height
+        self._moves = bytearray([_ALL_MOVES]) * size
+        self._blocked = bytearray(size)
+        self._walled = bytearray(size)
+        self._terrain_blocked = set()
+        self._blockers = {}
+        self._blocker_index = {}
+        self._built = True
+
+        # Default cells are open grass; only world edges and stored state differ
+        north, south = _BITS[Direction.NORTH], _BITS[Direction.SOUTH]
+        east, west = _BITS[Direction.EAST], _BITS[Direction.WEST]
+        for x in range(width):
+            self._moves[x] &= ~south
+            self._moves[(height - 1) * width + x] &= ~north
+        for y in range(height):
+            self._moves[y * width] &= ~west
+            self._moves[y * width + width - 1] &= ~east
+
+        changed = {self._record_cell(cell) for cell in cells}
+        changed.update(self._record_object(obj) for obj in objects)
+        changed.discard(None)
+        dirty = set(changed)
+        for i in changed:
+            dirty.update(self._neighbors(i))
+        for i in dirty:
+            self._refresh_mask(i)
+
+    def _index(self, pos: Position) -> int | None:
+        if not pos.in_bounds(self._width, self._height):
+            return None
+        return pos.y * self._width + pos.x
+
+    def _record_cell(self, cell: Cell) -> int | None:
+        """Store a cell's walls and terrain; return its index if in bounds."""
+        i = self._index(cell.position)
+        if i is None:
+            return None
+        walled = 0
+        for direction in cell.walls - cell.doors:
+            walled |= _BITS[direction]
+        self._walled[i] = walled
+        if terrain_is_passable(cell.terrain):
+            self._terrain_blocked.discard(i)
+        else:
+            self._terrain_blocked.add(i)
+        self._refresh_blocked(i)
+        return i
+
+    def _record_object(self, obj: AnyWorldObject) -> int | None:
+        """Store an impassable object; return its index if it blocks a cell."""
+        if obj.passable:
+            return None
+        i = self._index(obj.position)
+        if i is None:
+            return None
+        self._blockers.setdefault(i, set()).add(obj.id)
+        self._blocker_index[obj.id] = i
+        self._refresh_blocked(i)
+        return i
+
+    def _refresh_blocked(self, i: int) -> None:
+        self._blocked[i] = 1 if (i in self._terrain_blocked or i in self._blockers) else 0
+
+    def _neighbors(self, i: int) -> list[int]:
+        width, height = self._width, self._height
+        x, y = i % width, i // width
+        return [
+            (y + dy) * width + x + dx
+            for _, dx, dy, _ in _STEPS
+            if 0 <= x + dx < width and 0 <= y + dy < height
+        ]
+
+    def _refresh_around(self, i: int) -> None:
+        """Recompute masks of cell i and its neighbors after i changed."""
+        neighbors = self._neighbors(i)
+        self._refresh_mask(i)
+        for n in neighbors:
+            self._refresh_mask(n)
+        if self._fields:
+            self._drop_fields_touching([i, *neighbors])
+
+    def _refresh_mask(self, i: int) -> None:
+        width, height = self._width, self._height
+        x, y = i % width, i // width
+        walled = self._walled[i]
+        mask = 0
+        for bit, dx, dy, back in _STEPS:
+            if walled & bit:
+                continue
+            nx, ny = x + dx, y + dy
+            if not (0 <= nx < width and 0 <= ny < height):
+                continue
+            n = ny * width + nx
+            if self._blocked[n] or self._walled[n] & back:
+                continue
+            mask |= bit
+        self._moves[i] = mask
+
+    def _sealed_apart(self, s: int, g: int) -> bool:
+        """Cheap no-path check: is either end sealed in a small pocket without the other?
+
+        A* would otherwise explore everything reachable before giving up.
+        """
+        return self._pocket(s, g, forward=True) or self._pocket(g, s, forward=False)
+
+    def _pocket(self, origin: int, other: int, forward: bool) -> bool:
+        width = self._width
+        moves = self._moves
+        steps = ((1, width, 2), (2, -width, 1), (4, 1, 8), (8, -1, 4))
+        seen = {origin}
+        queue = deque([origin])
+        while queue:
+            current = queue.popleft()
+            for bit, delta, back in steps:
+                neighbor = current + delta
+                # Forward: current -> neighbor. Backward: neighbor -> current.
+                if forward:
+                    if not moves[current] & bit:
+                        continue
+                elif not (0 <= neighbor < len(moves) and moves[neighbor] & back):
+                    continue
+                if neighbor in seen:
+                    continue
+                if neighbor == other:
+                    return False
+                seen.add(neighbor)
+                if len(seen) > self.POCKET_LIMIT:
+                    return False
+                queue.append(neighbor)
+        return True
+
+    def _reconstruct(self, came_from: dict[int, int], current: int) -> tuple[Position, ...]:
+        width = self._width
+        path = [current]
+        while current in came_from:
+            current = came_from[current]
+            path.append(current)
+        path.reverse()
+        return tuple(Position(i % width, i // width) for i in path)
@@ -1,12 +1,15 @@
 """World service for Hearth.
 
-Provides grid state management as a thin service layer over storage repositories.
-No in-memory caching - always delegates to storage.
+Provides grid state management as a service layer over storage repositories.
+Cells, object passability and world dimensions are served from a write-through
+GridCache, and pathfinding runs against a PassabilityMap kept current the same
+way (with cached flow fields for journeys to named places); everything else
+delegates to storage.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 from core.types import Position, Direction, Rect, ObjectId, AgentName
 from core.terrain import Terrain, TERRAIN_DEFAULTS, TerrainProperties
@@ -14,6 +17,9 @@ from core.world import Cell
 from core.structures import Structure
 from core.objects import AnyWorldObject
 
+from .grid_cache import GridCache
+from .pathfinding import PassabilityMap
+
 if TYPE_CHECKING:
     from storage import Storage
 
@@ -63,8 +69,10 @@ class ObjectNotFoundError(WorldServiceError):
 class WorldService:
     """Grid state management for Hearth.
 
-    A thin service layer over WorldRepository and ObjectRepository.
-    No in-memory caching - always delegates to storage.
+    A service layer over WorldRepository and ObjectRepository. Cell and
+    passability reads are answered from an in-memory GridCache; all writes go
+    to storage first and are then applied to the cache. Code that writes cells
+    or objects through storage directly must call invalidate_cache().
     """
 
     def __init__(self, storage: "Storage"):
@@ -74,6 +82,17 @@ class WorldService:
             storage: Connected Storage instance
         """
         self._storage = storage
+        self._cache = GridCache(storage)
+        self._paths = PassabilityMap(storage)
+        self._place_positions: set[Position] | None = None
+        # A rollback can undo writes already applied to the caches
+        storage.db.add_rollback_listener(self.invalidate_cache)
+
+    def invalidate_cache(self, rect: Rect | None = None) -> None:
+        """Drop cached grid state (all, or chunks overlapping rect)."""
+        self._cache.invalidate(rect)
+        self._paths.invalidate()
+        self._place_positions = None
 
     # -------------------------------------------------------------------------
     # Properties
@@ -95,11 +114,11 @@ class WorldService:
 
     async def get_cell(self, pos: Position) -> Cell:
         """Get cell at position. Returns default if not stored."""
-        return await self._world_repo.get_cell(pos)
+        return await self._cache.get_cell(pos)
 
     async def get_cells_in_rect(self, rect: Rect) -> list[Cell]:
         """Get all cells in a rectangle (includes defaults)."""
-        return await self._world_repo.get_cells_in_rect(rect)
+        return await self._cache.get_cells_in_rect(rect)
 
     async def get_objects_at(self, pos: Position) -> list[AnyWorldObject]:
         """Get all world objects at a position."""
@@ -111,8 +130,7 @@ class WorldService:
 
     async def get_world_dimensions(self) -> tuple[int, int]:
         """Get world (width, height)."""
-        state = await self._world_repo.get_world_state()
-        return state.width, state.height
+        return await self._cache.get_dimensions()
 
     async def get_world_state(self):
         """Get full world state (tick, weather, dimensions)."""
@@ -151,6 +169,8 @@ class WorldService:
                 f"Position {obj.position} is out of bounds", obj.position
             )
         await self._object_repo.save_object(obj)
+        self._cache.put_object(obj)
+        self._paths.put_object(obj)
 
     async def remove_object(self, object_id: ObjectId) -> None:
         """Remove an object from the world."""
@@ -159,6 +179,8 @@ class WorldService:
         if obj is None:
             raise ObjectNotFoundError(f"Object {object_id} not found")
         await self._object_repo.delete_object(object_id)
+        self._cache.drop_object(object_id)
+        self._paths.drop_object(object_id)
 
     async def move_object(self, object_id: ObjectId, new_pos: Position) -> None:
         """Move an object to a new position.
@@ -185,6 +207,8 @@ class WorldService:
         # Create updated object with new position
         updated = obj.model_copy(update={"position": new_pos})
         await self._object_repo.save_object(updated)
+        self._cache.put_object(updated)
+        self._paths.put_object(updated)
 
     # -------------------------------------------------------------------------
     # Wall Placement (auto-symmetric)
@@ -200,28 +224,7 @@ class WorldService:
         Raises:
             InvalidPositionError: If position is out of bounds
         """
-        state = await self._world_repo.get_world_state()
-
-        if not pos.in_bounds(state.width, state.height):
-            raise InvalidPositionError(f"Position {pos} is out of bounds", pos)
-
-        adjacent = pos + direction
-
-        if not adjacent.in_bounds(state.width, state.height):
-            # At world edge - only update this cell
-            cell = await self._world_repo.get_cell(pos)
-            await self._world_repo.set_cell(cell.with_wall(direction))
-            return
-
-        # Update both cells in transaction
-        async with self._storage.db.transaction():
-            cell = await self._world_repo.get_cell(pos)
-            adjacent_cell = await self._world_repo.get_cell(adjacent)
-
-            await self._world_repo.set_cell(cell.with_wall(direction))
-            await self._world_repo.set_cell(
-                adjacent_cell.with_wall(direction.opposite)
-            )
+        await self._update_edge(pos, direction, Cell.with_wall)
 
     async def remove_wall(self, pos: Position, direction: Direction) -> None:
         """Remove a wall from a cell edge. Automatically updates both adjacent cells.
@@ -233,28 +236,7 @@ class WorldService:
         Raises:
             InvalidPositionError: If position is out of bounds
         """
-        state = await self._world_repo.get_world_state()
-
-        if not pos.in_bounds(state.width, state.height):
-            raise InvalidPositionError(f"Position {pos} is out of bounds", pos)
-
-        adjacent = pos + direction
-
-        if not adjacent.in_bounds(state.width, state.height):
-            # At world edge - only update this cell
-            cell = await self._world_repo.get_cell(pos)
-            await self._world_repo.set_cell(cell.without_wall(direction))
-            return
-
-        # Update both cells in transaction
-        async with self._storage.db.transaction():
-            cell = await self._world_repo.get_cell(pos)
-            adjacent_cell = await self._world_repo.get_cell(adjacent)
-
-            await self._world_repo.set_cell(cell.without_wall(direction))
-            await self._world_repo.set_cell(
-                adjacent_cell.without_wall(direction.opposite)
-            )
+        await self._update_edge(pos, direction, Cell.without_wall)
 
     async def place_door(self, pos: Position, direction: Direction) -> None:
         """Place a door in a wall. Automatically updates both adjacent cells.
@@ -268,28 +250,7 @@ class WorldService:
         Raises:
             InvalidPositionError: If position is out of bounds
         """
-        state = await self._world_repo.get_world_state()
-
-        if not pos.in_bounds(state.width, state.height):
-            raise InvalidPositionError(f"Position {pos} is out of bounds", pos)
-
-        adjacent = pos + direction
-
-        if not adjacent.in_bounds(state.width, state.height):
-            # At world edge - only update this cell
-            cell = await self._world_repo.get_cell(pos)
-            await self._world_repo.set_cell(cell.with_door(direction))
-            return
-
-        # Update both cells in transaction
-        async with self._storage.db.transaction():
-            cell = await self._world_repo.get_cell(pos)
-            adjacent_cell = await self._world_repo.get_cell(adjacent)
-
-            await self._world_repo.set_cell(cell.with_door(direction))
-            await self._world_repo.set_cell(
-                adjacent_cell.with_door(direction.opposite)
-            )
+        await self._update_edge(pos, direction, Cell.with_door)
 
     async def remove_door(self, pos: Position, direction: Direction) -> None:
         """Remove a door from a wall (wall remains). Updates both adjacent cells.
@@ -301,28 +262,41 @@ class WorldService:
         Raises:
             InvalidPositionError: If position is out of bounds
         """
-        state = await self._world_repo.get_world_state()
+        await self._update_edge(pos, direction, Cell.without_door)
 
-        if not pos.in_bounds(state.width, state.height):
+    async def _update_edge(
+        self,
+        pos: Position,
+        direction: Direction,
+        update: Callable[[Cell, Direction], Cell],
+    ) -> None:
+        """Apply an edge change to a cell and the mirrored change to its neighbor."""
+        width, height = await self.get_world_dimensions()
+
+        if not pos.in_bounds(width, height):
             raise InvalidPositionError(f"Position {pos} is out of bounds", pos)
 
         adjacent = pos + direction
+        cell = update(await self.get_cell(pos), direction)
 
-        if not adjacent.in_bounds(state.width, state.height):
+        if not adjacent.in_bounds(width, height):
             # At world edge - only update this cell
-            cell = await self._world_repo.get_cell(pos)
-            await self._world_repo.set_cell(cell.without_door(direction))
+            await self._world_repo.set_cell(cell)
+            self._cache.put_cell(cell)
+            self._paths.put_cell(cell)
             return
 
+        adjacent_cell = update(await self.get_cell(adjacent), direction.opposite)
+
         # Update both cells in transaction
         async with self._storage.db.transaction():
-            cell = await self._world_repo.get_cell(pos)
-            adjacent_cell = await self._world_repo.get_cell(adjacent)
+            await self._world_repo.set_cell(cell)
+            await self._world_repo.set_cell(adjacent_cell)
 
-            await self._world_repo.set_cell(cell.without_door(direction))
-            await self._world_repo.set_cell(
-                adjacent_cell.without_door(direction.opposite)
-            )
+        self._cache.put_cell(cell)
+        self._cache.put_cell(adjacent_cell)
+        self._paths.put_cell(cell)
+        self._paths.put_cell(adjacent_cell)
 
     # -------------------------------------------------------------------------
     # Named Places
@@ -333,7 +307,13 @@ class WorldService:
         width, height = await self.get_world_dimensions()
         if not pos.in_bounds(width, height):
             raise InvalidPositionError(f"Position {pos} is out of bounds", pos)
+        old_pos = await self._world_repo.get_named_place(name)
         await self._world_repo.set_named_place(name, pos)
+        self._place_positions = None
+        # The repository rewrites place_name on the old and new cells
+        await self._cache.refresh_rect(Rect(pos.x, pos.y, pos.x, pos.y))
+        if old_pos is not None and old_pos != pos:
+            await self._cache.refresh_rect(Rect(old_pos.x, old_pos.y, old_pos.x, old_pos.y))
 
     async def get_place_position(self, name: str) -> Position | None:
         """Look up position by place name."""
@@ -345,7 +325,11 @@ class WorldService:
 
     async def remove_place_name(self, name: str) -> None:
         """Remove a named place."""
+        pos = await self._world_repo.get_named_place(name)
         await self._world_repo.remove_named_place(name)
+        self._place_positions = None
+        if pos is not None:
+            await self._cache.refresh_rect(Rect(pos.x, pos.y, pos.x, pos.y))
 
     # -------------------------------------------------------------------------
     # Movement Utilities
@@ -373,12 +357,7 @@ class WorldService:
             return False
 
         # Check for impassable objects
-        objects = await self.get_objects_at(pos)
-        for obj in objects:
-            if not obj.passable:
-                return False
-
-        return True
+        return not await self._cache.has_blocking_object(pos)
 
     async def can_move(self, from_pos: Position, direction: Direction) -> bool:
         """Check if movement is possible from one cell to an adjacent cell.
@@ -413,6 +392,46 @@ class WorldService:
 
         return True
 
+    async def find_path(
+        self, start: Position, goal: Position
+    ) -> tuple[Position, ...] | None:
+        """Find a shortest path using the same rules as can_move.
+
+        Paths to named places are read off a cached flow field for that
+        place, which survives until a wall, door or object changes inside the
+        region it has explored.
+
+        Args:
+            start: Starting position
+            goal: Goal position
+
+        Returns:
+            Tuple of positions from start to goal (inclusive), or None if
+            the goal is unreachable
+        """
+        await self._paths.ensure_built()
+        if goal in await self._get_place_positions():
+            return self._paths.path_along_field(start, goal)
+        return self._paths.find_path(start, goal)
+
+    async def travel_distance(self, start: Position, goal: Position) -> int | None:
+        """Number of steps on a shortest path from start to goal.
+
+        Returns:
+            Step count, or None if the goal is unreachable
+        """
+        await self._paths.ensure_built()
+        if goal in await self._get_place_positions():
+            return self._paths.distance_along_field(start, goal)
+        path = self._paths.find_path(start, goal)
+        return None if path is None else len(path) - 1
+
+    async def _get_place_positions(self) -> set[Position]:
+        if self._place_positions is None:
+            places = await self._world_repo.get_all_named_places()
+            self._place_positions = set(places.values())
+        return self._place_positions
+
     # -------------------------------------------------------------------------
     # Structure Detection (flood-fill)
     # -------------------------------------------------------------------------
@@ -423,12 +442,12 @@ class WorldService:
         """Find enclosed area containing start position via flood-fill.
 
         Algorithm:
-        1. BFS from start position
-        2. For each cell, check all 4 directions
-        3. If can_exit (no wall or has door), explore neighbor
-        4. If reach world boundary without wall -> NOT enclosed (return None)
-        5. If search exhausts without hitting boundary -> IS enclosed
-        6. Return visited positions as interior cells
+        1. Flood from start over the in-memory wall bitmap of PassabilityMap
+        2. A cell's neighbor is explored if neither side of the shared edge
+           has a wall without a door
+        3. If we reach the world boundary without a wall -> NOT enclosed
+        4. If the fill exhausts without hitting the boundary -> IS enclosed
+        5. Return visited positions as interior cells
 
         Args:
             start: Starting position to flood-fill from
@@ -437,46 +456,9 @@ class WorldService:
         Returns:
             frozenset of interior positions if enclosed, None if not enclosed
         """
-        state = await self._world_repo.get_world_state()
-        width, height = state.width, state.height
-
-        # Check start is valid
-        if not start.in_bounds(width, height):
-            return None
-
-        visited: set[Position] = set()
-        to_visit: list[Position] = [start]
-
-        while to_visit:
-            if len(visited) > max_cells:
-                # Too large to be a structure, or not enclosed
-                return None
-
-            current = to_visit.pop()
-            if current in visited:
-                continue
-            visited.add(current)
-
-            # Check all four directions
-            for direction in Direction:
-                current_cell = await self._world_repo.get_cell(current)
-
-                if current_cell.can_exit(direction):
-                    # No wall blocking us (or there's a door)
-                    neighbor = current + direction
-
-                    if not neighbor.in_bounds(width, height):
-                        # We reached world boundary without wall - NOT enclosed
-                        return None
-
-                    neighbor_cell = await self._world_repo.get_cell(neighbor)
-                    if neighbor_cell.can_exit(direction.opposite):
-                        # Can enter neighbor too - add to search
-                        if neighbor not in visited:
-                            to_visit.append(neighbor)
-
-        # Exhausted search without hitting unblocked boundary = enclosed!
-        return frozenset(visited)
+        await self._paths.ensure_built()
+        visited, enclosed = self._paths.walled_region(start, max_cells)
+        return frozenset(visited) if enclosed else None
 
     async def detect_structure_at(
         self,
@@ -510,8 +492,9 @@ class WorldService:
     ) -> list[Structure]:
         """Detect all enclosed structures within a rectangle.
 
-        Scans the rectangle and flood-fills from each unvisited position.
-        Returns all detected structures.
+        Scans the rectangle and flood-fills from each position not already
+        covered by an earlier fill. Every cell a fill reaches shares its
+        outcome, so open ground is filled once rather than once per cell.
 
         Args:
             rect: Rectangle to scan
@@ -520,24 +503,58 @@ class WorldService:
         Returns:
             List of detected structures
         """
-        state = await self._world_repo.get_world_state()
-        clamped = rect.clamp(state.width, state.height)
+        width, height = await self.get_world_dimensions()
+        return await self._detect_from_seeds(
+            rect.clamp(width, height).positions(), max_cells_per_structure
+        )
+
+    async def detect_structures_at_edge(
+        self,
+        pos: Position,
+        direction: Direction,
+        created_by: AgentName | None = None,
+        max_cells: int = 1000,
+    ) -> list[Structure]:
+        """Detect structures closed off by the wall on one cell edge.
+
+        A newly placed wall can only enclose areas containing one of the two
+        cells it separates, so only those two cells are flood-filled. Use this
+        after place_wall instead of rescanning a whole rect.
+
+        Args:
+            pos: Position of the cell
+            direction: Edge the wall was placed on
+            created_by: Optional creator to assign to detected structures
+            max_cells: Max cells per structure
+
+        Returns:
+            Structures containing either side of the edge (zero, one or two)
+        """
+        width, height = await self.get_world_dimensions()
+        seeds = [p for p in (pos, pos + direction) if p.in_bounds(width, height)]
+        return await self._detect_from_seeds(seeds, max_cells, created_by)
 
+    async def _detect_from_seeds(
+        self,
+        seeds: list[Position],
+        max_cells: int,
+        created_by: AgentName | None = None,
+    ) -> list[Structure]:
+        """Flood-fill from each seed not covered by an earlier fill."""
+        await self._paths.ensure_built()
         structures: list[Structure] = []
         visited: set[Position] = set()
 
-        for pos in clamped.positions():
+        for pos in seeds:
             if pos in visited:
                 continue
 
-            interior = await self._flood_fill_enclosed(pos, max_cells_per_structure)
-            if interior is not None:
-                # Found an enclosed area
-                structures.append(Structure.create(interior_cells=interior))
-                visited.update(interior)
-            else:
-                # Not enclosed - mark as visited so we don't re-check
-                visited.add(pos)
+            region, enclosed = self._paths.walled_region(pos, max_cells)
+            visited.update(region)
+            if enclosed:
+                structures.append(
+                    Structure.create(interior_cells=frozenset(region), created_by=created_by)
+                )
 
         return structures
 
@@ -547,10 +564,15 @@ class WorldService:
         Sets structure_id on all interior cells.
         """
         await self._world_repo.save_structure(structure)
+        if structure.interior_cells:
+            await self._cache.refresh_rect(_bounding_rect(structure.interior_cells))
 
     async def delete_structure(self, structure_id: ObjectId) -> None:
         """Delete a structure and clear cell references."""
+        structure = await self._world_repo.get_structure(structure_id)
         await self._world_repo.delete_structure(structure_id)
+        if structure is not None and structure.interior_cells:
+            await self._cache.refresh_rect(_bounding_rect(structure.interior_cells))
 
     async def get_structure(self, structure_id: ObjectId) -> Structure | None:
         """Get structure by ID."""
@@ -565,3 +587,10 @@ class WorldService:
         if cell.structure_id is None:
             return None
         return await self._world_repo.get_structure(cell.structure_id)
+
+
+def _bounding_rect(positions: frozenset[Position]) -> Rect:
+    """Smallest rectangle containing all positions."""
+    xs = [p.x for p in positions]
+    ys = [p.y for p in positions]
+    return Rect(min(xs), min(ys), max(xs), max(ys))
@@ -15,6 +15,11 @@ Usage:
 
         # Create backups periodically
         await storage.create_snapshot(tick=100)
+
+        # Group a tick's writes into one transaction
+        async with storage.unit_of_work():
+            await storage.agents.save_agent(agent)
+            await storage.log_events([AgentMovedEvent(...)])
     finally:
         await storage.close()
 """
@@ -22,8 +27,9 @@ Usage:
 from __future__ import annotations
 
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Sequence
+from typing import TYPE_CHECKING, Any, AsyncIterator, Sequence
 
 from .database import Database
 from .event_log import EventLog
@@ -78,6 +84,9 @@ class Storage:
         self._objects: ObjectRepository | None = None
         self._conversations: ConversationRepository | None = None
 
+        # Events logged inside unit_of_work(), written once it commits
+        self._pending_events: list[DomainEvent] | None = None
+
     @property
     def world(self) -> WorldRepository:
         """Get world repository.
@@ -170,11 +179,49 @@ class Storage:
         Does NOT modify SQLite state - events are for debugging only.
         State changes should be made via repositories.
 
+        Inside unit_of_work() the events are held back until its
+        transaction commits, and dropped if it rolls back.
+
         Args:
             events: Events to log
         """
+        if self._pending_events is not None:
+            self._pending_events.extend(events)
+            return
         await self.event_log.append_all(events)
 
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[None]:
+        """Run a batch of writes (e.g. one tick) as a single transaction.
+
+        Every repository write inside the block joins one SQLite
+        transaction: the commit() each repository issues is deferred, so
+        the batch costs one WAL commit instead of one per write. Events
+        passed to log_events() are appended to the event log after the
+        commit succeeds. On exception (or cancellation) everything is
+        rolled back and the events are discarded, so a crash mid-batch
+        leaves neither partial state nor orphaned audit entries.
+
+        Yields:
+            None
+
+        Raises:
+            RuntimeError: If a unit of work is already open
+        """
+        if self._pending_events is not None:
+            raise RuntimeError("Units of work cannot be nested")
+
+        self._pending_events = []
+        try:
+            async with self.db.transaction():
+                yield
+            events = self._pending_events
+        finally:
+            self._pending_events = None
+
+        if events:
+            await self.event_log.append_all(events)
+
     async def create_snapshot(self, tick: int) -> Path:
         """Create a backup snapshot of the database.
 
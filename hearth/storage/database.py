@@ -6,10 +6,11 @@ transaction support, and schema migration handling.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, AsyncIterator
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable
 
 import aiosqlite
 
@@ -47,6 +48,12 @@ class Database:
         self.path = path
         self._conn: aiosqlite.Connection | None = None
         self._in_transaction: bool = False
+        # Savepoints are named from a counter that never repeats, and only
+        # one task at a time holds open savepoints on the shared connection
+        self._savepoint_seq: int = 0
+        self._savepoint_lock = asyncio.Lock()
+        self._savepoint_owner: asyncio.Task[Any] | None = None
+        self._rollback_listeners: list[Callable[[], None]] = []
 
     async def connect(self) -> None:
         """Open database connection.
@@ -105,7 +112,8 @@ class Database:
         Returns:
             Cursor for the executed statement
         """
-        return await self.connection.execute(sql, params)
+        async with self._outside_savepoints():
+            return await self.connection.execute(sql, params)
 
     async def executemany(
         self, sql: str, params_seq: Sequence[Sequence[Any]]
@@ -119,7 +127,8 @@ class Database:
         Returns:
             Cursor for the executed statement
         """
-        return await self.connection.executemany(sql, params_seq)
+        async with self._outside_savepoints():
+            return await self.connection.executemany(sql, params_seq)
 
     async def executescript(self, sql: str) -> aiosqlite.Cursor:
         """Execute multiple SQL statements as a script.
@@ -130,7 +139,23 @@ class Database:
         Returns:
             Cursor for the executed script
         """
-        return await self.connection.executescript(sql)
+        async with self._outside_savepoints():
+            return await self.connection.executescript(sql)
+
+    @asynccontextmanager
+    async def _outside_savepoints(self) -> AsyncIterator[None]:
+        """Hold a statement back until other tasks' savepoints are closed.
+
+        A statement run while another task's savepoint is open would be
+        undone if that savepoint rolls back, so it waits for the savepoint
+        lock instead. The task owning the savepoints runs straight through.
+        """
+        owner = self._savepoint_owner
+        if owner is None or owner is asyncio.current_task():
+            yield
+            return
+        async with self._savepoint_lock:
+            yield
 
     async def fetch_one(
         self, sql: str, params: Sequence[Any] = ()
@@ -174,15 +199,38 @@ class Database:
     async def rollback(self) -> None:
         """Rollback current transaction."""
         await self.connection.rollback()
+        self._notify_rollback()
+
+    def add_rollback_listener(self, callback: Callable[[], None]) -> None:
+        """Register a callback to run after every rollback.
+
+        Repositories that mirror rows in memory use this to drop state
+        the rollback just undid.
+
+        Args:
+            callback: Called with no arguments after the rollback
+        """
+        self._rollback_listeners.append(callback)
+
+    def _notify_rollback(self) -> None:
+        for callback in self._rollback_listeners:
+            callback()
 
     @asynccontextmanager
     async def transaction(self) -> AsyncIterator[None]:
         """Context manager for ACID transactions.
 
         Provides true transactional semantics - all operations within the
-        block either commit together or rollback together on exception.
+        block either commit together or rollback together on exception,
+        including cancellation (CancelledError, KeyboardInterrupt).
 
         Inner calls to commit() are ignored while inside this block.
+        A transaction opened inside another one becomes a savepoint: on
+        exception only its own changes are undone, and nothing is committed
+        until the outermost block exits. While a task has a savepoint open,
+        other tasks' savepoints and statements wait for it to close, so one
+        task's savepoint never releases or rolls back another's writes.
+        Don't wait inside a nested block on a task that writes.
 
         Usage:
             async with db.transaction():
@@ -192,24 +240,99 @@ class Database:
 
         Yields:
             None
-
-        Raises:
-            RuntimeError: If transactions are nested (not supported)
         """
         if self._in_transaction:
-            raise RuntimeError("Nested transactions are not supported")
+            async with self._savepoint():
+                yield
+            return
 
         self._in_transaction = True
         await self.execute("BEGIN TRANSACTION")
         try:
             yield
             await self.execute("COMMIT")
-        except Exception:
+        except BaseException:
+            # BaseException too: a cancelled tick must not leave BEGIN open
+            # for the next write's commit() to persist
             await self.execute("ROLLBACK")
+            self._notify_rollback()
             raise
         finally:
             self._in_transaction = False
 
+    @asynccontextmanager
+    async def _savepoint(self) -> AsyncIterator[None]:
+        """Nested transaction block, as a SQLite savepoint.
+
+        Holds the savepoint lock for the block, unless the current task
+        already holds it from an enclosing savepoint.
+        """
+        task = asyncio.current_task()
+        if self._savepoint_owner is task:
+            async with self._open_savepoint():
+                yield
+            return
+
+        async with self._savepoint_lock:
+            self._savepoint_owner = task
+            try:
+                async with self._open_savepoint():
+                    yield
+            finally:
+                self._savepoint_owner = None
+
+    @asynccontextmanager
+    async def _open_savepoint(self) -> AsyncIterator[None]:
+        """Open a uniquely named savepoint for the duration of the block."""
+        name = f"sp_{self._savepoint_seq}"
+        self._savepoint_seq += 1
+        await self.execute(f"SAVEPOINT {name}")
+        try:
+            yield
+            await self.execute(f"RELEASE {name}")
+        except BaseException:
+            await self.execute(f"ROLLBACK TO {name}")
+            await self.execute(f"RELEASE {name}")
+            self._notify_rollback()
+            raise
+
+    @asynccontextmanager
+    async def bulk_load(self) -> AsyncIterator[None]:
+        """Context manager that relaxes durability for a one-off bulk load.
+
+        Sets synchronous=OFF and temp_store=MEMORY for the duration of the
+        block and restores the previous values afterwards. Only use this
+        where a crash mid-load means starting over anyway (e.g. world init).
+
+        Usage:
+            async with db.bulk_load():
+                for batch in batches:
+                    async with db.transaction():
+                        await db.executemany("INSERT ...", batch)
+
+        Yields:
+            None
+
+        Raises:
+            RuntimeError: If called inside a transaction (PRAGMA synchronous
+                can't change mid-transaction)
+        """
+        if self._in_transaction:
+            raise RuntimeError("bulk_load() cannot be entered inside a transaction")
+
+        # Flush any implicit transaction so the PRAGMAs take effect
+        await self.connection.commit()
+        synchronous = (await self.fetch_one("PRAGMA synchronous"))[0]
+        temp_store = (await self.fetch_one("PRAGMA temp_store"))[0]
+        await self.execute("PRAGMA synchronous=OFF")
+        await self.execute("PRAGMA temp_store=MEMORY")
+        try:
+            yield
+        finally:
+            await self.connection.commit()
+            await self.execute(f"PRAGMA synchronous={int(synchronous)}")
+            await self.execute(f"PRAGMA temp_store={int(temp_store)}")
+
     @property
     def in_transaction(self) -> bool:
         """Check if currently inside a transaction block."""
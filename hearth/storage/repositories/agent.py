@@ -5,6 +5,8 @@ Handles persistence of agents, their inventory, and journey state.
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
 from core.types import Position, Rect, AgentName, ObjectId
@@ -18,10 +20,11 @@ from core.agent import (
 )
 from core.objects import Item
 
+from ..spatial_index import SpatialIndex
 from .base import BaseRepository
 
 if TYPE_CHECKING:
-    pass
+    from ..database import Database, Row
 
 
 class AgentRepository(BaseRepository):
@@ -31,8 +34,34 @@ class AgentRepository(BaseRepository):
     - Agent CRUD (position, state, session)
     - Inventory (stacks for resources, items for unique objects)
     - Journey state
+
+    Agent positions are mirrored in an in-memory SpatialIndex, loaded on the
+    first position query and updated by every write here, so proximity
+    queries only touch SQLite to hydrate the agents they find.
+
+    The last version of each agent read from or written to the database is
+    kept too, so save_agent() only writes the columns and inventory rows
+    that changed since. Both are dropped on rollback. A read that overlaps a
+    write of the same agent doesn't replace that baseline, since it may
+    have seen the rows from before, or halfway through, the write.
     """
 
+    def __init__(self, db: Database):
+        super().__init__(db)
+        self._index: SpatialIndex[AgentName] | None = None
+        # Bumped on every position write, so a load that raced one is redone
+        self._position_writes = 0
+        # Agent as currently stored, the baseline save_agent() diffs against
+        self._stored: dict[AgentName, Agent] = {}
+        # Sequence number of the last write to start or finish, per agent,
+        # and the writes still in flight; reads check both before recording
+        # a baseline. _reset_seq marks the last rollback.
+        self._write_seq = 0
+        self._last_write: dict[AgentName, int] = {}
+        self._writes_in_flight: dict[AgentName, int] = {}
+        self._reset_seq = 0
+        db.add_rollback_listener(self._forget_stored_state)
+
     # --- Agent CRUD ---
 
     async def get_agent(self, name: AgentName) -> Agent | None:
@@ -44,23 +73,127 @@ class AgentRepository(BaseRepository):
         Returns:
             Agent if found, None otherwise
         """
-        row = await self.db.fetch_one(
-            "SELECT * FROM agents WHERE name = ?",
-            (str(name),),
+        agents = await self.get_agents([name])
+        return agents[0] if agents else None
+
+    async def get_agents(self, names: Iterable[AgentName]) -> list[Agent]:
+        """Get several agents by name, skipping any that don't exist.
+
+        Loads agents, stacks and items in three queries however many
+        names are given.
+
+        Args:
+            names: Agent names
+
+        Returns:
+            Agents found, in the order of names
+        """
+        names = list(dict.fromkeys(str(name) for name in names))
+        if not names:
+            return []
+
+        since = self._write_seq
+        placeholders = ", ".join("?" * len(names))
+        rows = await self.db.fetch_all(
+            f"SELECT * FROM agents WHERE name IN ({placeholders})",
+            names,
         )
-        if row is None:
-            return None
+        by_name = await self._hydrate(
+            rows, f"WHERE agent IN ({placeholders})", names, since
+        )
+        return [by_name[name] for name in names if name in by_name]
+
+    async def get_all_agents(self) -> list[Agent]:
+        """Get all agents.
+
+        Returns:
+            List of all agents
+        """
+        since = self._write_seq
+        rows = await self.db.fetch_all("SELECT * FROM agents")
+        by_name = await self._hydrate(rows, "", (), since)
+        return list(by_name.values())
+
+    async def _hydrate(
+        self, rows: Sequence[Row], where: str, params: Sequence[str], since: int
+    ) -> dict[str, Agent]:
+        """Build agents from their rows plus one query per inventory table.
+
+        Args:
+            rows: Rows from the agents table
+            where: Clause selecting the same agents' inventory rows
+            params: Parameters for where
+            since: Write sequence number when the agents query was issued
+
+        Returns:
+            Agents keyed by name, in row order
+        """
+        if not rows:
+            return {}
+
+        stacks: dict[str, list[InventoryStack]] = {}
+        for row in await self.db.fetch_all(
+            f"SELECT agent, item_type, quantity FROM inventory_stacks {where}",
+            params,
+        ):
+            stacks.setdefault(row["agent"], []).append(
+                InventoryStack(item_type=row["item_type"], quantity=row["quantity"])
+            )
+
+        items: dict[str, list[Item]] = {}
+        for row in await self.db.fetch_all(
+            f"SELECT agent, id, item_type, properties FROM inventory_items {where}",
+            params,
+        ):
+            items.setdefault(row["agent"], []).append(self._row_to_item(row))
+
+        agents = {
+            row["name"]: self._row_to_agent(
+                row,
+                Inventory(
+                    stacks=tuple(stacks.get(row["name"], ())),
+                    items=tuple(items.get(row["name"], ())),
+                ),
+            )
+            for row in rows
+        }
+        if self._reset_seq <= since:
+            for agent in agents.values():
+                if self._unwritten_since(agent.name, since):
+                    self._stored[agent.name] = agent
+        return agents
 
-        # Load inventory separately
-        inventory = await self.get_inventory(name)
+    def _unwritten_since(self, name: AgentName, since: int) -> bool:
+        """Whether no write of an agent has overlapped a read started at since."""
+        return (
+            self._last_write.get(name, 0) <= since
+            and name not in self._writes_in_flight
+        )
 
+    @contextmanager
+    def _writing(self, name: AgentName) -> Iterator[None]:
+        """Mark a write of an agent's rows as in flight for its duration."""
+        self._write_seq += 1
+        self._last_write[name] = self._write_seq
+        self._writes_in_flight[name] = self._writes_in_flight.get(name, 0) + 1
+        try:
+            yield
+        finally:
+            self._writes_in_flight[name] -= 1
+            if not self._writes_in_flight[name]:
+                del self._writes_in_flight[name]
+            self._write_seq += 1
+            self._last_write[name] = self._write_seq
+
+    def _row_to_agent(self, row: Row, inventory: Inventory) -> Agent:
+        """Convert an agents row and its inventory to an Agent."""
         # Parse journey if present
         journey = None
         if row["journey"]:
             journey = self._parse_journey(row["journey"])
 
         return Agent(
-            name=name,
+            name=AgentName(row["name"]),
             model=AgentModel(
                 id=row["model_id"],
                 display_name=row["model_display_name"],
@@ -75,31 +208,48 @@ class AgentRepository(BaseRepository):
             last_active_tick=row["last_active_tick"],
         )
 
-    async def get_all_agents(self) -> list[Agent]:
-        """Get all agents.
-
-        Returns:
-            List of all agents
-        """
-        rows = await self.db.fetch_all("SELECT name FROM agents")
-        agents = []
-        for row in rows:
-            agent = await self.get_agent(AgentName(row["name"]))
-            if agent is not None:
-                agents.append(agent)
-        return agents
-
     async def save_agent(self, agent: Agent) -> None:
         """Save or update an agent.
 
+        An agent this repository has already loaded or saved is diffed
+        against that version: only changed columns are updated and only
+        changed inventory rows are written. Anything else is upserted whole.
+
         Args:
             agent: Agent to save
         """
-        # Serialize journey if present
-        journey_json = None
-        if agent.journey:
-            journey_json = self._serialize_journey(agent.journey)
+        with self._writing(agent.name):
+            stored = self._stored.get(agent.name)
+            if stored is None:
+                await self._upsert_agent(agent)
+                await self.save_inventory(agent.name, agent.inventory)
+            else:
+                changed = agent.changed_fields(stored)
+                if not changed:
+                    return
+
+                columns: dict[str, object] = {}
+                for field in changed:
+                    columns.update(self._agent_columns(agent, field))
+                if columns:
+                    assignments = ", ".join(f"{column} = ?" for column in columns)
+                    await self.db.execute(
+                        f"UPDATE agents SET {assignments} WHERE name = ?",
+                        (*columns.values(), str(agent.name)),
+                    )
+                if "inventory" in changed:
+                    await self._update_inventory(agent.name, stored.inventory, agent.inventory)
+
+            await self.db.commit()
+            self._stored[agent.name] = agent
+            self._index_set(agent.name, agent.position)
+
+    async def _upsert_agent(self, agent: Agent) -> None:
+        """Write an agent's full row, inserting or replacing it.
 
+        Args:
+            agent: Agent to write
+        """
         await self.db.execute(
             """
             INSERT INTO agents (
@@ -131,14 +281,40 @@ class AgentRepository(BaseRepository):
                 agent.session_id,
                 agent.last_active_tick,
                 self._agent_names_to_json(agent.known_agents),
-                journey_json,
+                self._serialize_journey(agent.journey) if agent.journey else None,
             ),
         )
 
-        # Save inventory
-        await self.save_inventory(agent.name, agent.inventory)
+    def _agent_columns(self, agent: Agent, field: str) -> dict[str, object]:
+        """Column values in the agents table for one Agent field.
+
+        Args:
+            agent: Agent to read the field from
+            field: Agent field name
 
-        await self.db.commit()
+        Returns:
+            Column name to value; empty for fields stored elsewhere
+            (inventory) or never updated in place (name)
+        """
+        match field:
+            case "model":
+                return {"model_id": agent.model.id, "model_display_name": agent.model.display_name}
+            case "personality":
+                return {"personality": agent.personality}
+            case "position":
+                return {"x": agent.position.x, "y": agent.position.y}
+            case "journey":
+                return {"journey": self._serialize_journey(agent.journey) if agent.journey else None}
+            case "is_sleeping":
+                return {"is_sleeping": int(agent.is_sleeping)}
+            case "known_agents":
+                return {"known_agents": self._agent_names_to_json(agent.known_agents)}
+            case "session_id":
+                return {"session_id": agent.session_id}
+            case "last_active_tick":
+                return {"last_active_tick": agent.last_active_tick}
+            case _:
+                return {}
 
     async def delete_agent(self, name: AgentName) -> None:
         """Delete an agent and their inventory.
@@ -147,11 +323,16 @@ class AgentRepository(BaseRepository):
             name: Agent name to delete
         """
         # Inventory tables have CASCADE delete, so just delete agent
-        await self.db.execute(
-            "DELETE FROM agents WHERE name = ?",
-            (str(name),),
-        )
-        await self.db.commit()
+        with self._writing(name):
+            await self.db.execute(
+                "DELETE FROM agents WHERE name = ?",
+                (str(name),),
+            )
+            await self.db.commit()
+            self._stored.pop(name, None)
+            self._position_writes += 1
+            if self._index is not None:
+                self._index.remove(name)
 
     # --- Position Queries ---
 
@@ -162,22 +343,23 @@ class AgentRepository(BaseRepository):
             rect: Rectangle to query
 
         Returns:
-            List of agents in the rect
+            List of agents in the rect, ordered by name
         """
-        rows = await self.db.fetch_all(
-            """
-            SELECT name FROM agents
-            WHERE x >= ? AND x <= ? AND y >= ? AND y <= ?
-            """,
-            (rect.min_x, rect.max_x, rect.min_y, rect.max_y),
-        )
+        index = await self._get_index()
+        return await self.get_agents(sorted(index.in_rect(rect)))
 
-        agents = []
-        for row in rows:
-            agent = await self.get_agent(AgentName(row["name"]))
-            if agent is not None:
-                agents.append(agent)
-        return agents
+    async def get_agents_near(self, pos: Position, radius: int) -> list[Agent]:
+        """Get all agents within a Manhattan distance of a position.
+
+        Args:
+            pos: Center position
+            radius: Maximum distance (inclusive)
+
+        Returns:
+            List of agents within radius, ordered by name
+        """
+        index = await self._get_index()
+        return await self.get_agents(sorted(index.near(pos, radius)))
 
     async def get_agent_at(self, pos: Position) -> Agent | None:
         """Get agent at exact position.
@@ -188,13 +370,39 @@ class AgentRepository(BaseRepository):
         Returns:
             Agent at position, or None
         """
-        row = await self.db.fetch_one(
-            "SELECT name FROM agents WHERE x = ? AND y = ?",
-            (pos.x, pos.y),
-        )
-        if row is None:
+        index = await self._get_index()
+        names = sorted(index.at(pos))
+        if not names:
             return None
-        return await self.get_agent(AgentName(row["name"]))
+        return await self.get_agent(names[0])
+
+    async def _get_index(self) -> SpatialIndex[AgentName]:
+        """Get the position index, loading it from the agents table if needed."""
+        while self._index is None:
+            writes = self._position_writes
+            rows = await self.db.fetch_all("SELECT name, x, y FROM agents")
+            if writes != self._position_writes:
+                # A position changed while the query was in flight; reload
+                continue
+            index: SpatialIndex[AgentName] = SpatialIndex()
+            for row in rows:
+                index.set(AgentName(row["name"]), Position(row["x"], row["y"]))
+            self._index = index
+        return self._index
+
+    def _forget_stored_state(self) -> None:
+        """Drop in-memory mirrors of the agents table after a rollback."""
+        self._stored.clear()
+        self._index = None
+        self._position_writes += 1
+        self._write_seq += 1
+        self._reset_seq = self._write_seq
+
+    def _index_set(self, name: AgentName, pos: Position) -> None:
+        """Record a position write in the index (if loaded)."""
+        self._position_writes += 1
+        if self._index is not None:
+            self._index.set(name, pos)
 
     # --- Inventory ---
 
@@ -218,8 +426,74 @@ class AgentRepository(BaseRepository):
             agent: Agent name
             inventory: Inventory to save
         """
-        await self._save_stacks(agent, inventory.stacks)
-        await self._save_items(agent, inventory.items)
+        with self._writing(agent):
+            await self._save_stacks(agent, inventory.stacks)
+            await self._save_items(agent, inventory.items)
+            stored = self._stored.get(agent)
+            if stored is not None:
+                self._stored[agent] = stored.with_inventory(inventory)
+
+    async def _update_inventory(
+        self, agent: AgentName, old: Inventory, new: Inventory
+    ) -> None:
+        """Write only the inventory rows that differ between two versions.
+
+        Args:
+            agent: Agent name
+            old: Inventory as currently stored
+            new: Inventory to store
+        """
+        old_stacks = {stack.item_type: stack.quantity for stack in old.stacks}
+        new_stacks = {stack.item_type: stack.quantity for stack in new.stacks}
+        removed_stacks = [
+            (str(agent), item_type) for item_type in old_stacks if item_type not in new_stacks
+        ]
+        changed_stacks = [
+            (str(agent), item_type, quantity)
+            for item_type, quantity in new_stacks.items()
+            if old_stacks.get(item_type) != quantity
+        ]
+        if removed_stacks:
+            await self.db.executemany(
+                "DELETE FROM inventory_stacks WHERE agent = ? AND item_type = ?",
+                removed_stacks,
+            )
+        if changed_stacks:
+            await self.db.executemany(
+                """
+                INSERT INTO inventory_stacks (agent, item_type, quantity) VALUES (?, ?, ?)
+                ON CONFLICT(agent, item_type) DO UPDATE SET quantity = excluded.quantity
+                """,
+                changed_stacks,
+            )
+
+        old_items = {item.id: item for item in old.items}
+        new_items = {item.id: item for item in new.items}
+        removed_items = [
+            (str(item_id), str(agent)) for item_id in old_items if item_id not in new_items
+        ]
+        changed_items = [
+            (str(item.id), str(agent), item.item_type, self._encode_json(list(item.properties)))
+            for item_id, item in new_items.items()
+            if old_items.get(item_id) != item
+        ]
+        if removed_items:
+            # Scoped to the agent: the item may already belong to someone else
+            await self.db.executemany(
+                "DELETE FROM inventory_items WHERE id = ? AND agent = ?",
+                removed_items,
+            )
+        if changed_items:
+            await self.db.executemany(
+                """
+                INSERT INTO inventory_items (id, agent, item_type, properties) VALUES (?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    agent = excluded.agent,
+                    item_type = excluded.item_type,
+                    properties = excluded.properties
+                """,
+                changed_items,
+            )
 
     async def _load_stacks(self, agent: AgentName) -> tuple[InventoryStack, ...]:
         """Load inventory stacks for an agent.
@@ -252,14 +526,15 @@ class AgentRepository(BaseRepository):
             "SELECT id, item_type, properties FROM inventory_items WHERE agent = ?",
             (str(agent),),
         )
-        return tuple(
-            Item(
-                id=ObjectId(row["id"]),
-                item_type=row["item_type"],
-                properties=tuple(self._decode_json(row["properties"]) or []),
-                quantity=1,
-            )
-            for row in rows
+        return tuple(self._row_to_item(row) for row in rows)
+
+    def _row_to_item(self, row: Row) -> Item:
+        """Convert an inventory_items row to an Item."""
+        return Item(
+            id=ObjectId(row["id"]),
+            item_type=row["item_type"],
+            properties=tuple(self._decode_json(row["properties"]) or []),
+            quantity=1,
         )
 
     async def _save_stacks(
@@ -375,11 +650,17 @@ class AgentRepository(BaseRepository):
             name: Agent name
             pos: New position
         """
-        await self.db.execute(
-            "UPDATE agents SET x = ?, y = ? WHERE name = ?",
-            (pos.x, pos.y, str(name)),
-        )
-        await self.db.commit()
+        with self._writing(name):
+            cursor = await self.db.execute(
+                "UPDATE agents SET x = ?, y = ? WHERE name = ?",
+                (pos.x, pos.y, str(name)),
+            )
+            await self.db.commit()
+            if cursor.rowcount:
+                self._index_set(name, pos)
+                stored = self._stored.get(name)
+                if stored is not None:
+                    self._stored[name] = stored.with_position(pos)
 
     async def update_session(
         self, name: AgentName, session_id: str | None, tick: int
@@ -391,11 +672,15 @@ class AgentRepository(BaseRepository):
             session_id: New session ID (or None)
             tick: Current tick
         """
-        await self.db.execute(
-            "UPDATE agents SET session_id = ?, last_active_tick = ? WHERE name = ?",
-            (session_id, tick, str(name)),
-        )
-        await self.db.commit()
+        with self._writing(name):
+            await self.db.execute(
+                "UPDATE agents SET session_id = ?, last_active_tick = ? WHERE name = ?",
+                (session_id, tick, str(name)),
+            )
+            await self.db.commit()
+            stored = self._stored.get(name)
+            if stored is not None:
+                self._stored[name] = stored.with_session_id(session_id).with_last_active_tick(tick)
 
     async def update_sleeping(self, name: AgentName, is_sleeping: bool) -> None:
         """Update agent's sleep state.
@@ -404,8 +689,12 @@ class AgentRepository(BaseRepository):
             name: Agent name
             is_sleeping: New sleep state
         """
-        await self.db.execute(
-            "UPDATE agents SET is_sleeping = ? WHERE name = ?",
-            (int(is_sleeping), str(name)),
-        )
-        await self.db.commit()
+        with self._writing(name):
+            await self.db.execute(
+                "UPDATE agents SET is_sleeping = ? WHERE name = ?",
+                (int(is_sleeping), str(name)),
+            )
+            await self.db.commit()
+            stored = self._stored.get(name)
+            if stored is not None:
+                self._stored[name] = stored.with_sleeping(is_sleeping)
@@ -6,7 +6,7 @@ Handles persistence of conversations, turns, participants, and invitations.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 from uuid import uuid4
 
 from core.types import AgentName, ConversationId
@@ -20,6 +20,9 @@ from core.constants import HEARTH_TZ
 
 from .base import BaseRepository
 
+if TYPE_CHECKING:
+    from ..database import Database, Row
+
 
 # Type alias for privacy values
 Privacy = Literal["public", "private"]
@@ -51,8 +54,24 @@ class ConversationRepository(BaseRepository):
     - Participant management
     - Turn history
     - Invitation management
+
+    Turn history is cached in-process per conversation: the first read loads
+    it with one query, add_turn() appends to it, and every later read (full,
+    last N turns, or since a tick) is served from memory. The cache is
+    dropped for a conversation when it ends, and entirely on rollback.
     """
 
+    def __init__(self, db: Database):
+        super().__init__(db)
+        # Full turn history per conversation, in insertion (id) order
+        self._turns: dict[ConversationId, list[ConversationTurn]] = {}
+        # Bumped when a turn write starts and when it finishes, so a load
+        # that raced one is redone; a load that ends while one is still in
+        # flight isn't cached at all
+        self._turn_writes = 0
+        self._turn_writes_in_flight = 0
+        db.add_rollback_listener(self._forget_turns)
+
     # --- Conversation CRUD ---
 
     async def create_conversation(
@@ -95,11 +114,15 @@ class ConversationRepository(BaseRepository):
             created_by=created_by,
         )
 
-    async def get_conversation(self, conv_id: ConversationId) -> Conversation | None:
+    async def get_conversation(
+        self, conv_id: ConversationId, history_limit: int | None = None
+    ) -> Conversation | None:
         """Get a conversation by ID.
 
         Args:
             conv_id: Conversation ID
+            history_limit: Only include the last N turns in history
+                           (None = full history)
 
         Returns:
             Conversation if found, None otherwise
@@ -115,10 +138,19 @@ class ConversationRepository(BaseRepository):
         participants = await self._get_active_participants(conv_id)
 
         # Load history
-        history = await self._get_turns(conv_id)
+        history = await self.get_turns(conv_id, limit=history_limit)
 
+        return self._row_to_conversation(row, participants, history)
+
+    def _row_to_conversation(
+        self,
+        row: Row,
+        participants: frozenset[AgentName],
+        history: tuple[ConversationTurn, ...],
+    ) -> Conversation:
+        """Convert a conversations row plus its participants and turns."""
         return Conversation(
-            id=conv_id,
+            id=ConversationId(row["id"]),
             privacy=_validate_privacy(row["privacy"]),
             participants=participants,
             history=history,
@@ -128,12 +160,14 @@ class ConversationRepository(BaseRepository):
         )
 
     async def get_conversation_for_agent(
-        self, agent: AgentName
+        self, agent: AgentName, history_limit: int | None = None
     ) -> Conversation | None:
         """Get the active conversation an agent is in.
 
         Args:
             agent: Agent name
+            history_limit: Only include the last N turns in history
+                           (None = full history)
 
         Returns:
             Active conversation, or None if not in any
@@ -148,22 +182,78 @@ class ConversationRepository(BaseRepository):
         )
         if row is None:
             return None
-        return await self.get_conversation(ConversationId(row["id"]))
+        return await self.get_conversation(ConversationId(row["id"]), history_limit)
+
+    async def get_active_memberships(
+        self, agents: list[AgentName]
+    ) -> dict[AgentName, tuple[ConversationId, int | None]]:
+        """Get the active conversation and last turn tick for several agents at once.
 
-    async def get_all_active_conversations(self) -> list[Conversation]:
+        Args:
+            agents: Agent names
+
+        Returns:
+            Dict mapping each agent in a conversation to
+            (conversation ID, tick of their last turn or None)
+        """
+        if not agents:
+            return {}
+        placeholders = ", ".join("?" for _ in agents)
+        rows = await self.db.fetch_all(
+            f"""
+            SELECT p.agent, c.id, p.last_turn_tick FROM conversations c
+            JOIN conversation_participants p ON c.id = p.conversation_id
+            WHERE p.agent IN ({placeholders})
+              AND p.left_at_tick IS NULL AND c.ended_at_tick IS NULL
+            """,
+            tuple(str(a) for a in agents),
+        )
+        result: dict[AgentName, tuple[ConversationId, int | None]] = {}
+        for row in rows:
+            result.setdefault(
+                AgentName(row["agent"]),
+                (ConversationId(row["id"]), row["last_turn_tick"]),
+            )
+        return result
+
+    async def get_all_active_conversations(
+        self, history_limit: int | None = None
+    ) -> list[Conversation]:
         """Get all active (not ended) conversations.
 
+        Args:
+            history_limit: Only include the last N turns in each history
+                           (None = full history)
+
         Returns:
             List of active conversations
         """
         rows = await self.db.fetch_all(
-            "SELECT id FROM conversations WHERE ended_at_tick IS NULL"
+            "SELECT * FROM conversations WHERE ended_at_tick IS NULL"
         )
+        if not rows:
+            return []
+
+        participant_rows = await self.db.fetch_all(
+            """
+            SELECT p.conversation_id, p.agent FROM conversation_participants p
+            JOIN conversations c ON c.id = p.conversation_id
+            WHERE c.ended_at_tick IS NULL AND p.left_at_tick IS NULL
+            """
+        )
+        participants: dict[str, set[AgentName]] = {}
+        for row in participant_rows:
+            participants.setdefault(row["conversation_id"], set()).add(AgentName(row["agent"]))
+
         conversations = []
         for row in rows:
-            conv = await self.get_conversation(ConversationId(row["id"]))
-            if conv is not None:
-                conversations.append(conv)
+            conv_id = ConversationId(row["id"])
+            history = await self.get_turns(conv_id, limit=history_limit)
+            conversations.append(
+                self._row_to_conversation(
+                    row, frozenset(participants.get(row["id"], ())), history
+                )
+            )
         return conversations
 
     async def end_conversation(self, conv_id: ConversationId, tick: int) -> None:
@@ -178,6 +268,8 @@ class ConversationRepository(BaseRepository):
             (tick, str(conv_id)),
         )
         await self.db.commit()
+        # Ended conversations are rarely read again; reload if they are
+        self._turns.pop(conv_id, None)
 
     # --- Participants ---
 
@@ -333,59 +425,63 @@ class ConversationRepository(BaseRepository):
         """
         now = datetime.now(HEARTH_TZ)
 
-        await self.db.execute(
-            """
-            INSERT INTO conversation_turns (conversation_id, speaker, message, tick, timestamp)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (str(conv_id), str(speaker), message, tick, now.isoformat()),
-        )
-
-        # Update speaker's last turn tick
-        await self.update_last_turn_tick(conv_id, speaker, tick)
+        self._turn_writes += 1
+        self._turn_writes_in_flight += 1
+        try:
+            await self.db.execute(
+                """
+                INSERT INTO conversation_turns (conversation_id, speaker, message, tick, timestamp)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (str(conv_id), str(speaker), message, tick, now.isoformat()),
+            )
 
-        await self.db.commit()
+            # Update speaker's last turn tick
+            await self.update_last_turn_tick(conv_id, speaker, tick)
 
-        return ConversationTurn(
-            speaker=speaker,
-            message=message,
-            tick=tick,
-            timestamp=now,
-        )
+            await self.db.commit()
 
-    async def _get_turns(self, conv_id: ConversationId) -> tuple[ConversationTurn, ...]:
-        """Get all turns in a conversation.
+            turn = ConversationTurn(
+                speaker=speaker,
+                message=message,
+                tick=tick,
+                timestamp=now,
+            )
+            cached = self._turns.get(conv_id)
+            if cached is not None:
+                cached.append(turn)
+            return turn
+        finally:
+            self._turn_writes_in_flight -= 1
+            self._turn_writes += 1
+
+    async def get_turns(
+        self, conv_id: ConversationId, limit: int | None = None
+    ) -> tuple[ConversationTurn, ...]:
+        """Get a conversation's turns, or only the most recent ones.
 
         Args:
             conv_id: Conversation ID
+            limit: Return only the last N turns (None = all)
 
         Returns:
             Tuple of turns in order
         """
-        rows = await self.db.fetch_all(
-            """
-            SELECT speaker, message, tick, timestamp
-            FROM conversation_turns
-            WHERE conversation_id = ?
-            ORDER BY id
-            """,
-            (str(conv_id),),
-        )
-        return tuple(
-            ConversationTurn(
-                speaker=AgentName(row["speaker"]),
-                message=row["message"],
-                tick=row["tick"],
-                timestamp=datetime.fromisoformat(row["timestamp"]),
-            )
-            for row in rows
-        )
+        turns = await self._cached_turns(conv_id)
+        if limit is None:
+            return tuple(turns)
+        if limit <= 0:
+            return ()
+        return tuple(turns[-limit:])
 
     async def get_turns_since(
         self, conv_id: ConversationId, since_tick: int | None
     ) -> tuple[ConversationTurn, ...]:
         """Get turns since a specific tick.
 
+        Turns are appended in tick order, so this only walks back over the
+        turns it returns.
+
         Args:
             conv_id: Conversation ID
             since_tick: Tick to start from (exclusive), or None for all
@@ -393,28 +489,59 @@ class ConversationRepository(BaseRepository):
         Returns:
             Tuple of turns after the specified tick
         """
+        turns = await self._cached_turns(conv_id)
         if since_tick is None:
-            return await self._get_turns(conv_id)
+            return tuple(turns)
 
-        rows = await self.db.fetch_all(
-            """
-            SELECT speaker, message, tick, timestamp
-            FROM conversation_turns
-            WHERE conversation_id = ? AND tick > ?
-            ORDER BY id
-            """,
-            (str(conv_id), since_tick),
-        )
-        return tuple(
-            ConversationTurn(
-                speaker=AgentName(row["speaker"]),
-                message=row["message"],
-                tick=row["tick"],
-                timestamp=datetime.fromisoformat(row["timestamp"]),
+        start = len(turns)
+        while start > 0 and turns[start - 1].tick > since_tick:
+            start -= 1
+        return tuple(turns[start:])
+
+    async def _cached_turns(self, conv_id: ConversationId) -> list[ConversationTurn]:
+        """Get the cached turn list for a conversation, loading it if needed.
+
+        Args:
+            conv_id: Conversation ID
+
+        Returns:
+            The cache's own list (callers must not modify it)
+        """
+        while (turns := self._turns.get(conv_id)) is None:
+            writes = self._turn_writes
+            rows = await self.db.fetch_all(
+                """
+                SELECT speaker, message, tick, timestamp
+                FROM conversation_turns
+                WHERE conversation_id = ?
+                ORDER BY id
+                """,
+                (str(conv_id),),
             )
-            for row in rows
+            if writes != self._turn_writes:
+                # A turn was added while the query was in flight; reload
+                continue
+            if self._turn_writes_in_flight:
+                # The rows may already hold a turn add_turn() is about to
+                # append, so don't cache them
+                return [self._row_to_turn(row) for row in rows]
+            self._turns[conv_id] = [self._row_to_turn(row) for row in rows]
+        return turns
+
+    def _row_to_turn(self, row: Row) -> ConversationTurn:
+        """Convert database row to ConversationTurn."""
+        return ConversationTurn(
+            speaker=AgentName(row["speaker"]),
+            message=row["message"],
+            tick=row["tick"],
+            timestamp=datetime.fromisoformat(row["timestamp"]),
         )
 
+    def _forget_turns(self) -> None:
+        """Drop the turn cache after a rollback."""
+        self._turns.clear()
+        self._turn_writes += 1
+
     # --- Invitations ---
 
     async def create_invitation(
@@ -485,15 +612,34 @@ class ConversationRepository(BaseRepository):
         if row is None:
             return None
 
-        return Invitation(
-            id=row["id"],
-            conversation_id=ConversationId(row["conversation_id"]),
-            inviter=AgentName(row["inviter"]),
-            invitee=AgentName(row["invitee"]),
-            privacy=_validate_privacy(row["privacy"]),
-            created_at_tick=row["created_at_tick"],
-            expires_at_tick=row["expires_at_tick"],
+        return self._row_to_invitation(row)
+
+    async def get_pending_invitations(
+        self, agents: list[AgentName]
+    ) -> dict[AgentName, Invitation]:
+        """Get the pending invitation for several agents (as invitee) at once.
+
+        Args:
+            agents: Agent names (invitees)
+
+        Returns:
+            Dict mapping each invitee with a pending invitation to it
+        """
+        if not agents:
+            return {}
+        placeholders = ", ".join("?" for _ in agents)
+        rows = await self.db.fetch_all(
+            f"""
+            SELECT * FROM conversation_invitations
+            WHERE invitee IN ({placeholders})
+            ORDER BY rowid
+            """,
+            tuple(str(a) for a in agents),
         )
+        result: dict[AgentName, Invitation] = {}
+        for row in rows:
+            result.setdefault(AgentName(row["invitee"]), self._row_to_invitation(row))
+        return result
 
     async def get_pending_outgoing_invite(
         self, agent: AgentName
@@ -513,15 +659,7 @@ class ConversationRepository(BaseRepository):
         if row is None:
             return None
 
-        return Invitation(
-            id=row["id"],
-            conversation_id=ConversationId(row["conversation_id"]),
-            inviter=AgentName(row["inviter"]),
-            invitee=AgentName(row["invitee"]),
-            privacy=_validate_privacy(row["privacy"]),
-            created_at_tick=row["created_at_tick"],
-            expires_at_tick=row["expires_at_tick"],
-        )
+        return self._row_to_invitation(row)
 
     async def delete_invitation(self, invite_id: str) -> None:
         """Delete an invitation.
@@ -564,15 +702,16 @@ class ConversationRepository(BaseRepository):
             "SELECT * FROM conversation_invitations WHERE expires_at_tick < ?",
             (current_tick,),
         )
-        return [
-            Invitation(
-                id=row["id"],
-                conversation_id=ConversationId(row["conversation_id"]),
-                inviter=AgentName(row["inviter"]),
-                invitee=AgentName(row["invitee"]),
-                privacy=_validate_privacy(row["privacy"]),
-                created_at_tick=row["created_at_tick"],
-                expires_at_tick=row["expires_at_tick"],
-            )
-            for row in rows
-        ]
+        return [self._row_to_invitation(row) for row in rows]
+
+    def _row_to_invitation(self, row) -> Invitation:
+        """Convert database row to Invitation."""
+        return Invitation(
+            id=row["id"],
+            conversation_id=ConversationId(row["conversation_id"]),
+            inviter=AgentName(row["inviter"]),
+            invitee=AgentName(row["invitee"]),
+            privacy=_validate_privacy(row["privacy"]),
+            created_at_tick=row["created_at_tick"],
+            expires_at_tick=row["expires_at_tick"],
+        )
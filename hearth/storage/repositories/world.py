@@ -5,6 +5,7 @@ Handles persistence of grid cells, world state, named places, and structures.
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterable, Iterable
 from typing import TYPE_CHECKING
 
 from core.types import Position, Rect, ObjectId, AgentName
@@ -18,6 +19,19 @@ if TYPE_CHECKING:
     pass
 
 
+# Insert-or-replace for a full cell row; shared by the bulk writers
+_UPSERT_CELL_SQL = """
+    INSERT INTO cells (x, y, terrain, walls, doors, place_name, structure_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(x, y) DO UPDATE SET
+        terrain = excluded.terrain,
+        walls = excluded.walls,
+        doors = excluded.doors,
+        place_name = excluded.place_name,
+        structure_id = excluded.structure_id
+"""
+
+
 class WorldRepository(BaseRepository):
     """Repository for world grid and global state.
 
@@ -172,8 +186,36 @@ class WorldRepository(BaseRepository):
         if not cells:
             return
 
-        # Prepare all rows
-        rows = [
+        await self.db.executemany(_UPSERT_CELL_SQL, self._cell_rows(cells))
+        await self.db.commit()
+
+    async def load_cells(self, batches: AsyncIterable[Iterable[Cell]]) -> int:
+        """Bulk-load cells as they arrive, one transaction per batch.
+
+        Meant for world init: runs under Database.bulk_load(), so the loader
+        never holds more than one batch and the producer can keep generating
+        while earlier batches are written.
+
+        Args:
+            batches: Async stream of cell batches to save
+
+        Returns:
+            Number of cells written
+        """
+        count = 0
+        async with self.db.bulk_load():
+            async for batch in batches:
+                rows = self._cell_rows(batch)
+                if not rows:
+                    continue
+                async with self.db.transaction():
+                    await self.db.executemany(_UPSERT_CELL_SQL, rows)
+                count += len(rows)
+        return count
+
+    def _cell_rows(self, cells: Iterable[Cell]) -> list[tuple]:
+        """Convert cells to rows for _UPSERT_CELL_SQL."""
+        return [
             (
                 cell.position.x,
                 cell.position.y,
@@ -186,22 +228,6 @@ class WorldRepository(BaseRepository):
             for cell in cells
         ]
 
-        # Bulk insert with executemany
-        await self.db.executemany(
-            """
-            INSERT INTO cells (x, y, terrain, walls, doors, place_name, structure_id)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(x, y) DO UPDATE SET
-                terrain = excluded.terrain,
-                walls = excluded.walls,
-                doors = excluded.doors,
-                place_name = excluded.place_name,
-                structure_id = excluded.structure_id
-            """,
-            rows,
-        )
-        await self.db.commit()
-
     async def get_cells_in_rect(self, rect: Rect) -> list[Cell]:
         """Get all cells in a rectangle.
 
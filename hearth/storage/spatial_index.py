@@ -0,0 +1,140 @@
+"""In-memory spatial index for Hearth.
+
+A uniform grid of buckets mapping keys (agent names, object IDs) to
+positions, so "who is near here?" is answered without querying SQLite.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterator
+
+from core.types import Position, Rect
+
+
+class SpatialIndex[K: Hashable]:
+    """Positions of keyed entities, bucketed on a uniform grid.
+
+    Each bucket covers a cell_size x cell_size square. A rect query visits
+    only the buckets the rect overlaps, so its cost depends on the area
+    searched and the entities found, not on how many entities exist.
+
+    The index is not persisted; its owner loads it from storage and keeps
+    it in sync on every write.
+    """
+
+    def __init__(self, cell_size: int = 16):
+        """Create an empty index.
+
+        Args:
+            cell_size: Side of each bucket in grid cells. Roughly the
+                       typical query radius works well.
+        """
+        if cell_size < 1:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self._positions: dict[K, Position] = {}
+        self._buckets: dict[tuple[int, int], set[K]] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._positions
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._positions)
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def set(self, key: K, pos: Position) -> None:
+        """Insert a key or move it to a new position."""
+        old = self._positions.get(key)
+        if old is not None:
+            if old == pos:
+                return
+            self._discard(key, old)
+        self._positions[key] = pos
+        self._buckets.setdefault(self._bucket_of(pos), set()).add(key)
+
+    def remove(self, key: K) -> None:
+        """Remove a key if present."""
+        old = self._positions.pop(key, None)
+        if old is not None:
+            self._discard(key, old)
+
+    def clear(self) -> None:
+        """Remove every key."""
+        self._positions.clear()
+        self._buckets.clear()
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def get(self, key: K) -> Position | None:
+        """Position of a key, or None if it isn't indexed."""
+        return self._positions.get(key)
+
+    def in_rect(self, rect: Rect) -> dict[K, Position]:
+        """Keys whose position lies in rect (inclusive bounds)."""
+        result: dict[K, Position] = {}
+        if rect.min_x > rect.max_x or rect.min_y > rect.max_y:
+            return result
+
+        min_bx, min_by = self._bucket_of(Position(rect.min_x, rect.min_y))
+        max_bx, max_by = self._bucket_of(Position(rect.max_x, rect.max_y))
+        # Sparse worlds: walking the buckets that exist beats walking the
+        # whole rect of possible buckets
+        if (max_bx - min_bx + 1) * (max_by - min_by + 1) > len(self._buckets):
+            keys = (
+                key
+                for (bx, by), bucket in self._buckets.items()
+                if min_bx <= bx <= max_bx and min_by <= by <= max_by
+                for key in bucket
+            )
+        else:
+            keys = (
+                key
+                for by in range(min_by, max_by + 1)
+                for bx in range(min_bx, max_bx + 1)
+                for key in self._buckets.get((bx, by), ())
+            )
+
+        for key in keys:
+            pos = self._positions[key]
+            if rect.contains(pos):
+                result[key] = pos
+        return result
+
+    def near(self, center: Position, radius: int) -> dict[K, Position]:
+        """Keys within Manhattan distance radius of center."""
+        rect = Rect(center.x - radius, center.y - radius, center.x + radius, center.y + radius)
+        return {
+            key: pos
+            for key, pos in self.in_rect(rect).items()
+            if center.distance_to(pos) <= radius
+        }
+
+    def at(self, pos: Position) -> list[K]:
+        """Keys at exactly pos."""
+        return [
+            key
+            for key in self._buckets.get(self._bucket_of(pos), ())
+            if self._positions[key] == pos
+        ]
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _bucket_of(self, pos: Position) -> tuple[int, int]:
+        return (pos.x // self.cell_size, pos.y // self.cell_size)
+
+    def _discard(self, key: K, pos: Position) -> None:
+        bucket_key = self._bucket_of(pos)
+        bucket = self._buckets[bucket_key]
+        bucket.discard(key)
+        if not bucket:
+            del self._buckets[bucket_key]
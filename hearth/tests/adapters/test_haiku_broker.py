@@ -0,0 +1,302 @@
+"""Unit tests for the shared Haiku broker."""
+
+import asyncio
+import json
+
+import anthropic
+import pytest
+import pytest_asyncio
+from unittest.mock import MagicMock
+
+from adapters.haiku_broker import HaikuBroker
+
+
+def _request(text: str = "hello") -> dict:
+    return {
+        "model": "claude-haiku-4-5-20251001",
+        "max_tokens": 16,
+        "messages": [{"role": "user", "content": text}],
+    }
+
+
+class FakeHaiku:
+    """Local HTTP server speaking just enough of the Messages API.
+
+    Replies echo the user prompt. fail_next makes the next N requests
+    return the given status code.
+    """
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.requests = 0
+        self.active = 0
+        self.peak = 0
+        self.fail_next: list[int] = []
+        self._server: asyncio.AbstractServer | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+
+    @property
+    def url(self) -> str:
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+
+    async def stop(self) -> None:
+        self._server.close()
+        # Drop keep-alive connections so wait_closed() doesn't wait on them
+        for writer in list(self._writers):
+            writer.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._writers.add(writer)
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    return
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                body = json.loads(await reader.readexactly(length))
+
+                self.requests += 1
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+                await asyncio.sleep(self.delay)
+                self.active -= 1
+
+                if self.fail_next:
+                    status = self.fail_next.pop(0)
+                    payload = {"type": "error", "error": {"type": "api_error", "message": "try again"}}
+                else:
+                    status = 200
+                    payload = {
+                        "id": f"msg_{self.requests}",
+                        "type": "message",
+                        "role": "assistant",
+                        "model": body["model"],
+                        "content": [{"type": "text", "text": body["messages"][0]["content"]}],
+                        "stop_reason": "end_turn",
+                        "stop_sequence": None,
+                        "usage": {"input_tokens": 1, "output_tokens": 1},
+                    }
+                data = json.dumps(payload).encode()
+                writer.write(
+                    b"HTTP/1.1 %d X\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n"
+                    % (status, len(data))
+                    + data
+                )
+                await writer.drain()
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+
+@pytest_asyncio.fixture
+async def fake_haiku():
+    """Start a FakeHaiku server for the test."""
+    server = FakeHaiku(delay=0.02)
+    await server.start()
+    yield server
+    await server.stop()
+
+
+async def _no_sleep(delay: float) -> None:
+    pass
+
+
+class TestAgainstFakeServer:
+    """End-to-end tests through a real AsyncAnthropic client."""
+
+    def _broker(self, server: FakeHaiku, **kwargs) -> HaikuBroker:
+        client = anthropic.AsyncAnthropic(api_key="test", base_url=server.url, max_retries=0)
+        return HaikuBroker(client=client, sleep=_no_sleep, **kwargs)
+
+    async def test_concurrency_is_capped(self, fake_haiku: FakeHaiku):
+        """Should never have more than max_concurrency requests in flight."""
+        broker = self._broker(fake_haiku, max_concurrency=2)
+
+        responses = await asyncio.gather(
+            *(broker.messages.create(**_request(f"scene {i}")) for i in range(8))
+        )
+
+        assert [r.content[0].text for r in responses] == [f"scene {i}" for i in range(8)]
+        assert fake_haiku.requests == 8
+        assert fake_haiku.peak <= 2
+        assert sum(count for _, count in broker.stats.latency_histogram) == 8
+
+    async def test_identical_requests_are_coalesced(self, fake_haiku: FakeHaiku):
+        """Should send one request for identical concurrent prompts."""
+        broker = self._broker(fake_haiku)
+
+        responses = await asyncio.gather(*(broker.messages.create(**_request()) for _ in range(5)))
+
+        assert fake_haiku.requests == 1
+        assert {r.id for r in responses} == {"msg_1"}
+        assert broker.stats.coalesced == 4
+
+    async def test_server_errors_are_retried(self, fake_haiku: FakeHaiku):
+        """Should retry 5xx and 429 responses and then succeed."""
+        broker = self._broker(fake_haiku, max_retries=3)
+        fake_haiku.fail_next = [500, 429]
+
+        response = await broker.messages.create(**_request())
+
+        assert response.content[0].text == "hello"
+        assert fake_haiku.requests == 3
+        assert broker.stats.retries == 2
+
+    async def test_gives_up_after_max_retries(self, fake_haiku: FakeHaiku):
+        """Should raise once retries are exhausted."""
+        broker = self._broker(fake_haiku, max_retries=1)
+        fake_haiku.fail_next = [503, 503, 503]
+
+        with pytest.raises(anthropic.APIStatusError):
+            await broker.messages.create(**_request())
+
+        assert fake_haiku.requests == 2
+        assert broker.stats.failures == 1
+
+
+class TestRetryPolicy:
+    """Tests for which errors are retried and how long to wait."""
+
+    async def test_client_errors_are_not_retried(self):
+        """Should raise non-transient errors immediately."""
+        client = MagicMock()
+
+        async def bad_request(**kwargs):
+            raise ValueError("bad request")
+
+        client.messages.create = bad_request
+        broker = HaikuBroker(client=client, sleep=_no_sleep)
+
+        with pytest.raises(ValueError):
+            await broker.messages.create(**_request())
+
+        assert broker.stats.requests == 1
+        assert broker.stats.retries == 0
+
+    async def test_backoff_is_jittered_and_capped(self):
+        """Should sleep a random fraction of an exponentially growing, capped ceiling."""
+        delays: list[float] = []
+
+        async def record_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        client = MagicMock()
+
+        async def unreachable(**kwargs):
+            raise anthropic.APIConnectionError(request=MagicMock())
+
+        client.messages.create = unreachable
+        broker = HaikuBroker(
+            client=client,
+            max_retries=5,
+            base_delay=1.0,
+            max_delay=4.0,
+            sleep=record_sleep,
+            rng=lambda: 0.5,
+        )
+
+        with pytest.raises(anthropic.APIConnectionError):
+            await broker.messages.create(**_request())
+
+        assert delays == [0.5, 1.0, 2.0, 2.0, 2.0]
+
+    async def test_cancelled_caller_leaves_coalesced_callers_running(self):
+        """Should still answer the other waiters when the first caller is cancelled."""
+        release = asyncio.Event()
+        response = MagicMock()
+        client = MagicMock()
+
+        async def slow(**kwargs):
+            await release.wait()
+            return response
+
+        client.messages.create = slow
+        broker = HaikuBroker(client=client)
+
+        first = asyncio.create_task(broker.messages.create(**_request()))
+        second = asyncio.create_task(broker.messages.create(**_request()))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await second is response
+        assert first.cancelled()
+        assert broker.stats.requests == 1
+
+    async def test_request_cancelled_once_every_caller_is(self):
+        """Should cancel the shared request when no waiters are left."""
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+        client = MagicMock()
+
+        async def hang(**kwargs):
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        client.messages.create = hang
+        broker = HaikuBroker(client=client)
+
+        callers = [asyncio.create_task(broker.messages.create(**_request())) for _ in range(2)]
+        await started.wait()
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        assert broker._in_flight == {}
+
+    async def test_reset_stats(self):
+        """Should zero the counters."""
+        response = MagicMock()
+        client = MagicMock()
+
+        async def ok(**kwargs):
+            return response
+
+        client.messages.create = ok
+        broker = HaikuBroker(client=client)
+        await broker.messages.create(**_request())
+        assert broker.stats.requests == 1
+
+        broker.reset_stats()
+
+        assert broker.stats.requests == 0
+        assert all(count == 0 for _, count in broker.stats.latency_histogram)
+
+
+class TestClose:
+    """Test releasing the shared client."""
+
+    async def test_closes_client_it_created(self):
+        """Should close a lazily created client, leaving the broker reusable."""
+        broker = HaikuBroker()
+        client = broker.client
+
+        await broker.close()
+
+        assert client.is_closed()
+        assert broker.client is not client
+
+    async def test_leaves_injected_client_open(self):
+        """Should not close a client it was given."""
+        client = MagicMock()
+        broker = HaikuBroker(client=client)
+
+        await broker.close()
+
+        client.close.assert_not_called()
+        assert broker.client is client
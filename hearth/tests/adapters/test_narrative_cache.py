@@ -0,0 +1,163 @@
+"""Unit tests for the perception narrative cache."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from adapters.narrative_cache import NarrativeCache
+from adapters.perception import PerceptionBuilder
+from core.terrain import Weather
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+FEATURES = {"terrain": ["water to the north"], "objects": [], "agents": [], "standing_on": None}
+
+
+class TestKeys:
+    """Tests for cache key derivation."""
+
+    def test_key_ignores_dict_order(self):
+        """Same features in a different order should hash the same."""
+        reordered = {"standing_on": None, "agents": [], "objects": [], "terrain": ["water to the north"]}
+        assert NarrativeCache.make_key(FEATURES, "morning", "clear") == NarrativeCache.make_key(
+            reordered, "morning", "clear"
+        )
+
+    def test_key_depends_on_all_inputs(self):
+        """Changing features, time of day or weather should change the key."""
+        base = NarrativeCache.make_key(FEATURES, "morning", "clear")
+        assert NarrativeCache.make_key({**FEATURES, "standing_on": "Well"}, "morning", "clear") != base
+        assert NarrativeCache.make_key(FEATURES, "evening", "clear") != base
+        assert NarrativeCache.make_key(FEATURES, "morning", "rainy") != base
+
+
+class TestEviction:
+    """Tests for LRU and TTL eviction."""
+
+    def test_hit_and_miss_counts(self, clock):
+        """Lookups should be counted as hits or misses."""
+        cache = NarrativeCache(clock=clock)
+        assert cache.get("a") is None
+        cache.put("a", "A meadow.")
+        assert cache.get("a") == "A meadow."
+
+        stats = cache.stats
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+        cache.reset_stats()
+        assert (cache.stats.hits, cache.stats.misses) == (0, 0)
+
+    def test_least_recently_used_is_evicted(self, clock):
+        """Should evict the entry used longest ago."""
+        cache = NarrativeCache(max_entries=2, clock=clock)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        cache.get("a")
+        cache.put("c", "C")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "A"
+        assert cache.get("c") == "C"
+
+    def test_entries_expire(self, clock):
+        """Should miss once an entry is older than the TTL."""
+        cache = NarrativeCache(ttl_seconds=60, clock=clock)
+        cache.put("a", "A")
+
+        clock.now += 59
+        assert cache.get("a") == "A"
+        clock.now += 1
+        assert cache.get("a") is None
+        assert cache.stats.size == 0
+
+
+class TestPersistence:
+    """Tests for on-disk persistence."""
+
+    def test_entries_survive_restart(self, tmp_path, clock):
+        """A new cache on the same file should see earlier entries."""
+        path = tmp_path / "narratives.jsonl"
+        NarrativeCache(path=path, clock=clock).put("a", "A")
+
+        reloaded = NarrativeCache(path=path, clock=clock)
+        assert reloaded.get("a") == "A"
+
+    def test_expired_and_corrupt_lines_are_skipped(self, tmp_path, clock):
+        """Should ignore expired entries and lines it cannot parse."""
+        path = tmp_path / "narratives.jsonl"
+        cache = NarrativeCache(ttl_seconds=60, path=path, clock=clock)
+        cache.put("old", "Old")
+        clock.now += 30
+        cache.put("new", "New")
+        with open(path, "a") as f:
+            f.write("{not json\n")
+
+        clock.now += 40
+        reloaded = NarrativeCache(ttl_seconds=60, path=path, clock=clock)
+        assert reloaded.get("old") is None
+        assert reloaded.get("new") == "New"
+
+    def test_file_is_compacted(self, tmp_path, clock):
+        """Should rewrite the file once it holds far more lines than live entries."""
+        path = tmp_path / "narratives.jsonl"
+        cache = NarrativeCache(max_entries=2, path=path, clock=clock)
+        for i in range(5):
+            cache.put(str(i), f"N{i}")
+
+        assert len(path.read_text().splitlines()) <= 4
+        reloaded = NarrativeCache(max_entries=2, path=path, clock=clock)
+        assert reloaded.get("4") == "N4"
+        assert reloaded.get("0") is None
+
+
+class TestPerceptionBuilderCaching:
+    """Tests for narrative caching in PerceptionBuilder."""
+
+    def _builder(self, create: AsyncMock) -> PerceptionBuilder:
+        haiku = MagicMock()
+        haiku.messages.create = create
+        return PerceptionBuilder(
+            world_service=MagicMock(),
+            agent_service=MagicMock(),
+            haiku_client=haiku,
+        )
+
+    async def test_unchanged_scene_skips_haiku(self):
+        """Should call Haiku once for repeated identical scenes."""
+        response = MagicMock()
+        response.content = [MagicMock(text="Water glints to the north.")]
+        create = AsyncMock(return_value=response)
+        builder = self._builder(create)
+
+        first = await builder._generate_narrative(FEATURES, "morning", Weather.CLEAR)
+        second = await builder._generate_narrative(dict(FEATURES), "morning", Weather.CLEAR)
+        await builder._generate_narrative(FEATURES, "evening", Weather.CLEAR)
+
+        assert first == second == "Water glints to the north."
+        assert create.await_count == 2
+        stats = builder.narrative_cache_stats
+        assert (stats.hits, stats.misses) == (1, 2)
+
+    async def test_fallback_is_not_cached(self):
+        """Should retry Haiku after a failed call instead of caching the fallback."""
+        create = AsyncMock(side_effect=RuntimeError("offline"))
+        builder = self._builder(create)
+
+        await builder._generate_narrative(FEATURES, "morning", Weather.CLEAR)
+        await builder._generate_narrative(FEATURES, "morning", Weather.CLEAR)
+
+        assert create.await_count == 2
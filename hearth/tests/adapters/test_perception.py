@@ -1,6 +1,10 @@
 """Tests for the perception builder module."""
 
+from pathlib import Path
+from typing import AsyncGenerator
+
 import pytest
+import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 from adapters.perception import (
@@ -16,6 +20,8 @@ from core.terrain import Terrain, Weather, TERRAIN_EMOJI
 from core.world import Cell
 from core.agent import Agent, AgentModel, Inventory, InventoryStack, Journey, JourneyDestination
 from core.objects import Sign, PlacedItem, Item, generate_object_id
+from services import WorldService, AgentService, ConversationService, AgentNotFoundError
+from storage import Storage
 
 
 # Module-level test model for convenience
@@ -632,3 +638,108 @@ class TestGetDirectionPhrase:
             Position(50, 50), Position(48, 48)
         )
         assert result == "southwest"
+
+
+# -----------------------------------------------------------------------------
+# Shared Snapshot Tests
+# -----------------------------------------------------------------------------
+
+
+@pytest_asyncio.fixture
+async def storage(temp_data_dir: Path) -> AsyncGenerator[Storage, None]:
+    """Create a fully initialized Storage instance."""
+    store = Storage(temp_data_dir)
+    await store.connect()
+    yield store
+    await store.close()
+
+
+@pytest_asyncio.fixture
+async def live_builder(storage: Storage) -> PerceptionBuilder:
+    """PerceptionBuilder over real services (narrative falls back offline)."""
+    mock_haiku = MagicMock()
+    mock_haiku.messages.create = AsyncMock(side_effect=RuntimeError("offline"))
+    return PerceptionBuilder(
+        world_service=WorldService(storage),
+        agent_service=AgentService(storage),
+        conversation_service=ConversationService(storage),
+        haiku_client=mock_haiku,
+        vision_radius=3,
+    )
+
+
+class TestPerceptionSnapshot:
+    """Tests for building perception from a shared snapshot."""
+
+    async def _populate(self, storage: Storage) -> None:
+        for name, pos in (("Ember", Position(10, 10)), ("Sage", Position(12, 10)), ("River", Position(30, 30))):
+            await storage.agents.save_agent(
+                Agent(name=AgentName(name), model=TEST_MODEL, position=pos)
+            )
+        world = WorldService(storage)
+        await world.place_wall(Position(11, 10), Direction.NORTH)
+        await world.place_object(
+            Sign(id=generate_object_id(), position=Position(11, 11), text="Hi", created_tick=0)
+        )
+        conversations = ConversationService(storage)
+        await conversations.create_invite(AgentName("Ember"), AgentName("Sage"), "public", tick=1)
+
+    async def test_matches_individual_builds(self, storage: Storage, live_builder: PerceptionBuilder):
+        """Should produce the same perception as building each agent alone."""
+        await self._populate(storage)
+        names = (AgentName("Ember"), AgentName("Sage"))
+
+        # Meetings are recorded by the first build; do that before comparing
+        for name in names:
+            await live_builder.build(name, tick=2)
+
+        snapshot = await live_builder.load_snapshot(names, tick=2)
+        for name in names:
+            shared = await live_builder.build(name, tick=2, snapshot=snapshot)
+            alone = await live_builder.build(name, tick=2)
+            assert shared == alone
+
+    async def test_cluster_reads_once(self, storage: Storage, live_builder: PerceptionBuilder):
+        """Should not query storage per agent when building from a snapshot."""
+        await self._populate(storage)
+        names = (AgentName("Ember"), AgentName("Sage"))
+        for name in names:
+            await live_builder.build(name, tick=2)
+        snapshot = await live_builder.load_snapshot(names, tick=2)
+
+        original = storage.db.fetch_all
+        calls = 0
+
+        async def counting_fetch_all(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            return await original(*args, **kwargs)
+
+        storage.db.fetch_all = counting_fetch_all
+        for name in names:
+            await live_builder.build(name, tick=2, snapshot=snapshot)
+
+        assert calls == 0
+
+    async def test_records_new_meetings(self, storage: Storage, live_builder: PerceptionBuilder):
+        """Should record meetings with visible agents and update the snapshot."""
+        await self._populate(storage)
+        snapshot = await live_builder.load_snapshot([AgentName("Ember"), AgentName("Sage")], tick=2)
+
+        await live_builder.build(AgentName("Ember"), tick=2, snapshot=snapshot)
+
+        assert AgentName("Sage") in snapshot.agents[AgentName("Ember")].known_agents
+        assert AgentName("Ember") in snapshot.agents[AgentName("Sage")].known_agents
+        stored = await storage.agents.get_agent(AgentName("Sage"))
+        assert AgentName("Ember") in stored.known_agents
+
+    async def test_invitation_and_missing_agent(self, storage: Storage, live_builder: PerceptionBuilder):
+        """Should include pending invitations and raise for unknown agents."""
+        await self._populate(storage)
+        snapshot = await live_builder.load_snapshot([AgentName("Sage"), AgentName("Ghost")], tick=2)
+
+        perception = await live_builder.build(AgentName("Sage"), tick=2, snapshot=snapshot)
+        assert perception.pending_invitation_text is not None
+
+        with pytest.raises(AgentNotFoundError):
+            await live_builder.build(AgentName("Ghost"), tick=2, snapshot=snapshot)
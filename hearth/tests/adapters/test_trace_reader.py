@@ -0,0 +1,53 @@
+"""Unit tests for reading trace files from the end."""
+
+import json
+from pathlib import Path
+
+from adapters.trace_reader import iter_lines_reversed, read_recent_turns
+
+
+def _write_lines(path: Path, entries: list[dict]) -> None:
+    with open(path, "w") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+def _turn(turn_id: str, *, ended: bool = True) -> list[dict]:
+    events = [
+        {"turn_id": turn_id, "event": "turn_start"},
+        {"turn_id": turn_id, "event": "text", "content": turn_id},
+    ]
+    if ended:
+        events.append({"turn_id": turn_id, "event": "turn_end"})
+    return events
+
+
+class TestIterLinesReversed:
+    """Tests for iter_lines_reversed."""
+
+    def test_lines_spanning_blocks(self, tmp_path):
+        """Should rejoin lines split across block boundaries."""
+        path = tmp_path / "lines.jsonl"
+        path.write_bytes(b"alpha\nbravo-charlie\n\ndelta\n")
+
+        lines = list(iter_lines_reversed(path, block_size=3))
+
+        assert lines == [b"delta", b"bravo-charlie", b"alpha"]
+
+
+class TestReadRecentTurns:
+    """Tests for read_recent_turns."""
+
+    def test_returns_last_complete_turns(self, tmp_path):
+        """Should return the last N complete turns, oldest first."""
+        path = tmp_path / "Ember.jsonl"
+        _write_lines(path, _turn("a") + _turn("b") + _turn("c") + _turn("d", ended=False))
+
+        turns = read_recent_turns(path, 2)
+
+        assert [turn_id for turn_id, _ in turns] == ["b", "c"]
+        assert [e["event"] for e in turns[1][1]] == ["turn_start", "text", "turn_end"]
+
+    def test_missing_file(self, tmp_path):
+        """Should return nothing for a trace file that doesn't exist."""
+        assert read_recent_turns(tmp_path / "Unknown.jsonl", 5) == []
@@ -0,0 +1,67 @@
+"""Unit tests for the buffered trace writer."""
+
+import json
+from pathlib import Path
+
+from adapters.trace_writer import TraceWriter
+
+
+def _read_lines(path: Path) -> list[dict]:
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class TestTraceWriter:
+    """Tests for TraceWriter."""
+
+    def test_flush_writes_entries_in_order(self, tmp_path):
+        """Should have every queued entry on disk, in order, after flush()."""
+        writer = TraceWriter()
+        path = tmp_path / "Ember.jsonl"
+
+        for i in range(100):
+            writer.write(path, {"n": i})
+        writer.flush()
+
+        assert [e["n"] for e in _read_lines(path)] == list(range(100))
+        writer.close()
+
+    def test_full_queue_drops_instead_of_blocking(self, tmp_path, monkeypatch):
+        """Should drop entries once the queue is full rather than stall."""
+        writer = TraceWriter(max_queue=1, block_timeout=0.01)
+        # No writer thread, so nothing drains the queue
+        monkeypatch.setattr(writer, "_ensure_thread", lambda: None)
+        path = tmp_path / "Ember.jsonl"
+
+        assert writer.write(path, {"n": 0}) is True
+        assert writer.write(path, {"n": 1}, droppable=True) is False
+        assert writer.write(path, {"n": 2}) is False
+        assert writer.dropped == 2
+
+    def test_index_key_records_byte_offset(self, tmp_path):
+        """Should index keyed entries by the byte offset of their line."""
+        writer = TraceWriter()
+        path = tmp_path / "Ember.jsonl"
+
+        writer.write(path, {"n": 0})
+        writer.write(path, {"n": 1}, index_key="turn-1")
+        writer.flush()
+
+        key, offset = (tmp_path / "Ember.idx").read_text().split()
+        assert key == "turn-1"
+        with open(path, "rb") as f:
+            f.seek(int(offset))
+            assert json.loads(f.readline()) == {"n": 1}
+        writer.close()
+
+    def test_close_writes_pending_and_goes_synchronous(self, tmp_path):
+        """Should drain on close() and write later entries directly."""
+        writer = TraceWriter()
+        path = tmp_path / "Ember.jsonl"
+
+        writer.write(path, {"n": 0})
+        writer.close()
+        assert len(_read_lines(path)) == 1
+
+        writer.write(path, {"n": 1})
+        assert len(_read_lines(path)) == 2
@@ -17,7 +17,9 @@ def trace_dir(tmp_path):
 @pytest.fixture
 def tracer(trace_dir):
     """Create a tracer instance."""
-    return HearthTracer(trace_dir)
+    tracer = HearthTracer(trace_dir)
+    yield tracer
+    tracer.close()
 
 
 class TestTracerInit:
@@ -125,6 +127,7 @@ class TestTurnLifecycle:
         assert len(turn_id) == 8  # 8-char UUID
 
         # Check file was created
+        tracer.flush()
         trace_file = trace_dir / "Ember.jsonl"
         assert trace_file.exists()
 
@@ -145,6 +148,7 @@ class TestTurnLifecycle:
         tracer.start_turn("Ember", 1, Position(0, 0), "model", "context")
         tracer.log_text("Ember", "Hello, world!")
 
+        tracer.flush()
         entries = _read_all_entries(trace_dir / "Ember.jsonl")
         text_entry = entries[1]
 
@@ -161,6 +165,7 @@ class TestTurnLifecycle:
             tool_input={"direction": "north"},
         )
 
+        tracer.flush()
         entries = _read_all_entries(trace_dir / "Ember.jsonl")
         tool_entry = entries[1]
 
@@ -179,6 +184,7 @@ class TestTurnLifecycle:
             is_error=False,
         )
 
+        tracer.flush()
         entries = _read_all_entries(trace_dir / "Ember.jsonl")
         result_entry = entries[1]
 
@@ -193,6 +199,7 @@ class TestTurnLifecycle:
         long_content = "x" * 1000
         tracer.log_tool_result("Ember", "tool_123", long_content)
 
+        tracer.flush()
         entries = _read_all_entries(trace_dir / "Ember.jsonl")
         result_entry = entries[1]
 
@@ -210,6 +217,7 @@ class TestTurnLifecycle:
             num_turns=3,
         )
 
+        tracer.flush()
         entries = _read_all_entries(trace_dir / "Ember.jsonl")
         end_entry = entries[1]
 
@@ -228,6 +236,7 @@ class TestTurnLifecycle:
         # Start a new turn and check it gets a new ID
         tracer._write_event("Ember", "test", {})
 
+        tracer.flush()
         entries = _read_all_entries(trace_dir / "Ember.jsonl")
         last_entry = entries[-1]
 
@@ -241,6 +250,7 @@ class TestTokenTracking:
         """log_token_update should log token_update event."""
         tracer.log_token_update("Ember", 50000, threshold=150000)
 
+        tracer.flush()
         entries = _read_all_entries(trace_dir / "Ember.jsonl")
         token_entry = entries[0]
 
@@ -253,6 +263,7 @@ class TestTokenTracking:
         """Percent should be capped at 100."""
         tracer.log_token_update("Ember", 200000, threshold=150000)
 
+        tracer.flush()
         entries = _read_all_entries(trace_dir / "Ember.jsonl")
         token_entry = entries[0]
 
@@ -308,6 +319,34 @@ class TestLoadEntries:
         assert len(history) == 3
         assert all(e["turn_id"] == turn_id for e in history)
 
+    def test_get_turn_history_finds_old_turns(self, tracer, trace_dir):
+        """get_turn_history should find turns far back in the file."""
+        turn_id = tracer.start_turn("Ember", 1, Position(0, 0), "model", "context")
+        tracer.log_text("Ember", "Early text")
+        tracer.end_turn("Ember", "Done.")
+
+        tracer.start_turn("Ember", 2, Position(0, 0), "model", "context")
+        for i in range(1500):
+            tracer.log_text("Ember", f"Text {i}")
+        tracer.end_turn("Ember", "Done.")
+
+        history = tracer.get_turn_history("Ember", turn_id)
+
+        assert [e["event"] for e in history] == ["turn_start", "text", "turn_end"]
+        assert history[1]["content"] == "Early text"
+
+    def test_get_turn_history_without_index(self, tracer, trace_dir):
+        """get_turn_history should fall back to scanning when the index is gone."""
+        turn_id = tracer.start_turn("Ember", 1, Position(0, 0), "model", "context")
+        tracer.end_turn("Ember", "Done.")
+        tracer.start_turn("Ember", 2, Position(0, 0), "model", "context")
+        tracer.flush()
+        (trace_dir / "Ember.idx").unlink()
+
+        history = tracer.get_turn_history("Ember", turn_id)
+
+        assert [e["event"] for e in history] == ["turn_start", "turn_end"]
+
 
 class TestPerAgentFiles:
     """Tests for per-agent trace files."""
@@ -318,6 +357,7 @@ class TestPerAgentFiles:
         tracer.start_turn("Sage", 1, Position(1, 1), "model", "context")
         tracer.start_turn("River", 1, Position(2, 2), "model", "context")
 
+        tracer.flush()
         assert (trace_dir / "Ember.jsonl").exists()
         assert (trace_dir / "Sage.jsonl").exists()
         assert (trace_dir / "River.jsonl").exists()
@@ -291,6 +291,13 @@ class TestAgent:
         with pytest.raises(Exception):
             agent.position = Position(0, 0)
 
+    def test_changed_fields(self, agent):
+        """Should name only the fields that differ from the baseline."""
+        moved = agent.with_position(Position(11, 10)).with_sleeping(True)
+
+        assert moved.changed_fields(agent) == {"position", "is_sleeping"}
+        assert agent.changed_fields(agent) == frozenset()
+
     def test_with_position(self, agent):
         """Move agent to new position."""
         new_agent = agent.with_position(Position(20, 20))
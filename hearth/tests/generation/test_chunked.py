@@ -0,0 +1,134 @@
+"""Tests for chunked terrain generation."""
+
+import pytest
+
+from generation import generate_terrain_chunked, iterate_in_thread, stream_terrain_chunked
+from generation.chunked import _split_axis
+from generation.tileset import create_hearth_tileset, TILE_TO_TERRAIN
+from generation.wfc import Direction
+from core.types import Position
+from core.terrain import Terrain
+
+
+TERRAIN_TO_TILE = {terrain: tile_id for tile_id, terrain in TILE_TO_TERRAIN.items()}
+
+
+def _violations(result: dict[Position, Terrain], width: int, height: int) -> list[Position]:
+    """Positions whose east or south neighbor breaks an adjacency rule."""
+    tileset = create_hearth_tileset()
+
+    def tile_at(x: int, y: int) -> str:
+        return TERRAIN_TO_TILE[result.get(Position(x, y), Terrain.GRASS)]
+
+    bad = []
+    for y in range(height):
+        for x in range(width):
+            for direction in (Direction.EAST, Direction.SOUTH):
+                nx, ny = x + direction.dx, y + direction.dy
+                if nx < width and ny < height:
+                    allowed = tileset[tile_at(x, y)].get_allowed_neighbors(direction)
+                    if tile_at(nx, ny) not in allowed:
+                        bad.append(Position(x, y))
+    return bad
+
+
+class TestSplitAxis:
+    """Test how an axis is divided into blocks and seams."""
+
+    def test_blocks_and_seams_cover_axis(self):
+        """Blocks separated by seam-sized gaps should cover the whole length."""
+        assert _split_axis(100, 30, 5) == [(0, 30), (35, 65), (70, 100)]
+
+    def test_short_tail_merges_into_last_block(self):
+        """A remainder too small for a seam and block should extend the last block."""
+        assert _split_axis(68, 30, 5) == [(0, 30), (35, 68)]
+        assert _split_axis(20, 30, 5) == [(0, 20)]
+
+
+class TestGenerateTerrainChunked:
+    """Test the chunked generator."""
+
+    def test_seams_respect_adjacency(self):
+        """No adjacency rule should be broken, including across seams."""
+        result = generate_terrain_chunked(90, 70, seed=3, chunk_size=24, workers=1)
+        assert _violations(result, 90, 70) == []
+
+    def test_output_does_not_depend_on_workers(self):
+        """Same seed should give the same world in-process and in a pool."""
+        in_process = generate_terrain_chunked(80, 80, seed=9, chunk_size=32, workers=1)
+        pooled = generate_terrain_chunked(80, 80, seed=9, chunk_size=32, workers=2)
+        assert in_process == pooled
+
+    def test_progress_reaches_total(self):
+        """Progress should be monotonic and finish at the cell count."""
+        calls = []
+        generate_terrain_chunked(
+            50, 40, seed=1, chunk_size=16, workers=1,
+            progress_callback=lambda done, total: calls.append((done, total)),
+        )
+        assert [done for done, _ in calls] == sorted(done for done, _ in calls)
+        assert calls[-1] == (2000, 2000)
+
+    def test_stream_matches_collected_result(self):
+        """Streamed regions should add up to the dict, each cell once."""
+        streamed = [
+            cell
+            for region in stream_terrain_chunked(60, 50, seed=4, chunk_size=20, workers=1)
+            for cell in region
+        ]
+        positions = [pos for pos, _ in streamed]
+
+        assert len(positions) == len(set(positions))
+        assert dict(streamed) == generate_terrain_chunked(60, 50, seed=4, chunk_size=20, workers=1)
+        assert all(terrain != Terrain.GRASS for _, terrain in streamed)
+
+    def test_rejects_bad_sizes(self):
+        """Should refuse non-positive chunk or seam sizes."""
+        with pytest.raises(ValueError):
+            generate_terrain_chunked(10, 10, chunk_size=0)
+
+
+class TestIterateInThread:
+    """Tests for driving a blocking iterator from the event loop."""
+
+    async def test_yields_items_in_order(self):
+        """Should yield every item the iterator produces, in order."""
+        items = [item async for item in iterate_in_thread(iter(range(20)), prefetch=2)]
+
+        assert items == list(range(20))
+
+    async def test_reraises_iterator_errors(self):
+        """Should raise the iterator's exception in the consumer."""
+        def failing():
+            yield 1
+            raise RuntimeError("solver failed")
+
+        seen = []
+        with pytest.raises(RuntimeError, match="solver failed"):
+            async for item in iterate_in_thread(failing()):
+                seen.append(item)
+
+        assert seen == [1]
+
+    async def test_stopping_early_closes_iterator(self):
+        """Should stop and close the iterator when the consumer breaks off."""
+        closed = False
+
+        def endless():
+            nonlocal closed
+            try:
+                n = 0
+                while True:
+                    yield n
+                    n += 1
+            finally:
+                closed = True
+
+        stream = iterate_in_thread(endless(), prefetch=1)
+        async for item in stream:
+            if item == 3:
+                break
+        await stream.aclose()
+
+        assert closed
+
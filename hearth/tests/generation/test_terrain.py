@@ -2,7 +2,7 @@
 
 import pytest
 
-from generation import generate_terrain, generate_terrain_grid
+from generation import TerrainGrid, generate_terrain, generate_terrain_grid
 from generation.tileset import TILE_TO_TERRAIN
 from core.types import Position
 from core.terrain import Terrain
@@ -119,6 +119,31 @@ class TestGenerateTerrainGrid:
         assert grass_count > total_cells * 0.2, "Expected grass to be common"
 
 
+class TestTerrainGrid:
+    """Test the compact non-grass terrain map."""
+
+    def test_reads_like_sparse_dict(self):
+        """Should behave like the dict generate_terrain() returns."""
+        terrain = generate_terrain(20, 20, seed=42)
+        grid = TerrainGrid(20, 20)
+        for pos, terrain_type in terrain.items():
+            grid.set(pos, terrain_type)
+
+        assert len(grid) == len(terrain)
+        assert dict(grid) == terrain
+
+    def test_grass_and_out_of_bounds_are_missing(self):
+        """Should raise KeyError for grass and off-grid cells."""
+        grid = TerrainGrid(4, 4)
+        grid.set(Position(1, 1), Terrain.WATER)
+        grid.set(Position(1, 1), Terrain.SAND)
+
+        assert len(grid) == 1
+        assert grid[Position(1, 1)] == Terrain.SAND
+        assert grid.get(Position(2, 2), Terrain.GRASS) == Terrain.GRASS
+        assert Position(9, 0) not in grid
+
+
 class TestGeneratorParameters:
     """Test generator parameter effects."""
 
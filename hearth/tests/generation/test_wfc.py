@@ -0,0 +1,160 @@
+"""Tests for the bitmask-backed WFC grid, solver and entropy index."""
+
+import random
+
+from generation.tileset import create_hearth_tileset
+from generation.wfc import Grid, WFCSolver, SolverState, Direction
+from generation.wfc.entropy_index import EntropyIndex
+
+
+TILE_IDS = {"water", "coast", "sand", "grass", "forest", "hill", "stone"}
+
+
+class TestGridMasks:
+    """Test the packed possibility representation."""
+
+    def test_cells_start_in_full_superposition(self):
+        """Every cell should allow every tile."""
+        grid = Grid(4, 3, TILE_IDS)
+        assert len(grid.masks) == 12
+        assert all(cell.possibilities == TILE_IDS for cell in grid.all_cells())
+        assert grid.masks.itemsize == 1  # 7 tiles fit in a byte
+
+    def test_cell_view_writes_through(self):
+        """Changes through a Cell should be visible from any other view."""
+        grid = Grid(4, 4, TILE_IDS)
+        cell = grid.get_cell(2, 1)
+
+        assert cell.constrain_to({"water", "coast", "unknown"})
+        assert not cell.constrain_to({"water", "coast"})
+        assert grid.get_cell(2, 1).possibilities == {"water", "coast"}
+        assert grid.cells[1][2].entropy == 2
+
+        assert cell.remove_possibility("coast")
+        assert not cell.remove_possibility("coast")
+        assert cell.collapsed
+        assert cell.tile_id == "water"
+
+    def test_snapshot_restore(self):
+        """Restoring a snapshot should undo later changes."""
+        grid = Grid(5, 5, TILE_IDS)
+        grid.get_cell(0, 0).collapse_to("stone")
+        snapshot = grid.snapshot()
+
+        grid.get_cell(0, 0).collapse_to("grass")
+        grid.get_cell(4, 4).collapse_to("sand")
+        grid.restore(snapshot)
+
+        assert grid.get_cell(0, 0).tile_id == "stone"
+        assert not grid.get_cell(4, 4).collapsed
+
+    def test_reset_keeps_array_identity(self):
+        """reset() should refill the same array so holders of masks see it."""
+        grid = Grid(3, 3, TILE_IDS)
+        masks = grid.masks
+        grid.get_cell(1, 1).collapse_to("hill")
+
+        grid.reset()
+
+        assert grid.masks is masks
+        assert grid.get_cell(1, 1).entropy == len(TILE_IDS)
+
+
+class TestSolver:
+    """Test the solver over the bitmask grid."""
+
+    def test_solution_respects_adjacency(self):
+        """Every pair of neighbors should be allowed by the tileset."""
+        random.seed(12345)
+        tileset = create_hearth_tileset()
+        grid = Grid(16, 16, set(tileset))
+        solver = WFCSolver(grid, tileset)
+
+        assert solver.solve()
+        for cell in grid.all_cells():
+            for neighbor, direction in grid.neighbors(cell):
+                assert neighbor.tile_id in tileset[cell.tile_id].get_allowed_neighbors(direction)
+
+    def test_collapse_propagates_to_neighbors(self):
+        """Collapsing a cell should narrow its neighbors immediately."""
+        tileset = create_hearth_tileset()
+        grid = Grid(3, 3, set(tileset))
+        solver = WFCSolver(grid, tileset)
+
+        grid.get_cell(1, 1).collapse_to("water")
+        assert solver._propagate_batch([1 * 3 + 1])
+
+        north = grid.get_cell(1 + Direction.NORTH.dx, 1 + Direction.NORTH.dy)
+        assert north.possibilities == {"water", "coast"}
+        assert north in solver.last_propagated
+
+    def test_conflict_with_collapsed_neighbor_is_contradiction(self):
+        """Should not let two collapsed neighbors keep incompatible tiles."""
+        tileset = create_hearth_tileset()
+        grid = Grid(2, 1, set(tileset))
+        solver = WFCSolver(grid, tileset)
+
+        grid.get_cell(0, 0).collapse_to("water")
+        grid.get_cell(1, 0).collapse_to("stone")
+
+        assert not solver.propagate([grid.get_cell(0, 0)])
+
+
+class TestEntropyIndex:
+    """Test the incremental selection index against a full scan."""
+
+    def _scan(self, grid: Grid) -> dict[int, tuple[int, int]]:
+        """Brute-force (entropy, collapsed neighbors) for every uncollapsed cell."""
+        result = {}
+        for cell in grid.all_cells():
+            if not cell.collapsed:
+                collapsed = sum(1 for n, _ in grid.neighbors(cell) if n.collapsed)
+                result[cell.y * grid.width + cell.x] = (cell.entropy, collapsed)
+        return result
+
+    def test_tracks_solver_steps(self):
+        """Index buckets should match a full scan after every step."""
+        random.seed(7)
+        tileset = create_hearth_tileset()
+        grid = Grid(20, 20, set(tileset))
+        solver = WFCSolver(grid, tileset, batch_size=5, min_batch_distance=3)
+
+        while solver.step() == SolverState.RUNNING:
+            index = solver._index
+            if index is None:
+                continue
+            expected = self._scan(grid)
+            assert len(index) == len(expected)
+            for cell_index, (entropy, collapsed) in expected.items():
+                assert divmod(index._key[cell_index], 8) == (entropy, collapsed)
+
+    def test_lowest_is_in_priority_order(self):
+        """Should hand out the lowest-priority cells first."""
+        random.seed(3)
+        grid = Grid(6, 6, TILE_IDS)
+        grid.get_cell(0, 0).collapse_to("grass")
+        grid.get_cell(3, 3).constrain_to({"grass", "sand"})
+        grid.get_cell(5, 5).constrain_to({"grass", "sand", "forest"})
+        index = EntropyIndex(grid)
+
+        lowest = index.lowest(4, fill_bias=0.5)
+
+        assert lowest[0] == 3 * 6 + 3
+        assert lowest[1] == 5 * 6 + 5
+        assert set(lowest[2:]) == {0 * 6 + 1, 1 * 6 + 0}
+
+    def test_restore_rebuilds_index(self):
+        """Backtracking should leave the index consistent with the grid."""
+        random.seed(11)
+        tileset = create_hearth_tileset()
+        grid = Grid(12, 12, set(tileset))
+        solver = WFCSolver(grid, tileset, batch_size=4, min_batch_distance=3, snapshot_interval=20)
+        for _ in range(15):
+            solver.step()
+        count = solver.collapsed_count
+
+        assert solver._restore_snapshot()
+        assert solver.collapsed_count < count
+        solver.step()
+
+        assert len(solver._index) == len(self._scan(grid))
@@ -2,7 +2,7 @@
 
 import pytest
 
-from core.types import Position, Rect, ObjectId, AgentName
+from core.types import Position, Rect, ObjectId, AgentName, Direction
 from core.terrain import Terrain
 from core.world import Cell
 from core.agent import Agent, AgentModel
@@ -142,6 +142,22 @@ class TestAgentQueries:
         assert result is None
 
 
+class TestNamedPlaceQueries:
+    """Test named place queries."""
+
+    async def test_get_travel_distance(self, observer_api: ObserverAPI, world_service):
+        """Should return walking distance, accounting for walls."""
+        await world_service.name_place("well", Position(12, 10))
+        assert await observer_api.get_travel_distance(Position(10, 10), "well") == 2
+
+        await world_service.place_wall(Position(11, 10), Direction.EAST)
+        assert await observer_api.get_travel_distance(Position(10, 10), "well") == 4
+
+    async def test_get_travel_distance_unknown_place(self, observer_api: ObserverAPI):
+        """Should return None for an unknown place."""
+        assert await observer_api.get_travel_distance(Position(10, 10), "nowhere") is None
+
+
 class TestViewportData:
     """Test viewport convenience method."""
 
@@ -1008,7 +1008,6 @@ class TestPathfinding:
 
         assert path == (Position(10, 10),)
 
-    @pytest.mark.slow  # A* explores entire 500x500 grid when no path exists
     async def test_pathfinding_no_path(
         self,
         agent_service: AgentService,
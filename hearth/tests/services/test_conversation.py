@@ -96,6 +96,26 @@ class TestInvitationFlow:
         result = await conversation_service.accept_invite(AgentName("Sage"), tick=1)
         assert result is None
 
+    async def test_get_pending_invitations(
+        self, storage: Storage, conversation_service: ConversationService
+    ):
+        """Should return pending invitations for several invitees at once."""
+        for name in ("Ember", "Sage", "River"):
+            await create_test_agent(storage, name)
+        invite = await conversation_service.create_invite(
+            inviter=AgentName("Ember"),
+            invitee=AgentName("Sage"),
+            privacy="private",
+            tick=1,
+        )
+
+        pending = await conversation_service.get_pending_invitations(
+            [AgentName("Sage"), AgentName("River")]
+        )
+
+        assert list(pending) == [AgentName("Sage")]
+        assert pending[AgentName("Sage")].id == invite.id
+
 
 class TestConversationParticipation:
     """Test joining and leaving conversations."""
@@ -285,6 +305,35 @@ class TestConversationContext:
         assert ctx.unseen_turns[0].message == "How are you?"
 
 
+    async def test_bulk_contexts_match_single(
+        self, storage: Storage, conversation_service: ConversationService
+    ):
+        """Should give each agent the same context as the single-agent query."""
+        for name in ("Ember", "Sage", "River"):
+            await create_test_agent(storage, name)
+
+        await conversation_service.create_invite(
+            inviter=AgentName("Ember"),
+            invitee=AgentName("Sage"),
+            privacy="public",
+            tick=1,
+        )
+        await conversation_service.accept_invite(AgentName("Sage"), tick=2)
+        await conversation_service.add_turn(AgentName("Ember"), "Hello!", tick=3)
+        await conversation_service.add_turn(AgentName("Sage"), "Hi there!", tick=4)
+        await conversation_service.add_turn(AgentName("Ember"), "How are you?", tick=5)
+
+        names = [AgentName("Ember"), AgentName("Sage"), AgentName("River")]
+        contexts = await conversation_service.get_conversation_contexts(names)
+
+        assert set(contexts) == {AgentName("Ember"), AgentName("Sage")}
+        for name in (AgentName("Ember"), AgentName("Sage")):
+            single = await conversation_service.get_conversation_context(name)
+            assert contexts[name].unseen_turns == single.unseen_turns
+            assert contexts[name].other_participants == single.other_participants
+            assert contexts[name].conversation.id == single.conversation.id
+
+
 class TestInvitationExpiry:
     """Test invitation expiration."""
 
@@ -0,0 +1,146 @@
+"""Tests for the WorldService grid cache."""
+
+from core.types import Position, Direction, Rect, ObjectId
+from core.terrain import Terrain
+from core.world import Cell
+from core.objects import PlacedItem
+from core.structures import Structure
+
+from services import WorldService
+
+
+def _boulder(object_id: str, pos: Position) -> PlacedItem:
+    return PlacedItem(
+        id=ObjectId(object_id),
+        position=pos,
+        item_type="boulder",
+        passable=False,
+        created_tick=0,
+    )
+
+
+class _QueryCounter:
+    """Counts calls to selected repository read methods."""
+
+    def __init__(self, repo, *names: str):
+        self.count = 0
+        for name in names:
+            original = getattr(repo, name)
+
+            async def counted(*args, _original=original, **kwargs):
+                self.count += 1
+                return await _original(*args, **kwargs)
+
+            setattr(repo, name, counted)
+
+
+class TestCacheReads:
+    """Reads are served from memory once a chunk is loaded."""
+
+    async def test_can_move_does_not_requery(self, world_service: WorldService):
+        """Should answer movement checks without touching storage after the first load."""
+        await world_service.can_move(Position(10, 10), Direction.NORTH)
+
+        world = _QueryCounter(world_service._world_repo, "get_cell", "get_stored_cells_in_rect", "get_world_state")
+        objects = _QueryCounter(world_service._object_repo, "get_objects_at", "get_objects_in_rect")
+
+        for direction in Direction:
+            await world_service.can_move(Position(10, 10), direction)
+            await world_service.can_move(Position(11, 10), direction)
+
+        assert world.count == 0
+        assert objects.count == 0
+
+    async def test_rect_spanning_chunks(self, world_service: WorldService):
+        """Should assemble rects that span several chunks in position order."""
+        size = world_service._cache.CHUNK_SIZE
+        await world_service._world_repo.set_cell(Cell(position=Position(size, size), terrain=Terrain.STONE))
+
+        rect = Rect(size - 2, size - 2, size + 1, size + 1)
+        cells = await world_service.get_cells_in_rect(rect)
+
+        assert [c.position for c in cells] == rect.positions()
+        assert [c.position for c in cells if c.terrain == Terrain.STONE] == [Position(size, size)]
+
+
+class TestCacheCoherence:
+    """Writes through WorldService keep the cache in sync with storage."""
+
+    async def test_wall_placed_after_load(self, world_service: WorldService):
+        """Should see a wall placed after the chunk was cached."""
+        assert await world_service.can_move(Position(10, 10), Direction.NORTH)
+
+        await world_service.place_wall(Position(10, 10), Direction.NORTH)
+
+        assert not await world_service.can_move(Position(10, 10), Direction.NORTH)
+        assert not await world_service.can_move(Position(10, 11), Direction.SOUTH)
+
+    async def test_wall_removed_after_load(self, world_service: WorldService):
+        """Should see a wall removed after the chunk was cached."""
+        await world_service.place_wall(Position(10, 10), Direction.EAST)
+        assert not await world_service.can_move(Position(10, 10), Direction.EAST)
+
+        await world_service.remove_wall(Position(10, 10), Direction.EAST)
+
+        assert await world_service.can_move(Position(10, 10), Direction.EAST)
+        assert await world_service._world_repo.get_cell(Position(10, 10)) == Cell(position=Position(10, 10))
+
+    async def test_object_placed_moved_removed(self, world_service: WorldService):
+        """Should track impassable objects as they are placed, moved and removed."""
+        assert await world_service.is_position_passable(Position(5, 5))
+
+        await world_service.place_object(_boulder("b1", Position(5, 5)))
+        assert not await world_service.is_position_passable(Position(5, 5))
+
+        await world_service.move_object(ObjectId("b1"), Position(6, 5))
+        assert await world_service.is_position_passable(Position(5, 5))
+        assert not await world_service.is_position_passable(Position(6, 5))
+
+        await world_service.remove_object(ObjectId("b1"))
+        assert await world_service.is_position_passable(Position(6, 5))
+
+    async def test_object_moved_across_chunks(self, world_service: WorldService):
+        """Should clear the old position when an object moves into another chunk."""
+        far = Position(world_service._cache.CHUNK_SIZE * 3, 5)
+        await world_service.place_object(_boulder("b1", Position(5, 5)))
+        assert not await world_service.is_position_passable(Position(5, 5))
+
+        await world_service.move_object(ObjectId("b1"), far)
+
+        assert await world_service.is_position_passable(Position(5, 5))
+        assert not await world_service.is_position_passable(far)
+
+    async def test_named_place_updates_cells(self, world_service: WorldService):
+        """Should refresh place_name on both the old and new cell."""
+        await world_service.get_cell(Position(3, 3))
+        await world_service.name_place("well", Position(3, 3))
+        assert (await world_service.get_cell(Position(3, 3))).place_name == "well"
+
+        await world_service.name_place("well", Position(4, 4))
+        assert (await world_service.get_cell(Position(3, 3))).place_name is None
+        assert (await world_service.get_cell(Position(4, 4))).place_name == "well"
+
+        await world_service.remove_place_name("well")
+        assert (await world_service.get_cell(Position(4, 4))).place_name is None
+
+    async def test_structure_save_and_delete(self, world_service: WorldService):
+        """Should refresh structure_id on interior cells."""
+        interior = frozenset({Position(20, 20), Position(21, 20)})
+        await world_service.get_cells_in_rect(Rect(20, 20, 21, 20))
+        structure = Structure.create(interior_cells=interior)
+
+        await world_service.save_structure(structure)
+        assert (await world_service.get_cell(Position(21, 20))).structure_id == structure.id
+
+        await world_service.delete_structure(structure.id)
+        assert (await world_service.get_cell(Position(21, 20))).structure_id is None
+
+    async def test_invalidate_picks_up_direct_writes(self, world_service: WorldService):
+        """Should re-read storage after invalidate_cache()."""
+        await world_service.get_cell(Position(7, 7))
+        await world_service._world_repo.set_cell(Cell(position=Position(7, 7), terrain=Terrain.WATER))
+        assert (await world_service.get_cell(Position(7, 7))).terrain == Terrain.GRASS
+
+        world_service.invalidate_cache(Rect(7, 7, 7, 7))
+
+        assert (await world_service.get_cell(Position(7, 7))).terrain == Terrain.WATER
@@ -0,0 +1,217 @@
+"""Tests for the passability map and bitmap-backed pathfinding."""
+
+import random
+from collections import deque
+
+from core.types import Position, Direction, ObjectId
+from core.terrain import Terrain
+from core.world import Cell
+from core.objects import PlacedItem
+
+from storage import Storage
+from services import WorldService
+
+
+def _boulder(object_id: str, pos: Position) -> PlacedItem:
+    return PlacedItem(
+        id=ObjectId(object_id),
+        position=pos,
+        item_type="boulder",
+        passable=False,
+        created_tick=0,
+    )
+
+
+async def _bfs_length(world_service: WorldService, start: Position, goal: Position) -> int | None:
+    """Reference shortest path length using WorldService.can_move directly."""
+    dist = {start: 0}
+    queue = deque([start])
+    while queue:
+        current = queue.popleft()
+        if current == goal:
+            return dist[current]
+        for direction in Direction:
+            if await world_service.can_move(current, direction):
+                neighbor = current + direction
+                if neighbor not in dist:
+                    dist[neighbor] = dist[current] + 1
+                    queue.append(neighbor)
+    return None
+
+
+class TestFindPath:
+    """find_path agrees with can_move."""
+
+    async def test_matches_reference_on_random_worlds(self, storage: Storage, world_service: WorldService):
+        """Should return shortest valid paths, or None exactly when BFS finds none."""
+        await storage.world.set_dimensions(14, 14)
+        rng = random.Random(7)
+        for i in range(60):
+            pos = Position(rng.randrange(14), rng.randrange(14))
+            direction = rng.choice(list(Direction))
+            if rng.random() < 0.2:
+                await world_service.place_door(pos, direction)
+            else:
+                await world_service.place_wall(pos, direction)
+        for i in range(12):
+            await world_service.place_object(_boulder(f"b{i}", Position(rng.randrange(14), rng.randrange(14))))
+        await storage.world.set_cell(Cell(position=Position(6, 6), terrain=Terrain.WATER))
+        world_service.invalidate_cache()
+
+        for _ in range(40):
+            start = Position(rng.randrange(14), rng.randrange(14))
+            goal = Position(rng.randrange(14), rng.randrange(14))
+            path = await world_service.find_path(start, goal)
+            expected = await _bfs_length(world_service, start, goal)
+
+            if expected is None:
+                assert path is None
+                continue
+            assert path is not None
+            assert len(path) - 1 == expected
+            assert path[0] == start and path[-1] == goal
+            for a, b in zip(path, path[1:]):
+                direction = next(d for d in Direction if a + d == b)
+                assert await world_service.can_move(a, direction)
+
+    async def test_sealed_goal_is_rejected_quickly(self, world_service: WorldService):
+        """Should report no path to a walled-in cell without searching the world."""
+        for direction in Direction:
+            await world_service.place_wall(Position(12, 10), direction)
+
+        assert await world_service.find_path(Position(10, 10), Position(12, 10)) is None
+
+    async def test_sealed_room_is_rejected(self, world_service: WorldService):
+        """Should report no path into a closed multi-cell room."""
+        for x in range(20, 23):
+            await world_service.place_wall(Position(x, 20), Direction.SOUTH)
+            await world_service.place_wall(Position(x, 22), Direction.NORTH)
+        for y in range(20, 23):
+            await world_service.place_wall(Position(20, y), Direction.WEST)
+            await world_service.place_wall(Position(22, y), Direction.EAST)
+
+        assert await world_service.find_path(Position(5, 5), Position(21, 21)) is None
+
+        await world_service.place_door(Position(21, 20), Direction.SOUTH)
+        path = await world_service.find_path(Position(5, 5), Position(21, 21))
+        assert path is not None
+        assert len(path) - 1 == 32
+
+
+class TestIncrementalUpdates:
+    """The map tracks writes made after it was built."""
+
+    async def test_wall_and_door_changes(self, world_service: WorldService):
+        """Should route around a new wall and through a new door."""
+        start, goal = Position(10, 10), Position(11, 10)
+        assert len(await world_service.find_path(start, goal)) == 2
+
+        await world_service.place_wall(start, Direction.EAST)
+        assert len(await world_service.find_path(start, goal)) == 4
+
+        await world_service.place_door(start, Direction.EAST)
+        assert len(await world_service.find_path(start, goal)) == 2
+
+        await world_service.remove_door(start, Direction.EAST)
+        assert len(await world_service.find_path(start, goal)) == 4
+
+        await world_service.remove_wall(start, Direction.EAST)
+        assert len(await world_service.find_path(start, goal)) == 2
+
+    async def test_object_changes(self, world_service: WorldService):
+        """Should treat impassable objects as blocked and follow their moves."""
+        start, goal = Position(10, 10), Position(12, 10)
+        assert len(await world_service.find_path(start, goal)) == 3
+
+        await world_service.place_object(_boulder("b1", Position(11, 10)))
+        assert len(await world_service.find_path(start, goal)) == 5
+
+        await world_service.move_object(ObjectId("b1"), goal)
+        assert await world_service.find_path(start, goal) is None
+
+        await world_service.remove_object(ObjectId("b1"))
+        assert len(await world_service.find_path(start, goal)) == 3
+
+    async def test_invalidate_picks_up_direct_writes(self, storage: Storage, world_service: WorldService):
+        """Should rebuild from storage after invalidate_cache()."""
+        await world_service.find_path(Position(0, 0), Position(1, 0))
+        await storage.world.set_cell(Cell(position=Position(1, 0), terrain=Terrain.WATER))
+
+        world_service.invalidate_cache()
+
+        assert await world_service.find_path(Position(0, 0), Position(1, 0)) is None
+
+
+class TestFlowFields:
+    """Journeys to named places use cached flow fields."""
+
+    async def test_matches_astar_on_random_world(self, storage: Storage, world_service: WorldService):
+        """Should give paths as short as A* while walls keep changing."""
+        await storage.world.set_dimensions(16, 16)
+        rng = random.Random(11)
+        for _ in range(70):
+            pos = Position(rng.randrange(16), rng.randrange(16))
+            await world_service.place_wall(pos, rng.choice(list(Direction)))
+        goal = Position(8, 8)
+        await world_service.name_place("square", goal)
+
+        for i in range(80):
+            if i % 4 == 0:
+                pos = Position(rng.randrange(16), rng.randrange(16))
+                direction = rng.choice(list(Direction))
+                if rng.random() < 0.5:
+                    await world_service.remove_wall(pos, direction)
+                else:
+                    await world_service.place_wall(pos, direction)
+            start = Position(rng.randrange(16), rng.randrange(16))
+            path = await world_service.find_path(start, goal)
+            expected = world_service._paths.find_path(start, goal)
+
+            if expected is None:
+                assert path is None
+                continue
+            assert len(path) == len(expected)
+            assert path[0] == start and path[-1] == goal
+            for a, b in zip(path, path[1:]):
+                direction = next(d for d in Direction if a + d == b)
+                assert await world_service.can_move(a, direction)
+
+    async def test_field_is_reused(self, world_service: WorldService):
+        """Should serve later journeys to the same place from the cached field."""
+        goal = Position(50, 50)
+        await world_service.name_place("home", goal)
+        await world_service.find_path(Position(40, 50), goal)
+        field = world_service._paths._fields[50 * 500 + 50]
+
+        assert len(await world_service.find_path(Position(45, 48), goal)) == 8
+        assert world_service._paths._fields[50 * 500 + 50] is field
+
+    async def test_change_inside_region_drops_field(self, world_service: WorldService):
+        """Should recompute after a wall goes up inside the explored region."""
+        goal = Position(50, 50)
+        await world_service.name_place("home", goal)
+        assert await world_service.travel_distance(Position(48, 50), goal) == 2
+
+        await world_service.place_wall(Position(49, 50), Direction.EAST)
+
+        assert await world_service.travel_distance(Position(48, 50), goal) == 4
+
+    async def test_change_outside_region_keeps_field(self, world_service: WorldService):
+        """Should keep the field when a wall goes up far from anything it explored."""
+        goal = Position(50, 50)
+        await world_service.name_place("home", goal)
+        await world_service.travel_distance(Position(48, 50), goal)
+
+        await world_service.place_wall(Position(300, 300), Direction.EAST)
+
+        assert 50 * 500 + 50 in world_service._paths._fields
+
+    async def test_renamed_place_uses_new_position(self, world_service: WorldService):
+        """Should route to where the place is now."""
+        await world_service.name_place("home", Position(50, 50))
+        await world_service.travel_distance(Position(48, 50), Position(50, 50))
+
+        await world_service.name_place("home", Position(60, 50))
+        target = await world_service.get_place_position("home")
+
+        assert await world_service.travel_distance(Position(48, 50), target) == 12
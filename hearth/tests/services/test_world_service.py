@@ -438,6 +438,43 @@ class TestStructureDetection:
         cell = await world_service.get_cell(Position(10, 10))
         assert cell.structure_id is None
 
+    async def test_detect_structures_in_rect(self, world_service: WorldService):
+        """Should find every enclosure in a rect, once each."""
+        for pos in (Position(10, 10), Position(20, 20)):
+            for direction in Direction:
+                await world_service.place_wall(pos, direction)
+
+        structures = await world_service.detect_structures_in_rect(Rect(0, 0, 30, 30))
+
+        interiors = sorted(next(iter(s.interior_cells)) for s in structures)
+        assert interiors == [Position(10, 10), Position(20, 20)]
+
+    async def test_detect_structures_at_edge(self, world_service: WorldService):
+        """Should find the enclosure closed off by the last wall placed."""
+        await world_service.place_wall(Position(10, 10), Direction.NORTH)
+        await world_service.place_wall(Position(10, 10), Direction.SOUTH)
+        await world_service.place_wall(Position(10, 10), Direction.WEST)
+        assert await world_service.detect_structures_at_edge(Position(10, 10), Direction.WEST) == []
+
+        await world_service.place_wall(Position(10, 10), Direction.EAST)
+        structures = await world_service.detect_structures_at_edge(
+            Position(10, 10), Direction.EAST, created_by=AgentName("Ember")
+        )
+
+        assert len(structures) == 1
+        assert structures[0].interior_cells == frozenset({Position(10, 10)})
+        assert structures[0].created_by == AgentName("Ember")
+
+    async def test_detect_sees_walls_removed_later(self, world_service: WorldService):
+        """Should stop reporting an enclosure once one of its walls is removed."""
+        for direction in Direction:
+            await world_service.place_wall(Position(10, 10), direction)
+        assert await world_service.detect_structure_at(Position(10, 10)) is not None
+
+        await world_service.remove_wall(Position(10, 10), Direction.NORTH)
+
+        assert await world_service.detect_structure_at(Position(10, 10)) is None
+
 
 class TestNamedPlaces:
     """Test place naming."""
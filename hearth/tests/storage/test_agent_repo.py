@@ -1,5 +1,7 @@
 """Tests for AgentRepository."""
 
+import asyncio
+
 import pytest
 
 from core.types import Position, Rect, AgentName, ObjectId
@@ -126,6 +128,77 @@ class TestAgentPositionQueries:
         not_found = await storage.agents.get_agent_at(Position(25, 31))
         assert not_found is None
 
+    async def test_index_follows_position_writes(self, storage: Storage):
+        """Moves, saves and deletes should be reflected in proximity queries."""
+        for name, pos in [("Ember", Position(5, 5)), ("Sage", Position(8, 5))]:
+            await storage.agents.save_agent(
+                Agent(
+                    name=AgentName(name),
+                    model=AgentModel(id="claude-sonnet", display_name="Sonnet"),
+                    position=pos,
+                )
+            )
+        assert len(await storage.agents.get_agents_near(Position(5, 5), 3)) == 2
+
+        await storage.agents.update_position(AgentName("Sage"), Position(40, 40))
+        near = await storage.agents.get_agents_near(Position(5, 5), 3)
+        assert [a.name for a in near] == [AgentName("Ember")]
+        assert (await storage.agents.get_agent_at(Position(40, 40))).name == AgentName("Sage")
+
+        await storage.agents.delete_agent(AgentName("Ember"))
+        assert await storage.agents.get_agents_near(Position(5, 5), 3) == []
+
+    async def test_empty_area_does_not_query_database(self, storage: Storage, monkeypatch):
+        """Once the index is loaded, an empty proximity query shouldn't hit SQLite."""
+        await storage.agents.save_agent(
+            Agent(
+                name=AgentName("Ember"),
+                model=AgentModel(id="claude-sonnet", display_name="Sonnet"),
+                position=Position(5, 5),
+            )
+        )
+        await storage.agents.get_agents_in_rect(Rect(0, 0, 1, 1))
+
+        queries = []
+        original = storage.db.execute
+
+        async def counting_execute(sql, params=()):
+            queries.append(sql)
+            return await original(sql, params)
+
+        monkeypatch.setattr(storage.db, "execute", counting_execute)
+        assert await storage.agents.get_agents_in_rect(Rect(100, 100, 120, 120)) == []
+        assert await storage.agents.get_agent_at(Position(6, 6)) is None
+        assert queries == []
+
+    async def test_get_agents_batches_inventory(self, storage: Storage, monkeypatch):
+        """Should hydrate several agents with their inventories in three queries."""
+        for i, name in enumerate(["Ember", "Sage", "River"]):
+            await storage.agents.save_agent(
+                Agent(
+                    name=AgentName(name),
+                    model=AgentModel(id="claude-sonnet", display_name="Sonnet"),
+                    position=Position(i, 0),
+                    inventory=Inventory().add_resource("wood", i + 1),
+                )
+            )
+
+        queries = []
+        original = storage.db.execute
+
+        async def counting_execute(sql, params=()):
+            queries.append(sql)
+            return await original(sql, params)
+
+        monkeypatch.setattr(storage.db, "execute", counting_execute)
+        agents = await storage.agents.get_agents(
+            [AgentName("River"), AgentName("Nobody"), AgentName("Ember")]
+        )
+
+        assert [a.name for a in agents] == [AgentName("River"), AgentName("Ember")]
+        assert [a.inventory.get_resource_quantity("wood") for a in agents] == [3, 1]
+        assert len(queries) == 3
+
 
 class TestAgentInventory:
     """Test inventory operations."""
@@ -264,3 +337,128 @@ class TestAgentState:
         retrieved = await storage.agents.get_agent(AgentName("Ember"))
         assert retrieved.session_id == "session-12345"
         assert retrieved.last_active_tick == 42
+
+
+class TestDifferentialSave:
+    """Test that save_agent writes only what changed."""
+
+    @pytest.fixture
+    def statements(self, storage: Storage, monkeypatch) -> list[str]:
+        """Record every write statement sent to the database."""
+        statements: list[str] = []
+        execute, executemany = storage.db.execute, storage.db.executemany
+
+        async def recording_execute(sql, params=()):
+            if not sql.lstrip().upper().startswith("SELECT"):
+                statements.append(" ".join(sql.split()))
+            return await execute(sql, params)
+
+        async def recording_executemany(sql, params_seq):
+            statements.append(" ".join(sql.split()))
+            return await executemany(sql, params_seq)
+
+        monkeypatch.setattr(storage.db, "execute", recording_execute)
+        monkeypatch.setattr(storage.db, "executemany", recording_executemany)
+        return statements
+
+    async def _saved_agent(self, storage: Storage) -> Agent:
+        agent = Agent(
+            name=AgentName("Ember"),
+            model=AgentModel(id="claude-sonnet", display_name="Sonnet"),
+            position=Position(10, 10),
+            inventory=Inventory().add_resource("wood", 3).add_resource("stone", 1),
+        )
+        await storage.agents.save_agent(agent)
+        return agent
+
+    async def test_journey_step_is_one_update(self, storage: Storage, statements: list[str]):
+        """A journey step should only update position and journey."""
+        agent = await self._saved_agent(storage)
+        journey = Journey.create(
+            JourneyDestination.to_position(Position(12, 10)),
+            (Position(10, 10), Position(11, 10), Position(12, 10)),
+        )
+        agent = agent.with_journey(journey)
+        await storage.agents.save_agent(agent)
+        statements.clear()
+
+        await storage.agents.save_agent(
+            agent.with_position(Position(11, 10)).with_journey(journey.advance())
+        )
+
+        assert len(statements) == 1
+        assert statements[0].startswith("UPDATE agents SET")
+        assert sorted(statements[0].split(" SET ")[1].split(" WHERE ")[0].split(", ")) == [
+            "journey = ?", "x = ?", "y = ?",
+        ]
+        retrieved = await storage.agents.get_agent(AgentName("Ember"))
+        assert retrieved.position == Position(11, 10)
+        assert retrieved.journey.progress == 1
+
+    async def test_unchanged_agent_writes_nothing(self, storage: Storage, statements: list[str]):
+        """Saving the stored version again should be a no-op."""
+        agent = await self._saved_agent(storage)
+        statements.clear()
+
+        await storage.agents.save_agent(agent)
+        await storage.agents.save_agent(await storage.agents.get_agent(AgentName("Ember")))
+
+        assert statements == []
+
+    async def test_inventory_is_diffed(self, storage: Storage, statements: list[str]):
+        """Only changed stacks and items should be written."""
+        agent = await self._saved_agent(storage)
+        item = Item.unique("carving", properties=("oak",))
+        agent = agent.with_inventory(agent.inventory.add_item(item))
+        await storage.agents.save_agent(agent)
+        statements.clear()
+
+        updated = agent.with_inventory(
+            agent.inventory.remove_resource("stone", 1).add_resource("wood", 2).remove_item(item.id)
+        )
+        await storage.agents.save_agent(updated)
+
+        assert sorted(statements) == [
+            "DELETE FROM inventory_items WHERE id = ? AND agent = ?",
+            "DELETE FROM inventory_stacks WHERE agent = ? AND item_type = ?",
+            "INSERT INTO inventory_stacks (agent, item_type, quantity) VALUES (?, ?, ?) "
+            "ON CONFLICT(agent, item_type) DO UPDATE SET quantity = excluded.quantity",
+        ]
+        retrieved = await storage.agents.get_agent(AgentName("Ember"))
+        assert retrieved.inventory.get_resource_quantity("wood") == 5
+        assert retrieved.inventory.get_resource_quantity("stone") == 0
+        assert retrieved.inventory.items == ()
+
+    async def test_rollback_forgets_baseline(self, storage: Storage):
+        """A save rolled back with its transaction should be redone in full."""
+        agent = await self._saved_agent(storage)
+        moved = agent.with_position(Position(20, 20))
+
+        with pytest.raises(RuntimeError):
+            async with storage.db.transaction():
+                await storage.agents.save_agent(moved)
+                raise RuntimeError("tick failed")
+
+        assert (await storage.agents.get_agent(AgentName("Ember"))).position == Position(10, 10)
+        await storage.agents.save_agent(moved)
+        assert (await storage.agents.get_agent(AgentName("Ember"))).position == Position(20, 20)
+        assert [a.name for a in await storage.agents.get_agents_near(Position(20, 20), 0)] == [
+            AgentName("Ember")
+        ]
+
+    async def test_read_overlapping_save_keeps_baseline(self, storage: Storage):
+        """A read racing a save shouldn't leave the pre-save rows as baseline."""
+        agent = await self._saved_agent(storage)
+        moved = agent.with_position(Position(11, 10)).with_inventory(
+            agent.inventory.add_resource("wood", 1)
+        )
+
+        await asyncio.gather(
+            storage.agents.get_agent(AgentName("Ember")),
+            storage.agents.save_agent(moved),
+        )
+        await storage.agents.save_agent(agent)
+
+        retrieved = await storage.agents.get_agent(AgentName("Ember"))
+        assert retrieved.position == Position(10, 10)
+        assert retrieved.inventory.get_resource_quantity("wood") == 3
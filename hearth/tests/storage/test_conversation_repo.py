@@ -1,5 +1,7 @@
 """Tests for ConversationRepository."""
 
+import asyncio
+
 import pytest
 
 from core.types import AgentName, ConversationId, Position
@@ -285,6 +287,88 @@ class TestConversationTurns:
         assert last_tick == 5
 
 
+class TestTurnCache:
+    """Test windowed history and the in-process turn cache."""
+
+    async def _conversation_with_turns(self, storage: Storage, count: int):
+        await create_test_agent(storage, "Ember")
+        conv = await storage.conversations.create_conversation(
+            created_by=AgentName("Ember"), privacy="public", tick=1,
+        )
+        for tick in range(2, count + 2):
+            await storage.conversations.add_turn(conv.id, AgentName("Ember"), f"Turn {tick}", tick)
+        return conv
+
+    async def test_history_limit_returns_last_turns(self, storage: Storage):
+        """Should include only the last N turns when a limit is given."""
+        conv = await self._conversation_with_turns(storage, 5)
+
+        retrieved = await storage.conversations.get_conversation(conv.id, history_limit=2)
+
+        assert [t.message for t in retrieved.history] == ["Turn 5", "Turn 6"]
+        assert (await storage.conversations.get_turns(conv.id, limit=0)) == ()
+
+    async def test_reads_after_first_load_skip_turn_queries(self, storage: Storage, monkeypatch):
+        """Once cached, new turns should be visible without rereading the table."""
+        conv = await self._conversation_with_turns(storage, 3)
+        await storage.conversations.get_turns(conv.id)
+
+        queries = []
+        original = storage.db.execute
+
+        async def recording_execute(sql, params=()):
+            queries.append(sql)
+            return await original(sql, params)
+
+        monkeypatch.setattr(storage.db, "execute", recording_execute)
+        await storage.conversations.add_turn(conv.id, AgentName("Ember"), "Latest", 9)
+        queries.clear()
+
+        turns = await storage.conversations.get_turns_since(conv.id, since_tick=3)
+
+        assert [t.message for t in turns] == ["Turn 4", "Latest"]
+        assert not any("conversation_turns" in sql for sql in queries)
+
+    async def test_first_load_racing_add_turn(self, storage: Storage):
+        """A load overlapping add_turn should not leave the turn cached twice."""
+        conv = await self._conversation_with_turns(storage, 0)
+
+        await asyncio.gather(
+            storage.conversations.add_turn(conv.id, AgentName("Ember"), "Hello", 2),
+            storage.conversations.get_turns(conv.id),
+        )
+
+        assert [t.message for t in await storage.conversations.get_turns(conv.id)] == ["Hello"]
+
+    async def test_rollback_drops_cache(self, storage: Storage):
+        """A turn rolled back with its transaction should not stay cached."""
+        conv = await self._conversation_with_turns(storage, 1)
+        await storage.conversations.get_turns(conv.id)
+
+        with pytest.raises(RuntimeError):
+            async with storage.db.transaction():
+                await storage.conversations.add_turn(conv.id, AgentName("Ember"), "Lost", 5)
+                raise RuntimeError("tick failed")
+
+        assert [t.message for t in await storage.conversations.get_turns(conv.id)] == ["Turn 2"]
+
+    async def test_all_active_conversations(self, storage: Storage):
+        """Should load every active conversation with participants and history."""
+        conv = await self._conversation_with_turns(storage, 2)
+        await create_test_agent(storage, "Sage")
+        await storage.conversations.add_participant(conv.id, AgentName("Sage"), tick=2)
+        ended = await storage.conversations.create_conversation(
+            created_by=AgentName("Sage"), privacy="private", tick=3,
+        )
+        await storage.conversations.end_conversation(ended.id, tick=4)
+
+        active = await storage.conversations.get_all_active_conversations(history_limit=1)
+
+        assert [c.id for c in active] == [conv.id]
+        assert active[0].participants == {AgentName("Ember"), AgentName("Sage")}
+        assert [t.message for t in active[0].history] == ["Turn 3"]
+
+
 class TestInvitations:
     """Test invitation operations."""
 
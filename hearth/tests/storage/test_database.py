@@ -1,5 +1,6 @@
 """Tests for Database class."""
 
+import asyncio
 from pathlib import Path
 
 import pytest
@@ -111,6 +112,142 @@ class TestDatabaseTransactions:
         rows = await db.fetch_all("SELECT * FROM test")
         assert len(rows) == 1
 
+    async def test_nested_transaction_is_savepoint(self, db: Database):
+        """A failing inner block should undo only its own writes."""
+        await db.execute("CREATE TABLE test (id INTEGER PRIMARY KEY)")
+        await db.commit()
+
+        async with db.transaction():
+            await db.execute("INSERT INTO test VALUES (1)")
+            with pytest.raises(ValueError):
+                async with db.transaction():
+                    await db.execute("INSERT INTO test VALUES (2)")
+                    raise ValueError("inner failed")
+            async with db.transaction():
+                await db.execute("INSERT INTO test VALUES (3)")
+
+        rows = await db.fetch_all("SELECT id FROM test ORDER BY id")
+        assert [row["id"] for row in rows] == [1, 3]
+
+    async def test_concurrent_nested_transactions(self, db: Database):
+        """Nested blocks from concurrent tasks shouldn't release or undo each other."""
+        await db.execute("CREATE TABLE test (id INTEGER PRIMARY KEY)")
+        await db.commit()
+
+        async def write(value: int, fail: bool) -> None:
+            async with db.transaction():
+                await db.execute("INSERT INTO test VALUES (?)", (value,))
+                await asyncio.sleep(0)
+                await db.execute("INSERT INTO test VALUES (?)", (value + 10,))
+                if fail:
+                    raise ValueError("inner failed")
+
+        async with db.transaction():
+            results = await asyncio.gather(
+                write(1, fail=True), write(2, fail=False), return_exceptions=True
+            )
+
+        assert isinstance(results[0], ValueError)
+        assert results[1] is None
+        rows = await db.fetch_all("SELECT id FROM test ORDER BY id")
+        assert [row["id"] for row in rows] == [2, 12]
+
+    async def test_savepoint_rollback_keeps_other_tasks_writes(self, db: Database):
+        """Plain writes from other tasks shouldn't land inside a savepoint."""
+        await db.execute("CREATE TABLE test (id INTEGER PRIMARY KEY)")
+        await db.commit()
+        opened = asyncio.Event()
+
+        async def failing_block() -> None:
+            async with db.transaction():
+                await db.execute("INSERT INTO test VALUES (1)")
+                opened.set()
+                await asyncio.sleep(0.01)
+                raise ValueError("inner failed")
+
+        async def plain_write() -> None:
+            await opened.wait()
+            await db.execute("INSERT INTO test VALUES (2)")
+            await db.commit()
+
+        async with db.transaction():
+            results = await asyncio.gather(
+                failing_block(), plain_write(), return_exceptions=True
+            )
+
+        assert isinstance(results[0], ValueError)
+        rows = await db.fetch_all("SELECT id FROM test ORDER BY id")
+        assert [row["id"] for row in rows] == [2]
+
+    async def test_rollback_notifies_listeners(self, db: Database):
+        """Rollback listeners should run on failed transactions, not commits."""
+        calls = []
+        db.add_rollback_listener(lambda: calls.append("rollback"))
+
+        async with db.transaction():
+            pass
+        with pytest.raises(ValueError):
+            async with db.transaction():
+                raise ValueError("fail")
+        await db.rollback()
+
+        assert calls == ["rollback", "rollback"]
+
+    async def test_base_exception_rolls_back(self, db: Database):
+        """Non-Exception errors (cancellation, Ctrl-C) should roll back too."""
+        await db.execute("CREATE TABLE test (id INTEGER PRIMARY KEY)")
+        await db.commit()
+        calls = []
+        db.add_rollback_listener(lambda: calls.append("rollback"))
+
+        with pytest.raises(KeyboardInterrupt):
+            async with db.transaction():
+                await db.execute("INSERT INTO test VALUES (1)")
+                with pytest.raises(asyncio.CancelledError):
+                    async with db.transaction():
+                        await db.execute("INSERT INTO test VALUES (2)")
+                        raise asyncio.CancelledError()
+                raise KeyboardInterrupt()
+
+        await db.execute("INSERT INTO test VALUES (3)")
+        await db.commit()
+
+        rows = await db.fetch_all("SELECT id FROM test ORDER BY id")
+        assert [row["id"] for row in rows] == [3]
+        assert calls == ["rollback", "rollback"]
+
+
+class TestBulkLoad:
+    """Test the bulk-load PRAGMA window."""
+
+    async def test_relaxes_and_restores_pragmas(self, db: Database):
+        """Should turn synchronous off inside the block and restore it after."""
+        before = (await db.fetch_one("PRAGMA synchronous"))[0]
+
+        async with db.bulk_load():
+            assert (await db.fetch_one("PRAGMA synchronous"))[0] == 0
+            assert (await db.fetch_one("PRAGMA temp_store"))[0] == 2
+
+        assert (await db.fetch_one("PRAGMA synchronous"))[0] == before
+        assert (await db.fetch_one("PRAGMA temp_store"))[0] == 0
+
+    async def test_restores_pragmas_on_error(self, db: Database):
+        """Should restore the PRAGMAs even if the load fails."""
+        before = (await db.fetch_one("PRAGMA synchronous"))[0]
+
+        with pytest.raises(ValueError):
+            async with db.bulk_load():
+                raise ValueError("load failed")
+
+        assert (await db.fetch_one("PRAGMA synchronous"))[0] == before
+
+    async def test_rejects_open_transaction(self, db: Database):
+        """Should refuse to start inside a transaction."""
+        async with db.transaction():
+            with pytest.raises(RuntimeError):
+                async with db.bulk_load():
+                    pass
+
 
 class TestSchemaVersion:
     """Test schema version tracking."""
@@ -0,0 +1,56 @@
+"""Tests for the in-memory SpatialIndex."""
+
+import random
+
+import pytest
+
+from core.types import Position, Rect
+from storage.spatial_index import SpatialIndex
+
+
+class TestSpatialIndex:
+    """Test bucketed position lookups."""
+
+    def test_set_moves_between_buckets(self):
+        """Should find a key only at its latest position."""
+        index: SpatialIndex[str] = SpatialIndex(cell_size=4)
+        index.set("a", Position(1, 1))
+        index.set("a", Position(30, 30))
+
+        assert index.get("a") == Position(30, 30)
+        assert index.in_rect(Rect(0, 0, 3, 3)) == {}
+        assert index.at(Position(30, 30)) == ["a"]
+        assert len(index) == 1
+
+    def test_remove(self):
+        """Removed keys should disappear from every query."""
+        index: SpatialIndex[str] = SpatialIndex()
+        index.set("a", Position(2, 2))
+        index.remove("a")
+        index.remove("missing")
+
+        assert "a" not in index
+        assert index.near(Position(2, 2), 5) == {}
+
+    def test_queries_match_brute_force(self):
+        """Rect and radius queries should agree with a full scan."""
+        rng = random.Random(5)
+        index: SpatialIndex[int] = SpatialIndex(cell_size=8)
+        positions = {i: Position(rng.randrange(-20, 100), rng.randrange(-20, 100)) for i in range(300)}
+        for key, pos in positions.items():
+            index.set(key, pos)
+
+        for _ in range(50):
+            x, y = rng.randrange(-30, 110), rng.randrange(-30, 110)
+            rect = Rect(x, y, x + rng.randrange(0, 40), y + rng.randrange(0, 40))
+            assert index.in_rect(rect) == {k: p for k, p in positions.items() if rect.contains(p)}
+
+            center, radius = Position(x, y), rng.randrange(0, 25)
+            assert index.near(center, radius) == {
+                k: p for k, p in positions.items() if center.distance_to(p) <= radius
+            }
+
+    def test_rejects_bad_cell_size(self):
+        """Should refuse a non-positive bucket size."""
+        with pytest.raises(ValueError):
+            SpatialIndex(cell_size=0)
@@ -0,0 +1,111 @@
+"""Tests for Storage.unit_of_work()."""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from core.types import Position, AgentName
+from core.agent import Agent, AgentModel
+from core.events import AgentMovedEvent
+
+from storage import Storage
+
+
+def _agent(x: int) -> Agent:
+    return Agent(
+        name=AgentName("Ember"),
+        model=AgentModel(id="claude-sonnet", display_name="Sonnet"),
+        position=Position(x, 0),
+    )
+
+
+def _moved(tick: int) -> AgentMovedEvent:
+    return AgentMovedEvent(
+        tick=tick,
+        timestamp=datetime.now(timezone.utc),
+        agent=AgentName("Ember"),
+        from_position=Position(0, 0),
+        to_position=Position(1, 0),
+    )
+
+
+class TestUnitOfWork:
+    """Test tick-scoped transactions."""
+
+    async def test_commits_writes_and_events_together(self, storage: Storage):
+        """Writes should land once the block exits; events only after commit."""
+        async with storage.unit_of_work():
+            await storage.agents.save_agent(_agent(1))
+            await storage.world.set_tick(7)
+            await storage.log_events([_moved(7)])
+            assert storage.db.in_transaction
+            assert await storage.event_log.count() == 0
+
+        assert not storage.db.in_transaction
+        assert (await storage.world.get_world_state()).current_tick == 7
+        assert (await storage.agents.get_agent(AgentName("Ember"))).position == Position(1, 0)
+        assert await storage.event_log.count() == 1
+
+    async def test_failure_discards_writes_and_events(self, storage: Storage):
+        """An exception should roll back every write and drop buffered events."""
+        await storage.agents.save_agent(_agent(1))
+
+        with pytest.raises(RuntimeError):
+            async with storage.unit_of_work():
+                await storage.agents.save_agent(_agent(5))
+                await storage.world.set_tick(8)
+                await storage.log_events([_moved(8)])
+                raise RuntimeError("tick failed")
+
+        assert (await storage.world.get_world_state()).current_tick == 0
+        assert (await storage.agents.get_agent(AgentName("Ember"))).position == Position(1, 0)
+        assert await storage.event_log.count() == 0
+
+    async def test_cancellation_discards_writes(self, storage: Storage, temp_data_dir):
+        """A cancelled tick should roll back, not leave its writes for the next commit."""
+        await storage.agents.save_agent(_agent(1))
+        written = asyncio.Event()
+
+        async def tick() -> None:
+            async with storage.unit_of_work():
+                await storage.agents.save_agent(_agent(5))
+                await storage.log_events([_moved(8)])
+                written.set()
+                await asyncio.Event().wait()  # e.g. waiting on an LLM call
+
+        task = asyncio.create_task(tick())
+        await written.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert not storage.db.in_transaction
+        # A later write commits on its own; it must not carry the tick's writes
+        await storage.world.set_tick(2)
+        assert (await storage.agents.get_agent(AgentName("Ember"))).position == Position(1, 0)
+        await storage.close()
+
+        reopened = Storage(temp_data_dir)
+        await reopened.connect()
+        try:
+            assert (await reopened.world.get_world_state()).current_tick == 2
+            assert (await reopened.agents.get_agent(AgentName("Ember"))).position == Position(1, 0)
+            assert await reopened.event_log.count() == 0
+        finally:
+            await reopened.close()
+
+    async def test_inner_transactions_join(self, storage: Storage):
+        """Repository code that opens its own transaction should still work."""
+        async with storage.unit_of_work():
+            async with storage.db.transaction():
+                await storage.world.set_tick(3)
+
+        assert (await storage.world.get_world_state()).current_tick == 3
+
+    async def test_rejects_nesting(self, storage: Storage):
+        """Should refuse to open a unit of work inside another."""
+        async with storage.unit_of_work():
+            with pytest.raises(RuntimeError):
+                async with storage.unit_of_work():
+                    pass
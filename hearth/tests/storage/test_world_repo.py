@@ -123,6 +123,33 @@ class TestCells:
         assert len(cells) == 1
         assert cells[0].position == Position(5, 5)
 
+    async def test_load_cells_streams_batches(self, storage: Storage):
+        """Should write every batch and report the cell count."""
+        async def batches():
+            yield [Cell(position=Position(x, 0), terrain=Terrain.WATER) for x in range(3)]
+            yield []
+            yield [Cell(position=Position(x, 1), terrain=Terrain.SAND) for x in range(2)]
+
+        count = await storage.world.load_cells(batches())
+
+        assert count == 5
+        cells = await storage.world.get_stored_cells_in_rect(Rect(0, 0, 5, 5))
+        assert sorted((c.position.x, c.position.y, c.terrain) for c in cells) == [
+            (0, 0, Terrain.WATER), (0, 1, Terrain.SAND), (1, 0, Terrain.WATER),
+            (1, 1, Terrain.SAND), (2, 0, Terrain.WATER),
+        ]
+
+    async def test_load_cells_keeps_committed_batches_on_error(self, storage: Storage):
+        """A failing producer should leave earlier batches written."""
+        async def batches():
+            yield [Cell(position=Position(1, 1), terrain=Terrain.STONE)]
+            raise RuntimeError("generation failed")
+
+        with pytest.raises(RuntimeError):
+            await storage.world.load_cells(batches())
+
+        assert (await storage.world.get_cell(Position(1, 1))).terrain == Terrain.STONE
+
 
 class TestNamedPlaces:
     """Test named places operations."""
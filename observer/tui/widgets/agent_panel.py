@@ -1,6 +1,5 @@
 """Agent panel widget showing streaming narrative and tool calls."""
 
-import json
 from pathlib import Path
 
 from textual.app import ComposeResult
@@ -9,6 +8,8 @@ from textual.widgets import Static, RichLog
 from textual.reactive import reactive
 from rich.text import Text
 
+from engine.adapters.trace_reader import read_recent_turns
+
 
 MOOD_EMOJIS = {
     "focused": "\u26a1",        # Lightning
@@ -258,53 +259,15 @@ class AgentPanel(Vertical):
         """
         Load recent turns from trace file and populate the RichLog.
 
-        Reads the JSONL trace file, groups events by turn_id,
-        and renders the last N complete turns.
+        Reads the JSONL trace file backwards from the end, so only the
+        last N complete turns are parsed however long the file has grown.
         """
         trace_file = trace_dir / f"{self.agent_name}.jsonl"
-        if not trace_file.exists():
-            return
-
-        # Read all events from trace file
-        events: list[dict] = []
         try:
-            with open(trace_file, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        events.append(json.loads(line))
-        except Exception:
+            recent_turns = read_recent_turns(trace_file, count)
+        except OSError:
             return
 
-        if not events:
-            return
-
-        # Group events by turn_id
-        turns: dict[str, list[dict]] = {}
-        turn_order: list[str] = []  # Track order of first appearance
-
-        for event in events:
-            turn_id = event.get("turn_id")
-            if not turn_id:
-                continue
-
-            if turn_id not in turns:
-                turns[turn_id] = []
-                turn_order.append(turn_id)
-            turns[turn_id].append(event)
-
-        # Filter to only complete turns (have both turn_start and turn_end)
-        complete_turns = []
-        for turn_id in turn_order:
-            turn_events = turns[turn_id]
-            has_start = any(e.get("event") == "turn_start" for e in turn_events)
-            has_end = any(e.get("event") == "turn_end" for e in turn_events)
-            if has_start and has_end:
-                complete_turns.append((turn_id, turn_events))
-
-        # Take last N turns
-        recent_turns = complete_turns[-count:]
-
         # Get the RichLog widget
         log = self.query_one("#narrative-log", RichLog)
 
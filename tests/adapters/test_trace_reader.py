@@ -0,0 +1,148 @@
+"""Tests for engine.adapters.trace_reader module."""
+
+import json
+from pathlib import Path
+
+from engine.adapters.trace_reader import (
+    index_path,
+    iter_lines_reversed,
+    read_last_entries,
+    read_recent_turns,
+    read_turn,
+)
+from engine.adapters.trace_writer import TraceWriter
+
+
+def _write_lines(path: Path, entries: list[dict]) -> None:
+    with open(path, "w") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+def _turn(turn_id: str, *, ended: bool = True) -> list[dict]:
+    events = [
+        {"turn_id": turn_id, "event": "turn_start"},
+        {"turn_id": turn_id, "event": "text", "content": turn_id},
+    ]
+    if ended:
+        events.append({"turn_id": turn_id, "event": "turn_end"})
+    return events
+
+
+class TestIterLinesReversed:
+    """Tests for iter_lines_reversed."""
+
+    def test_lines_spanning_blocks(self, tmp_path: Path):
+        """Test lines split across block boundaries are rejoined."""
+        path = tmp_path / "lines.jsonl"
+        path.write_bytes(b"alpha\nbravo-charlie\n\ndelta\n")
+
+        lines = list(iter_lines_reversed(path, block_size=3))
+
+        assert lines == [b"delta", b"bravo-charlie", b"alpha"]
+
+    def test_no_trailing_newline(self, tmp_path: Path):
+        """Test a final line without a newline is still yielded first."""
+        path = tmp_path / "lines.jsonl"
+        path.write_bytes(b"alpha\nbravo")
+
+        assert list(iter_lines_reversed(path, block_size=4)) == [b"bravo", b"alpha"]
+
+    def test_empty_file(self, tmp_path: Path):
+        """Test an empty file yields nothing."""
+        path = tmp_path / "lines.jsonl"
+        path.write_bytes(b"")
+
+        assert list(iter_lines_reversed(path)) == []
+
+
+class TestReadLastEntries:
+    """Tests for read_last_entries."""
+
+    def test_returns_tail_oldest_first(self, tmp_path: Path):
+        """Test the last N entries come back in file order."""
+        path = tmp_path / "Ember.jsonl"
+        _write_lines(path, [{"n": i} for i in range(50)])
+
+        entries = read_last_entries(path, 3)
+
+        assert [e["n"] for e in entries] == [47, 48, 49]
+
+    def test_skips_corrupt_lines(self, tmp_path: Path):
+        """Test a truncated line doesn't break loading."""
+        path = tmp_path / "Ember.jsonl"
+        _write_lines(path, [{"n": 0}, {"n": 1}])
+        with open(path, "a") as f:
+            f.write('{"n": 2, "trunc')
+
+        assert [e["n"] for e in read_last_entries(path, 5)] == [0, 1]
+
+    def test_missing_file(self, tmp_path: Path):
+        """Test a missing trace file gives no entries."""
+        assert read_last_entries(tmp_path / "Unknown.jsonl", 5) == []
+
+
+class TestReadRecentTurns:
+    """Tests for read_recent_turns."""
+
+    def test_returns_last_complete_turns(self, tmp_path: Path):
+        """Test only complete turns are returned, oldest first."""
+        path = tmp_path / "Ember.jsonl"
+        _write_lines(path, _turn("a") + _turn("b") + _turn("c") + _turn("d", ended=False))
+
+        turns = read_recent_turns(path, 2)
+
+        assert [turn_id for turn_id, _ in turns] == ["b", "c"]
+        assert [e["event"] for e in turns[1][1]] == ["turn_start", "text", "turn_end"]
+
+    def test_fewer_turns_than_requested(self, tmp_path: Path):
+        """Test a short file returns every complete turn."""
+        path = tmp_path / "Ember.jsonl"
+        _write_lines(path, _turn("a") + _turn("b"))
+
+        assert [turn_id for turn_id, _ in read_recent_turns(path, 20)] == ["a", "b"]
+
+
+class TestReadTurn:
+    """Tests for read_turn."""
+
+    def test_reads_indexed_turn(self, tmp_path: Path):
+        """Test a turn is loaded through the index the writer keeps."""
+        writer = TraceWriter()
+        path = tmp_path / "Ember.jsonl"
+        for turn_id in ("a", "b", "c"):
+            for entry in _turn(turn_id):
+                key = turn_id if entry["event"] == "turn_start" else None
+                writer.write(path, entry, index_key=key)
+        writer.close()
+
+        assert index_path(path).exists()
+        events = read_turn(path, "b")
+
+        assert [e["event"] for e in events] == ["turn_start", "text", "turn_end"]
+        assert all(e["turn_id"] == "b" for e in events)
+
+    def test_unindexed_file_falls_back_to_scan(self, tmp_path: Path):
+        """Test files written before the index existed still load."""
+        path = tmp_path / "Ember.jsonl"
+        _write_lines(path, _turn("a") + _turn("b"))
+
+        assert [e["content"] for e in read_turn(path, "a") if e["event"] == "text"] == ["a"]
+
+    def test_stale_index_falls_back_to_scan(self, tmp_path: Path):
+        """Test an index pointing at the wrong line is ignored."""
+        path = tmp_path / "Ember.jsonl"
+        _write_lines(path, _turn("a") + _turn("b"))
+        index_path(path).write_text("b\t0\n")
+
+        events = read_turn(path, "b")
+
+        assert [e["event"] for e in events] == ["turn_start", "text", "turn_end"]
+        assert all(e["turn_id"] == "b" for e in events)
+
+    def test_unknown_turn(self, tmp_path: Path):
+        """Test an unknown turn ID gives no events."""
+        path = tmp_path / "Ember.jsonl"
+        _write_lines(path, _turn("a"))
+
+        assert read_turn(path, "zzz") == []
@@ -0,0 +1,122 @@
+"""Tests for engine.adapters.trace_writer module."""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+from engine.adapters.trace_writer import TraceWriter
+
+
+def _read_lines(path: Path) -> list[dict]:
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class TestTraceWriter:
+    """Tests for TraceWriter."""
+
+    def test_flush_writes_entries_in_order(self, tmp_path: Path):
+        """Test entries are on disk, in order, once flush() returns."""
+        writer = TraceWriter()
+        path = tmp_path / "Ember.jsonl"
+
+        for i in range(100):
+            writer.write(path, {"n": i})
+        writer.flush()
+
+        assert [e["n"] for e in _read_lines(path)] == list(range(100))
+        writer.close()
+
+    def test_index_key_records_byte_offset(self, tmp_path: Path):
+        """Test keyed entries are indexed by the offset of their line."""
+        writer = TraceWriter()
+        path = tmp_path / "Ember.jsonl"
+
+        writer.write(path, {"n": 0})
+        writer.write(path, {"n": 1}, index_key="turn-1")
+        writer.flush()
+        writer.write(path, {"n": 2}, index_key="turn-2")
+        writer.close()
+
+        index = [line.split("\t") for line in (tmp_path / "Ember.idx").read_text().splitlines()]
+        assert [key for key, _ in index] == ["turn-1", "turn-2"]
+        with open(path, "rb") as f:
+            for n, (_, offset) in enumerate(index, start=1):
+                f.seek(int(offset))
+                assert json.loads(f.readline()) == {"n": n}
+
+    def test_entries_go_to_their_own_files(self, tmp_path: Path):
+        """Test a batch spanning several files splits correctly."""
+        writer = TraceWriter()
+
+        writer.write(tmp_path / "Ember.jsonl", {"agent": "Ember"})
+        writer.write(tmp_path / "Sage.jsonl", {"agent": "Sage"})
+        writer.write(tmp_path / "Ember.jsonl", {"agent": "Ember"})
+        writer.flush()
+
+        assert len(_read_lines(tmp_path / "Ember.jsonl")) == 2
+        assert _read_lines(tmp_path / "Sage.jsonl") == [{"agent": "Sage"}]
+        writer.close()
+
+    def test_concurrent_writers(self, tmp_path: Path):
+        """Test writes from many threads all land."""
+        writer = TraceWriter()
+        path = tmp_path / "Ember.jsonl"
+
+        def produce(thread_id: int) -> None:
+            for i in range(50):
+                writer.write(path, {"thread": thread_id, "n": i})
+
+        threads = [threading.Thread(target=produce, args=(t,)) for t in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        writer.flush()
+
+        assert len(_read_lines(path)) == 200
+        writer.close()
+
+    def test_full_queue_drops_instead_of_blocking(self, tmp_path: Path, monkeypatch):
+        """Test a full queue drops entries after at most block_timeout."""
+        writer = TraceWriter(max_queue=1, block_timeout=0.01)
+        # No writer thread, so nothing drains the queue
+        monkeypatch.setattr(writer, "_ensure_thread", lambda: None)
+        path = tmp_path / "Ember.jsonl"
+
+        assert writer.write(path, {"n": 0}) is True
+        assert writer.write(path, {"n": 1}, droppable=True) is False
+        assert writer.write(path, {"n": 2}) is False
+        assert writer.dropped == 2
+
+    def test_thread_exits_when_idle(self, tmp_path: Path):
+        """Test the writer thread stops after idling and restarts on write."""
+        writer = TraceWriter(idle_timeout=0.05)
+        path = tmp_path / "Ember.jsonl"
+
+        writer.write(path, {"n": 0})
+        writer.flush()
+        deadline = time.monotonic() + 2
+        while writer._thread is not None and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert writer._thread is None
+        assert writer._files == {}
+
+        writer.write(path, {"n": 1})
+        writer.flush()
+        assert len(_read_lines(path)) == 2
+        writer.close()
+
+    def test_close_writes_pending_and_goes_synchronous(self, tmp_path: Path):
+        """Test close() drains the queue and later writes still land."""
+        writer = TraceWriter()
+        path = tmp_path / "Ember.jsonl"
+
+        writer.write(path, {"n": 0})
+        writer.close()
+        assert len(_read_lines(path)) == 1
+
+        writer.write(path, {"n": 1})
+        assert len(_read_lines(path)) == 2
@@ -109,6 +109,7 @@ class TestStartTurn:
             context="Test context",
         )
 
+        tracer.flush()
         trace_file = trace_dir / "Ember.jsonl"
         assert trace_file.exists()
 
@@ -151,6 +152,7 @@ class TestLogText:
 
         tracer.log_text("Ember", "Hello, world!")
 
+        tracer.flush()
         trace_file = trace_dir / "Ember.jsonl"
         with open(trace_file) as f:
             lines = f.readlines()
@@ -176,6 +178,7 @@ class TestLogToolUse:
             tool_input={"path": "/test"},
         )
 
+        tracer.flush()
         trace_file = trace_dir / "Ember.jsonl"
         with open(trace_file) as f:
             lines = f.readlines()
@@ -203,6 +206,7 @@ class TestLogToolResult:
             is_error=False,
         )
 
+        tracer.flush()
         trace_file = trace_dir / "Ember.jsonl"
         with open(trace_file) as f:
             lines = f.readlines()
@@ -227,6 +231,7 @@ class TestLogToolResult:
             content=long_content,
         )
 
+        tracer.flush()
         trace_file = trace_dir / "Ember.jsonl"
         with open(trace_file) as f:
             lines = f.readlines()
@@ -253,6 +258,7 @@ class TestEndTurn:
             num_turns=2,
         )
 
+        tracer.flush()
         trace_file = trace_dir / "Ember.jsonl"
         with open(trace_file) as f:
             lines = f.readlines()
@@ -295,6 +301,7 @@ class TestLogInterpretComplete:
 
         tracer.log_interpret_complete("Ember", result, tick=5)
 
+        tracer.flush()
         trace_file = trace_dir / "Ember.jsonl"
         with open(trace_file) as f:
             event = json.loads(f.readline())
@@ -338,6 +345,7 @@ class TestThreadSafety:
         assert len(results) == 3
 
         # Each agent has their own file with correct events
+        tracer.flush()
         for agent in ["Ember", "Sage", "River"]:
             trace_file = trace_dir / f"{agent}.jsonl"
             assert trace_file.exists()
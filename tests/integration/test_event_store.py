@@ -58,7 +58,7 @@ class TestBasicRecovery:
         assert len(current.agents) == 3
 
         # Snapshot file should exist
-        snapshot_files = list((temp_village / "snapshots").glob("*.json"))
+        snapshot_files = list((temp_village / "snapshots").glob("state_*.json.gz"))
         assert len(snapshot_files) == 1
 
     def test_recover_empty_store_returns_none(self, temp_village: Path):
@@ -451,7 +451,7 @@ class TestSnapshotAndArchive:
 
         # Snapshot should exist
         snapshot_files = list(
-            (store.village_root / "snapshots").glob("*.json")
+            (store.village_root / "snapshots").glob("state_*.json.gz")
         )
         assert len(snapshot_files) >= 1
 
@@ -0,0 +1,115 @@
+"""Tests for engine.runtime.interpreter.client module."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import anthropic
+import pytest
+
+from engine.runtime.interpreter import InterpreterClient
+
+
+async def _no_sleep(delay: float) -> None:
+    pass
+
+
+def _client(create) -> MagicMock:
+    client = MagicMock()
+    client.messages.create = create
+    return client
+
+
+class TestInterpreterClient:
+    """Tests for InterpreterClient."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self):
+        """Test no more than max_concurrency requests are in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return kwargs["n"]
+
+        client = InterpreterClient(client=_client(create), max_concurrency=2)
+
+        results = await asyncio.gather(*(client.messages.create(n=i) for i in range(6)))
+
+        assert results == list(range(6))
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_are_retried(self):
+        """Test connection errors are retried with jittered, capped backoff."""
+        delays: list[float] = []
+        calls = 0
+
+        async def record_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        async def flaky(**kwargs):
+            nonlocal calls
+            calls += 1
+            if calls < 4:
+                raise anthropic.APIConnectionError(request=MagicMock())
+            return "ok"
+
+        client = InterpreterClient(
+            client=_client(flaky),
+            base_delay=1.0,
+            max_delay=2.0,
+            sleep=record_sleep,
+            rng=lambda: 0.5,
+        )
+
+        assert await client.messages.create() == "ok"
+        assert delays == [0.5, 1.0, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self):
+        """Test non-transient errors are raised at once."""
+        create = AsyncMock(side_effect=ValueError("bad request"))
+        client = InterpreterClient(client=_client(create), sleep=_no_sleep)
+
+        with pytest.raises(ValueError):
+            await client.messages.create()
+
+        assert create.await_count == 1
+
+    def test_new_event_loop_gets_new_client(self, monkeypatch):
+        """Test a client created on one loop isn't reused on the next."""
+        created = []
+
+        def fake_anthropic(**kwargs):
+            client = _client(AsyncMock(return_value="ok"))
+            client.close = AsyncMock()
+            created.append(client)
+            return client
+
+        monkeypatch.setattr(anthropic, "AsyncAnthropic", fake_anthropic)
+        monkeypatch.setattr(
+            "engine.runtime.interpreter.client.wrap_anthropic", lambda client: client
+        )
+        client = InterpreterClient()
+
+        asyncio.run(client.messages.create())
+        asyncio.run(client.messages.create())
+
+        assert len(created) == 2
+
+    @pytest.mark.asyncio
+    async def test_close_closes_owned_client_only(self):
+        """Test close() leaves an injected client open."""
+        injected = _client(AsyncMock(return_value="ok"))
+        injected.close = AsyncMock()
+        client = InterpreterClient(client=injected)
+        await client.messages.create()
+
+        await client.close()
+
+        injected.close.assert_not_awaited()
@@ -15,7 +15,7 @@ from engine.domain import (
     UpdateMoodEffect,
     AgentMovedEvent,
 )
-from engine.runtime.context import TickContext, TickResult
+from engine.runtime.context import TickContext, TickContextBuilder, TickResult
 from engine.runtime.interpreter import AgentTurnResult
 
 
@@ -382,6 +382,118 @@ class TestTickContextQueries:
         assert len(convs) == 1
 
 
+class TestTickContextBuilder:
+    """Tests for TickContextBuilder."""
+
+    def test_builder_from_context(self, tick_context: TickContext):
+        """Test that a builder starts from the context's state."""
+        builder = tick_context.builder()
+
+        assert isinstance(builder, TickContextBuilder)
+        assert builder.tick == tick_context.tick
+        assert builder.agents == tick_context.agents
+        assert builder.build() == tick_context
+
+    def test_build_accumulates_updates(self, tick_context: TickContext):
+        """Test that effects, events, turn results and acted agents accumulate."""
+        effect = UpdateMoodEffect(agent=AgentName("Ember"), mood="happy")
+        event = AgentMovedEvent(
+            tick=1,
+            timestamp=tick_context.timestamp,
+            agent=AgentName("Ember"),
+            from_location=LocationId("workshop"),
+            to_location=LocationId("garden"),
+        )
+        turn_result = AgentTurnResult(narrative="I walked away.")
+
+        builder = tick_context.builder()
+        builder.add_effect(effect)
+        builder.add_effects([effect, effect])
+        builder.add_event(event)
+        builder.set_turn_result(AgentName("Ember"), turn_result)
+        builder.mark_agent_acted(AgentName("Ember"))
+        builder.mark_agent_acted(AgentName("Sage"))
+        new_ctx = builder.build()
+
+        assert new_ctx.effects == (effect, effect, effect)
+        assert new_ctx.events == (event,)
+        assert new_ctx.turn_results == {AgentName("Ember"): turn_result}
+        assert new_ctx.agents_acted == frozenset([AgentName("Ember"), AgentName("Sage")])
+
+    def test_build_matches_with_methods(
+        self,
+        tick_context: TickContext,
+        sample_agent: AgentSnapshot,
+        sample_conversation: Conversation,
+        sample_invitation: Invitation,
+    ):
+        """Test that the builder produces the same context as chained with_* calls."""
+        moved = AgentSnapshot(
+            **{**sample_agent.model_dump(), "location": LocationId("garden")}
+        )
+        effect = MoveAgentEffect(
+            agent=AgentName("Ember"),
+            from_location=LocationId("workshop"),
+            to_location=LocationId("garden"),
+        )
+
+        expected = (
+            tick_context
+            .with_effect(effect)
+            .with_updated_agent(moved)
+            .with_updated_conversation(sample_conversation)
+            .with_added_invite(sample_invitation)
+            .with_removed_invite(sample_invitation.invitee)
+            .with_removed_conversation(sample_conversation.id)
+        )
+
+        builder = tick_context.builder()
+        builder.add_effect(effect)
+        builder.update_agent(moved)
+        builder.update_conversation(sample_conversation)
+        builder.add_invite(sample_invitation)
+        builder.remove_invite(sample_invitation.invitee)
+        builder.remove_conversation(sample_conversation.id)
+
+        assert builder.build() == expected
+
+    def test_source_context_unchanged(
+        self,
+        tick_context: TickContext,
+        sample_agent: AgentSnapshot,
+    ):
+        """Test that building never mutates the source context."""
+        updated_agent = AgentSnapshot(
+            **{**sample_agent.model_dump(), "mood": "excited"}
+        )
+
+        builder = tick_context.builder()
+        builder.update_agent(updated_agent)
+        builder.add_effect(UpdateMoodEffect(agent=AgentName("Ember"), mood="excited"))
+        builder.mark_agent_acted(AgentName("Ember"))
+        builder.build()
+
+        assert tick_context.agents[sample_agent.name].mood == "curious"
+        assert tick_context.effects == ()
+        assert tick_context.agents_acted == frozenset()
+
+    def test_later_updates_do_not_leak_into_built_context(
+        self,
+        tick_context: TickContext,
+        sample_invitation: Invitation,
+    ):
+        """Test that a built context is unaffected by further builder updates."""
+        builder = tick_context.builder()
+        first = builder.build()
+
+        builder.add_invite(sample_invitation)
+        builder.mark_agent_acted(AgentName("Ember"))
+
+        assert first.pending_invites == tick_context.pending_invites
+        assert first.agents_acted == frozenset()
+        assert sample_invitation.invitee in builder.build().pending_invites
+
+
 class TestTickResult:
     """Tests for TickResult."""
 
@@ -3,6 +3,7 @@
 import pytest
 from pathlib import Path
 
+from engine.services import dreams
 from engine.services.dreams import append_dream, get_unseen_dreams, _format_dream_entry, _read_dream_entry
 
 
@@ -59,6 +60,17 @@ class TestAppendDream:
         dreams_dir = temp_village_dir / "agents" / "sage" / "dreams"
         assert dreams_dir.exists()
 
+    def test_file_name_has_tick_prefix(self, temp_village_dir: Path):
+        """Test dream file name starts with its zero-padded tick."""
+        path = append_dream(
+            agent_name="Ember",
+            content="A vision appeared.",
+            tick=42,
+            village_root=temp_village_dir,
+        )
+
+        assert path.name.startswith("tick-0000000042_")
+
     def test_agent_name_lowercased(self, temp_village_dir: Path):
         """Test agent directory uses lowercase name."""
         append_dream(
@@ -118,6 +130,55 @@ class TestGetUnseenDreams:
         assert "Starlight" in result[0]
 
 
+    def test_returns_dreams_in_tick_order(self, temp_village_dir: Path):
+        """Test unseen dreams come back oldest tick first."""
+        append_dream("Ember", "Later", tick=20, village_root=temp_village_dir)
+        append_dream("Ember", "Earlier", tick=9, village_root=temp_village_dir)
+
+        agent_dir = temp_village_dir / "agents" / "ember"
+        result = get_unseen_dreams(agent_dir, last_active_tick=0)
+
+        assert "Earlier" in result[0]
+        assert "Later" in result[1]
+
+    def test_only_opens_unseen_dreams(self, temp_village_dir: Path, monkeypatch):
+        """Test seen dreams are filtered by file name without being read."""
+        for tick in range(1, 11):
+            append_dream("Ember", f"Dream {tick}", tick=tick, village_root=temp_village_dir)
+
+        opened: list[str] = []
+        original = dreams._read_dream_entry
+
+        def counting_read(path: Path):
+            opened.append(path.name)
+            return original(path)
+
+        monkeypatch.setattr(dreams, "_read_dream_entry", counting_read)
+
+        agent_dir = temp_village_dir / "agents" / "ember"
+        result = get_unseen_dreams(agent_dir, last_active_tick=8)
+
+        assert len(result) == 2
+        assert len(opened) == 2
+
+    def test_migrates_legacy_dream_files(self, temp_village_dir: Path):
+        """Test timestamp-named dream files are renamed with their tick."""
+        dreams_dir = temp_village_dir / "agents" / "ember" / "dreams"
+        dreams_dir.mkdir(parents=True)
+        (dreams_dir / "20250101_120000_000001.md").write_text("[tick:7]\nOld dream")
+        (dreams_dir / "20250101_120000_000002.md").write_text("No header")
+
+        result = get_unseen_dreams(dreams_dir.parent, last_active_tick=5)
+
+        assert result == ["Old dream"]
+        assert sorted(p.name for p in dreams_dir.iterdir()) == [
+            "tick-0000000007_20250101_120000_000001.md",
+            "untimed_20250101_120000_000002.md",
+        ]
+        # Second call reads the migrated names
+        assert get_unseen_dreams(dreams_dir.parent, last_active_tick=5) == ["Old dream"]
+
+
 class TestFormatDreamEntry:
     """Tests for _format_dream_entry helper."""
 
@@ -171,6 +171,49 @@ class TestSyncSharedFilesIn:
 
         assert not old_shared.exists()
 
+    def test_unchanged_files_not_recopied(self, temp_village_dir: Path):
+        """Test a second sync only copies files that changed in master."""
+        ensure_shared_directories(temp_village_dir)
+        agent_dir = ensure_agent_directory("Ember", temp_village_dir)
+        master_dir = temp_village_dir / "shared"
+        (master_dir / "workshop" / "same.txt").write_text("same")
+        (master_dir / "workshop" / "changes.txt").write_text("v1")
+        sync_shared_files_in(agent_dir, "workshop", master_dir)
+        same_inode = (agent_dir / "shared" / "workshop" / "same.txt").stat().st_ino
+
+        (master_dir / "workshop" / "changes.txt").write_text("version 2")
+        copied = sync_shared_files_in(agent_dir, "workshop", master_dir)
+
+        assert len(copied) == 2
+        assert (agent_dir / "shared" / "workshop" / "same.txt").stat().st_ino == same_inode
+        assert (agent_dir / "shared" / "workshop" / "changes.txt").read_text() == "version 2"
+
+    def test_removes_files_deleted_from_master(self, temp_village_dir: Path):
+        """Test files deleted from master disappear from the agent's copy."""
+        ensure_shared_directories(temp_village_dir)
+        agent_dir = ensure_agent_directory("Ember", temp_village_dir)
+        master_dir = temp_village_dir / "shared"
+        (master_dir / "workshop" / "gone.txt").write_text("gone")
+        sync_shared_files_in(agent_dir, "workshop", master_dir)
+
+        (master_dir / "workshop" / "gone.txt").unlink()
+        copied = sync_shared_files_in(agent_dir, "workshop", master_dir)
+
+        assert copied == []
+        assert not (agent_dir / "shared" / "workshop" / "gone.txt").exists()
+
+    def test_removes_other_location_dirs(self, temp_village_dir: Path):
+        """Test moving location drops the previous location's files."""
+        ensure_shared_directories(temp_village_dir)
+        agent_dir = ensure_agent_directory("Ember", temp_village_dir)
+        master_dir = temp_village_dir / "shared"
+        (master_dir / "workshop" / "tool.txt").write_text("hammer")
+        sync_shared_files_in(agent_dir, "workshop", master_dir)
+
+        sync_shared_files_in(agent_dir, "library", master_dir)
+
+        assert not (agent_dir / "shared" / "workshop").exists()
+
     def test_unknown_location_syncs_nothing(self, temp_village_dir: Path):
         """Test syncing unknown location copies nothing."""
         ensure_shared_directories(temp_village_dir)
@@ -204,8 +247,8 @@ class TestSyncSharedFilesOut:
         assert master_file.exists()
         assert master_file.read_text() == "Created by agent"
 
-    def test_clears_agent_shared_after_sync(self, temp_village_dir: Path):
-        """Test agent's shared directory is cleared after sync out."""
+    def test_keeps_agent_copy_after_sync(self, temp_village_dir: Path):
+        """Test agent's shared directory is kept for the next incremental sync."""
         ensure_shared_directories(temp_village_dir)
         agent_dir = ensure_agent_directory("Ember", temp_village_dir)
         master_dir = temp_village_dir / "shared"
@@ -218,8 +261,81 @@ class TestSyncSharedFilesOut:
         # Sync out
         sync_shared_files_out(agent_dir, "workshop", master_dir)
 
-        # Agent's shared should be removed
-        assert not (agent_dir / "shared").exists()
+        assert (agent_shared / "test.txt").read_text() == "test"
+        assert (master_dir / "workshop" / "test.txt").read_text() == "test"
+
+    def test_only_changed_files_written(self, temp_village_dir: Path):
+        """Test files the agent didn't change are not copied back."""
+        ensure_shared_directories(temp_village_dir)
+        agent_dir = ensure_agent_directory("Ember", temp_village_dir)
+        master_dir = temp_village_dir / "shared"
+        (master_dir / "workshop" / "kept.txt").write_text("kept")
+        (master_dir / "workshop" / "edited.txt").write_text("before")
+        sync_shared_files_in(agent_dir, "workshop", master_dir)
+
+        kept_mtime = (master_dir / "workshop" / "kept.txt").stat().st_mtime_ns
+        (agent_dir / "shared" / "workshop" / "edited.txt").write_text("after")
+        # Touched but identical content isn't a change either
+        (agent_dir / "shared" / "workshop" / "kept.txt").write_text("kept")
+
+        sync_shared_files_out(agent_dir, "workshop", master_dir)
+
+        assert (master_dir / "workshop" / "edited.txt").read_text() == "after"
+        assert (master_dir / "workshop" / "kept.txt").stat().st_mtime_ns == kept_mtime
+
+    def test_deleted_files_removed_from_master(self, temp_village_dir: Path):
+        """Test files the agent deleted are deleted from master."""
+        ensure_shared_directories(temp_village_dir)
+        agent_dir = ensure_agent_directory("Ember", temp_village_dir)
+        master_dir = temp_village_dir / "shared"
+        (master_dir / "workshop" / "old.txt").write_text("old")
+        sync_shared_files_in(agent_dir, "workshop", master_dir)
+
+        (agent_dir / "shared" / "workshop" / "old.txt").unlink()
+        sync_shared_files_out(agent_dir, "workshop", master_dir)
+
+        assert not (master_dir / "workshop" / "old.txt").exists()
+
+    def test_concurrent_edit_keeps_both_versions(self, temp_village_dir: Path):
+        """Test the first agent to sync out wins; the second gets a conflict copy."""
+        ensure_shared_directories(temp_village_dir)
+        ember_dir = ensure_agent_directory("Ember", temp_village_dir)
+        sage_dir = ensure_agent_directory("Sage", temp_village_dir)
+        master_dir = temp_village_dir / "shared"
+        (master_dir / "workshop" / "notes.md").write_text("start")
+        sync_shared_files_in(ember_dir, "workshop", master_dir)
+        sync_shared_files_in(sage_dir, "workshop", master_dir)
+
+        (ember_dir / "shared" / "workshop" / "notes.md").write_text("ember's edit")
+        (sage_dir / "shared" / "workshop" / "notes.md").write_text("sage's edit")
+        sync_shared_files_out(ember_dir, "workshop", master_dir)
+        sync_shared_files_out(sage_dir, "workshop", master_dir)
+
+        assert (master_dir / "workshop" / "notes.md").read_text() == "ember's edit"
+        conflict = master_dir / "workshop" / "notes.conflict-sage.md"
+        assert conflict.read_text() == "sage's edit"
+
+        # Next turn, Sage sees the winning version and the conflict copy
+        copied = sync_shared_files_in(sage_dir, "workshop", master_dir)
+        assert (sage_dir / "shared" / "workshop" / "notes.md").read_text() == "ember's edit"
+        assert "shared/workshop/notes.conflict-sage.md" in copied
+
+    def test_delete_skipped_if_master_changed(self, temp_village_dir: Path):
+        """Test a delete doesn't discard another agent's newer edit."""
+        ensure_shared_directories(temp_village_dir)
+        ember_dir = ensure_agent_directory("Ember", temp_village_dir)
+        sage_dir = ensure_agent_directory("Sage", temp_village_dir)
+        master_dir = temp_village_dir / "shared"
+        (master_dir / "workshop" / "notes.md").write_text("start")
+        sync_shared_files_in(ember_dir, "workshop", master_dir)
+        sync_shared_files_in(sage_dir, "workshop", master_dir)
+
+        (ember_dir / "shared" / "workshop" / "notes.md").write_text("ember's edit")
+        (sage_dir / "shared" / "workshop" / "notes.md").unlink()
+        sync_shared_files_out(ember_dir, "workshop", master_dir)
+        sync_shared_files_out(sage_dir, "workshop", master_dir)
+
+        assert (master_dir / "workshop" / "notes.md").read_text() == "ember's edit"
 
     def test_no_shared_dir_does_nothing(self, temp_village_dir: Path):
         """Test syncing when no shared dir exists does nothing."""
@@ -4,7 +4,7 @@ import pytest
 import json
 from pathlib import Path
 
-from engine.storage.archive import EventArchive
+from engine.storage.archive import EventArchive, read_footer
 
 
 class TestEventArchiveInitialization:
@@ -192,3 +192,70 @@ class TestLoadArchivedEvents:
 
         assert len(loaded) == 1
         assert json.loads(loaded[0])["tick"] == 5
+
+
+class TestArchiveFooters:
+    """Tests for footer-indexed archive files."""
+
+    def _write_log(self, archive: EventArchive, ticks: list[int]) -> None:
+        with open(archive.active_log, "w") as f:
+            for i, tick in enumerate(ticks):
+                f.write(json.dumps({"type": "test", "tick": tick, "n": i}) + "\n")
+
+    def test_archive_file_has_footer(self, temp_village_dir: Path):
+        """Test archived files end with a tick-range footer."""
+        archive = EventArchive(temp_village_dir)
+        self._write_log(archive, [1, 1, 2, 4, 9])
+
+        archive.archive_events_before(5)
+
+        footer = read_footer(archive.archive_dir / "events_1_4.jsonl")
+        assert footer["first_tick"] == 1
+        assert footer["last_tick"] == 4
+        assert footer["count"] == 4
+        assert [t for t, _ in footer["tick_offsets"]] == [1, 2, 4]
+
+    def test_footer_not_returned_as_event(self, temp_village_dir: Path):
+        """Test range reads never include the footer line."""
+        archive = EventArchive(temp_village_dir)
+        self._write_log(archive, [1, 2, 3])
+
+        archive.archive_events_before(10)
+
+        loaded = archive.load_archived_events(0, 100)
+        assert [json.loads(line)["tick"] for line in loaded] == [1, 2, 3]
+
+    def test_seeks_to_start_tick(self, temp_village_dir: Path):
+        """Test range reads within a footer-indexed file."""
+        archive = EventArchive(temp_village_dir)
+        self._write_log(archive, [1, 2, 2, 3, 5, 8])
+
+        archive.archive_events_before(10)
+
+        loaded = archive.load_archived_events(2, 4)
+        assert [json.loads(line)["n"] for line in loaded] == [1, 2, 3]
+
+    def test_repeated_range_does_not_overwrite(self, temp_village_dir: Path):
+        """Test archiving the same tick range twice keeps both files."""
+        archive = EventArchive(temp_village_dir)
+        self._write_log(archive, [1, 2])
+        archive.archive_events_before(5)
+        self._write_log(archive, [1, 2])
+        archive.archive_events_before(5)
+
+        assert len(list(archive.archive_dir.glob("events_1_2*.jsonl"))) == 2
+        assert len(archive.load_archived_events(1, 2)) == 4
+
+    def test_loads_across_files_in_tick_order(self, temp_village_dir: Path):
+        """Test reads spanning several archive files are merged in tick order."""
+        archive = EventArchive(temp_village_dir)
+        for batch in ([1, 2], [3, 4], [5, 6]):
+            with open(archive.active_log, "a") as f:
+                for tick in batch:
+                    f.write(json.dumps({"type": "test", "tick": tick}) + "\n")
+            archive.archive_events_before(batch[-1] + 1)
+
+        loaded = archive.load_archived_events(2, 5)
+
+        assert [json.loads(line)["tick"] for line in loaded] == [2, 3, 4, 5]
+        assert archive.active_log.read_text() == ""
@@ -0,0 +1,140 @@
+"""Tests for engine.storage.event_index module."""
+
+import json
+from pathlib import Path
+
+from engine.storage.event_index import EventLogIndex
+
+
+def _write_events(log_path: Path, events: list[dict], mode: str = "w") -> None:
+    with open(log_path, mode) as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+def _append_via_index(index: EventLogIndex, events: list[dict]) -> None:
+    lines = [(json.dumps(e) + "\n").encode() for e in events]
+    with open(index.log_path, "ab") as f:
+        offset = f.tell()
+        f.writelines(lines)
+    index.record(offset, lines, [e["tick"] for e in events], [e["type"] for e in events])
+
+
+class TestEventLogIndexBuild:
+    """Tests for building and loading the sidecar index."""
+
+    def test_empty_log(self, temp_village_dir: Path):
+        """Test index over a missing log is empty."""
+        index = EventLogIndex(temp_village_dir / "events.jsonl")
+
+        assert len(index) == 0
+        assert index.latest(10) == []
+
+    def test_indexes_existing_log(self, temp_village_dir: Path):
+        """Test an existing log without a sidecar is indexed on load."""
+        log = temp_village_dir / "events.jsonl"
+        _write_events(log, [
+            {"tick": 1, "type": "a"},
+            {"tick": 2, "type": "b"},
+        ])
+
+        index = EventLogIndex(log)
+
+        assert len(index) == 2
+        assert index.index_path.exists()
+        assert index.end_offset == log.stat().st_size
+
+    def test_record_persists_sidecar(self, temp_village_dir: Path):
+        """Test recorded entries survive a reload without rescanning."""
+        log = temp_village_dir / "events.jsonl"
+        index = EventLogIndex(log)
+        _append_via_index(index, [{"tick": 1, "type": "a"}, {"tick": 1, "type": "b"}])
+
+        reloaded = EventLogIndex(log)
+
+        assert [e.type for e in reloaded.latest(10)] == ["a", "b"]
+
+    def test_indexes_tail_written_behind_its_back(self, temp_village_dir: Path):
+        """Test lines appended without recording are picked up on next query."""
+        log = temp_village_dir / "events.jsonl"
+        index = EventLogIndex(log)
+        _append_via_index(index, [{"tick": 1, "type": "a"}])
+        _write_events(log, [{"tick": 2, "type": "b"}], mode="a")
+
+        assert [e.tick for e in index.latest(10)] == [1, 2]
+
+    def test_rebuilds_after_log_rewrite(self, temp_village_dir: Path):
+        """Test a rewritten log (e.g. after archiving) invalidates the index."""
+        log = temp_village_dir / "events.jsonl"
+        index = EventLogIndex(log)
+        _append_via_index(index, [{"tick": t, "type": "a"} for t in range(1, 6)])
+        _write_events(log, [{"tick": 5, "type": "a"}])
+
+        assert [e.tick for e in index.latest(10)] == [5]
+
+    def test_rebuilds_stale_sidecar_on_load(self, temp_village_dir: Path):
+        """Test a sidecar that no longer matches the log is discarded."""
+        log = temp_village_dir / "events.jsonl"
+        index = EventLogIndex(log)
+        _append_via_index(index, [{"tick": 1, "type": "a"}])
+        _write_events(log, [{"tick": 7, "type": "zz"}, {"tick": 8, "type": "zz"}])
+
+        reloaded = EventLogIndex(log)
+
+        assert [e.tick for e in reloaded.latest(10)] == [7, 8]
+
+    def test_recovers_from_torn_sidecar(self, temp_village_dir: Path):
+        """Test a partially written sidecar line is dropped and re-indexed."""
+        log = temp_village_dir / "events.jsonl"
+        index = EventLogIndex(log)
+        _append_via_index(index, [{"tick": 1, "type": "a"}, {"tick": 2, "type": "b"}])
+        content = index.index_path.read_text()
+        index.index_path.write_text(content[:-3])
+
+        reloaded = EventLogIndex(log)
+
+        assert [e.tick for e in reloaded.latest(10)] == [1, 2]
+        assert EventLogIndex(log).latest(10) == reloaded.latest(10)
+
+
+class TestEventLogIndexQueries:
+    """Tests for index-backed queries."""
+
+    def test_latest_respects_limit_and_order(self, temp_village_dir: Path):
+        """Test latest returns the newest entries, oldest first."""
+        index = EventLogIndex(temp_village_dir / "events.jsonl")
+        _append_via_index(index, [{"tick": t, "type": "a"} for t in range(10)])
+
+        assert [e.tick for e in index.latest(3)] == [7, 8, 9]
+
+    def test_latest_filters_by_type(self, temp_village_dir: Path):
+        """Test latest only visits the requested event types."""
+        index = EventLogIndex(temp_village_dir / "events.jsonl")
+        _append_via_index(index, [
+            {"tick": 1, "type": "a"},
+            {"tick": 2, "type": "b"},
+            {"tick": 3, "type": "c"},
+            {"tick": 4, "type": "a"},
+        ])
+
+        entries = index.latest(10, event_types={"a", "c"})
+
+        assert [(e.tick, e.type) for e in entries] == [(1, "a"), (3, "c"), (4, "a")]
+
+    def test_latest_since_tick(self, temp_village_dir: Path):
+        """Test latest stops at since_tick."""
+        index = EventLogIndex(temp_village_dir / "events.jsonl")
+        _append_via_index(index, [{"tick": t, "type": "a"} for t in range(10)])
+
+        assert [e.tick for e in index.latest(100, since_tick=8)] == [8, 9]
+
+    def test_entries_since_and_read(self, temp_village_dir: Path):
+        """Test range reads return exactly the indexed lines."""
+        index = EventLogIndex(temp_village_dir / "events.jsonl")
+        events = [{"tick": t, "type": "a", "n": t} for t in (1, 2, 2, 3)]
+        _append_via_index(index, events)
+
+        entries = index.entries_since(2)
+
+        assert [json.loads(line)["n"] for line in index.read_lines(entries)] == [2, 2, 3]
+        assert [json.loads(line)["n"] for line in index.read_range(entries).splitlines()] == [2, 2, 3]
@@ -54,7 +54,7 @@ class TestEventStoreInitialization:
 
         # Snapshot should be saved
         assert (temp_village_dir / "snapshots").exists()
-        snapshots = list((temp_village_dir / "snapshots").glob("state_*.json"))
+        snapshots = list((temp_village_dir / "snapshots").glob("state_*.json.gz"))
         assert len(snapshots) == 1
 
     def test_get_current_snapshot_before_init_raises(self, temp_village_dir: Path):
@@ -226,6 +226,106 @@ class TestEventStoreRecovery:
 
         assert result is None
 
+    def test_recover_skips_events_at_snapshot_tick(self, temp_village_dir: Path, world_snapshot: WorldSnapshot, sample_agent: AgentSnapshot):
+        """Test events at or before the snapshot tick are not replayed."""
+        store1 = EventStore(temp_village_dir)
+        snapshot = VillageSnapshot(
+            world=world_snapshot,
+            agents={sample_agent.name: sample_agent},
+            conversations={},
+            pending_invites={},
+        )
+        store1.initialize(snapshot)
+        store1.append(AgentMoodChangedEvent(
+            tick=world_snapshot.tick,
+            timestamp=datetime.now(),
+            agent=sample_agent.name,
+            old_mood="curious",
+            new_mood="already-in-snapshot",
+        ))
+        store1.append(AgentMoodChangedEvent(
+            tick=world_snapshot.tick + 1,
+            timestamp=datetime.now(),
+            agent=sample_agent.name,
+            old_mood="curious",
+            new_mood="replayed",
+        ))
+
+        store2 = EventStore(temp_village_dir)
+        recovered = store2.recover()
+
+        assert recovered.agents[sample_agent.name].mood == "replayed"
+        assert store2.last_recovery.events_replayed == 1
+        assert store2.last_recovery.snapshot_tick == world_snapshot.tick
+
+    def test_parallel_recover_matches_serial(self, temp_village_dir: Path, world_snapshot: WorldSnapshot, sample_agent: AgentSnapshot):
+        """Test process-pool recovery folds to the same state as in-process replay."""
+        store1 = EventStore(temp_village_dir)
+        snapshot = VillageSnapshot(
+            world=world_snapshot,
+            agents={sample_agent.name: sample_agent},
+            conversations={},
+            pending_invites={},
+        )
+        store1.initialize(snapshot)
+        store1.append_all([
+            AgentMoodChangedEvent(
+                tick=tick,
+                timestamp=datetime.now(),
+                agent=sample_agent.name,
+                old_mood="curious",
+                new_mood=f"mood_{tick}",
+            )
+            for tick in range(2, 40)
+        ])
+
+        serial = EventStore(temp_village_dir)
+        serial.recover(workers=1)
+
+        parallel = EventStore(temp_village_dir)
+        parallel.PARALLEL_RECOVERY_MIN_EVENTS = 0
+        parallel.RECOVERY_CHUNK_EVENTS = 7
+        parallel.recover(workers=2)
+
+        assert parallel.last_recovery.workers == 2
+        assert parallel.last_recovery.events_replayed == 38
+        assert parallel.get_current_snapshot().to_dict() == serial.get_current_snapshot().to_dict()
+        assert parallel.get_events_since(0) == serial.get_events_since(0)
+
+    def test_parallel_replay_reads_log_lazily(self, temp_village_dir: Path, world_snapshot: WorldSnapshot, sample_agent: AgentSnapshot):
+        """Test parallel replay keeps only a bounded window of blocks in flight."""
+        store = EventStore(temp_village_dir)
+        store.initialize(VillageSnapshot(
+            world=world_snapshot,
+            agents={sample_agent.name: sample_agent},
+            conversations={},
+            pending_invites={},
+        ))
+        store.append_all([
+            AgentMoodChangedEvent(
+                tick=tick,
+                timestamp=datetime.now(),
+                agent=sample_agent.name,
+                old_mood="curious",
+                new_mood=f"mood_{tick}",
+            )
+            for tick in range(2, 42)
+        ])
+
+        reads = []
+        read_range = store.index.read_range
+        store.index.read_range = lambda entries: reads.append(len(entries)) or read_range(entries)
+        store.RECOVERY_CHUNK_EVENTS = 2
+
+        chunks = store._parse_for_replay(store.index.entries_since(2), workers=2)
+        first = next(chunks)
+
+        assert first[0].tick == 2
+        # 20 blocks in the log; only the window (2 x workers) plus one read ahead
+        assert len(reads) <= 5
+        assert sum(len(chunk) for chunk in chunks) == 38
+        assert len(reads) == 20
+
 
 class TestEventStoreApplyEvent:
     """Tests for event application to state."""
@@ -557,7 +657,7 @@ class TestEventStoreSnapshotAndArchive:
         store.create_snapshot_and_archive()
 
         # Snapshot should exist
-        snapshots = list((temp_village_dir / "snapshots").glob("state_*.json"))
+        snapshots = list((temp_village_dir / "snapshots").glob("state_*.json.gz"))
         assert len(snapshots) >= 1
 
     def test_set_scheduler_state(self, temp_village_dir: Path, world_snapshot: WorldSnapshot, sample_agent: AgentSnapshot):
@@ -780,3 +880,131 @@ class TestConversationEndingUnseenEvents:
         conv_ids = {e.conversation_id for e in endings}
         assert ConversationId("conv-1") in conv_ids
         assert ConversationId("conv-2") in conv_ids
+
+
+class TestStructuralSharing:
+    """Tests for copy-on-write snapshot updates."""
+
+    def test_untouched_state_is_shared(
+        self,
+        temp_village_dir: Path,
+        world_snapshot: WorldSnapshot,
+        sample_agent: AgentSnapshot,
+        second_agent: AgentSnapshot,
+        sample_conversation,
+    ):
+        """Test an agent event leaves other agents and conversations shared."""
+        store = EventStore(temp_village_dir)
+        snapshot = VillageSnapshot(
+            world=world_snapshot,
+            agents={sample_agent.name: sample_agent, second_agent.name: second_agent},
+            conversations={sample_conversation.id: sample_conversation},
+            pending_invites={},
+        )
+        store.initialize(snapshot)
+
+        store.append(AgentMoodChangedEvent(
+            tick=1,
+            timestamp=world_snapshot.world_time,
+            agent=sample_agent.name,
+            old_mood="curious",
+            new_mood="happy",
+        ))
+
+        current = store.get_current_snapshot()
+        assert current.agents[sample_agent.name].mood == "happy"
+        assert current.agents[second_agent.name] is second_agent
+        assert current.conversations is snapshot.conversations
+        assert current.pending_invites is snapshot.pending_invites
+        assert current.world is world_snapshot
+
+    def test_previous_snapshot_is_not_mutated(
+        self,
+        temp_village_dir: Path,
+        world_snapshot: WorldSnapshot,
+        sample_agent: AgentSnapshot,
+    ):
+        """Test appending an unseen ending does not alias the previous snapshot's lists."""
+        ending = UnseenConversationEnding(
+            conversation_id=ConversationId("conv-old"),
+            other_participant=AgentName("Sage"),
+            final_message="Bye!",
+            ended_at_tick=1,
+        )
+        store = EventStore(temp_village_dir)
+        snapshot = VillageSnapshot(
+            world=world_snapshot,
+            agents={sample_agent.name: sample_agent},
+            conversations={},
+            pending_invites={},
+            unseen_endings={sample_agent.name: [ending]},
+        )
+        store.initialize(snapshot)
+
+        store.append(ConversationEndingUnseenEvent(
+            tick=2,
+            timestamp=datetime.now(),
+            agent=sample_agent.name,
+            conversation_id=ConversationId("conv-new"),
+            other_participant=AgentName("River"),
+            final_message="Later!",
+        ))
+
+        assert len(snapshot.unseen_endings[sample_agent.name]) == 1
+        assert len(store.get_current_snapshot().unseen_endings[sample_agent.name]) == 2
+
+    def test_batch_matches_one_at_a_time(
+        self,
+        temp_village_dir: Path,
+        world_snapshot: WorldSnapshot,
+        sample_agent: AgentSnapshot,
+    ):
+        """Test append_all folds a batch to the same state as individual appends."""
+        snapshot = VillageSnapshot(
+            world=world_snapshot,
+            agents={sample_agent.name: sample_agent},
+            conversations={},
+            pending_invites={},
+        )
+        now = datetime.now()
+        events = [
+            ConversationStartedEvent(
+                tick=2,
+                timestamp=now,
+                conversation_id=ConversationId("conv-batch"),
+                location=sample_agent.location,
+                privacy="public",
+                initial_participants=(sample_agent.name,),
+            ),
+            ConversationTurnEvent(
+                tick=2,
+                timestamp=now,
+                conversation_id=ConversationId("conv-batch"),
+                speaker=sample_agent.name,
+                narrative="Hello there.",
+            ),
+            AgentMovedEvent(
+                tick=3,
+                timestamp=now,
+                agent=sample_agent.name,
+                from_location=sample_agent.location,
+                to_location=LocationId("garden"),
+            ),
+            WeatherChangedEvent(
+                tick=3,
+                timestamp=now,
+                old_weather="clear",
+                new_weather="rainy",
+            ),
+        ]
+
+        batched = EventStore(temp_village_dir / "batched")
+        batched.initialize(snapshot)
+        batched.append_all(events)
+
+        single = EventStore(temp_village_dir / "single")
+        single.initialize(snapshot)
+        for event in events:
+            single.append(event)
+
+        assert batched.get_current_snapshot().to_dict() == single.get_current_snapshot().to_dict()
@@ -198,7 +198,7 @@ class TestSnapshotStore:
         path = store.save(snapshot)
 
         assert path.exists()
-        assert path.name == f"state_{snapshot.tick}.json"
+        assert path.name == f"state_{snapshot.tick}.json.gz"
 
     def test_load_snapshot(self, temp_village_dir: Path, world_snapshot: WorldSnapshot, sample_agent: AgentSnapshot):
         """Test loading a saved snapshot."""
@@ -319,3 +319,189 @@ class TestSnapshotStore:
         store = SnapshotStore(temp_village_dir)
 
         assert store.list_snapshots() == []
+
+
+class TestSnapshotDeltas:
+    """Tests for delta snapshots and the manifest."""
+
+    def _at_tick(self, snapshot: VillageSnapshot, tick: int, **changes) -> VillageSnapshot:
+        return VillageSnapshot(
+            world=snapshot.world.model_copy(update={"tick": tick}),
+            agents=changes.get("agents", snapshot.agents),
+            conversations=changes.get("conversations", snapshot.conversations),
+            pending_invites=snapshot.pending_invites,
+            scheduler_state=snapshot.scheduler_state,
+            unseen_endings=snapshot.unseen_endings,
+        )
+
+    def test_second_save_is_delta(
+        self,
+        temp_village_dir: Path,
+        world_snapshot: WorldSnapshot,
+        sample_agent: AgentSnapshot,
+        second_agent: AgentSnapshot,
+    ):
+        """Test saves after a full snapshot store only changed agents."""
+        store = SnapshotStore(temp_village_dir)
+        first = VillageSnapshot(
+            world=world_snapshot,
+            agents={sample_agent.name: sample_agent, second_agent.name: second_agent},
+            conversations={},
+            pending_invites={},
+        )
+        store.save(first)
+
+        moved = sample_agent.model_copy(update={"mood": "content"})
+        path = store.save(self._at_tick(first, 50, agents={**first.agents, moved.name: moved}))
+
+        assert path.name == "delta_50.json.gz"
+        loaded = SnapshotStore(temp_village_dir).load(50)
+        assert loaded.agents[sample_agent.name].mood == "content"
+        assert loaded.agents[second_agent.name] == second_agent
+
+    def test_delta_stores_only_new_turns(
+        self,
+        temp_village_dir: Path,
+        world_snapshot: WorldSnapshot,
+        sample_agent: AgentSnapshot,
+        sample_conversation: Conversation,
+    ):
+        """Test conversation history in a delta is the tail since the full snapshot."""
+        store = SnapshotStore(temp_village_dir)
+        first = VillageSnapshot(
+            world=world_snapshot,
+            agents={sample_agent.name: sample_agent},
+            conversations={sample_conversation.id: sample_conversation},
+            pending_invites={},
+        )
+        store.save(first)
+
+        new_turn = sample_conversation.history[0].model_copy(update={"narrative": "Another thought.", "tick": 2})
+        longer = sample_conversation.model_copy(update={"history": (*sample_conversation.history, new_turn)})
+        store.save(self._at_tick(first, 50, conversations={longer.id: longer}))
+
+        import gzip, json
+        delta = json.loads(gzip.decompress((store.snapshots_dir / "delta_50.json.gz").read_bytes()))
+        assert delta["conversations"][sample_conversation.id]["history_base"] == 1
+        assert len(delta["conversations"][sample_conversation.id]["history_tail"]) == 1
+
+        loaded = SnapshotStore(temp_village_dir).load_latest()
+        assert loaded.conversations[longer.id].history == longer.history
+
+    def test_delta_save_skips_full_serialization(
+        self,
+        temp_village_dir: Path,
+        world_snapshot: WorldSnapshot,
+        sample_agent: AgentSnapshot,
+        sample_conversation: Conversation,
+        monkeypatch,
+    ):
+        """Test a delta save never serializes the whole snapshot."""
+        store = SnapshotStore(temp_village_dir)
+        first = VillageSnapshot(
+            world=world_snapshot,
+            agents={sample_agent.name: sample_agent},
+            conversations={sample_conversation.id: sample_conversation},
+            pending_invites={},
+        )
+        store.save(first)
+
+        def fail(self):
+            raise AssertionError("delta save called to_dict()")
+
+        monkeypatch.setattr(VillageSnapshot, "to_dict", fail)
+        path = store.save(self._at_tick(first, 50))
+
+        assert path.name == "delta_50.json.gz"
+        monkeypatch.undo()
+        loaded = SnapshotStore(temp_village_dir).load(50)
+        assert loaded.tick == 50
+        assert loaded.conversations == first.conversations
+
+    def test_removed_conversation_in_delta(
+        self,
+        temp_village_dir: Path,
+        world_snapshot: WorldSnapshot,
+        sample_agent: AgentSnapshot,
+        sample_conversation: Conversation,
+    ):
+        """Test conversations ended since the full snapshot are dropped on load."""
+        store = SnapshotStore(temp_village_dir)
+        first = VillageSnapshot(
+            world=world_snapshot,
+            agents={sample_agent.name: sample_agent},
+            conversations={sample_conversation.id: sample_conversation},
+            pending_invites={},
+        )
+        store.save(first)
+        store.save(self._at_tick(first, 50, conversations={}))
+
+        assert SnapshotStore(temp_village_dir).load_latest().conversations == {}
+
+    def test_full_snapshot_every_n_saves(
+        self,
+        temp_village_dir: Path,
+        world_snapshot: WorldSnapshot,
+        sample_agent: AgentSnapshot,
+    ):
+        """Test a full snapshot is written every FULL_EVERY saves, across restarts."""
+        store = SnapshotStore(temp_village_dir)
+        first = VillageSnapshot(
+            world=world_snapshot,
+            agents={sample_agent.name: sample_agent},
+            conversations={},
+            pending_invites={},
+        )
+        store.save(first)
+        for i in range(1, SnapshotStore.FULL_EVERY):
+            store.save(self._at_tick(first, 1 + i))
+
+        # A fresh store picks up the delta count from the manifest
+        restarted = SnapshotStore(temp_village_dir)
+        path = restarted.save(self._at_tick(first, 1 + SnapshotStore.FULL_EVERY))
+
+        assert path.name.startswith("state_")
+
+    def test_manifest_lists_snapshots(
+        self,
+        temp_village_dir: Path,
+        world_snapshot: WorldSnapshot,
+        sample_agent: AgentSnapshot,
+    ):
+        """Test the manifest is the source of truth for snapshot listings."""
+        store = SnapshotStore(temp_village_dir)
+        first = VillageSnapshot(
+            world=world_snapshot,
+            agents={sample_agent.name: sample_agent},
+            conversations={},
+            pending_invites={},
+        )
+        store.save(first)
+        store.save(self._at_tick(first, 50))
+
+        assert store.manifest_path.exists()
+        assert SnapshotStore(temp_village_dir).list_snapshots() == [1, 50]
+
+    def test_loads_legacy_json_snapshots(
+        self,
+        temp_village_dir: Path,
+        world_snapshot: WorldSnapshot,
+        sample_agent: AgentSnapshot,
+    ):
+        """Test plain JSON snapshots from before the manifest still load."""
+        import json
+        snapshot = VillageSnapshot(
+            world=world_snapshot,
+            agents={sample_agent.name: sample_agent},
+            conversations={},
+            pending_invites={},
+        )
+        legacy = temp_village_dir / "snapshots" / f"state_{snapshot.tick}.json"
+        legacy.write_text(json.dumps(snapshot.to_dict(), default=str))
+
+        store = SnapshotStore(temp_village_dir)
+        loaded = store.load_latest()
+
+        assert loaded is not None
+        assert loaded.agents[sample_agent.name] == sample_agent
+        assert store.manifest_path.exists()